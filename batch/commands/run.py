@@ -0,0 +1,106 @@
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Run the operations of a batch manifest."""
+
+import concurrent.futures
+import os
+from typing import AnyStr, Optional
+
+import click
+
+from batch import manifest as batch_manifest
+from common import chronicle_auth
+from common import commands_utility
+from common import exception_handler
+from common import file_utility
+from common import operations
+from common import options
+
+
+@click.command(
+    name="run",
+    help="Run the operations of a batch manifest without prompts.")
+@click.argument("manifest", type=click.Path(exists=True, dir_okay=False))
+@click.option(
+    "-o",
+    "--output",
+    help="Path of the NDJSON file with the result of each operation. "
+    "Default: <manifest>_results.ndjson")
+@options.concurrency_option
+@options.env_option
+@options.url_option
+@options.region_option
+@options.credential_file_option
+@exception_handler.catch_exception()
+def run(credential_file: AnyStr, region: str, url: Optional[str], env: str,
+        concurrency: int, output: Optional[str], manifest: str) -> None:
+  """Runs the operations of a batch manifest over a shared session.
+
+  Args:
+    credential_file (AnyStr): Path of Service Account JSON.
+    region (str): Option for selecting regions. Available options - US, EUROPE,
+      ASIA_SOUTHEAST1.
+    url (str): Base URL to be used for API calls.
+    env (str): Option for selecting environment. Available options - prod, test.
+    concurrency (int): Maximum number of operations run in parallel.
+    output (str): Path of the NDJSON file with the result of each operation.
+    manifest (str): Path of the manifest file.
+
+  Raises:
+    OSError: Failed to read the given file, e.g. not found, no read access
+      (https://docs.python.org/library/exceptions.html#os-exceptions).
+    ValueError: Invalid file contents.
+  """
+  try:
+    batch_operations = batch_manifest.load_manifest(manifest)
+  except ValueError as e:
+    click.echo(f"Invalid manifest: {e}")
+    return
+
+  if not batch_operations:
+    click.echo("No operations found in the manifest.")
+    return
+
+  url = commands_utility.lower_or_none(url)
+  output = output or f"{os.path.splitext(manifest)[0]}_results.ndjson"
+  client = chronicle_auth.initialize_http_session(credential_file)
+  total = len(batch_operations)
+  failed = 0
+
+  click.echo(f"Running {total} operations...\n")
+  with file_utility.NdjsonWriter(output) as writer:
+    with concurrent.futures.ThreadPoolExecutor(
+        max_workers=concurrency) as executor:
+      # Results are returned in manifest order, regardless of which
+      # operation completes first.
+      results = executor.map(
+          lambda operation: operations.run_operation(
+              client, operation,
+              operations.get_operation_url(operation, region, url, env)),
+          batch_operations)
+      for result in results:
+        writer.write(result)
+        if result["success"]:
+          outcome = "OK"
+        else:
+          failed += 1
+          outcome = (f"Failed (Response Code: {result['status_code']})"
+                     if "status_code" in result else
+                     f"Failed ({result['error']})")
+        click.echo(f"[{result['index'] + 1}/{total}] {result['operation']} "
+                   f"{result['id']}: {outcome}")
+
+  click.echo(f"\n{total - failed} operations succeeded, {failed} failed.")
+  click.echo(f"Results exported successfully to: {os.path.abspath(output)}")
@@ -0,0 +1,105 @@
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Unit tests for run.py."""
+
+import json
+from typing import Any
+from unittest import mock
+
+from click.testing import CliRunner
+
+from batch.commands.run import run
+from mock_test_utility import MockResponse
+
+runner = CliRunner()
+
+MANIFEST = """operations:
+  - operation: feeds.disable
+    id: 123
+  - operation: forwarders.get
+    id: abc
+  - operation: parsers.status
+    id: xyz
+"""
+
+
+@mock.patch("batch.commands.run.chronicle_auth.initialize_http_session")
+def test_run(mock_client: mock.MagicMock, tmp_path: Any) -> None:
+  """Test that every operation is run and its result exported."""
+  manifest_path = tmp_path / "manifest.yaml"
+  manifest_path.write_text(MANIFEST)
+  mock_client.return_value = mock.Mock()
+  mock_client.return_value.request.side_effect = [
+      MockResponse(status_code=200, text="{}"),
+      MockResponse(status_code=200, text='{"name": "forwarders/abc"}'),
+      MockResponse(
+          status_code=400, text='{"error": {"message": "invalid config"}}'),
+  ]
+
+  result = runner.invoke(run, [str(manifest_path)])
+
+  assert result.output == f"""Running 3 operations...
+
+[1/3] feeds.disable 123: OK
+[2/3] forwarders.get abc: OK
+[3/3] parsers.status xyz: Failed (Response Code: 400)
+
+2 operations succeeded, 1 failed.
+Results exported successfully to: {tmp_path / "manifest_results.ndjson"}
+"""
+  assert mock_client.call_count == 1
+  with open(tmp_path / "manifest_results.ndjson") as file:
+    results = [json.loads(line) for line in file]
+  assert [(r["operation"], r["id"], r["success"]) for r in results] == [
+      ("feeds.disable", "123", True),
+      ("forwarders.get", "abc", True),
+      ("parsers.status", "xyz", False),
+  ]
+  assert results[1]["response"] == {"name": "forwarders/abc"}
+
+
+@mock.patch("batch.commands.run.chronicle_auth.initialize_http_session")
+def test_run_concurrency(mock_client: mock.MagicMock, tmp_path: Any) -> None:
+  """Test that results keep manifest order when run in parallel."""
+  manifest_path = tmp_path / "manifest.yaml"
+  manifest_path.write_text("operations:\n" + "".join(
+      f"  - {{operation: feeds.get, id: '{i}'}}\n" for i in range(20)))
+  output_path = tmp_path / "results.ndjson"
+  mock_client.return_value = mock.Mock()
+  mock_client.return_value.request.side_effect = (
+      lambda method, url: MockResponse(
+          status_code=200, text=json.dumps({"name": url.rsplit("/", 1)[1]})))
+
+  result = runner.invoke(
+      run,
+      [str(manifest_path), "--concurrency", "5", "--output",
+       str(output_path)])
+
+  assert "20 operations succeeded, 0 failed." in result.output
+  with open(output_path) as file:
+    results = [json.loads(line) for line in file]
+  assert [r["response"]["name"] for r in results] == [
+      str(i) for i in range(20)
+  ]
+
+
+def test_run_invalid_manifest(tmp_path: Any) -> None:
+  """Test that an invalid manifest is reported without running anything."""
+  manifest_path = tmp_path / "manifest.yaml"
+  manifest_path.write_text("operations: [{operation: feeds.get}]")
+
+  result = runner.invoke(run, [str(manifest_path)])
+
+  assert result.output == "Invalid manifest: Operation 1 has no 'id'.\n"
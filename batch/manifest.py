@@ -0,0 +1,73 @@
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Load the operations of a batch manifest."""
+
+from typing import List
+
+import yaml
+
+from common import operations
+
+KEY_OPERATIONS = "operations"
+KEY_OPERATION = "operation"
+KEY_ID = "id"
+
+
+def load_manifest(manifest_path: str) -> List[operations.Operation]:
+  """Loads and validates the operations of a batch manifest.
+
+  The manifest is a YAML file with a list of operations, e.g.
+
+    operations:
+      - operation: feeds.disable
+        id: 123
+      - operation: parsers.status
+        id: abc
+
+  Args:
+    manifest_path (str): Path of the manifest file.
+
+  Returns:
+    List[operations.Operation]: Operations in manifest order.
+
+  Raises:
+    OSError: Failed to read the manifest file.
+    ValueError: Invalid manifest contents.
+  """
+  with open(manifest_path, "r") as file:
+    try:
+      manifest = yaml.safe_load(file)
+    except yaml.YAMLError as e:
+      raise ValueError(f"Manifest is not valid YAML: {e}") from e
+
+  if not isinstance(manifest, dict) or not isinstance(
+      manifest.get(KEY_OPERATIONS), list):
+    raise ValueError(f"Manifest must contain a list of '{KEY_OPERATIONS}'.")
+
+  manifest_operations = []
+  for index, entry in enumerate(manifest[KEY_OPERATIONS]):
+    if not isinstance(entry, dict):
+      raise ValueError(f"Operation {index + 1} must be a mapping.")
+    name = entry.get(KEY_OPERATION)
+    if name not in operations.OPERATION_TYPES:
+      raise ValueError(
+          f"Operation {index + 1} has unsupported operation '{name}'. "
+          f"Supported operations: {', '.join(operations.OPERATION_TYPES)}")
+    resource_id = entry.get(KEY_ID)
+    if resource_id is None or not str(resource_id):
+      raise ValueError(f"Operation {index + 1} has no '{KEY_ID}'.")
+    manifest_operations.append(
+        operations.Operation(index, name, str(resource_id)))
+  return manifest_operations
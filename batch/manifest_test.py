@@ -0,0 +1,59 @@
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Unit tests for manifest.py."""
+
+from typing import Any
+
+import pytest
+
+from batch import manifest
+from common import operations
+
+
+def write_manifest(tmp_path: Any, content: str) -> str:
+  """Writes a manifest file and returns its path."""
+  manifest_path = tmp_path / "manifest.yaml"
+  manifest_path.write_text(content)
+  return str(manifest_path)
+
+
+def test_load_manifest(tmp_path: Any) -> None:
+  """Test that operations are loaded in manifest order."""
+  manifest_path = write_manifest(
+      tmp_path, """operations:
+  - operation: feeds.disable
+    id: 123
+  - operation: parsers.status
+    id: abc
+""")
+  assert manifest.load_manifest(manifest_path) == [
+      operations.Operation(0, "feeds.disable", "123"),
+      operations.Operation(1, "parsers.status", "abc"),
+  ]
+
+
+@pytest.mark.parametrize("content,error", [
+    ("- feeds.get", "must contain a list of 'operations'"),
+    ("operations: [feeds.get]", "Operation 1 must be a mapping"),
+    ("operations: [{operation: feeds.rename, id: 1}]",
+     "unsupported operation 'feeds.rename'"),
+    ("operations: [{operation: feeds.get}]", "Operation 1 has no 'id'"),
+    ("operations: [", "not valid YAML"),
+])
+def test_load_invalid_manifest(tmp_path: Any, content: str,
+                               error: str) -> None:
+  """Test that invalid manifests are rejected before any operation runs."""
+  with pytest.raises(ValueError, match=error):
+    manifest.load_manifest(write_manifest(tmp_path, content))
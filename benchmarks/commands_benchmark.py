@@ -0,0 +1,254 @@
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""End to end benchmark of CLI commands against the local API stand-in.
+
+Each command is run in-process with real HTTP sessions, retries and response
+decoding against benchmarks.stand_in_server, and its wall clock latency and
+peak Python memory are reported per dataset size. Only authentication is
+bypassed. Feeds and forwarders commands are pointed at the stand-in with
+--url; parser commands, which have no --url option, by overriding the base
+URLs in common.uri.
+
+Usage:
+  python -m benchmarks.commands_benchmark [--sizes 10,1000,100000]
+      [--repeat 3] [--latency-ms 0] [--error-rate 0] [--concurrency 8]
+      [--commands "feeds list,parsers list"] [--url http://host:port]
+
+With --url, the commands run against an already running stand-in server and
+--sizes only labels the results.
+"""
+
+import argparse
+import contextlib
+import dataclasses
+import importlib
+import statistics
+import tempfile
+import time
+import tracemalloc
+from typing import Callable, Iterator, List, Optional, Tuple
+from unittest import mock
+
+from click.testing import CliRunner
+from google.auth import credentials
+
+from benchmarks import stand_in_server
+from common import chronicle_auth
+from common import http_client
+from common import uri
+from feeds import feed_schema_utility
+
+RESOURCE_ID = "00000000-0000-0000-0000-000000000000"
+FAILURE_MARKERS = ("Error while", "Failed with exception", "Failed to find key")
+
+
+@dataclasses.dataclass(frozen=True)
+class BenchmarkCommand:
+  """Command run by the benchmark."""
+  name: str
+  # Import path of the click command object.
+  command: str
+  # Returns the command line arguments for the stand-in URL and concurrency.
+  get_args: Callable[[str, int], List[str]]
+  # Answers to the prompts of the command.
+  prompt_input: Optional[str] = None
+
+
+COMMANDS = [
+    BenchmarkCommand("feeds list", "feeds.commands.list.list_command",
+                     lambda url, _: ["--url", url]),
+    BenchmarkCommand("feeds get", "feeds.commands.get.get",
+                     lambda url, _: ["--url", url], f"{RESOURCE_ID}\n"),
+    BenchmarkCommand(
+        "forwarders list", "forwarders.commands.list.list_command",
+        lambda url, concurrency: ["--url", url, "--concurrency",
+                                  str(concurrency)]),
+    BenchmarkCommand("forwarders get", "forwarders.commands.get.get",
+                     lambda url, _: ["--url", url], f"{RESOURCE_ID}\n"),
+    BenchmarkCommand("parsers list", "parsers.commands.list.list_command",
+                     lambda url, _: []),
+    BenchmarkCommand("parsers history", "parsers.commands.history.history",
+                     lambda url, _: [], "LOG_0\n"),
+    BenchmarkCommand(
+        "parsers list_errors", "parsers.commands.list_errors.list_errors",
+        lambda url, _: [],
+        "LOG_0\n2022-01-01T00:00:00Z\n2022-01-02T00:00:00Z\n"),
+    BenchmarkCommand("parsers list_parsers",
+                     "parsers.commands.list_parsers.list_parsers",
+                     lambda url, _: ["--v2", "benchmark", "benchmark"]),
+    BenchmarkCommand("parsers list_extensions",
+                     "parsers.commands.list_extensions.list_extensions",
+                     lambda url, _: ["--v2", "benchmark", "benchmark"]),
+]
+
+
+@dataclasses.dataclass
+class Result:
+  """Measurements of a command at a dataset size."""
+  timings: List[float]
+  peak_memory: int
+  requests: int
+  failures: int
+
+
+@contextlib.contextmanager
+def stand_in_environment(url: str) -> Iterator[None]:
+  """Points every command at the stand-in and bypasses authentication.
+
+  Args:
+    url (str): Base URL of the stand-in server.
+
+  Yields:
+    None, while commands are pointed at the stand-in.
+  """
+  with tempfile.TemporaryDirectory() as cache_dir, mock.patch.object(
+      chronicle_auth, "load_credentials",
+      lambda *args: credentials.AnonymousCredentials()), mock.patch.object(
+          uri, "BASE_URL", url), mock.patch.object(
+              uri, "DATAPLANE_BASE_URL", url), mock.patch.object(
+                  feed_schema_utility, "SCHEMA_CACHE_DIR", cache_dir):
+    try:
+      yield
+    finally:
+      http_client.close_all()
+
+
+def run_command(benchmark_command: BenchmarkCommand, url: str,
+                concurrency: int) -> Tuple[float, bool]:
+  """Runs a command once.
+
+  Args:
+    benchmark_command (BenchmarkCommand): Command to be run.
+    url (str): Base URL of the stand-in server.
+    concurrency (int): Value of --concurrency for commands which support it.
+
+  Returns:
+    Tuple[float, bool]: Wall clock seconds and whether the command failed.
+  """
+  module_name, command_name = benchmark_command.command.rsplit(".", 1)
+  command = getattr(importlib.import_module(module_name), command_name)
+  # Every run starts like a new process, reading the schema from disk.
+  feed_schema_utility.clear_loaded_schemas()
+  start = time.perf_counter()
+  result = CliRunner().invoke(command,
+                              benchmark_command.get_args(url, concurrency),
+                              input=benchmark_command.prompt_input)
+  elapsed = time.perf_counter() - start
+  failed = bool(result.exception) or any(
+      marker in result.output for marker in FAILURE_MARKERS)
+  return elapsed, failed
+
+
+def measure(benchmark_command: BenchmarkCommand, server_url: str,
+            request_count: Callable[[], int], repeat: int,
+            concurrency: int) -> Result:
+  """Measures the latency and peak memory of a command.
+
+  Latency is measured without memory tracing, which would slow the command
+  down, and peak memory in one additional traced run.
+
+  Args:
+    benchmark_command (BenchmarkCommand): Command to be measured.
+    server_url (str): Base URL of the stand-in server.
+    request_count (Callable[[], int]): Returns the number of requests served
+      so far, or -1 if unknown.
+    repeat (int): Number of timed runs.
+    concurrency (int): Value of --concurrency for commands which support it.
+
+  Returns:
+    Result: Measurements of the command.
+  """
+  timings = []
+  failures = 0
+  requests_before = request_count()
+  for _ in range(repeat):
+    elapsed, failed = run_command(benchmark_command, server_url, concurrency)
+    timings.append(elapsed)
+    failures += failed
+  requests = request_count() - requests_before
+
+  tracemalloc.start()
+  try:
+    _, failed = run_command(benchmark_command, server_url, concurrency)
+    failures += failed
+    _, peak_memory = tracemalloc.get_traced_memory()
+  finally:
+    tracemalloc.stop()
+
+  return Result(timings, peak_memory,
+                requests // repeat if requests_before >= 0 else -1, failures)
+
+
+def report(name: str, size: int, result: Result) -> None:
+  """Prints the measurements of a command."""
+  requests = str(result.requests) if result.requests >= 0 else "?"
+  print(f"{name:<26}{size:>8}"
+        f"{statistics.median(result.timings) * 1000:>12.1f}"
+        f"{min(result.timings) * 1000:>12.1f}"
+        f"{result.peak_memory / 2**20:>12.1f}"
+        f"{requests:>10}{result.failures:>10}")
+
+
+def main() -> None:
+  parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+  parser.add_argument("--sizes", default="10,1000,100000")
+  parser.add_argument("--repeat", type=int, default=3)
+  parser.add_argument("--latency-ms", type=float, default=0.0)
+  parser.add_argument("--jitter-ms", type=float, default=0.0)
+  parser.add_argument("--error-rate", type=float, default=0.0)
+  parser.add_argument("--seed", type=int, default=0)
+  parser.add_argument("--concurrency", type=int, default=8)
+  parser.add_argument("--max-retries", type=int, default=5)
+  parser.add_argument(
+      "--commands", help="Comma separated command names. Default: all")
+  parser.add_argument("--url", help="Base URL of a running stand-in server.")
+  args = parser.parse_args()
+
+  commands = COMMANDS
+  if args.commands:
+    names = [name.strip() for name in args.commands.split(",")]
+    commands = [command for command in COMMANDS if command.name in names]
+  # The stand-in is local, so client side rate limiting would only measure
+  # the limiter.
+  http_client.configure(max_retries=args.max_retries, rate_limit=0)
+
+  print(f"{'command':<26}{'size':>8}{'median ms':>12}{'best ms':>12}"
+        f"{'peak MiB':>12}{'requests':>10}{'failures':>10}")
+  for size in [int(size) for size in args.sizes.split(",")]:
+    server = None
+    if args.url:
+      url = args.url
+      request_count = lambda: -1
+    else:
+      server = stand_in_server.start(size, args.latency_ms / 1000,
+                                     args.jitter_ms / 1000, args.error_rate,
+                                     args.seed)
+      url = server.url
+      request_count = lambda: server.request_count
+    try:
+      with stand_in_environment(url):
+        for benchmark_command in commands:
+          report(
+              benchmark_command.name, size,
+              measure(benchmark_command, url, request_count, args.repeat,
+                      args.concurrency))
+    finally:
+      if server:
+        server.shutdown()
+        server.server_close()
+
+
+if __name__ == "__main__":
+  main()
@@ -0,0 +1,32 @@
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Unit tests for commands_utility_benchmark.py."""
+
+import json
+
+from benchmarks import commands_utility_benchmark
+
+
+def test_benchmarks_have_baselines() -> None:
+  """Test that every benchmark runs and has a recorded baseline."""
+  benchmarks = commands_utility_benchmark.get_benchmarks()
+  for func in benchmarks.values():
+    func()
+
+  with open(commands_utility_benchmark.BASELINE_PATH) as file:
+    baseline = json.load(file)
+  assert sorted(baseline[commands_utility_benchmark.KEY_BENCHMARKS]) == sorted(
+      benchmarks)
+  assert baseline[commands_utility_benchmark.KEY_CALIBRATION] > 0
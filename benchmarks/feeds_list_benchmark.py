@@ -0,0 +1,162 @@
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Benchmark of rendering `feeds list` for a large synthetic tenant.
+
+The API is replaced by canned responses, so only the client side cost of
+looking up feed schemas and rendering feeds is measured. The lookup cost is
+also compared with the linear scan FeedSchema used before it was indexed.
+
+Usage:
+  python -m benchmarks.feeds_list_benchmark [--feeds 5000] [--repeat 3]
+"""
+
+import argparse
+import json
+import statistics
+import tempfile
+import time
+from typing import Any, Callable, Dict, List
+from unittest import mock
+
+from click.testing import CliRunner
+
+from feeds import feed_schema_utility
+from feeds.commands import list as list_feeds
+from mock_test_utility import MockResponse
+
+SOURCE_TYPES = 30
+LOG_TYPES_PER_SOURCE_TYPE = 200
+
+
+def build_feed_schema() -> Dict[str, Any]:
+  """Returns a feed schema comparable in size to the real one."""
+  return {
+      "feedSourceTypeSchemas": [{
+          "name": f"feedSourceTypeSchemas/SOURCE_{source}",
+          "displayName": f"Source {source}",
+          "feedSourceType": f"SOURCE_{source}",
+          "logTypeSchemas": [{
+              "name": (f"feedSourceTypeSchemas/SOURCE_{source}/"
+                       f"logTypeSchemas/LOG_{log}"),
+              "displayName": f"Log {log}",
+              "logType": f"LOG_{log}",
+              "detailsFieldSchemas": [{
+                  "fieldPath": f"details.settings.field{field}",
+                  "displayName": f"Field {field}",
+                  "type": "STRING",
+              } for field in range(3)],
+          } for log in range(LOG_TYPES_PER_SOURCE_TYPE)],
+      } for source in range(SOURCE_TYPES)]
+  }
+
+
+def build_feeds(count: int) -> Dict[str, Any]:
+  """Returns a list feeds response with feeds spread over all log types."""
+  feeds = []
+  for index in range(count):
+    source = index % SOURCE_TYPES
+    log = (index * 7) % LOG_TYPES_PER_SOURCE_TYPE
+    feeds.append({
+        "name": f"feeds/{index:08d}-0000-0000-0000-000000000000",
+        "displayName": f"Feed {index}",
+        "details": {
+            "feedSourceType": f"SOURCE_{source}",
+            "logType": f"LOG_{log}",
+            "namespace": "benchmark",
+            "labels": [{"key": "index", "value": str(index)}],
+            "settings": {f"field{field}": f"value{field}" for field in range(3)},
+        },
+        "feedState": "ACTIVE",
+    })
+  return {"feeds": feeds}
+
+
+def linear_lookup(schema_response: Dict[str, Any], source_type: str,
+                  log_type: str) -> Any:
+  """Looks up a detailed schema by scanning the whole feed schema."""
+  for source in schema_response["feedSourceTypeSchemas"]:
+    if source_type == source["feedSourceType"]:
+      for log_type_schema in source["logTypeSchemas"]:
+        if log_type == log_type_schema["logType"]:
+          return log_type_schema
+  return None
+
+
+def measure(func: Callable[[], Any], repeat: int) -> List[float]:
+  """Returns the wall clock seconds of each run of a function."""
+  timings = []
+  for _ in range(repeat):
+    start = time.perf_counter()
+    func()
+    timings.append(time.perf_counter() - start)
+  return timings
+
+
+def report(name: str, timings: List[float]) -> None:
+  """Prints the median and best timing of a benchmark."""
+  print(f"{name:<40} median {statistics.median(timings) * 1000:9.1f} ms"
+        f"   best {min(timings) * 1000:9.1f} ms")
+
+
+def main() -> None:
+  parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+  parser.add_argument("--feeds", type=int, default=5000)
+  parser.add_argument("--repeat", type=int, default=3)
+  args = parser.parse_args()
+
+  schema_response = build_feed_schema()
+  feeds_response = build_feeds(args.feeds)
+  schema_text = json.dumps(schema_response)
+  feeds_text = json.dumps(feeds_response)
+  lookups = [(feed["details"]["feedSourceType"], feed["details"]["logType"])
+             for feed in feeds_response["feeds"]]
+  print(f"{args.feeds} feeds, {SOURCE_TYPES * LOG_TYPES_PER_SOURCE_TYPE} "
+        f"log type schemas, {len(schema_text) // 1024} KiB feed schema")
+
+  report(
+      "schema lookups, linear scan",
+      measure(lambda: [linear_lookup(schema_response, *key) for key in lookups],
+              args.repeat))
+
+  def indexed_lookups() -> None:
+    with mock.patch.object(feed_schema_utility.FeedSchema, "__init__",
+                           lambda self: None):
+      feed_schema = feed_schema_utility.FeedSchema()
+    feed_schema.schema_response = schema_response
+    for key in lookups:
+      feed_schema.get_detailed_schema(*key)
+
+  report("schema lookups, indexed (incl. build)",
+         measure(indexed_lookups, args.repeat))
+
+  def render() -> None:
+    feed_schema_utility.clear_loaded_schemas()
+    with tempfile.TemporaryDirectory() as cache_dir, mock.patch.object(
+        feed_schema_utility, "SCHEMA_CACHE_DIR", cache_dir), mock.patch(
+            "feeds.feed_schema_utility.chronicle_auth.initialize_http_session"
+        ) as mock_session:
+      mock_session.return_value.request.side_effect = [
+          MockResponse(status_code=200, text=schema_text),
+          MockResponse(status_code=200, text=feeds_text),
+      ]
+      result = CliRunner().invoke(list_feeds.list_command)
+      if result.exit_code or "failed with error" in result.output:
+        raise RuntimeError(result.output[-2000:])
+
+  report(f"feeds list, {args.feeds} feeds", measure(render, args.repeat))
+
+
+if __name__ == "__main__":
+  main()
@@ -0,0 +1,473 @@
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Local stand-in for the Chronicle APIs used by the CLI.
+
+Serves synthetic feeds, feed schema, forwarders, collectors, CBN parsers and
+Dataplane parsers and parser extensions over HTTP, with configurable latency
+and error rate, so commands can be run end to end against it with --url.
+Dataplane list responses are paginated like the real API.
+
+Usage:
+  python -m benchmarks.stand_in_server [--port 8080] [--resources 1000]
+      [--latency-ms 0] [--jitter-ms 0] [--error-rate 0] [--seed 0]
+"""
+
+import argparse
+import base64
+import functools
+import hashlib
+import http.server
+import json
+import random
+import re
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+import urllib.parse
+
+from benchmarks import feeds_list_benchmark
+
+COLLECTORS_PER_FORWARDER = 1
+DEFAULT_PAGE_SIZE = 1000
+DATAPLANE_PARENT = (r"/v1alpha/projects/[^/]+/locations/[^/]+/instances/[^/]+"
+                    r"/logTypes/[^/]+")
+
+
+class Dataset:
+  """Synthetic resources of a tenant, with `size` resources of each type.
+
+  Each type of resource is built on first use and kept for the lifetime of
+  the dataset.
+  """
+
+  def __init__(self, size: int) -> None:
+    """Initializes the dataset.
+
+    Args:
+      size (int): Number of resources of each type.
+    """
+    self.size = size
+
+  @functools.cached_property
+  def feed_schema(self) -> Dict[str, Any]:
+    """Feed schema served at /v1/feedSchema."""
+    return feeds_list_benchmark.build_feed_schema()
+
+  @functools.cached_property
+  def feeds(self) -> Dict[str, Dict[str, Any]]:
+    """Feeds keyed by feed ID."""
+    feeds = feeds_list_benchmark.build_feeds(self.size)["feeds"]
+    return {feed["name"].split("/")[-1]: feed for feed in feeds}
+
+  @functools.cached_property
+  def forwarders(self) -> Dict[str, Dict[str, Any]]:
+    """Forwarders keyed by forwarder ID."""
+    forwarders = {}
+    for index in range(self.size):
+      forwarder_id = f"{index:08d}-0000-0000-0000-000000000000"
+      forwarders[forwarder_id] = {
+          "name": f"forwarders/{forwarder_id}",
+          "displayName": f"Forwarder {index}",
+          "config": {
+              "uploadCompression": True,
+              "metadata": {
+                  "assetNamespace": "benchmark",
+                  "labels": [{"key": "index", "value": str(index)}],
+              },
+          },
+          "state": "ACTIVE",
+      }
+    return forwarders
+
+  def get_collectors(self, forwarder_id: str) -> List[Dict[str, Any]]:
+    """Returns the collectors of a forwarder.
+
+    Args:
+      forwarder_id (str): ID of the forwarder.
+
+    Returns:
+      List[Dict[str, Any]]: Collectors of the forwarder.
+    """
+    return [{
+        "name": f"forwarders/{forwarder_id}/collectors/{index:08d}",
+        "displayName": f"Collector {index}",
+        "config": {
+            "logType": "BENCHMARK",
+            "metadata": {"assetNamespace": "benchmark"},
+            "maxSecondsPerBatch": 10,
+            "maxBytesPerBatch": 1048576,
+            "fileSettings": {"filePath": "/var/log/benchmark.log"},
+        },
+        "state": "ACTIVE",
+    } for index in range(COLLECTORS_PER_FORWARDER)]
+
+  @functools.cached_property
+  def cbn_parsers(self) -> Dict[str, Dict[str, Any]]:
+    """CBN parsers keyed by config ID."""
+    parsers = {}
+    for index in range(self.size):
+      config_id = f"{index:08d}-0000-0000-0000-000000000000"
+      parsers[config_id] = {
+          "configId": config_id,
+          "config": base64.b64encode(b"filter {}").decode(),
+          "logType": f"LOG_{index % 200}",
+          "state": "LIVE",
+          "sha256": "0" * 64,
+          "author": "benchmark",
+          "submitTime": "2022-01-01T00:00:00Z",
+          "lastLiveTime": "2022-01-01T00:00:00Z",
+          "stateLastChangedTime": "2022-01-01T00:00:00Z",
+      }
+    return parsers
+
+  @functools.cached_property
+  def parser_errors(self) -> List[Dict[str, Any]]:
+    """Errors of the CBN parsers, one per parser."""
+    return [{
+        "errorId": f"{index:08d}",
+        "configId": f"{index:08d}-0000-0000-0000-000000000000",
+        "logType": f"LOG_{index % 200}",
+        "errorTime": "2022-01-01T00:00:00Z",
+        "category": "PARSING",
+        "errorMsg": "failed to parse log",
+        "logs": [base64.b64encode(f"log line {index}".encode()).decode()],
+    } for index in range(self.size)]
+
+  def get_dataplane_resources(self, collection: str) -> List[Dict[str, Any]]:
+    """Returns Dataplane parsers or parser extensions.
+
+    Args:
+      collection (str): Collection of the resources, parsers or
+        parserExtensions.
+
+    Returns:
+      List[Dict[str, Any]]: Resources of the collection in list order.
+
+    Raises:
+      KeyError: Unknown collection.
+    """
+    return self._dataplane_resources[collection]
+
+  @functools.cached_property
+  def _dataplane_resources(self) -> Dict[str, List[Dict[str, Any]]]:
+    """Dataplane parsers and parser extensions keyed by collection."""
+    parent = "projects/benchmark/locations/us/instances/benchmark/logTypes"
+    return {
+        "parsers": [{
+            "name": f"{parent}/LOG_{index % 200}/parsers/{index:08d}",
+            "creator": {"author": "benchmark"},
+            "state": "ACTIVE",
+            "type": "CUSTOM",
+            "createTime": "2022-01-01T00:00:00Z",
+        } for index in range(self.size)],
+        "parserExtensions": [{
+            "name": f"{parent}/LOG_{index % 200}/parserExtensions/{index:08d}",
+            "author": "benchmark",
+            "state": "LIVE",
+            "createTime": "2022-01-01T00:00:00Z",
+        } for index in range(self.size)],
+    }
+
+
+class StandInServer(http.server.ThreadingHTTPServer):
+  """HTTP server serving a synthetic dataset."""
+
+  daemon_threads = True
+
+  def __init__(self,
+               address: Tuple[str, int],
+               dataset: Dataset,
+               latency: float = 0.0,
+               jitter: float = 0.0,
+               error_rate: float = 0.0,
+               seed: Optional[int] = None) -> None:
+    """Initializes the server.
+
+    Args:
+      address (Tuple[str, int]): Host and port to listen on. Port 0 picks a
+        free port.
+      dataset (Dataset): Resources served.
+      latency (float): Seconds every response is delayed by.
+      jitter (float): Maximum random seconds added to the latency.
+      error_rate (float): Fraction of requests answered with 503.
+      seed (int): Seed of the latency jitter and error injection.
+    """
+    super().__init__(address, StandInHandler)
+    self.dataset = dataset
+    self.latency = latency
+    self.jitter = jitter
+    self.error_rate = error_rate
+    self.request_count = 0
+    self._random = random.Random(seed)
+    self._lock = threading.Lock()
+
+  @property
+  def url(self) -> str:
+    """Base URL of the server, to be passed to commands with --url."""
+    host, port = self.server_address[:2]
+    return f"http://{host}:{port}"
+
+  def next_request(self) -> Tuple[float, bool]:
+    """Counts a request and returns its delay and whether it fails.
+
+    Returns:
+      Tuple[float, bool]: Seconds the response is delayed by, and whether it
+      is answered with an injected error.
+    """
+    with self._lock:
+      self.request_count += 1
+      delay = self.latency + self._random.uniform(0, self.jitter)
+      return delay, self._random.random() < self.error_rate
+
+
+class StandInHandler(http.server.BaseHTTPRequestHandler):
+  """Routes requests to the dataset of the server."""
+
+  protocol_version = "HTTP/1.1"
+  # Headers and body are written separately, which would otherwise stall
+  # each response on a delayed ACK.
+  disable_nagle_algorithm = True
+  server: StandInServer
+
+  def do_GET(self) -> None:  # pylint: disable=invalid-name
+    """Handles a GET request."""
+    self._handle("GET")
+
+  def do_POST(self) -> None:  # pylint: disable=invalid-name
+    """Handles a POST request."""
+    self._handle("POST")
+
+  def do_DELETE(self) -> None:  # pylint: disable=invalid-name
+    """Handles a DELETE request."""
+    self._handle("DELETE")
+
+  def log_message(self, *args: Any) -> None:
+    """Suppresses the access log."""
+
+  def _handle(self, method: str) -> None:
+    """Answers a request after its delay, or with an error.
+
+    The request body is read and ignored. Injected errors are answered with
+    503 and unknown routes or resources with 404.
+
+    Args:
+      method (str): Method of the request.
+    """
+    content_length = int(self.headers.get("Content-Length") or 0)
+    if content_length:
+      self.rfile.read(content_length)
+
+    delay, fail = self.server.next_request()
+    if delay:
+      time.sleep(delay)
+    if fail:
+      self._send_error(503, "UNAVAILABLE", "Injected error.")
+      return
+
+    parsed_url = urllib.parse.urlsplit(self.path)
+    query = dict(urllib.parse.parse_qsl(parsed_url.query))
+    try:
+      status_code, body = self._route(method, parsed_url.path, query)
+    except KeyError:
+      self._send_error(404, "NOT_FOUND", "Resource not found.")
+      return
+    if status_code is None:
+      self._send_error(404, "NOT_FOUND", f"No route for {method} {self.path}")
+      return
+    self._send_json(status_code, body, method == "GET")
+
+  def _route(self, method: str, path: str,
+             query: Dict[str, str]) -> Tuple[Optional[int], Any]:
+    """Returns the status code and body of a request.
+
+    Args:
+      method (str): Method of the request.
+      path (str): Path of the request URL.
+      query (Dict[str, str]): Query parameters of the request URL.
+
+    Returns:
+      Tuple[int, Any]: Status code and JSON body of the response. The status
+      code is None if no route matches.
+
+    Raises:
+      KeyError: The requested resource does not exist.
+    """
+    dataset = self.server.dataset
+    if method == "GET" and path == "/v1/feedSchema":
+      return 200, dataset.feed_schema
+    if method == "GET" and path == "/v1/feeds":
+      return 200, {"feeds": list(dataset.feeds.values())}
+    match = re.fullmatch(r"/v1/feeds/([^/:]+)(:enable|:disable)?", path)
+    if match:
+      feed = dataset.feeds[match.group(1)]
+      if method == "GET" and not match.group(2):
+        return 200, feed
+      if method == "POST" and match.group(2):
+        state = "ACTIVE" if match.group(2) == ":enable" else "INACTIVE"
+        return 200, dict(feed, feedState=state)
+      if method == "DELETE" and not match.group(2):
+        return 200, {}
+
+    if method == "GET" and path == "/v2/forwarders":
+      return 200, {"forwarders": list(dataset.forwarders.values())}
+    match = re.fullmatch(r"/v2/forwarders/([^/]+)(/collectors)?", path)
+    if match:
+      forwarder = dataset.forwarders[match.group(1)]
+      if method == "GET" and match.group(2):
+        return 200, {"collectors": dataset.get_collectors(match.group(1))}
+      if method == "GET":
+        return 200, forwarder
+      if method == "DELETE" and not match.group(2):
+        return 200, {}
+
+    if method == "GET" and path in (
+        "/v1/tools/cbnParsers", "/v1/tools/cbnParsers:listCbnParserHistory"):
+      return 200, {"cbnParsers": list(dataset.cbn_parsers.values())}
+    if method == "GET" and path == "/v1/tools/cbnParsers:listCbnParserErrors":
+      return 200, {"errors": dataset.parser_errors}
+    match = re.fullmatch(r"/v1/tools/cbnParsers/([^/:]+)", path)
+    if method == "GET" and match:
+      return 200, dataset.cbn_parsers[match.group(1)]
+
+    match = re.fullmatch(f"{DATAPLANE_PARENT}/(parsers|parserExtensions)", path)
+    if method == "GET" and match:
+      return 200, self._paginate(
+          match.group(1), dataset.get_dataplane_resources(match.group(1)),
+          query)
+    return None, None
+
+  def _paginate(self, key: str, items: List[Dict[str, Any]],
+                query: Dict[str, str]) -> Dict[str, Any]:
+    """Returns a page of items, with nextPageToken if more items remain.
+
+    Page tokens are the offset of the first item of the page.
+
+    Args:
+      key (str): Key of the items in the page.
+      items (List[Dict[str, Any]]): Every item of the list.
+      query (Dict[str, str]): Query parameters with the page_size and
+        page_token of the request.
+
+    Returns:
+      Dict[str, Any]: Page of the list response.
+    """
+    page_size = int(query.get("page_size") or DEFAULT_PAGE_SIZE)
+    offset = int(query.get("page_token") or 0)
+    page = {key: items[offset:offset + page_size]}
+    if offset + page_size < len(items):
+      page["nextPageToken"] = str(offset + page_size)
+    return page
+
+  def _send_error(self, status_code: int, status: str, message: str) -> None:
+    """Sends an error in the format of the Chronicle APIs.
+
+    Args:
+      status_code (int): Status code of the response.
+      status (str): Status of the error, e.g. NOT_FOUND.
+      message (str): Error message.
+    """
+    self._send_json(status_code, {
+        "error": {
+            "code": status_code,
+            "message": message,
+            "status": status,
+        }
+    })
+
+  def _send_json(self,
+                 status_code: int,
+                 body: Any,
+                 cacheable: bool = False) -> None:
+    """Sends a JSON body, or 304 if the client's ETag still matches.
+
+    Args:
+      status_code (int): Status code of the response.
+      body (Any): Body of the response.
+      cacheable (bool): Whether an ETag is sent with a 200 response and
+        checked against the If-None-Match header of the request.
+    """
+    content = json.dumps(body).encode()
+    etag = None
+    if cacheable and status_code == 200:
+      etag = f'"{hashlib.sha256(content).hexdigest()[:32]}"'
+      if self.headers.get("If-None-Match") == etag:
+        self.send_response(304)
+        self.send_header("ETag", etag)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+        return
+    self.send_response(status_code)
+    self.send_header("Content-Type", "application/json; charset=UTF-8")
+    self.send_header("Content-Length", str(len(content)))
+    if etag:
+      self.send_header("ETag", etag)
+    self.end_headers()
+    self.wfile.write(content)
+
+
+def start(size: int,
+          latency: float = 0.0,
+          jitter: float = 0.0,
+          error_rate: float = 0.0,
+          seed: Optional[int] = None,
+          host: str = "127.0.0.1",
+          port: int = 0) -> StandInServer:
+  """Starts a stand-in server on a background thread.
+
+  Args:
+    size (int): Number of resources of each type.
+    latency (float): Seconds every response is delayed by.
+    jitter (float): Maximum random seconds added to the latency.
+    error_rate (float): Fraction of requests answered with 503.
+    seed (int): Seed of the latency jitter and error injection.
+    host (str): Host to listen on.
+    port (int): Port to listen on. 0 picks a free port.
+
+  Returns:
+    StandInServer: Running server. Call shutdown() and server_close() to stop
+    it.
+  """
+  server = StandInServer((host, port), Dataset(size), latency, jitter,
+                         error_rate, seed)
+  threading.Thread(target=server.serve_forever, daemon=True).start()
+  return server
+
+
+def main() -> None:
+  """Serves a dataset in the foreground until interrupted."""
+  parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+  parser.add_argument("--host", default="127.0.0.1")
+  parser.add_argument("--port", type=int, default=8080)
+  parser.add_argument("--resources", type=int, default=1000)
+  parser.add_argument("--latency-ms", type=float, default=0.0)
+  parser.add_argument("--jitter-ms", type=float, default=0.0)
+  parser.add_argument("--error-rate", type=float, default=0.0)
+  parser.add_argument("--seed", type=int)
+  args = parser.parse_args()
+
+  server = StandInServer((args.host, args.port), Dataset(args.resources),
+                         args.latency_ms / 1000, args.jitter_ms / 1000,
+                         args.error_rate, args.seed)
+  print(f"Serving {args.resources} resources of each type at {server.url}")
+  try:
+    server.serve_forever()
+  except KeyboardInterrupt:
+    pass
+  finally:
+    server.server_close()
+
+
+if __name__ == "__main__":
+  main()
@@ -0,0 +1,99 @@
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Unit tests for stand_in_server.py."""
+
+import json
+from typing import Any, Iterator
+import urllib.error
+import urllib.request
+
+import pytest
+
+from benchmarks import stand_in_server
+
+DATAPLANE_PARSERS_PATH = ("/v1alpha/projects/p/locations/us/instances/i/"
+                          "logTypes/-/parsers")
+
+
+@pytest.fixture(name="server")
+def fixture_server() -> Iterator[stand_in_server.StandInServer]:
+  """Stand-in server with 3 resources of each type."""
+  server = stand_in_server.start(3)
+  yield server
+  server.shutdown()
+  server.server_close()
+
+
+def fetch(server: stand_in_server.StandInServer,
+          path: str,
+          method: str = "GET") -> Any:
+  """Returns the status code and parsed body of a request."""
+  request = urllib.request.Request(server.url + path, method=method)
+  try:
+    with urllib.request.urlopen(request) as response:
+      return response.status, json.load(response)
+  except urllib.error.HTTPError as e:
+    return e.code, json.load(e)
+
+
+def test_resources(server: stand_in_server.StandInServer) -> None:
+  """Test that list and get endpoints serve the same resources."""
+  status_code, feeds = fetch(server, "/v1/feeds")
+  assert status_code == 200
+  assert len(feeds["feeds"]) == 3
+  feed_id = feeds["feeds"][1]["name"].split("/")[-1]
+  assert fetch(server, f"/v1/feeds/{feed_id}") == (200, feeds["feeds"][1])
+  status_code, disabled = fetch(server, f"/v1/feeds/{feed_id}:disable", "POST")
+  assert disabled["feedState"] == "INACTIVE"
+
+  _, forwarders = fetch(server, "/v2/forwarders")
+  forwarder_id = forwarders["forwarders"][0]["name"].split("/")[-1]
+  _, collectors = fetch(server, f"/v2/forwarders/{forwarder_id}/collectors")
+  assert len(collectors["collectors"]) == (
+      stand_in_server.COLLECTORS_PER_FORWARDER)
+
+  assert fetch(server, "/v1/feeds/unknown")[0] == 404
+  assert fetch(server, "/v1/unknown")[0] == 404
+  assert server.request_count == 7
+
+
+def test_pagination(server: stand_in_server.StandInServer) -> None:
+  """Test that Dataplane lists are paginated with nextPageToken."""
+  _, first_page = fetch(server, f"{DATAPLANE_PARSERS_PATH}?page_size=2")
+  assert len(first_page["parsers"]) == 2
+  _, last_page = fetch(
+      server, f"{DATAPLANE_PARSERS_PATH}?page_size=2&"
+      f"page_token={first_page['nextPageToken']}")
+  assert len(last_page["parsers"]) == 1
+  assert "nextPageToken" not in last_page
+
+
+def test_error_rate(server: stand_in_server.StandInServer) -> None:
+  """Test that injected errors are retryable API errors."""
+  server.error_rate = 1.0
+  status_code, body = fetch(server, "/v1/feeds")
+  assert status_code == 503
+  assert body["error"]["status"] == "UNAVAILABLE"
+
+
+def test_conditional_get(server: stand_in_server.StandInServer) -> None:
+  """Test that a GET with a matching ETag is answered with 304."""
+  with urllib.request.urlopen(server.url + "/v1/feeds") as response:
+    etag = response.headers["ETag"]
+  request = urllib.request.Request(
+      server.url + "/v1/feeds", headers={"If-None-Match": etag})
+  with pytest.raises(urllib.error.HTTPError) as e:
+    urllib.request.urlopen(request)
+  assert e.value.code == 304
@@ -14,19 +14,36 @@
 #
 """Utility functions."""
 
+import codecs
 import json
-from typing import Any, AnyStr, Dict, Optional
+import re
+from typing import Any, AnyStr, Dict, Iterable, Iterator, Optional
 
 import click
 
+from common import profiling
+from common import retry
 from common import templates
 
+try:
+  # Optional faster JSON decoder, used when installed.
+  import orjson  # pylint: disable=g-import-not-at-top
+except ImportError:
+  orjson = None
 
+
+@profiling.traced("decode response", profiling.CATEGORY_DECODE)
 def check_content_type(api_response: AnyStr) -> Any:
   """Return JSON based content for the response data.
 
+  The response data is preferably the raw response body (response.content),
+  which is decoded without building an intermediate str. orjson is used to
+  decode it if installed, falling back to the json module for documents
+  orjson rejects, e.g. NaN. Unlike the json module, orjson decodes integers
+  beyond 64 bits as floats; the APIs encode such values as strings.
+
   Args:
-    api_response (AnyStr): API response
+    api_response (AnyStr): API response body as bytes or str.
 
   Returns:
     JSON: Response data.
@@ -34,12 +51,79 @@ def check_content_type(api_response: AnyStr) -> Any:
   Raises:
     TypeError: If response data is not JSON.
   """
+  if orjson:
+    try:
+      return orjson.loads(api_response)
+    except orjson.JSONDecodeError:
+      pass
   try:
     return json.loads(api_response)
-  except json.JSONDecodeError:
+  except (json.JSONDecodeError, UnicodeDecodeError):
     raise TypeError("URL is not reachable.") from None
 
 
+def iter_array_items(chunks: Iterable[bytes], key: str) -> Iterator[Any]:
+  """Decodes the items of an array of a JSON object while it is received.
+
+  Only the array held by the key is decoded, one item at a time, so a list
+  response does not have to be held in memory as a whole. Pass the chunks of
+  a response requested with stream=True, e.g. response.iter_content(). A
+  response without the key yields no items.
+
+  Args:
+    chunks (Iterable[bytes]): Response body in chunks.
+    key (str): Key of the array in the JSON object.
+
+  Yields:
+    Any: Decoded items of the array, in order.
+
+  Raises:
+    TypeError: If response data is not JSON.
+  """
+  chunks = iter(chunks)
+  text_decoder = codecs.getincrementaldecoder("utf-8")()
+  decoder = json.JSONDecoder()
+  array_start = re.compile(re.escape(json.dumps(key)) + r"\s*:\s*\[")
+  separator = re.compile(r"[\s,]*")
+  buffer = ""
+  position = 0
+
+  def read_more() -> bool:
+    nonlocal buffer, position
+    for chunk in chunks:
+      text = text_decoder.decode(chunk)
+      if text:
+        buffer = buffer[position:] + text
+        position = 0
+        return True
+    return False
+
+  match = None
+  while not match:
+    match = array_start.search(buffer)
+    if not match and not read_more():
+      return
+  position = match.end()
+
+  while True:
+    position = separator.match(buffer, position).end()
+    if position == len(buffer):
+      if not read_more():
+        raise TypeError("URL is not reachable.")
+      continue
+    if buffer[position] == "]":
+      return
+    try:
+      item, end = decoder.raw_decode(buffer, position)
+    except json.JSONDecodeError:
+      # The item is only partly received, unless the stream has ended.
+      if not read_more():
+        raise TypeError("URL is not reachable.") from None
+      continue
+    position = end
+    yield item
+
+
 def print_request_details(url: AnyStr, method: AnyStr,
                           request_body: Optional[Dict[str, Any]],
                           response_body: Dict[str, Any]) -> None:
@@ -58,3 +142,6 @@ def print_request_details(url: AnyStr, method: AnyStr,
           request_body=request_body,
           response_body=response_body,
       ))
+  retries = retry.get_retry_count(method, url)
+  if retries:
+    click.echo(templates.retry_details_template.substitute(retries=retries))
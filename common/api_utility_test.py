@@ -14,10 +14,14 @@
 #
 """Unit tests for api_utility.py."""
 
+import json
 from typing import Any
+from unittest import mock
+
 import pytest
 
 from common import api_utility
+from common import retry
 
 
 def test_content_type_is_json() -> None:
@@ -32,6 +36,52 @@ def test_content_type_is_not_json() -> None:
     api_utility.check_content_type('{"key": "value"')
 
 
+def test_content_type_from_bytes() -> None:
+  """Test that the raw response body is decoded."""
+  api_response = '{"key": "välue", "count": 9007199254740993, "nan": NaN}'
+  got = api_utility.check_content_type(api_response.encode("utf-8"))
+  assert got['key'] == 'välue'
+  assert got['count'] == 9007199254740993
+  assert got['nan'] != got['nan']
+
+
+def test_content_type_invalid_bytes() -> None:
+  """Test that a body which is not UTF-8 JSON is not reachable."""
+  with pytest.raises(TypeError, match="URL is not reachable."):
+    api_utility.check_content_type(b'\xff<html>')
+
+
+def test_content_type_without_fast_backend() -> None:
+  """Test decoding with the json module only."""
+  with mock.patch.object(api_utility, 'orjson', None):
+    assert api_utility.check_content_type(b'{"key": "value"}') == {
+        'key': 'value'
+    }
+    with pytest.raises(TypeError, match="URL is not reachable."):
+      api_utility.check_content_type(b'{"key": "value"')
+
+
+def test_iter_array_items() -> None:
+  """Test that array items are decoded from any split of the response."""
+  feeds = [{'name': f'feeds/{i}', 'displayName': 'é' * i} for i in range(20)]
+  body = json.dumps({'feeds': feeds}).encode('utf-8')
+  for chunk_size in (1, 7, len(body)):
+    chunks = (body[start:start + chunk_size]
+              for start in range(0, len(body), chunk_size))
+    assert list(api_utility.iter_array_items(chunks, 'feeds')) == feeds
+
+
+def test_iter_array_items_without_key() -> None:
+  """Test that a response without the array yields no items."""
+  assert not list(api_utility.iter_array_items([b'{}'], 'feeds'))
+
+
+def test_iter_array_items_truncated() -> None:
+  """Test that a truncated response is reported."""
+  with pytest.raises(TypeError, match='URL is not reachable.'):
+    list(api_utility.iter_array_items([b'{"feeds": [{"name": 1}, {'], 'feeds'))
+
+
 def test_print_request_details(capfd: Any) -> None:
   """Test printing request details."""
   api_utility.print_request_details('test.com', 'GET',
@@ -49,3 +99,17 @@ Response:
   Body: {'body': 'test response'}
 
 """
+
+
+def test_print_request_details_with_retries(capfd: Any) -> None:
+  """Test printing request details of a retried request."""
+  retry.record_retries('GET', 'retried.test.com', 2)
+  api_utility.print_request_details('retried.test.com', 'GET', None,
+                                    {'body': 'test response'})
+  console_output, _ = capfd.readouterr()
+  assert console_output.endswith("""Response:
+  Body: {'body': 'test response'}
+
+Retries: 2
+
+""")
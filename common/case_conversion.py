@@ -0,0 +1,113 @@
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Memoized conversions of dictionary keys between naming conventions.
+
+Every key of every record is converted when responses are displayed,
+flattened or turned into request bodies, while the key vocabulary is small.
+Conversions are therefore cached per key, with precompiled patterns, and
+whole key sets of a dictionary can be converted with a single cache lookup.
+"""
+
+import functools
+import re
+from typing import Callable, Iterable, Tuple
+
+# Maximum number of cached conversions per function.
+CACHE_SIZE = 4096
+# Key sets with more keys are converted key by key, as such dictionaries are
+# usually keyed by resource IDs and their key sets do not repeat.
+MAX_CACHED_KEY_SET_SIZE = 64
+
+_WORD_BOUNDARY_PATTERN = re.compile("(.)([A-Z][a-z]+)")
+_CAPITAL_BOUNDARY_PATTERN = re.compile("([a-z0-9])([A-Z])")
+_LOWER_UPPER_BOUNDARY_PATTERN = re.compile("([a-z])([A-Z])")
+
+
+@functools.lru_cache(maxsize=CACHE_SIZE)
+def to_snake_case(key: str) -> str:
+  """Converts a camel case key to snake case.
+
+  Args:
+    key (str): Camel case key. Example - logType
+
+  Returns:
+    str: Snake case key. Example - log_type
+  """
+  key = _WORD_BOUNDARY_PATTERN.sub(r"\1_\2", key)
+  return _CAPITAL_BOUNDARY_PATTERN.sub(r"\1_\2", key).lower()
+
+
+@functools.lru_cache(maxsize=CACHE_SIZE)
+def to_camel_case(key: str) -> str:
+  """Converts a snake case key to camel case.
+
+  Args:
+    key (str): Snake case key. Example - feed_schema
+
+  Returns:
+    str: Camel case key. Example - feedSchema
+  """
+  components = key.split("_")
+  # Capitalize the first letter of each component except the first one
+  # with the 'title' method and join them together.
+  return components[0] + "".join(each.title() for each in components[1:])
+
+
+@functools.lru_cache(maxsize=CACHE_SIZE)
+def to_human_readable(key: str) -> str:
+  """Converts a camel case or snake case key to space separated words.
+
+  Args:
+    key (str): Camel case or snake case key. Example - displayName,
+      commands_utility
+
+  Returns:
+    str: Space separated key. Example - Display name, Commands utility
+  """
+  return _LOWER_UPPER_BOUNDARY_PATTERN.sub(
+      r"\g<1> \g<2>", to_camel_case(key)).capitalize()
+
+
+def convert_keys(keys: Iterable[str],
+                 converter: Callable[[str], str]) -> Tuple[str, ...]:
+  """Converts a set of keys at once.
+
+  Args:
+    keys (Iterable[str]): Keys to be converted, e.g. the keys of a dict.
+    converter (Callable[[str], str]): Conversion of a single key, e.g.
+      to_snake_case.
+
+  Returns:
+    Tuple[str, ...]: Converted keys, in the order of the given keys.
+  """
+  keys = tuple(keys)
+  if len(keys) > MAX_CACHED_KEY_SET_SIZE:
+    return tuple(converter(key) for key in keys)
+  return _convert_key_set(keys, converter)
+
+
+@functools.lru_cache(maxsize=CACHE_SIZE)
+def _convert_key_set(keys: Tuple[str, ...],
+                     converter: Callable[[str], str]) -> Tuple[str, ...]:
+  """Converts a tuple of keys, cached by the whole tuple.
+
+  Args:
+    keys (Tuple[str, ...]): Keys to be converted.
+    converter (Callable[[str], str]): Conversion of a single key.
+
+  Returns:
+    Tuple[str, ...]: Converted keys.
+  """
+  return tuple(converter(key) for key in keys)
@@ -0,0 +1,75 @@
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Unit tests for case_conversion.py."""
+
+import re
+from typing import Callable
+
+import pytest
+
+from common import case_conversion
+
+KEYS = [
+    "", "_", "__", "a", "A", "id", "ID", "name", "displayName", "logType",
+    "feedSourceType", "details.workday_settings.authentication",
+    "HTTPSettings", "httpSettings", "readHeaderTimeout", "maxFileBufferBytes",
+    "rsCredentials", "uploadCompression", "key1Value", "abc123Def",
+    "ABCDef", "already_snake_case", "snake_case_With_Caps", "_leading",
+    "trailing_", "double__underscore", "Collector [1a2b]", "mixed_caseKey",
+    "ünicodeKey", "keyÜber", "dots.and.camelCase", "a_b_c", "x1_y2",
+]
+
+
+def reference_to_snake_case(key: str) -> str:
+  """Conversion to snake case without memoization."""
+  s1 = re.sub("(.)([A-Z][a-z]+)", r"\1_\2", key)
+  return re.sub("([a-z0-9])([A-Z])", r"\1_\2", s1).lower()
+
+
+def reference_to_camel_case(key: str) -> str:
+  """Conversion to camel case without memoization."""
+  components = key.split("_")
+  return components[0] + "".join(each.title() for each in components[1:])
+
+
+def reference_to_human_readable(key: str) -> str:
+  """Conversion to space separated words without memoization."""
+  return re.sub("([a-z])([A-Z])", r"\g<1> \g<2>",
+                reference_to_camel_case(key)).capitalize()
+
+
+@pytest.mark.parametrize("converter,reference", [
+    (case_conversion.to_snake_case, reference_to_snake_case),
+    (case_conversion.to_camel_case, reference_to_camel_case),
+    (case_conversion.to_human_readable, reference_to_human_readable),
+])
+def test_conversions_match_reference(converter: Callable[[str], str],
+                                     reference: Callable[[str], str]) -> None:
+  """Test that memoized conversions are identical to uncached ones."""
+  for _ in range(2):  # Converts once uncached and once from the cache.
+    assert [converter(key) for key in KEYS] == [reference(key) for key in KEYS]
+
+
+def test_convert_keys() -> None:
+  """Test that key sets are converted in order, cached or not."""
+  keys = {"logType": 1, "displayName": 2}
+  assert case_conversion.convert_keys(
+      keys, case_conversion.to_snake_case) == ("log_type", "display_name")
+
+  many_keys = [f"key{index}Name" for index in range(
+      case_conversion.MAX_CACHED_KEY_SET_SIZE + 1)]
+  assert case_conversion.convert_keys(
+      many_keys, case_conversion.to_snake_case) == tuple(
+          reference_to_snake_case(key) for key in many_keys)
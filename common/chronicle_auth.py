@@ -15,16 +15,17 @@
 """Helper functions to access Chronicle APIs using OAuth 2.0."""
 
 import os
-import pathlib
-from typing import AnyStr, Any
+from typing import AnyStr, Any, Sequence
 
-from google.auth.transport import requests
 from google.oauth2 import service_account
 
-CHRONICLE_CLI_ROOT_DIR = os.path.join(
-    str(pathlib.Path.home()), ".chronicle_cli")
-default_cred_file_path = os.path.join(CHRONICLE_CLI_ROOT_DIR,
-                                      "chronicle_credentials.json")
+from common import http_client
+from common import token_cache
+from common.constants import path_constants
+
+CHRONICLE_CLI_ROOT_DIR = path_constants.CHRONICLE_CLI_ROOT_DIR
+default_cred_file_path = path_constants.DEFAULT_CRED_FILE_PATH
+TOKEN_CACHE_DIR = os.path.join(CHRONICLE_CLI_ROOT_DIR, "tokens")
 AUTHORIZATION_SCOPES = ["https://www.googleapis.com/auth/chronicle-backstory"]
 DATAPLANE_AUTHORIZATION_SCOPES = [
     "https://www.googleapis.com/auth/cloud-platform"
@@ -34,6 +35,9 @@ DATAPLANE_AUTHORIZATION_SCOPES = [
 def initialize_http_session(credential_file_path: AnyStr) -> Any:
   """Initializes an authorized HTTP session, based on the given credential.
 
+  Sessions are pooled, so repeated calls with the same credential file return
+  the same session.
+
   Args:
     credential_file_path: Absolute or relative path to a JSON file containing
       private OAuth 2.0 credentials of a Google Cloud Platform service account.
@@ -43,15 +47,17 @@ def initialize_http_session(credential_file_path: AnyStr) -> Any:
   Returns:
     HTTP session object to send authorized requests and receive responses.
   """
-  credentials = service_account.Credentials.from_service_account_file(
-      filename=os.path.abspath(credential_file_path or default_cred_file_path),
-      scopes=AUTHORIZATION_SCOPES)
-  return requests.AuthorizedSession(credentials)
+  return http_client.get_session(
+      os.path.abspath(credential_file_path or default_cred_file_path),
+      AUTHORIZATION_SCOPES, load_credentials)
 
 
 def initialize_dataplane_http_session(credential_file_path: AnyStr) -> Any:
   """Initalizes an authorized HTTP session for Dataplane APIs, based on the given credential.
 
+  Sessions are pooled, so repeated calls with the same credential file return
+  the same session.
+
   Args:
     credential_file_path: Absolute or relative path to a JSON file containing
       private OAuth 2.0 credentials of a Google Cloud Platform service account.
@@ -61,7 +67,25 @@ def initialize_dataplane_http_session(credential_file_path: AnyStr) -> Any:
   Returns:
     HTTP session object to send authorized requests and receive responses.
   """
+  return http_client.get_session(
+      os.path.abspath(credential_file_path or default_cred_file_path),
+      DATAPLANE_AUTHORIZATION_SCOPES, load_credentials)
+
+
+def load_credentials(credential_file_path: str, scopes: Sequence[str]) -> Any:
+  """Loads service account credentials from the given file.
+
+  Access tokens minted for the credentials are cached in TOKEN_CACHE_DIR and
+  reused by later CLI invocations until shortly before they expire.
+
+  Args:
+    credential_file_path (str): Absolute path of the service account JSON.
+    scopes (Sequence[str]): OAuth 2.0 scopes requested for the credentials.
+
+  Returns:
+    Service account credentials.
+  """
   credentials = service_account.Credentials.from_service_account_file(
-      filename=os.path.abspath(credential_file_path or default_cred_file_path),
-      scopes=DATAPLANE_AUTHORIZATION_SCOPES)
-  return requests.AuthorizedSession(credentials)
+      filename=credential_file_path, scopes=scopes)
+  return token_cache.CachedCredentials(credentials, credential_file_path,
+                                       scopes, TOKEN_CACHE_DIR)
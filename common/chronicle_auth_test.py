@@ -14,15 +14,26 @@
 #
 """Unit tests for chronicle_auth.py."""
 
+from typing import Iterator
 from unittest import mock
 
 from google.oauth2 import service_account
+import pytest
 
 from common import chronicle_auth
+from common import http_client
 from feeds.tests.fixtures import create_service_account_file
 from feeds.tests.fixtures import TEMP_SERVICE_ACCOUNT_FILE
 
 
+@pytest.fixture(autouse=True)
+def clear_session_pool() -> Iterator[None]:
+  """Start and finish every test with an empty session pool."""
+  http_client.close_all()
+  yield
+  http_client.close_all()
+
+
 @mock.patch.object(service_account.Credentials, "from_service_account_file")
 def test_initialize_http_session(mock_from_service_account_file):
   """Test to check if http session is initialize or not.
@@ -79,3 +90,34 @@ def test_initialize_chronicle_http_session_with_custom_json_credentials(
   mock_from_service_account_file.assert_called_once_with(
       filename=TEMP_SERVICE_ACCOUNT_FILE,
       scopes=chronicle_auth.DATAPLANE_AUTHORIZATION_SCOPES)
+
+
+@mock.patch.object(service_account.Credentials, "from_service_account_file")
+def test_initialize_http_session_reuses_pooled_session(
+    mock_from_service_account_file):
+  """Test that repeated calls return the same session and credentials.
+
+  Args:
+    mock_from_service_account_file (mock.MagicMock): Mock object
+  """
+  create_service_account_file()
+  first = chronicle_auth.initialize_http_session(TEMP_SERVICE_ACCOUNT_FILE)
+  second = chronicle_auth.initialize_http_session(TEMP_SERVICE_ACCOUNT_FILE)
+  assert first is second
+  mock_from_service_account_file.assert_called_once()
+
+
+@mock.patch.object(service_account.Credentials, "from_service_account_file")
+def test_initialize_http_session_separates_scopes(
+    mock_from_service_account_file):
+  """Test that Backstory and Dataplane scopes get separate sessions.
+
+  Args:
+    mock_from_service_account_file (mock.MagicMock): Mock object
+  """
+  create_service_account_file()
+  backstory = chronicle_auth.initialize_http_session(TEMP_SERVICE_ACCOUNT_FILE)
+  dataplane = chronicle_auth.initialize_dataplane_http_session(
+      TEMP_SERVICE_ACCOUNT_FILE)
+  assert backstory is not dataplane
+  assert mock_from_service_account_file.call_count == 2
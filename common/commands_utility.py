@@ -15,11 +15,12 @@
 """Utility functions."""
 
 import collections
-import re
 from typing import Any, AnyStr, Dict
 
 import yaml
 
+from common import case_conversion
+from common import profiling
 from forwarders.constants.schema import SENSITIVE_FIELDS
 
 
@@ -35,6 +36,7 @@ def lower_or_none(input_str: AnyStr) -> Any:
   return input_str.lower() if input_str else None
 
 
+@profiling.traced("yaml dump", profiling.CATEGORY_RENDER)
 def convert_dict_to_yaml(input_dict: Dict[AnyStr, Any]) -> Any:
   """Converts JSON dictionary to YAML format.
 
@@ -47,25 +49,9 @@ def convert_dict_to_yaml(input_dict: Dict[AnyStr, Any]) -> Any:
   return yaml.dump(input_dict, Dumper=yaml.Dumper, sort_keys=False)
 
 
-def space_separated_str(input_str: AnyStr) -> AnyStr:
-  """Converts a string separated by spaces.
-
-  Args:
-    input_str (AnyStr): Input string in camel case or snake case. Example -
-      displayName, commands_utility
-
-  Returns:
-    AnyStr: Space separated string. Example - Display name, Commands
-    utility
-  """
-  # Handle input string in snake case.
-  components = input_str.split("_")
-  # Capitalize the first letter of each component except the first one
-  # with the 'title' method and join them together.
-  camel_case_str = components[0] + "".join(
-      each.title() for each in components[1:])
-
-  return re.sub("([a-z])([A-Z])", r"\g<1> \g<2>", camel_case_str).capitalize()
+# Key conversions are memoized, see common/case_conversion.py.
+space_separated_str = case_conversion.to_human_readable
+convert_to_snakecase = case_conversion.to_snake_case
 
 
 def convert_dict_keys_to_human_readable(
@@ -81,27 +67,15 @@ def convert_dict_keys_to_human_readable(
     {"Regex filters":{"Description":"any description"}}
   """
   res = dict()
-  for k, v in input_dict.items():
+  readable_keys = case_conversion.convert_keys(input_dict, space_separated_str)
+  for readable_key, v in zip(readable_keys, input_dict.values()):
     if isinstance(v, dict):
-      res[space_separated_str(k)] = convert_dict_keys_to_human_readable(v)
+      res[readable_key] = convert_dict_keys_to_human_readable(v)
     else:
-      res[space_separated_str(k)] = v
+      res[readable_key] = v
   return res
 
 
-def convert_to_snakecase(key: AnyStr) -> AnyStr:
-  """Converts camelcase key name to snakecase key name.
-
-  Args:
-    key (AnyStr): Camelcase key name.
-
-  Returns:
-    AnyStr: Snakecase key name.
-  """
-  s1 = re.sub("(.)([A-Z][a-z]+)", r"\1_\2", key)
-  return re.sub("([a-z0-9])([A-Z])", r"\1_\2", s1).lower()
-
-
 def unpack(data: Any) -> Any:
   """Unpack value from dictionary.
 
@@ -125,7 +99,10 @@ def convert_dict_keys_to_snake_case(content: Any) -> Dict[AnyStr, Any]:
   Returns:
     Dict[AnyStr, Any]: Dictionary with snake case keys.
   """
-  return {convert_to_snakecase(key): value for key, value in content.items()}
+  return dict(
+      zip(
+          case_conversion.convert_keys(content, convert_to_snakecase),
+          content.values()))
 
 
 def convert_nested_dict_keys_to_snake_case(data: Any) -> Dict[str, Any]:
@@ -0,0 +1,24 @@
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Path constants to be used across the project."""
+import os
+import pathlib
+
+CHRONICLE_CLI_ROOT_DIR = os.path.join(
+    str(pathlib.Path.home()), ".chronicle_cli")
+DEFAULT_CRED_FILE_PATH = os.path.join(CHRONICLE_CLI_ROOT_DIR,
+                                      "chronicle_credentials.json")
+INVENTORY_DB_PATH = os.path.join(CHRONICLE_CLI_ROOT_DIR, "inventory.db")
+SHELL_HISTORY_PATH = os.path.join(CHRONICLE_CLI_ROOT_DIR, "shell_history")
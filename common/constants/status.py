@@ -18,3 +18,4 @@ import http
 STATUS_OK = http.HTTPStatus.OK.value
 STATUS_BAD_REQUEST = http.HTTPStatus.BAD_REQUEST.value
 STATUS_NOT_FOUND = http.HTTPStatus.NOT_FOUND.value
+STATUS_NOT_MODIFIED = http.HTTPStatus.NOT_MODIFIED.value
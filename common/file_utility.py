@@ -16,10 +16,11 @@
 import csv
 import json
 import os
-from typing import Any, AnyStr, Dict, List
+from typing import Any, AnyStr, Dict, Iterable, List, Optional
 
 FILE_FORMAT_CSV = "CSV"
 FILE_FORMAT_JSON = "JSON"
+FILE_FORMAT_NDJSON = "NDJSON"
 FILE_FORMAT_TXT = "TXT"
 
 
@@ -66,10 +67,8 @@ def export_csv(export_path: AnyStr, column_headers: List[str],
     column_headers (List[str]): List of all column name.
     rows (List[List[str]]): Array with row values.
   """
-  with open(export_path, "w") as file:
-    file_writer = csv.writer(file, delimiter=",")
-    file_writer.writerow(column_headers)
-    file_writer.writerows(rows)
+  with CsvWriter(export_path, column_headers) as writer:
+    writer.write_rows(rows)
 
 
 def export_txt(file_path: AnyStr, data: str) -> None:
@@ -81,3 +80,142 @@ def export_txt(file_path: AnyStr, data: str) -> None:
   """
   with open(file_path, "w") as file:
     file.write(data)
+
+
+class FileWriter:
+  """Base class of writers which export data to a file incrementally.
+
+  The file is created when the writer is created and closed by close() or
+  when leaving the with statement, so data can be written as it is produced
+  instead of being collected in memory first.
+  """
+
+  def __init__(self, file_path: AnyStr) -> None:
+    """Creates the file.
+
+    Args:
+      file_path (AnyStr): Path of file to export output of command.
+    """
+    self.file_path = file_path
+    self.count = 0
+    self._file = open(file_path, "w")
+
+  def __enter__(self) -> "FileWriter":
+    return self
+
+  def __exit__(self, *args: Any) -> None:
+    self.close()
+
+  def close(self) -> None:
+    """Finishes and closes the file."""
+    self._file.close()
+
+
+class TxtWriter(FileWriter):
+  """Writes text to a file."""
+
+  def write(self, data: str) -> None:
+    """Appends text to the file.
+
+    Args:
+      data (str): Text data.
+    """
+    self._file.write(data)
+    self.count += 1
+
+
+class CsvWriter(FileWriter):
+  """Writes rows to a CSV file."""
+
+  def __init__(self, export_path: AnyStr, column_headers: List[str]) -> None:
+    """Creates the file and writes the column headers.
+
+    Args:
+      export_path (AnyStr): Path of file to export output of list command.
+      column_headers (List[str]): List of all column name.
+    """
+    super().__init__(export_path)
+    self._writer = csv.writer(self._file, delimiter=",")
+    self._writer.writerow(column_headers)
+
+  def write(self, row: List[Any]) -> None:
+    """Appends a row to the file.
+
+    Args:
+      row (List[Any]): Row values.
+    """
+    self._writer.writerow(row)
+    self.count += 1
+
+  def write_rows(self, rows: Iterable[List[Any]]) -> None:
+    """Appends rows to the file.
+
+    Args:
+      rows (Iterable[List[Any]]): Rows with row values.
+    """
+    for row in rows:
+      self.write(row)
+
+
+class JsonArrayWriter(FileWriter):
+  """Writes items of a JSON array to a file.
+
+  The file content is identical to export_json() called with the complete
+  list, or with {key: list} if a key is given.
+  """
+
+  def __init__(self, file_path: AnyStr, key: Optional[str] = None) -> None:
+    """Creates the file.
+
+    Args:
+      file_path (AnyStr): Path of file to export output of command.
+      key (str): Key of the array in the top level JSON object. The array is
+        the top level value if None.
+    """
+    super().__init__(file_path)
+    self._key = key
+    self._indent = "\n  " if key is None else "\n    "
+
+  def write(self, item: Any) -> None:
+    """Appends an item to the array.
+
+    Args:
+      item (Any): JSON serializable item.
+    """
+    if not self.count:
+      if self._key is not None:
+        self._file.write(f"{{\n  {json.dumps(self._key)}: ")
+      self._file.write("[")
+    else:
+      self._file.write(",")
+    self._file.write(self._indent)
+    self._file.write(
+        json.dumps(item, indent=2).replace("\n", self._indent))
+    self.count += 1
+
+  def close(self) -> None:
+    """Closes the array and the file."""
+    if self._file.closed:
+      return
+    if not self.count:
+      opening = "" if self._key is None else f"{{\n  {json.dumps(self._key)}: "
+      self._file.write(f"{opening}[]")
+    else:
+      self._file.write(self._indent[:-2] + "]")
+    if self._key is not None:
+      self._file.write("\n}")
+    super().close()
+
+
+class NdjsonWriter(FileWriter):
+  """Writes items to a newline delimited JSON file, one item per line."""
+
+  def write(self, item: Any) -> None:
+    """Appends an item to the file.
+
+    Args:
+      item (Any): JSON serializable item.
+    """
+    self._file.write(json.dumps(item))
+    self._file.write("\n")
+    self.count += 1
@@ -0,0 +1,68 @@
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Unit tests for file_utility.py."""
+
+import csv
+import json
+from typing import Any
+
+import pytest
+
+from common import file_utility
+
+ITEMS = [{"name": "feeds/1", "details": {"labels": [{"key": "k"}]}}, [1, 2], 3]
+
+
+@pytest.mark.parametrize("key", [None, "feeds"])
+@pytest.mark.parametrize("items", [ITEMS, ITEMS[:1], []])
+def test_json_array_writer_matches_export_json(tmp_path: Any, key: Any,
+                                               items: Any) -> None:
+  """Test that streamed JSON is identical to JSON exported at once."""
+  streamed_path = str(tmp_path / "streamed.json")
+  exported_path = str(tmp_path / "exported.json")
+  with file_utility.JsonArrayWriter(streamed_path, key) as writer:
+    for item in items:
+      writer.write(item)
+  file_utility.export_json(exported_path,
+                           items if key is None else {key: items})
+
+  assert writer.count == len(items)
+  assert file_utility.read_file(streamed_path) == file_utility.read_file(
+      exported_path)
+
+
+def test_ndjson_writer(tmp_path: Any) -> None:
+  """Test that every item is written to a line of its own."""
+  path = str(tmp_path / "export.ndjson")
+  with file_utility.NdjsonWriter(path) as writer:
+    for item in ITEMS:
+      writer.write(item)
+
+  with open(path) as file:
+    lines = file.read().splitlines()
+  assert [json.loads(line) for line in lines] == ITEMS
+
+
+def test_csv_writer(tmp_path: Any) -> None:
+  """Test that rows are written after the column headers."""
+  path = str(tmp_path / "export.csv")
+  with file_utility.CsvWriter(path, ["Name", "Value"]) as writer:
+    writer.write(["a", "1"])
+    writer.write_rows([["b", "2"], ["c, d", "3"]])
+
+  with open(path) as file:
+    rows = list(csv.reader(file))
+  assert rows == [["Name", "Value"], ["a", "1"], ["b", "2"], ["c, d", "3"]]
+  assert writer.count == 3
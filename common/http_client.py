@@ -0,0 +1,124 @@
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Process-wide pool of authorized HTTP sessions."""
+
+import threading
+from typing import Any, AnyStr, Callable, Dict, Optional, Sequence, Tuple
+
+from common import retry
+
+DEFAULT_POOL_SIZE = 10
+DEFAULT_KEEP_ALIVE = True
+
+_pool_size = DEFAULT_POOL_SIZE
+_keep_alive = DEFAULT_KEEP_ALIVE
+_max_retries = retry.DEFAULT_MAX_RETRIES
+_rate_limit = retry.DEFAULT_RATE_LIMIT
+_sessions: Dict[Tuple[str, Tuple[str, ...]], Any] = {}
+_lock = threading.Lock()
+
+
+def configure(pool_size: Optional[int] = None,
+              keep_alive: Optional[bool] = None,
+              max_retries: Optional[int] = None,
+              rate_limit: Optional[float] = None) -> None:
+  """Configures sessions created after this call.
+
+  Args:
+    pool_size (int): Maximum number of connections kept open per host.
+    keep_alive (bool): Whether connections are reused between requests.
+    max_retries (int): Maximum number of times a failed request is retried.
+    rate_limit (float): Requests per second allowed per host. 0 disables rate
+      limiting.
+  """
+  global _pool_size, _keep_alive, _max_retries, _rate_limit
+  if pool_size is not None:
+    if pool_size < 1:
+      raise ValueError("Connection pool size must be at least 1.")
+    _pool_size = pool_size
+  if keep_alive is not None:
+    _keep_alive = keep_alive
+  if max_retries is not None:
+    if max_retries < 0:
+      raise ValueError("Maximum number of retries must not be negative.")
+    _max_retries = max_retries
+  if rate_limit is not None:
+    if rate_limit < 0:
+      raise ValueError("Rate limit must not be negative.")
+    _rate_limit = rate_limit
+
+
+def get_pool_size() -> int:
+  """Returns the maximum number of connections kept open per host."""
+  return _pool_size
+
+
+def get_session(credential_file_path: AnyStr, scopes: Sequence[str],
+                load_credentials: Callable[[str, Sequence[str]], Any]) -> Any:
+  """Returns the shared session for the given credential file and scopes.
+
+  The session, and the credentials loaded for it, are created on first use
+  and reused by every later call with the same credential file and scopes.
+
+  Args:
+    credential_file_path (AnyStr): Absolute path of the service account JSON.
+    scopes (Sequence[str]): OAuth 2.0 scopes requested for the session.
+    load_credentials (Callable): Function returning the credentials for the
+      given credential file path and scopes.
+
+  Returns:
+    HTTP session object to send authorized requests and receive responses.
+  """
+  key = (credential_file_path, tuple(sorted(scopes)))
+  with _lock:
+    session = _sessions.get(key)
+    if session is None:
+      session = _create_session(load_credentials(credential_file_path, scopes))
+      _sessions[key] = session
+  return session
+
+
+def close_all() -> None:
+  """Closes and forgets every pooled session."""
+  with _lock:
+    for session in _sessions.values():
+      session.close()
+    _sessions.clear()
+
+
+def _create_session(credentials: Any) -> Any:
+  """Creates an authorized session with the configured pooling and retries.
+
+  Args:
+    credentials (Any): Credentials used to authorize requests.
+
+  Returns:
+    HTTP session object to send authorized requests and receive responses.
+  """
+  # The HTTP libraries are imported on first use rather than at module load,
+  # which keeps them off the start-up path of commands like --help.
+  from requests import adapters  # pylint: disable=g-import-not-at-top
+
+  from common import retrying_session  # pylint: disable=g-import-not-at-top
+
+  session = retrying_session.RetryingSession(
+      credentials, max_retries=_max_retries, rate_limit=_rate_limit)
+  adapter = adapters.HTTPAdapter(
+      pool_connections=_pool_size, pool_maxsize=_pool_size)
+  session.mount("https://", adapter)
+  session.mount("http://", adapter)
+  if not _keep_alive:
+    session.headers["Connection"] = "close"
+  return session
@@ -0,0 +1,110 @@
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Unit tests for http_client.py."""
+
+from typing import Iterator
+from unittest import mock
+
+import pytest
+
+from common import http_client
+from common import options
+from common import retry
+
+
+@pytest.fixture(autouse=True)
+def reset_pool() -> Iterator[None]:
+  """Restore the default pool configuration around every test."""
+  http_client.close_all()
+  yield
+  http_client.close_all()
+  http_client.configure(http_client.DEFAULT_POOL_SIZE,
+                        http_client.DEFAULT_KEEP_ALIVE,
+                        retry.DEFAULT_MAX_RETRIES, retry.DEFAULT_RATE_LIMIT)
+
+
+def test_get_session_is_reused() -> None:
+  """Test that a session is created once per credential file and scopes."""
+  loader = mock.MagicMock()
+  first = http_client.get_session("/tmp/creds.json", ["b", "a"], loader)
+  second = http_client.get_session("/tmp/creds.json", ["a", "b"], loader)
+  assert first is second
+  loader.assert_called_once_with("/tmp/creds.json", ["b", "a"])
+
+
+def test_get_session_per_credential_file() -> None:
+  """Test that different credential files get different sessions."""
+  loader = mock.MagicMock()
+  first = http_client.get_session("/tmp/one.json", ["a"], loader)
+  second = http_client.get_session("/tmp/two.json", ["a"], loader)
+  assert first is not second
+
+
+def test_configure_pool_size() -> None:
+  """Test that the configured pool size is applied to the adapters."""
+  http_client.configure(pool_size=3)
+  session = http_client.get_session("/tmp/creds.json", ["a"],
+                                    mock.MagicMock())
+  adapter = session.get_adapter("https://backstory.googleapis.com")
+  assert adapter._pool_maxsize == 3  # pylint: disable=protected-access
+  assert session.headers.get("Connection") != "close"
+
+
+def test_default_concurrency_bounded_by_pool_size() -> None:
+  """Test that the default concurrency never exceeds the pool size."""
+  assert options.get_default_concurrency() == options.DEFAULT_CONCURRENCY
+  http_client.configure(pool_size=2)
+  assert http_client.get_pool_size() == 2
+  assert options.get_default_concurrency() == 2
+
+
+def test_configure_keep_alive_disabled() -> None:
+  """Test that disabling keep-alive closes connections after each request."""
+  http_client.configure(keep_alive=False)
+  session = http_client.get_session("/tmp/creds.json", ["a"],
+                                    mock.MagicMock())
+  assert session.headers["Connection"] == "close"
+
+
+def test_configure_invalid_pool_size() -> None:
+  """Test that a pool size below one is rejected."""
+  with pytest.raises(ValueError, match="at least 1"):
+    http_client.configure(pool_size=0)
+
+
+def test_configure_retries() -> None:
+  """Test that retry settings are applied to new sessions."""
+  http_client.configure(max_retries=0, rate_limit=2.5)
+  session = http_client.get_session("/tmp/creds.json", ["a"],
+                                    mock.MagicMock())
+  assert session.max_retries == 0
+  assert session.rate_limit == 2.5
+
+
+def test_configure_invalid_retries() -> None:
+  """Test that negative retry settings are rejected."""
+  with pytest.raises(ValueError, match="retries"):
+    http_client.configure(max_retries=-1)
+  with pytest.raises(ValueError, match="Rate limit"):
+    http_client.configure(rate_limit=-1)
+
+
+def test_close_all() -> None:
+  """Test that closing the pool creates fresh sessions afterwards."""
+  loader = mock.MagicMock()
+  first = http_client.get_session("/tmp/creds.json", ["a"], loader)
+  http_client.close_all()
+  second = http_client.get_session("/tmp/creds.json", ["a"], loader)
+  assert first is not second
@@ -0,0 +1,93 @@
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Click group which imports its subcommands only when they are resolved."""
+
+import importlib
+from typing import Any, Dict, List, Optional
+
+import click
+
+
+class LazyGroup(click.Group):
+  """Click group with lazily imported subcommands.
+
+  Subcommands are given as a mapping of command name to the import path of
+  the command object, e.g. {"get": "feeds.commands.get.get"}. The module of a
+  subcommand is imported only when that subcommand is resolved, so running a
+  single command does not import every other command module.
+  """
+
+  def __init__(self,
+               *args: Any,
+               lazy_subcommands: Optional[Dict[str, str]] = None,
+               **kwargs: Any) -> None:
+    """Initializes the group.
+
+    Args:
+      *args: Positional arguments of click.Group.
+      lazy_subcommands (Dict[str, str]): Mapping of command name to import path
+        of the command object.
+      **kwargs: Keyword arguments of click.Group.
+    """
+    super().__init__(*args, **kwargs)
+    self.lazy_subcommands = lazy_subcommands or {}
+
+  def list_commands(self, ctx: click.Context) -> List[str]:
+    """Returns names of the eagerly added and lazy subcommands.
+
+    Args:
+      ctx (click.Context): Click context.
+
+    Returns:
+      List[str]: Sorted subcommand names.
+    """
+    return sorted(super().list_commands(ctx) + list(self.lazy_subcommands))
+
+  def get_command(self, ctx: click.Context,
+                  cmd_name: str) -> Optional[click.Command]:
+    """Returns the subcommand, importing its module if it is lazy.
+
+    Args:
+      ctx (click.Context): Click context.
+      cmd_name (str): Name of the subcommand.
+
+    Returns:
+      click.Command: Subcommand, or None if there is no such subcommand.
+    """
+    if cmd_name in self.lazy_subcommands:
+      return self._lazy_load(cmd_name)
+    return super().get_command(ctx, cmd_name)
+
+  def _lazy_load(self, cmd_name: str) -> click.Command:
+    """Imports and returns a lazy subcommand.
+
+    Args:
+      cmd_name (str): Name of the subcommand.
+
+    Returns:
+      click.Command: Subcommand.
+
+    Raises:
+      ValueError: If the import path does not point to a click command.
+    """
+    import_path = self.lazy_subcommands[cmd_name]
+    module_name, cmd_object_name = import_path.rsplit(".", 1)
+    module = importlib.import_module(module_name)
+    cmd_object = getattr(module, cmd_object_name)
+    if not isinstance(cmd_object, click.Command):
+      raise ValueError(
+          f"Lazy loading of {import_path} failed by returning a non-command "
+          "object.")
+    return cmd_object
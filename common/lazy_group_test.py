@@ -0,0 +1,57 @@
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Unit tests for lazy_group.py."""
+
+import sys
+
+import click
+from click.testing import CliRunner
+import pytest
+
+from common import lazy_group
+
+runner = CliRunner()
+
+
+@click.group(
+    cls=lazy_group.LazyGroup,
+    lazy_subcommands={
+        "get": "feeds.commands.get.get",
+        "invalid": "common.lazy_group.LazyGroup",
+    })
+def group() -> None:
+  """Test group."""
+
+
+def test_list_commands() -> None:
+  """Test that lazy subcommands are listed."""
+  assert group.list_commands(click.Context(group)) == ["get", "invalid"]
+
+
+def test_get_command_imports_module() -> None:
+  """Test that resolving a lazy subcommand returns the command object."""
+  command = group.get_command(click.Context(group), "get")
+  assert command is sys.modules["feeds.commands.get"].get
+
+
+def test_get_command_unknown() -> None:
+  """Test that an unknown subcommand resolves to None."""
+  assert group.get_command(click.Context(group), "unknown") is None
+
+
+def test_get_command_non_command_object() -> None:
+  """Test that an import path to a non-command object is rejected."""
+  with pytest.raises(ValueError, match="non-command object"):
+    group.get_command(click.Context(group), "invalid")
@@ -0,0 +1,296 @@
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Per-invocation metrics of API calls in the OpenMetrics text format.
+
+While collection is enabled, every HTTP attempt sent through the shared
+session is counted by method, endpoint and status, together with retries,
+bytes sent and received and a latency histogram per endpoint. Endpoints are
+URL templates, e.g. https://backstory.googleapis.com/v1/feeds/{id}, so the
+number of series does not grow with the number of resources. The output can
+be read by the Prometheus node exporter textfile collector.
+"""
+
+import collections
+import os
+import sys
+import tempfile
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from common import profiling
+
+try:
+  import resource  # pylint: disable=g-import-not-at-top
+except ImportError:  # Windows
+  resource = None
+
+METRIC_PREFIX = "chronicle_cli"
+# Upper bounds of the request latency histogram buckets in seconds.
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+STATUS_ERROR = "error"
+
+_collector: Optional["Collector"] = None
+
+
+class Collector:
+  """Thread-safe accumulator of the metrics of one invocation."""
+
+  def __init__(self) -> None:
+    """Initializes empty metrics."""
+    self._start = time.perf_counter()
+    self._lock = threading.Lock()
+    # Keyed by (method, endpoint, status).
+    self._requests: Dict[Tuple[str, str, str], int] = collections.Counter()
+    # Keyed by (method, endpoint).
+    self._retries: Dict[Tuple[str, str], int] = collections.Counter()
+    self._sent_bytes: Dict[Tuple[str, str], int] = collections.Counter()
+    self._received_bytes: Dict[Tuple[str, str], int] = collections.Counter()
+    self._latency_buckets: Dict[Tuple[str, str], List[int]] = {}
+    self._latency_sums: Dict[Tuple[str, str], float] = collections.Counter()
+    self._latency_counts: Dict[Tuple[str, str], int] = collections.Counter()
+
+  def add_request(self, method: str, endpoint: str, status: str,
+                  attempt: int, sent_bytes: int, received_bytes: int,
+                  latency: float) -> None:
+    """Records an HTTP attempt.
+
+    Args:
+      method (str): Request method.
+      endpoint (str): URL template of the request.
+      status (str): Response status code, or STATUS_ERROR.
+      attempt (int): Number of the attempt, 0 for the first one.
+      sent_bytes (int): Size of the request body.
+      received_bytes (int): Size of the response body.
+      latency (float): Seconds until the response was received.
+    """
+    key = (method, endpoint)
+    with self._lock:
+      self._requests[(method, endpoint, status)] += 1
+      if attempt:
+        self._retries[key] += 1
+      self._sent_bytes[key] += sent_bytes
+      self._received_bytes[key] += received_bytes
+      buckets = self._latency_buckets.setdefault(key,
+                                                 [0] * len(LATENCY_BUCKETS))
+      for index, upper_bound in enumerate(LATENCY_BUCKETS):
+        if latency <= upper_bound:
+          buckets[index] += 1
+      self._latency_sums[key] += latency
+      self._latency_counts[key] += 1
+
+  def render(self) -> str:
+    """Returns the metrics in the OpenMetrics text format.
+
+    Returns:
+      str: Metrics exposition ending with the "# EOF" marker.
+    """
+    with self._lock:
+      lines = []
+      _add_family(lines, "requests", "counter",
+                  "HTTP requests sent, including retries.", [
+                      ("_total", _labels(method, endpoint, status=status),
+                       count)
+                      for (method, endpoint,
+                           status), count in sorted(self._requests.items())
+                  ])
+      _add_family(lines, "retries", "counter",
+                  "HTTP requests sent again after a failed attempt.",
+                  _get_samples(self._retries))
+      _add_family(lines, "sent_bytes", "counter",
+                  "Bytes of request bodies sent.",
+                  _get_samples(self._sent_bytes))
+      _add_family(lines, "received_bytes", "counter",
+                  "Bytes of response bodies received.",
+                  _get_samples(self._received_bytes))
+      histogram_samples = []
+      for key, buckets in sorted(self._latency_buckets.items()):
+        count = self._latency_counts[key]
+        for upper_bound, bucket_count in zip(LATENCY_BUCKETS, buckets):
+          histogram_samples.append(
+              ("_bucket", _labels(*key, le=repr(upper_bound)), bucket_count))
+        histogram_samples.append(("_bucket", _labels(*key, le="+Inf"), count))
+        histogram_samples.append(("_sum", _labels(*key),
+                                  self._latency_sums[key]))
+        histogram_samples.append(("_count", _labels(*key), count))
+      _add_family(lines, "request_duration_seconds", "histogram",
+                  "Latency of HTTP requests.", histogram_samples)
+    _add_family(lines, "duration_seconds", "gauge",
+                "Wall time of the invocation.",
+                [("", "", time.perf_counter() - self._start)])
+    peak_rss = get_peak_rss()
+    if peak_rss is not None:
+      _add_family(lines, "peak_rss_bytes", "gauge",
+                  "Peak resident set size of the process.",
+                  [("", "", peak_rss)])
+    lines.append("# EOF")
+    return "\n".join(lines) + "\n"
+
+
+def start() -> None:
+  """Enables collection of metrics for the rest of the process."""
+  global _collector
+  _collector = Collector()
+
+
+def stop(path: str) -> Optional[str]:
+  """Disables collection and writes the metrics to a file.
+
+  The file is replaced atomically, so a textfile collector reading it never
+  sees a partial exposition. Missing parent directories are created.
+
+  Args:
+    path (str): Path of the metrics file.
+
+  Returns:
+    str: Absolute path of the metrics file, None if collection was not
+    enabled.
+
+  Raises:
+    OSError: Failed to write the metrics file.
+  """
+  global _collector
+  collector, _collector = _collector, None
+  if collector is None:
+    return None
+  path = os.path.abspath(path)
+  os.makedirs(os.path.dirname(path), exist_ok=True)
+  fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+  try:
+    with os.fdopen(fd, "w") as file:
+      file.write(collector.render())
+    # mkstemp creates the file readable only by its owner.
+    os.chmod(temp_path, 0o644)
+    os.replace(temp_path, path)
+  except OSError:
+    if os.path.exists(temp_path):
+      os.remove(temp_path)
+    raise
+  return path
+
+
+def is_enabled() -> bool:
+  """Returns whether metrics are collected."""
+  return _collector is not None
+
+
+def record_request(method: str,
+                   url: str,
+                   start_time: float,
+                   attempt: int,
+                   response: Any = None,
+                   request: Any = None) -> None:
+  """Records an HTTP attempt if collection is enabled.
+
+  Args:
+    method (str): Request method.
+    url (str): Request URL.
+    start_time (float): time.perf_counter() when the request was sent.
+    attempt (int): Number of the attempt, 0 for the first one.
+    response (Any): Response received, None if the request failed.
+    request (Any): Prepared request sent, used when there is no response.
+  """
+  collector = _collector
+  if collector is None:
+    return
+  latency = time.perf_counter() - start_time
+  if response is not None:
+    request = response.request
+    status = str(response.status_code)
+    received_bytes = profiling.get_response_size(response)
+  else:
+    status = STATUS_ERROR
+    received_bytes = 0
+  sent_bytes = 0
+  if request is not None:
+    sent_bytes = int(request.headers.get("Content-Length", 0))
+  collector.add_request(method.upper(), profiling.get_url_template(url),
+                        status, attempt, sent_bytes, received_bytes, latency)
+
+
+def get_peak_rss() -> Optional[int]:
+  """Returns the peak resident set size of the process in bytes.
+
+  Returns:
+    int: Peak RSS, None where the platform does not report it.
+  """
+  if resource is None:
+    return None
+  peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+  # Linux reports kilobytes, macOS reports bytes.
+  if sys.platform != "darwin":
+    peak_rss *= 1024
+  return peak_rss
+
+
+def _labels(method: str, endpoint: str, **labels: str) -> str:
+  """Returns the label set of a sample.
+
+  Args:
+    method (str): Request method.
+    endpoint (str): URL template of the request.
+    **labels: Additional labels.
+
+  Returns:
+    str: Label set in braces.
+  """
+  pairs = {"method": method, "endpoint": endpoint, **labels}
+  return "{" + ",".join(
+      f'{name}="{_escape(value)}"' for name, value in pairs.items()) + "}"
+
+
+def _escape(value: str) -> str:
+  """Escapes a label value.
+
+  Args:
+    value (str): Label value.
+
+  Returns:
+    str: Escaped label value.
+  """
+  return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _get_samples(
+    counts: Dict[Tuple[str, str], int]) -> List[Tuple[str, str, Any]]:
+  """Returns the samples of a counter keyed by method and endpoint.
+
+  Args:
+    counts (Dict[Tuple[str, str], int]): Counts by method and endpoint.
+
+  Returns:
+    List[Tuple[str, str, Any]]: Suffix, label set and value of every sample.
+  """
+  return [("_total", _labels(*key), count)
+          for key, count in sorted(counts.items())]
+
+
+def _add_family(lines: List[str], name: str, metric_type: str, help_text: str,
+                samples: List[Tuple[str, str, Any]]) -> None:
+  """Appends a metric family to the exposition.
+
+  Args:
+    lines (List[str]): Lines of the exposition.
+    name (str): Name of the metric without prefix.
+    metric_type (str): OpenMetrics type, e.g. "counter".
+    help_text (str): Description of the metric.
+    samples (List[Tuple[str, str, Any]]): Suffix, label set and value of
+      every sample.
+  """
+  full_name = f"{METRIC_PREFIX}_{name}"
+  lines.append(f"# TYPE {full_name} {metric_type}")
+  lines.append(f"# HELP {full_name} {help_text}")
+  for suffix, labels, value in samples:
+    lines.append(f"{full_name}{suffix}{labels} {value}")
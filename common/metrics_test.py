@@ -0,0 +1,114 @@
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Unit tests for metrics.py."""
+
+import os
+from typing import Any, Dict
+from unittest import mock
+
+import pytest
+
+from common import metrics
+
+URL = "https://backstory.googleapis.com/v1/feeds/123"
+ENDPOINT = "https://backstory.googleapis.com/v1/feeds/{id}"
+LABELS = f'{{method="GET",endpoint="{ENDPOINT}"}}'
+
+
+def make_response(status_code: int, content: bytes,
+                  headers: Dict[str, str]) -> mock.MagicMock:
+  """Returns a mock response with the given request headers."""
+  response = mock.MagicMock(status_code=status_code, content=content)
+  response.request.headers = headers
+  return response
+
+
+def parse(path: str) -> Dict[str, float]:
+  """Returns the samples of a metrics file keyed by name and labels."""
+  with open(path) as file:
+    lines = file.read().splitlines()
+  assert lines[-1] == "# EOF"
+  samples = {}
+  for line in lines:
+    if not line.startswith("#"):
+      name, value = line.rsplit(" ", 1)
+      samples[name] = float(value)
+  return samples
+
+
+@pytest.fixture(name="metrics_path")
+def fixture_metrics_path(tmp_path: Any) -> Any:
+  yield os.path.join(tmp_path, "cli.prom")
+  metrics.stop(os.path.join(tmp_path, "unused.prom"))
+
+
+def test_disabled(metrics_path: str) -> None:
+  """Test that nothing is recorded or written while disabled."""
+  assert not metrics.is_enabled()
+  metrics.record_request("GET", URL, 0.0, 0)
+  assert metrics.stop(metrics_path) is None
+  assert not os.path.exists(metrics_path)
+
+
+def test_metrics_directory_created(tmp_path: Any) -> None:
+  """Test that missing directories of the metrics file are created."""
+  metrics_path = os.path.join(tmp_path, "metrics", "cli.prom")
+  metrics.start()
+  assert metrics.stop(metrics_path) == metrics_path
+  assert parse(metrics_path)
+
+
+@mock.patch.object(metrics.time, "perf_counter")
+def test_metrics_written(mock_perf_counter: mock.MagicMock,
+                         metrics_path: str) -> None:
+  """Test that requests, retries, bytes and latencies are written on stop."""
+  mock_perf_counter.side_effect = [0.0, 0.3, 0.6, 2.0, 5.0]
+  metrics.start()
+  metrics.record_request(
+      "get", URL, 0.0, 0, response=make_response(503, b"", {}))
+  metrics.record_request(
+      "GET", URL, 0.0, 1, request=mock.MagicMock(headers={}))
+  metrics.record_request(
+      "GET",
+      URL,
+      0.0,
+      2,
+      response=make_response(200, b"{}", {"Content-Length": "10"}))
+
+  assert metrics.stop(metrics_path) == metrics_path
+  assert not metrics.is_enabled()
+  samples = parse(metrics_path)
+  requests_name = "chronicle_cli_requests_total"
+  assert samples[
+      f'{requests_name}{{method="GET",endpoint="{ENDPOINT}",status="503"}}'] == 1
+  assert samples[
+      f'{requests_name}{{method="GET",endpoint="{ENDPOINT}",status="error"}}'] == 1
+  assert samples[
+      f'{requests_name}{{method="GET",endpoint="{ENDPOINT}",status="200"}}'] == 1
+  assert samples[f"chronicle_cli_retries_total{LABELS}"] == 2
+  assert samples[f"chronicle_cli_sent_bytes_total{LABELS}"] == 10
+  assert samples[f"chronicle_cli_received_bytes_total{LABELS}"] == 2
+  bucket_name = "chronicle_cli_request_duration_seconds_bucket"
+  bucket_labels = f'method="GET",endpoint="{ENDPOINT}"'
+  assert samples[f'{bucket_name}{{{bucket_labels},le="0.25"}}'] == 0
+  assert samples[f'{bucket_name}{{{bucket_labels},le="0.5"}}'] == 1
+  assert samples[f'{bucket_name}{{{bucket_labels},le="1.0"}}'] == 2
+  assert samples[f'{bucket_name}{{{bucket_labels},le="+Inf"}}'] == 3
+  assert samples[f"chronicle_cli_request_duration_seconds_sum{LABELS}"] == (
+      pytest.approx(2.9))
+  assert samples[f"chronicle_cli_request_duration_seconds_count{LABELS}"] == 3
+  assert samples["chronicle_cli_duration_seconds"] == 5.0
+  if metrics.get_peak_rss() is not None:
+    assert samples["chronicle_cli_peak_rss_bytes"] > 0
@@ -0,0 +1,191 @@
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Operations run on single resources by batch manifests and bulk commands."""
+
+import dataclasses
+from typing import Any, Callable, Dict, Optional
+
+from common import api_utility
+from common.constants import key_constants
+from common.constants import status
+from feeds import feed_utility
+from forwarders import forwarder_utility
+from parsers import url as parser_url
+
+
+@dataclasses.dataclass(frozen=True)
+class OperationType:
+  """API call made by a type of operation."""
+  method: str
+  # Returns the URL of the resource for region, base URL, environment and ID.
+  get_url: Callable[[str, Optional[str], str, str], str]
+  request_kwargs: Dict[str, Any] = dataclasses.field(default_factory=dict)
+
+
+@dataclasses.dataclass
+class Operation:
+  """Operation run on a single resource."""
+  index: int
+  name: str
+  resource_id: str
+
+
+def get_feed_url(region: str, custom_url: Optional[str], env: str,
+                 feed_id: str) -> str:
+  """Returns the URL of a feed.
+
+  Args:
+    region (str): Region (US, EUROPE, ASIA_SOUTHEAST1).
+    custom_url (str): Base URL to be used for API calls.
+    env (str): Environment (prod, test). Unused for feeds.
+    feed_id (str): ID of the feed.
+
+  Returns:
+    str: Feed URL.
+  """
+  del env  # Unused.
+  return feed_utility.get_feed_resource_url(region, custom_url, feed_id)
+
+
+def get_forwarder_url(region: str, custom_url: Optional[str], env: str,
+                      forwarder_id: str) -> str:
+  """Returns the URL of a forwarder.
+
+  Args:
+    region (str): Region (US, EUROPE, ASIA_SOUTHEAST1).
+    custom_url (str): Base URL to be used for API calls.
+    env (str): Environment (prod, test). Unused for forwarders.
+    forwarder_id (str): ID of the forwarder.
+
+  Returns:
+    str: Forwarder URL.
+  """
+  del env  # Unused.
+  return (
+      f"{forwarder_utility.get_forwarder_url(region, custom_url)}/"
+      f"{forwarder_id}")
+
+
+def get_parser_status_url(region: str, custom_url: Optional[str], env: str,
+                          config_id: str) -> str:
+  """Returns the URL of the status of a CBN parser.
+
+  Args:
+    region (str): Region (US, EUROPE, ASIA_SOUTHEAST1).
+    custom_url (str): Base URL to be used for API calls. Unused for parsers.
+    env (str): Environment (prod, test).
+    config_id (str): Config ID of the parser.
+
+  Returns:
+    str: Parser status URL.
+  """
+  del custom_url  # Unused.
+  return f"{parser_url.get_url(region, 'status', env)}/{config_id}"
+
+
+OPERATION_TYPES = {
+    "feeds.get":
+        OperationType("GET", get_feed_url),
+    "feeds.enable":
+        OperationType("POST", lambda *args: f"{get_feed_url(*args)}:enable",
+                      {"data": {}}),
+    "feeds.disable":
+        OperationType("POST", lambda *args: f"{get_feed_url(*args)}:disable",
+                      {"data": {}}),
+    "feeds.delete":
+        OperationType("DELETE", get_feed_url),
+    "forwarders.get":
+        OperationType("GET", get_forwarder_url),
+    "forwarders.delete":
+        OperationType("DELETE", get_forwarder_url),
+    "parsers.status":
+        OperationType("GET", get_parser_status_url,
+                      {"timeout": parser_url.HTTP_REQUEST_TIMEOUT_IN_SECS}),
+}
+
+
+def get_operation_url(operation: Operation, region: str,
+                      custom_url: Optional[str], env: str) -> str:
+  """Returns the URL of the resource of an operation.
+
+  Args:
+    operation (Operation): Operation to be run.
+    region (str): Region (US, EUROPE, ASIA_SOUTHEAST1).
+    custom_url (str): Base URL to be used for API calls.
+    env (str): Environment (prod, test).
+
+  Returns:
+    str: Operation URL.
+  """
+  return OPERATION_TYPES[operation.name].get_url(region, custom_url, env,
+                                                 operation.resource_id)
+
+
+def run_operation(client: Any, operation: Operation,
+                  operation_url: str) -> Dict[str, Any]:
+  """Runs an operation and returns its result.
+
+  Failures are reported in the result instead of being raised, so a failed
+  operation does not stop the remaining ones.
+
+  Args:
+    client (Any): HTTP session object to send authorized requests and receive
+      responses.
+    operation (Operation): Operation to be run.
+    operation_url (str): URL of the resource of the operation.
+
+  Returns:
+    Dict[str, Any]: Result of the operation with its index, name, ID, whether
+    it succeeded, and the response code and body or the error message.
+  """
+  operation_type = OPERATION_TYPES[operation.name]
+  result = {
+      "index": operation.index,
+      "operation": operation.name,
+      "id": operation.resource_id,
+  }
+  try:
+    response = client.request(operation_type.method, operation_url,
+                              **operation_type.request_kwargs)
+    parsed_response = api_utility.check_content_type(response.content)
+  except Exception as e:  # pylint: disable=broad-except
+    result.update({"success": False, "error": str(e)})
+    return result
+
+  result.update({
+      "success": response.status_code == status.STATUS_OK,
+      "status_code": response.status_code,
+      "response": parsed_response,
+  })
+  return result
+
+
+def get_failure(result: Dict[str, Any]) -> str:
+  """Returns why an operation failed for display.
+
+  Args:
+    result (Dict[str, Any]): Result of the failed operation.
+
+  Returns:
+    str: Failure with the response code and error message, or the error.
+  """
+  if "status_code" not in result:
+    return f"failed ({result['error']})"
+  error_message = result["response"].get(key_constants.KEY_ERROR, {}).get(
+      key_constants.KEY_MESSAGE)
+  failure = f"failed (Response Code: {result['status_code']}"
+  if error_message:
+    failure += f", Error: {error_message}"
+  return failure + ")"
@@ -0,0 +1,89 @@
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Unit tests for operations.py."""
+
+from unittest import mock
+
+from common import operations
+from mock_test_utility import MockResponse
+
+
+def test_get_operation_url() -> None:
+  """Test that the URL of the operation type is built."""
+  assert operations.get_operation_url(
+      operations.Operation(0, "feeds.disable", "123"), "EUROPE", None,
+      "prod") == "https://europe-backstory.googleapis.com/v1/feeds/123:disable"
+
+
+def test_run_operation() -> None:
+  """Test that the API call of the operation type is made."""
+  client = mock.Mock()
+  client.request.return_value = MockResponse(status_code=200, text="{}")
+
+  result = operations.run_operation(
+      client, operations.Operation(2, "feeds.enable", "123"),
+      "https://backstory.googleapis.com/v1/feeds/123:enable")
+
+  client.request.assert_called_once_with(
+      "POST", "https://backstory.googleapis.com/v1/feeds/123:enable", data={})
+  assert result == {
+      "index": 2,
+      "operation": "feeds.enable",
+      "id": "123",
+      "success": True,
+      "status_code": 200,
+      "response": {},
+  }
+
+
+def test_run_operation_failure() -> None:
+  """Test that errors are reported in the result instead of being raised."""
+  client = mock.Mock()
+  client.request.side_effect = [
+      MockResponse(status_code=404, text='{"error": {"message": "missing"}}'),
+      ConnectionError("connection refused"),
+  ]
+  operation = operations.Operation(0, "forwarders.delete", "abc")
+  operation_url = "https://backstory.googleapis.com/v2/forwarders/abc"
+
+  not_found = operations.run_operation(client, operation, operation_url)
+  assert not not_found["success"]
+  assert not_found["status_code"] == 404
+
+  unreachable = operations.run_operation(client, operation, operation_url)
+  assert unreachable == {
+      "index": 0,
+      "operation": "forwarders.delete",
+      "id": "abc",
+      "success": False,
+      "error": "connection refused",
+  }
+
+
+def test_get_failure() -> None:
+  """Test that the response code and error message of a failure are shown."""
+  assert operations.get_failure({
+      "status_code": 403,
+      "response": {
+          "error": {
+              "message": "Permission denied"
+          }
+      }
+  }) == "failed (Response Code: 403, Error: Permission denied)"
+  assert operations.get_failure({
+      "status_code": 500,
+      "response": {}
+  }) == "failed (Response Code: 500)"
+  assert operations.get_failure({"error": "timed out"}) == "failed (timed out)"
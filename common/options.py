@@ -14,9 +14,13 @@
 #
 """CLI options."""
 
+from typing import List
+
 import click
 
-from common import chronicle_auth
+from common import http_client
+from common import paginator
+from common.constants import path_constants
 
 REGION_LIST = [
     "ASIA-NORTHEAST1",
@@ -42,7 +46,7 @@ credential_file_option = click.option(
     "--credential_file",
     help=(
         "Path of Service Account JSON. Default:"
-        f" {chronicle_auth.default_cred_file_path}"
+        f" {path_constants.DEFAULT_CRED_FILE_PATH}"
     ),
 )
 
@@ -73,3 +77,89 @@ export_option = click.option(
 v2_option = click.option(
     "--v2", is_flag=True, help="Enable v2 commands."
 )
+
+page_size_option = click.option(
+    "--page-size",
+    type=click.IntRange(1, paginator.DEFAULT_PAGE_SIZE),
+    default=paginator.DEFAULT_PAGE_SIZE,
+    show_default=True,
+    help="Number of items fetched per API request.")
+
+max_items_option = click.option(
+    "--max-items",
+    type=click.IntRange(min=1),
+    help="Maximum number of items to list. Lists all items by default.")
+
+# Default number of API requests sent in parallel.
+DEFAULT_CONCURRENCY = 4
+
+
+def get_default_concurrency() -> int:
+  """Returns the default concurrency, at most the connection pool size.
+
+  More parallel requests than pooled connections would open connections
+  that are discarded right after use.
+
+  Returns:
+    int: Default maximum number of API requests sent in parallel.
+  """
+  return min(DEFAULT_CONCURRENCY, http_client.get_pool_size())
+
+
+concurrency_option = click.option(
+    "--concurrency",
+    type=click.IntRange(min=1),
+    default=get_default_concurrency,
+    show_default=f"{DEFAULT_CONCURRENCY}, at most --pool-size",
+    help="Maximum number of API requests sent in parallel.")
+
+database_option = click.option(
+    "--database",
+    type=click.Path(dir_okay=False),
+    default=path_constants.INVENTORY_DB_PATH,
+    help="Path of the local inventory database.")
+
+refresh_schema_option = click.option(
+    "--refresh-schema",
+    is_flag=True,
+    help="Fetch the feed schema from the API instead of the local cache.")
+
+
+def _parse_regions(ctx: click.Context, param: click.Parameter,
+                   value: str) -> List[str]:
+  """Parses a comma separated list of regions.
+
+  Args:
+    ctx (click.Context): Click context.
+    param (click.Parameter): Parsed option.
+    value (str): Comma separated regions, or None if not given.
+
+  Returns:
+    List[str]: Upper cased regions in the given order, without duplicates.
+
+  Raises:
+    click.BadParameter: A region is not one of REGION_LIST.
+  """
+  del ctx, param  # Unused.
+  regions = []
+  for region in (value or "").split(","):
+    region = region.strip().upper()
+    if not region or region in regions:
+      continue
+    if region not in REGION_LIST:
+      raise click.BadParameter(
+          f"{region!r} is not one of {', '.join(REGION_LIST)}.")
+    regions.append(region)
+  return regions
+
+
+regions_option = click.option(
+    "--regions",
+    "region_list",
+    callback=_parse_regions,
+    help="Comma separated regions to query concurrently instead of --region.")
+
+all_regions_option = click.option(
+    "--all-regions",
+    is_flag=True,
+    help="Query all regions concurrently instead of --region.")
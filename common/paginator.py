@@ -0,0 +1,124 @@
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Pagination of list API responses which use nextPageToken."""
+
+import concurrent.futures
+import dataclasses
+from typing import Any, Dict, Iterator, List, Optional
+import urllib.parse
+
+from common import api_utility
+from common.constants import status
+
+DEFAULT_PAGE_SIZE = 1000
+KEY_NEXT_PAGE_TOKEN = "nextPageToken"
+PAGE_TOKEN_PARAM = "page_token"
+
+
+@dataclasses.dataclass
+class Page:
+  """Single page of a list response."""
+  url: str
+  status_code: int
+  response: Dict[str, Any]
+  items: List[Any]
+
+
+def iter_pages(client: Any,
+               method: str,
+               url: str,
+               items_key: str,
+               max_items: Optional[int] = None,
+               **request_kwargs: Any) -> Iterator[Page]:
+  """Yields pages of a list response, following nextPageToken.
+
+  While the caller processes a page, the next page is already being fetched
+  in the background. Iteration stops after the last page, after a page with
+  a non-OK status code (which is still yielded), or once max_items items have
+  been yielded.
+
+  Args:
+    client (Any): HTTP session object to send authorized requests and receive
+      responses.
+    method (str): Method to be used for API calls.
+    url (str): URL of the first page. Later pages add the page token to it.
+    items_key (str): Key of the list of items in the response.
+    max_items (int): Maximum number of items to yield. All items if None.
+    **request_kwargs: Keyword arguments passed on to client.request.
+
+  Yields:
+    Page: Pages of the list response.
+  """
+  remaining = max_items
+  with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+    future = executor.submit(_fetch_page, client, method, url, items_key,
+                             request_kwargs)
+    while future:
+      page = future.result()
+      future = None
+      if remaining is not None:
+        page.items = page.items[:remaining]
+        remaining -= len(page.items)
+
+      next_page_token = page.response.get(KEY_NEXT_PAGE_TOKEN)
+      if (page.status_code == status.STATUS_OK and next_page_token and
+          (remaining is None or remaining > 0)):
+        future = executor.submit(_fetch_page, client, method,
+                                 add_page_token(url, next_page_token),
+                                 items_key, request_kwargs)
+      yield page
+
+
+def add_page_token(url: str, page_token: str) -> str:
+  """Returns the URL with the page token query parameter set.
+
+  Args:
+    url (str): URL of the first page.
+    page_token (str): Token of the page to be fetched.
+
+  Returns:
+    str: URL of the page.
+  """
+  parsed_url = urllib.parse.urlsplit(url)
+  query = [(key, value)
+           for key, value in urllib.parse.parse_qsl(parsed_url.query)
+           if key != PAGE_TOKEN_PARAM]
+  query.append((PAGE_TOKEN_PARAM, page_token))
+  return urllib.parse.urlunsplit(
+      parsed_url._replace(query=urllib.parse.urlencode(query)))
+
+
+def _fetch_page(client: Any, method: str, url: str, items_key: str,
+                request_kwargs: Dict[str, Any]) -> Page:
+  """Fetches a single page.
+
+  Args:
+    client (Any): HTTP session object to send authorized requests and receive
+      responses.
+    method (str): Method to be used for API calls.
+    url (str): URL of the page.
+    items_key (str): Key of the list of items in the response.
+    request_kwargs (Dict[str, Any]): Keyword arguments passed on to
+      client.request.
+
+  Returns:
+    Page: Fetched page.
+  """
+  response = client.request(method, url, **request_kwargs)
+  parsed_response = api_utility.check_content_type(response.content)
+  items = []
+  if response.status_code == status.STATUS_OK:
+    items = parsed_response.get(items_key, [])
+  return Page(url, response.status_code, parsed_response, items)
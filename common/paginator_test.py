@@ -0,0 +1,84 @@
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Unit tests for paginator.py."""
+
+import json
+from unittest import mock
+
+from common import paginator
+from mock_test_utility import MockResponse
+
+URL = "https://example.com/v1/parsers?page_size=2"
+
+
+def page_response(items, next_page_token=None) -> MockResponse:
+  """Returns a list response with the given items and page token."""
+  response = {"parsers": items}
+  if next_page_token:
+    response[paginator.KEY_NEXT_PAGE_TOKEN] = next_page_token
+  return MockResponse(status_code=200, text=json.dumps(response))
+
+
+def test_iter_pages_follows_next_page_token() -> None:
+  """Test that every page is fetched until there is no next page token."""
+  client = mock.MagicMock()
+  client.request.side_effect = [
+      page_response([1, 2], "token1"),
+      page_response([3, 4], "token2"),
+      page_response([5]),
+  ]
+  pages = list(paginator.iter_pages(client, "GET", URL, "parsers", timeout=1))
+
+  assert [page.items for page in pages] == [[1, 2], [3, 4], [5]]
+  assert client.request.mock_calls == [
+      mock.call("GET", URL, timeout=1),
+      mock.call("GET", f"{URL}&page_token=token1", timeout=1),
+      mock.call("GET", f"{URL}&page_token=token2", timeout=1),
+  ]
+
+
+def test_iter_pages_max_items() -> None:
+  """Test that no more pages are fetched once max_items is reached."""
+  client = mock.MagicMock()
+  client.request.side_effect = [
+      page_response([1, 2], "token1"),
+      page_response([3, 4], "token2"),
+  ]
+  pages = list(
+      paginator.iter_pages(client, "GET", URL, "parsers", max_items=3))
+
+  assert [page.items for page in pages] == [[1, 2], [3]]
+  assert client.request.call_count == 2
+
+
+def test_iter_pages_stops_on_error() -> None:
+  """Test that a failed page is yielded and ends the iteration."""
+  client = mock.MagicMock()
+  client.request.side_effect = [
+      page_response([1, 2], "token1"),
+      MockResponse(
+          status_code=400, text=json.dumps({"error": {"message": "bad"}})),
+  ]
+  pages = list(paginator.iter_pages(client, "GET", URL, "parsers"))
+
+  assert [page.status_code for page in pages] == [200, 400]
+  assert pages[1].items == []
+  assert pages[1].response == {"error": {"message": "bad"}}
+
+
+def test_add_page_token_replaces_existing_token() -> None:
+  """Test that an existing page token in the URL is replaced."""
+  got = paginator.add_page_token(f"{URL}&page_token=old", "new")
+  assert got == f"{URL}&page_token=new"
@@ -0,0 +1,279 @@
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Profiling of CLI commands with cProfile and a Chrome trace.
+
+While profiling is enabled, the main thread is profiled with cProfile and
+spans of HTTP requests and rendering phases are recorded from every thread.
+The spans are written in the Chrome trace event format, which can be opened
+in chrome://tracing or https://ui.perfetto.dev. When profiling is disabled,
+spans cost a single global lookup.
+"""
+
+import contextlib
+import cProfile
+import functools
+import json
+import os
+import threading
+import time
+from typing import Any, Callable, ContextManager, Dict, List, Optional, Tuple
+import urllib.parse
+
+PROFILE_SUFFIX = ".prof"
+TRACE_SUFFIX = ".trace.json"
+
+CATEGORY_AUTH = "auth"
+CATEGORY_COMMAND = "command"
+CATEGORY_DECODE = "decode"
+CATEGORY_HTTP = "http"
+CATEGORY_RENDER = "render"
+CATEGORY_SCHEMA = "schema"
+
+# Path segments following these collections are resource IDs.
+COLLECTIONS = frozenset([
+    "cbnParsers", "collectors", "feeds", "forwarders", "instances",
+    "locations", "logTypes", "parserExtensions", "parsers", "projects",
+    "validationReports"
+])
+
+_NULL_SPAN = contextlib.nullcontext()
+_profiler: Optional["Profiler"] = None
+
+
+class Profiler:
+  """Collects a cProfile profile and trace spans of a command."""
+
+  def __init__(self, path_prefix: str) -> None:
+    """Initializes the profiler.
+
+    Args:
+      path_prefix (str): Path of the output files without suffix.
+    """
+    self.profile_path = os.path.abspath(path_prefix) + PROFILE_SUFFIX
+    self.trace_path = os.path.abspath(path_prefix) + TRACE_SUFFIX
+    self._profile = cProfile.Profile()
+    self._events: List[Dict[str, Any]] = []
+    self._lock = threading.Lock()
+    self._start = time.perf_counter()
+
+  @contextlib.contextmanager
+  def span(self, name: str, category: str, **args: Any) -> Any:
+    """Records the duration of the enclosed block as a span.
+
+    Args:
+      name (str): Name of the span.
+      category (str): Category of the span, e.g. CATEGORY_HTTP.
+      **args: Details shown with the span. The dict is yielded, so details
+        known only at the end of the block can be added to it.
+
+    Yields:
+      Dict[str, Any]: Details of the span.
+    """
+    start = time.perf_counter()
+    try:
+      yield args
+    finally:
+      self.add_span(name, category, start, time.perf_counter(), args)
+
+  def add_span(self, name: str, category: str, start: float, end: float,
+               args: Dict[str, Any]) -> None:
+    """Records a span.
+
+    Args:
+      name (str): Name of the span.
+      category (str): Category of the span.
+      start (float): time.perf_counter() at the start of the span.
+      end (float): time.perf_counter() at the end of the span.
+      args (Dict[str, Any]): Details shown with the span.
+    """
+    event = {
+        "name": name,
+        "cat": category,
+        "ph": "X",
+        "ts": (start - self._start) * 1e6,
+        "dur": (end - start) * 1e6,
+        "pid": os.getpid(),
+        "tid": threading.get_ident(),
+        "args": args,
+    }
+    with self._lock:
+      self._events.append(event)
+
+  def start(self) -> None:
+    """Starts profiling the calling thread."""
+    self._profile.enable()
+
+  def stop(self) -> Tuple[str, str]:
+    """Stops profiling and writes the profile and the trace.
+
+    Returns:
+      Tuple[str, str]: Paths of the cProfile dump and the trace.
+    """
+    self._profile.disable()
+    self.add_span("command", CATEGORY_COMMAND, self._start, time.perf_counter(),
+                  {})
+    self._profile.dump_stats(self.profile_path)
+    with self._lock:
+      events = list(self._events)
+    with open(self.trace_path, "w") as file:
+      json.dump({
+          "traceEvents": events,
+          "displayTimeUnit": "ms"
+      }, file, default=str)
+    return self.profile_path, self.trace_path
+
+
+def start(path_prefix: str) -> None:
+  """Enables profiling for the rest of the process.
+
+  Args:
+    path_prefix (str): Path of the output files without suffix.
+  """
+  global _profiler
+  _profiler = Profiler(path_prefix)
+  _profiler.start()
+
+
+def stop() -> Optional[Tuple[str, str]]:
+  """Disables profiling and writes the output files.
+
+  Returns:
+    Tuple[str, str]: Paths of the cProfile dump and the trace, None if
+    profiling was not enabled.
+  """
+  global _profiler
+  profiler, _profiler = _profiler, None
+  if profiler is None:
+    return None
+  return profiler.stop()
+
+
+def is_enabled() -> bool:
+  """Returns whether profiling is enabled."""
+  return _profiler is not None
+
+
+def span(name: str, category: str, **args: Any) -> ContextManager[Any]:
+  """Returns a context manager recording a span if profiling is enabled.
+
+  Args:
+    name (str): Name of the span.
+    category (str): Category of the span, e.g. CATEGORY_RENDER.
+    **args: Details shown with the span.
+
+  Returns:
+    ContextManager: Context manager yielding the dict of span details, or
+    None if profiling is disabled.
+  """
+  profiler = _profiler
+  if profiler is None:
+    return _NULL_SPAN
+  return profiler.span(name, category, **args)
+
+
+def traced(name: str, category: str) -> Callable[[Callable[..., Any]],
+                                                 Callable[..., Any]]:
+  """Decorator recording every call of a function as a span.
+
+  Args:
+    name (str): Name of the spans.
+    category (str): Category of the spans.
+
+  Returns:
+    Decorator of the function.
+  """
+
+  def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+
+    @functools.wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+      if _profiler is None:
+        return func(*args, **kwargs)
+      with _profiler.span(name, category):
+        return func(*args, **kwargs)
+
+    return wrapper
+
+  return decorator
+
+
+def record_request(method: str, url: str, start: float, response: Any,
+                   attempt: int) -> None:
+  """Records an HTTP request as a span if profiling is enabled.
+
+  Args:
+    method (str): Request method.
+    url (str): Request URL.
+    start (float): time.perf_counter() when the request was sent.
+    response (Any): Response received, None if the request failed.
+    attempt (int): Number of the attempt, 0 for the first one.
+  """
+  profiler = _profiler
+  if profiler is None:
+    return
+  end = time.perf_counter()
+  url_template = get_url_template(url)
+  args = {"url": url_template, "attempt": attempt}
+  if response is None:
+    args["status"] = "error"
+  else:
+    args["status"] = response.status_code
+    args["bytes"] = get_response_size(response)
+  profiler.add_span(f"{method} {url_template}", CATEGORY_HTTP, start, end,
+                    args)
+
+
+def get_response_size(response: Any) -> int:
+  """Returns the size of a response body in bytes.
+
+  The body of a streamed response is not read here, so that it can still be
+  consumed incrementally by the caller. Its Content-Length is used instead.
+
+  Args:
+    response (Any): Response received.
+
+  Returns:
+    int: Size of the response body, 0 if unknown.
+  """
+  # requests only marks the body consumed once it has been read, which
+  # happens right away unless the request was sent with stream=True.
+  if getattr(response, "_content_consumed", True):
+    return len(response.content)
+  return int(response.headers.get("Content-Length", 0))
+
+
+def get_url_template(url: str) -> str:
+  """Returns the URL with resource IDs and query values replaced.
+
+  Requests for different resources of the same collection share a template,
+  e.g. https://backstory.googleapis.com/v1/feeds/{id}:enable.
+
+  Args:
+    url (str): Request URL.
+
+  Returns:
+    str: URL template.
+  """
+  parsed_url = urllib.parse.urlsplit(url)
+  segments = parsed_url.path.split("/")
+  for index in range(1, len(segments)):
+    resource, colon, action = segments[index].partition(":")
+    if segments[index - 1] in COLLECTIONS and resource:
+      segments[index] = "{id}" + colon + action
+  template = f"{parsed_url.scheme}://{parsed_url.netloc}{'/'.join(segments)}"
+  if parsed_url.query:
+    keys = [key for key, _ in urllib.parse.parse_qsl(parsed_url.query)]
+    template += "?" + "&".join(f"{key}={{{key}}}" for key in keys)
+  return template
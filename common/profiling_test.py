@@ -0,0 +1,116 @@
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Unit tests for profiling.py."""
+
+import io
+import json
+import os
+import pstats
+from typing import Any
+
+import pytest
+import requests
+
+from common import profiling
+
+
+class MockResponse:
+  """Response with a status code and content."""
+
+  def __init__(self, status_code: int, content: bytes) -> None:
+    self.status_code = status_code
+    self.content = content
+
+
+@profiling.traced("double", profiling.CATEGORY_RENDER)
+def double(value: int) -> int:
+  return value * 2
+
+
+@pytest.fixture(name="profile_prefix")
+def fixture_profile_prefix(tmp_path: Any) -> Any:
+  yield os.path.join(tmp_path, "run")
+  profiling.stop()
+
+
+def test_get_url_template() -> None:
+  """Test that resource IDs and query values are replaced."""
+  url = ("https://backstory.googleapis.com/v1/feeds/123:enable"
+         "?pageSize=10&pageToken=abc")
+  assert profiling.get_url_template(url) == (
+      "https://backstory.googleapis.com/v1/feeds/{id}:enable"
+      "?pageSize={pageSize}&pageToken={pageToken}")
+
+
+def test_get_url_template_nested_resources() -> None:
+  """Test that IDs of nested resources are replaced."""
+  url = "https://backstory.googleapis.com/v2/forwarders/f1/collectors"
+  assert profiling.get_url_template(url) == (
+      "https://backstory.googleapis.com/v2/forwarders/{id}/collectors")
+
+
+def test_get_response_size_of_streamed_response() -> None:
+  """Test that the body of a streamed response is left unread."""
+  response = requests.Response()
+  response.headers["Content-Length"] = "12"
+  response.raw = io.BytesIO(b'{"feeds": []}')
+  assert profiling.get_response_size(response) == 12
+  assert response.content == b'{"feeds": []}'
+  assert profiling.get_response_size(response) == 13
+  assert profiling.get_response_size(MockResponse(200, b"{}")) == 2
+
+
+def test_disabled() -> None:
+  """Test that spans and requests are not recorded while disabled."""
+  assert not profiling.is_enabled()
+  with profiling.span("name", profiling.CATEGORY_RENDER) as args:
+    assert args is None
+  assert double(2) == 4
+  profiling.record_request("GET", "https://example.com", 0.0, None, 0)
+  assert profiling.stop() is None
+
+
+def test_profile_and_trace_written(profile_prefix: str) -> None:
+  """Test that the cProfile dump and the trace are written on stop."""
+  profiling.start(profile_prefix)
+  assert profiling.is_enabled()
+  with profiling.span("block", profiling.CATEGORY_RENDER, rows=1) as args:
+    args["done"] = True
+  assert double(2) == 4
+  profiling.record_request("GET", "https://example.com/v1/feeds/1",
+                           0.0, MockResponse(200, b"{}"), 0)
+  profiling.record_request("DELETE", "https://example.com/v1/feeds/1", 0.0,
+                           None, 1)
+
+  profile_path, trace_path = profiling.stop()
+
+  assert not profiling.is_enabled()
+  assert profile_path == f"{profile_prefix}.prof"
+  pstats.Stats(profile_path)
+  with open(trace_path) as file:
+    trace = json.load(file)
+  events = {event["name"]: event for event in trace["traceEvents"]}
+  assert events["block"]["args"] == {"rows": 1, "done": True}
+  assert events["double"]["cat"] == profiling.CATEGORY_RENDER
+  assert events["GET https://example.com/v1/feeds/{id}"]["args"] == {
+      "url": "https://example.com/v1/feeds/{id}",
+      "attempt": 0,
+      "status": 200,
+      "bytes": 2,
+  }
+  assert events["DELETE https://example.com/v1/feeds/{id}"]["args"][
+      "status"] == "error"
+  assert events["command"]["cat"] == profiling.CATEGORY_COMMAND
+  assert all(event["ph"] == "X" for event in trace["traceEvents"])
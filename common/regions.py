@@ -0,0 +1,171 @@
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Run API calls against several regions concurrently."""
+
+import concurrent.futures
+import dataclasses
+from typing import Any, Callable, List, Optional, Tuple
+
+import click
+
+from common import api_utility
+from common import options
+from common.constants import key_constants
+from common.constants import status
+
+
+@dataclasses.dataclass
+class RegionResult:
+  """Result of an API call made against a region."""
+  region: str
+  result: Any = None
+  error: Optional[Exception] = None
+
+
+def get_regions(regions: List[str], all_regions: bool) -> List[str]:
+  """Gets the regions selected with --regions or --all-regions.
+
+  Args:
+    regions (List[str]): Regions given with --regions.
+    all_regions (bool): Whether --all-regions was given.
+
+  Returns:
+    List[str]: Selected regions, empty if only a single region, given with
+    --region, is targeted.
+  """
+  if all_regions:
+    return list(options.REGION_LIST)
+  return list(regions or [])
+
+
+def get_url_error(region_list: List[str], url: str) -> Optional[str]:
+  """Checks that a custom URL is not combined with several regions.
+
+  Args:
+    region_list (List[str]): Selected regions.
+    url (str): Base URL to be used for API calls.
+
+  Returns:
+    str: Error message, None if the options can be used together.
+  """
+  if region_list and url:
+    return "--url cannot be combined with --regions or --all-regions."
+  return None
+
+
+def fan_out(function: Callable[[str], Any],
+            region_list: List[str]) -> List[RegionResult]:
+  """Calls a function for every region concurrently.
+
+  An exception raised for a region is returned in its result, so that the
+  other regions are still reported.
+
+  Args:
+    function (Callable[[str], Any]): Function called with each region.
+    region_list (List[str]): Regions to call the function for.
+
+  Returns:
+    List[RegionResult]: Results in the order of the given regions.
+  """
+
+  def call(region: str) -> RegionResult:
+    try:
+      return RegionResult(region, function(region))
+    except Exception as e:  # pylint: disable=broad-except
+      return RegionResult(region, error=e)
+
+  with concurrent.futures.ThreadPoolExecutor(
+      max_workers=max(len(region_list), 1)) as executor:
+    return list(executor.map(call, region_list))
+
+
+def find_first(
+    function: Callable[[str], Any], region_list: List[str],
+    is_found: Callable[[Any], bool]
+) -> Tuple[Optional[RegionResult], List[RegionResult]]:
+  """Calls a function for every region until one of them finds its object.
+
+  Regions are queried concurrently. The first result accepted by is_found is
+  returned without waiting for the remaining regions; calls that have not
+  started yet are cancelled. Calls already in flight cannot be interrupted:
+  they still run to completion in the background, and the interpreter waits
+  for them before the process exits.
+
+  An exception raised for a region is returned in its miss, so that the
+  caller can report why each region did not find the object.
+
+  Args:
+    function (Callable[[str], Any]): Function called with each region.
+    region_list (List[str]): Regions to call the function for.
+    is_found (Callable[[Any], bool]): Whether a result holds the object.
+
+  Returns:
+    Tuple[RegionResult, List[RegionResult]]: Result of the region that found
+    the object, None if no region did, and the results of the regions that
+    completed without finding it, in the order of the given regions.
+  """
+  executor = concurrent.futures.ThreadPoolExecutor(
+      max_workers=max(len(region_list), 1))
+  try:
+    futures = {
+        executor.submit(function, region): region for region in region_list
+    }
+    misses = {}
+    for future in concurrent.futures.as_completed(futures):
+      region = futures[future]
+      if future.exception() is not None:
+        misses[region] = RegionResult(region, error=future.exception())
+      elif is_found(future.result()):
+        return RegionResult(region, future.result()), [
+            misses[region] for region in region_list if region in misses
+        ]
+      else:
+        misses[region] = RegionResult(region, future.result())
+    return None, [misses[region] for region in region_list]
+  finally:
+    executor.shutdown(wait=False, cancel_futures=True)
+
+
+def print_not_found(name: str, misses: List[RegionResult]) -> None:
+  """Prints why an object was not found in any of several regions.
+
+  The object is only reported as not found if every region answered with
+  404. Otherwise, the response code and error of every region are printed,
+  so that e.g. a permission error is not mistaken for a missing object.
+
+  Args:
+    name (str): Name of the object, e.g. "Feed".
+    misses (List[RegionResult]): HTTP responses or errors of the regions
+      that did not find the object, as returned by find_first.
+  """
+  if all(miss.error is None and
+         miss.result.status_code == status.STATUS_NOT_FOUND
+         for miss in misses):
+    click.echo(f"{name} not found in regions: "
+               f"{', '.join(miss.region for miss in misses)}.")
+    return
+
+  click.echo(f"{name} could not be fetched from the following regions:")
+  for miss in misses:
+    click.echo(f"\nRegion: {miss.region}")
+    if miss.error is not None:
+      click.echo(f"Error: {miss.error}")
+      continue
+    try:
+      error = api_utility.check_content_type(miss.result.content)
+      message = error[key_constants.KEY_ERROR][key_constants.KEY_MESSAGE]
+    except (TypeError, KeyError):
+      message = miss.result.text
+    click.echo(f"Response Code: {miss.result.status_code}\nError: {message}")
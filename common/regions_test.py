@@ -0,0 +1,143 @@
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Unit tests for regions.py."""
+
+import threading
+
+import click
+from click.testing import CliRunner
+import pytest
+
+from common import options
+from common import regions
+from mock_test_utility import MockResponse
+
+
+def test_get_regions() -> None:
+  """Test that the regions of --regions and --all-regions are selected."""
+  assert not regions.get_regions([], False)
+  assert regions.get_regions(["EUROPE", "US"], False) == ["EUROPE", "US"]
+  assert regions.get_regions([], True) == options.REGION_LIST
+
+
+def test_get_url_error() -> None:
+  """Test that a custom URL cannot target several regions."""
+  assert regions.get_url_error([], "https://example.com") is None
+  assert regions.get_url_error(["US"], None) is None
+  assert regions.get_url_error(["US"], "https://example.com")
+
+
+def test_regions_option() -> None:
+  """Test that --regions is validated and normalized."""
+
+  @click.command()
+  @options.regions_option
+  def command(region_list):
+    click.echo(",".join(region_list))
+
+  result = CliRunner().invoke(command, ["--regions", "us, europe,US"])
+  assert result.output == "US,EUROPE\n"
+  result = CliRunner().invoke(command, ["--regions", "us,mars"])
+  assert result.exit_code == 2
+  assert "'MARS' is not one of" in result.output
+
+
+def test_fan_out_keeps_region_order() -> None:
+  """Test that results are returned in region order along with errors."""
+  barrier = threading.Barrier(3)
+
+  def function(region):
+    # Every region must be in flight at the same time to pass the barrier.
+    barrier.wait(timeout=5)
+    if region == "EUROPE":
+      raise ValueError("unavailable")
+    return region.lower()
+
+  results = regions.fan_out(function, ["US", "EUROPE", "ASIA-SOUTH1"])
+  assert [result.region for result in results] == [
+      "US", "EUROPE", "ASIA-SOUTH1"
+  ]
+  assert results[0].result == "us"
+  assert str(results[1].error) == "unavailable"
+  assert results[2].result == "asia-south1"
+
+
+def test_find_first_returns_without_waiting() -> None:
+  """Test that the first region finding the object is returned right away."""
+  release = threading.Event()
+
+  def function(region):
+    if region == "EUROPE":
+      return 200
+    release.wait(timeout=5)
+    return 404
+
+  try:
+    found, _ = regions.find_first(function, ["US", "ASIA-SOUTH1", "EUROPE"],
+                                  lambda status_code: status_code == 200)
+  finally:
+    release.set()
+  assert found == regions.RegionResult("EUROPE", 200)
+
+
+def test_find_first_not_found() -> None:
+  """Test that every region's result or error is returned if none has it."""
+  error = ValueError("unavailable")
+
+  def function(region):
+    if region == "US":
+      raise error
+    return 404
+
+  found, misses = regions.find_first(function, ["US", "EUROPE"],
+                                     lambda status_code: status_code == 200)
+  assert found is None
+  assert misses == [
+      regions.RegionResult("US", error=error),
+      regions.RegionResult("EUROPE", 404)
+  ]
+
+
+def test_print_not_found() -> None:
+  """Test that the object is reported as not found if every region had 404."""
+  misses = [
+      regions.RegionResult("US", MockResponse(404, "{}")),
+      regions.RegionResult("EUROPE", MockResponse(404, "{}"))
+  ]
+
+  result = CliRunner().invoke(
+      click.command()(lambda: regions.print_not_found("Feed", misses)))
+  assert result.output == "Feed not found in regions: US, EUROPE.\n"
+
+
+def test_print_not_found_region_errors() -> None:
+  """Test that the error of every region is printed if one is not 404."""
+  misses = [
+      regions.RegionResult(
+          "US", MockResponse(403, """{"error": {"message": "Denied"}}""")),
+      regions.RegionResult(
+          "EUROPE", MockResponse(404, """{"error": {"message": "Missing"}}""")),
+      regions.RegionResult("ASIA-SOUTH1", MockResponse(502, "Bad Gateway")),
+      regions.RegionResult("UK", error=ValueError("unavailable"))
+  ]
+
+  result = CliRunner().invoke(
+      click.command()(lambda: regions.print_not_found("Feed", misses)))
+  assert result.output == (
+      "Feed could not be fetched from the following regions:\n"
+      "\nRegion: US\nResponse Code: 403\nError: Denied\n"
+      "\nRegion: EUROPE\nResponse Code: 404\nError: Missing\n"
+      "\nRegion: ASIA-SOUTH1\nResponse Code: 502\nError: Bad Gateway\n"
+      "\nRegion: UK\nError: unavailable\n")
@@ -0,0 +1,84 @@
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Renders text reports to the console and a TXT export as they are built."""
+
+from typing import Any, AnyStr, Optional
+
+import click
+
+from common import file_utility
+from common import profiling
+
+RECORD_SEPARATOR = f'\n\n{"=" * 60}\n'
+
+
+class ReportRenderer:
+  """Writes the records of a text report as they are produced.
+
+  Each record is echoed to the console right away and, if an export path is
+  given, appended to the TXT export file. The console output and file content
+  are the same as echoing and exporting the concatenation of all records, but
+  no record has to be kept in memory once it is written.
+  """
+
+  def __init__(self, export_path: Optional[AnyStr] = None) -> None:
+    """Initializes the renderer.
+
+    Args:
+      export_path (AnyStr): Path of the TXT file to export the report to. The
+        report is only written to the console if None.
+    """
+    self.count = 0
+    self._writer = None
+    if export_path:
+      self._writer = file_utility.TxtWriter(export_path)
+
+  def __enter__(self) -> "ReportRenderer":
+    return self
+
+  def __exit__(self, *args: Any) -> None:
+    self.close()
+
+  def write(self, text: str) -> None:
+    """Writes text to the console and the export file.
+
+    Args:
+      text (str): Text to be written.
+    """
+    click.echo(text, nl=False)
+    if self._writer:
+      self._writer.write(text)
+
+  @profiling.traced("report record", profiling.CATEGORY_RENDER)
+  def write_record(self, details: str) -> None:
+    """Writes a record followed by the record separator.
+
+    Args:
+      details (str): Details of the record.
+    """
+    self.write(details + RECORD_SEPARATOR)
+    self.count += 1
+
+  def end_block(self) -> None:
+    """Ends the current block of records on the console.
+
+    The line break is not written to the export file.
+    """
+    click.echo()
+
+  def close(self) -> None:
+    """Closes the export file."""
+    if self._writer:
+      self._writer.close()
@@ -0,0 +1,50 @@
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Unit tests for report_renderer.py."""
+
+from typing import Any
+
+import click
+from click.testing import CliRunner
+
+from common import report_renderer
+
+runner = CliRunner()
+RECORDS = ["\nRecord 1", "\nRecord 2"]
+
+
+@click.command()
+@click.option("--export-path", default=None)
+def render(export_path: str) -> None:
+  with report_renderer.ReportRenderer(export_path) as renderer:
+    for record in RECORDS:
+      renderer.write_record(record)
+    renderer.end_block()
+
+
+def test_console_output_matches_concatenated_report() -> None:
+  """Test that records are echoed as if the whole report was echoed once."""
+  result = runner.invoke(render)
+  expected = "".join(
+      record + report_renderer.RECORD_SEPARATOR for record in RECORDS)
+  assert result.output == f"{expected}\n"
+
+
+def test_export_txt(tmp_path: Any) -> None:
+  """Test that records are exported without the console line break."""
+  export_path = str(tmp_path / "report.txt")
+  result = runner.invoke(render, ["--export-path", export_path])
+  with open(export_path) as file:
+    assert file.read() == result.output[:-1]
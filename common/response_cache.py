@@ -0,0 +1,168 @@
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""On-disk cache of API responses with conditional revalidation."""
+
+import dataclasses
+import datetime
+import hashlib
+import json
+import os
+import tempfile
+from typing import Any, Dict, Optional
+
+KEY_URL = "url"
+KEY_BODY = "body"
+KEY_ETAG = "etag"
+KEY_LAST_MODIFIED = "lastModified"
+KEY_FETCHED_AT = "fetchedAt"
+DATETIME_FORMAT = "%Y-%m-%dT%H:%M:%S.%f"
+
+HEADER_ETAG = "ETag"
+HEADER_LAST_MODIFIED = "Last-Modified"
+HEADER_IF_NONE_MATCH = "If-None-Match"
+HEADER_IF_MODIFIED_SINCE = "If-Modified-Since"
+
+
+@dataclasses.dataclass
+class CachedResponse:
+  """Response body stored in the cache along with its validators."""
+  body: Any
+  etag: Optional[str]
+  last_modified: Optional[str]
+  fetched_at: datetime.datetime
+
+  def is_fresh(self, ttl: datetime.timedelta) -> bool:
+    """Returns whether the response can be used without revalidation.
+
+    Args:
+      ttl (datetime.timedelta): Time a response stays fresh after fetching.
+
+    Returns:
+      bool: True if the response is younger than the TTL.
+    """
+    return datetime.datetime.utcnow() - self.fetched_at < ttl
+
+  def get_validation_headers(self) -> Dict[str, str]:
+    """Returns request headers asking the server to revalidate the response.
+
+    Returns:
+      Dict[str, str]: Conditional request headers. Empty if the server sent no
+        validators.
+    """
+    headers = {}
+    if self.etag:
+      headers[HEADER_IF_NONE_MATCH] = self.etag
+    if self.last_modified:
+      headers[HEADER_IF_MODIFIED_SINCE] = self.last_modified
+    return headers
+
+
+class ResponseCache:
+  """Cache of response bodies keyed by request URL.
+
+  Every URL is stored in its own file readable only by the current user, so
+  responses of different regions and base URLs never mix. Failures to read or
+  write the cache are not errors; the response is then fetched again.
+  """
+
+  def __init__(self, cache_dir: str) -> None:
+    """Initializes the cache.
+
+    Args:
+      cache_dir (str): Directory holding the cached responses.
+    """
+    self.cache_dir = cache_dir
+
+  def load(self, url: str) -> Optional[CachedResponse]:
+    """Loads the cached response of a URL.
+
+    Args:
+      url (str): Request URL.
+
+    Returns:
+      CachedResponse: Cached response, or None if there is no usable entry.
+    """
+    try:
+      with open(self._get_path(url), "r") as file:
+        cached = json.load(file)
+      if cached[KEY_URL] != url:
+        return None
+      return CachedResponse(
+          cached[KEY_BODY], cached.get(KEY_ETAG),
+          cached.get(KEY_LAST_MODIFIED),
+          datetime.datetime.strptime(cached[KEY_FETCHED_AT], DATETIME_FORMAT))
+    except (OSError, ValueError, KeyError, TypeError):
+      return None
+
+  def store(self, url: str, body: Any, headers: Dict[str, str]) -> None:
+    """Stores a response body along with the validators in its headers.
+
+    Args:
+      url (str): Request URL.
+      body (Any): JSON serializable response body.
+      headers (Dict[str, str]): Response headers.
+    """
+    self._write(url, body, headers.get(HEADER_ETAG),
+                headers.get(HEADER_LAST_MODIFIED))
+
+  def touch(self, url: str, cached: CachedResponse) -> None:
+    """Marks a cached response as fresh after the server revalidated it.
+
+    Args:
+      url (str): Request URL.
+      cached (CachedResponse): Revalidated response.
+    """
+    self._write(url, cached.body, cached.etag, cached.last_modified)
+
+  def _get_path(self, url: str) -> str:
+    """Returns the cache file path of a URL.
+
+    Args:
+      url (str): Request URL.
+
+    Returns:
+      str: Path of the cache file.
+    """
+    digest = hashlib.sha256(url.encode()).hexdigest()
+    return os.path.join(self.cache_dir, f"{digest}.json")
+
+  def _write(self, url: str, body: Any, etag: Optional[str],
+             last_modified: Optional[str]) -> None:
+    """Atomically writes a cache entry.
+
+    Args:
+      url (str): Request URL.
+      body (Any): JSON serializable response body.
+      etag (str): ETag response header.
+      last_modified (str): Last-Modified response header.
+    """
+    temp_path = None
+    try:
+      os.makedirs(self.cache_dir, mode=0o700, exist_ok=True)
+      # mkstemp creates the file with 0600 permissions.
+      fd, temp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+      with os.fdopen(fd, "w") as file:
+        json.dump({
+            KEY_URL: url,
+            KEY_ETAG: etag,
+            KEY_LAST_MODIFIED: last_modified,
+            KEY_FETCHED_AT: datetime.datetime.utcnow().strftime(
+                DATETIME_FORMAT),
+            KEY_BODY: body,
+        }, file)
+      os.replace(temp_path, self._get_path(url))
+    except OSError:
+      if temp_path and os.path.exists(temp_path):
+        os.remove(temp_path)
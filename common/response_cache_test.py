@@ -0,0 +1,85 @@
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Unit tests for response_cache.py."""
+
+import datetime
+import os
+from typing import Any
+
+from common import response_cache
+
+URL = "https://backstory.googleapis.com/v1/feedSchema"
+
+
+def test_store_and_load(tmp_path: Any) -> None:
+  """Test that a stored response is loaded along with its validators."""
+  cache = response_cache.ResponseCache(str(tmp_path / "cache"))
+  cache.store(URL, {"key": "value"}, {
+      "ETag": '"abc"',
+      "Last-Modified": "Wed, 21 Oct 2015 07:28:00 GMT"
+  })
+
+  cached = cache.load(URL)
+  assert cached.body == {"key": "value"}
+  assert cached.is_fresh(datetime.timedelta(minutes=1))
+  assert not cached.is_fresh(datetime.timedelta(0))
+  assert cached.get_validation_headers() == {
+      "If-None-Match": '"abc"',
+      "If-Modified-Since": "Wed, 21 Oct 2015 07:28:00 GMT"
+  }
+  assert (os.stat(tmp_path / "cache").st_mode & 0o777) == 0o700
+
+
+def test_load_missing_or_corrupt(tmp_path: Any) -> None:
+  """Test that missing and unreadable entries are treated as not cached."""
+  cache = response_cache.ResponseCache(str(tmp_path))
+  assert cache.load(URL) is None
+
+  cache.store(URL, {}, {})
+  with open(cache._get_path(URL), "w") as file:  # pylint: disable=protected-access
+    file.write("{not json")
+  assert cache.load(URL) is None
+
+
+def test_entries_are_per_url(tmp_path: Any) -> None:
+  """Test that responses of different base URLs do not mix."""
+  cache = response_cache.ResponseCache(str(tmp_path))
+  cache.store(URL, {"region": "us"}, {})
+  eu_url = "https://europe-backstory.googleapis.com/v1/feedSchema"
+  assert cache.load(eu_url) is None
+  cache.store(eu_url, {"region": "europe"}, {})
+  assert cache.load(URL).body == {"region": "us"}
+  assert cache.load(eu_url).body == {"region": "europe"}
+  assert cache.load(URL).get_validation_headers() == {}
+
+
+def test_touch_renews_freshness(tmp_path: Any) -> None:
+  """Test that a revalidated response is fresh again."""
+  cache = response_cache.ResponseCache(str(tmp_path))
+  cache.store(URL, {"key": "value"}, {"ETag": "1"})
+  cached = cache.load(URL)
+  cached.fetched_at -= datetime.timedelta(days=2)
+  cache.touch(URL, cached)
+  assert cache.load(URL).is_fresh(datetime.timedelta(days=1))
+  assert cache.load(URL).etag == "1"
+
+
+def test_store_unwritable_directory(tmp_path: Any) -> None:
+  """Test that failing to write the cache is not an error."""
+  blocker = tmp_path / "file"
+  blocker.write_text("")
+  cache = response_cache.ResponseCache(str(blocker / "cache"))
+  cache.store(URL, {}, {})
+  assert cache.load(URL) is None
@@ -0,0 +1,201 @@
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Retry, backoff and rate limiting rules shared by all API calls.
+
+Idempotent requests (GET, HEAD, OPTIONS, PUT, DELETE) are retried on
+connection failures and on the status codes in RETRY_STATUS_CODES. Other
+requests, e.g. POST, are retried only when the server cannot have acted on
+them: on 429 responses and when no connection could be established.
+"""
+
+import datetime
+import email.utils
+import random
+import threading
+import time
+from typing import Dict, Optional, Tuple
+import urllib.parse
+
+DEFAULT_MAX_RETRIES = 5
+# Requests per second allowed per host. 0 disables rate limiting.
+DEFAULT_RATE_LIMIT = 20.0
+BACKOFF_BASE_SECS = 0.5
+BACKOFF_MAX_SECS = 32.0
+# Longest wait honored from a Retry-After header.
+RETRY_AFTER_MAX_SECS = 120.0
+
+STATUS_TOO_MANY_REQUESTS = 429
+RETRY_STATUS_CODES = frozenset([429, 500, 502, 503, 504])
+IDEMPOTENT_METHODS = frozenset(["GET", "HEAD", "OPTIONS", "PUT", "DELETE"])
+
+_rate_limiters: Dict[str, "TokenBucket"] = {}
+_retry_counts: Dict[Tuple[str, str], int] = {}
+_lock = threading.Lock()
+
+
+class TokenBucket:
+  """Thread-safe token bucket refilled at a fixed rate."""
+
+  def __init__(self, rate: float, capacity: Optional[float] = None) -> None:
+    """Initializes a full bucket.
+
+    Args:
+      rate (float): Tokens added per second.
+      capacity (float): Maximum number of tokens. Defaults to the rate, which
+        allows bursts of one second worth of requests.
+    """
+    self.rate = rate
+    self.capacity = capacity or max(rate, 1.0)
+    self._tokens = self.capacity
+    self._updated = time.monotonic()
+    self._lock = threading.Lock()
+
+  def acquire(self) -> float:
+    """Takes a token, waiting until one is available.
+
+    Returns:
+      float: Seconds spent waiting.
+    """
+    with self._lock:
+      now = time.monotonic()
+      self._tokens = min(self.capacity,
+                         self._tokens + (now - self._updated) * self.rate)
+      self._updated = now
+      self._tokens -= 1
+      # A negative balance is a reservation, which is paid for by sleeping
+      # outside of the lock.
+      wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+    if wait:
+      time.sleep(wait)
+    return wait
+
+
+def acquire(url: str, rate: float) -> float:
+  """Waits for the rate limiter of the host of the given URL.
+
+  Args:
+    url (str): Request URL.
+    rate (float): Requests per second allowed per host. 0 disables limiting.
+
+  Returns:
+    float: Seconds spent waiting.
+  """
+  if rate <= 0:
+    return 0.0
+  host = urllib.parse.urlsplit(url).netloc
+  with _lock:
+    bucket = _rate_limiters.get(host)
+    if bucket is None or bucket.rate != rate:
+      bucket = TokenBucket(rate)
+      _rate_limiters[host] = bucket
+  return bucket.acquire()
+
+
+def should_retry_status(method: str, status_code: int) -> bool:
+  """Returns whether a response with the given status code may be retried.
+
+  Args:
+    method (str): Request method.
+    status_code (int): Response status code.
+
+  Returns:
+    bool: True if the request can safely be sent again.
+  """
+  if status_code not in RETRY_STATUS_CODES:
+    return False
+  return (method.upper() in IDEMPOTENT_METHODS or
+          status_code == STATUS_TOO_MANY_REQUESTS)
+
+
+def should_retry_error(method: str, connected: bool) -> bool:
+  """Returns whether a request which failed without a response may be retried.
+
+  Args:
+    method (str): Request method.
+    connected (bool): Whether the request may have reached the server.
+
+  Returns:
+    bool: True if the request can safely be sent again.
+  """
+  return method.upper() in IDEMPOTENT_METHODS or not connected
+
+
+def get_backoff(attempt: int, retry_after: Optional[str] = None) -> float:
+  """Returns the seconds to wait before the given retry.
+
+  Args:
+    attempt (int): Number of the retry, starting at 1.
+    retry_after (str): Value of the Retry-After response header, if any.
+
+  Returns:
+    float: Seconds to wait. The Retry-After delay if the header is valid,
+      otherwise exponential backoff with full jitter.
+  """
+  delay = parse_retry_after(retry_after)
+  if delay is not None:
+    return min(delay, RETRY_AFTER_MAX_SECS)
+  return random.uniform(
+      0, min(BACKOFF_MAX_SECS, BACKOFF_BASE_SECS * 2**(attempt - 1)))
+
+
+def parse_retry_after(retry_after: Optional[str]) -> Optional[float]:
+  """Parses a Retry-After header given in seconds or as an HTTP date.
+
+  Args:
+    retry_after (str): Value of the Retry-After header.
+
+  Returns:
+    float: Seconds to wait, or None if the header is missing or invalid.
+  """
+  if not retry_after:
+    return None
+  try:
+    return max(0.0, float(retry_after))
+  except ValueError:
+    pass
+  try:
+    retry_at = email.utils.parsedate_to_datetime(retry_after)
+  except (TypeError, ValueError):
+    return None
+  if retry_at.tzinfo is None:
+    retry_at = retry_at.replace(tzinfo=datetime.timezone.utc)
+  now = datetime.datetime.now(datetime.timezone.utc)
+  return max(0.0, (retry_at - now).total_seconds())
+
+
+def record_retries(method: str, url: str, retries: int) -> None:
+  """Records the number of retries of the latest request to a URL.
+
+  Args:
+    method (str): Request method.
+    url (str): Request URL.
+    retries (int): Number of retries.
+  """
+  with _lock:
+    _retry_counts[(method.upper(), url)] = retries
+
+
+def get_retry_count(method: str, url: str) -> int:
+  """Returns the number of retries of the latest request to a URL.
+
+  Args:
+    method (str): Request method.
+    url (str): Request URL.
+
+  Returns:
+    int: Number of retries, 0 if the request was not retried or not sent.
+  """
+  with _lock:
+    return _retry_counts.get((method.upper(), url), 0)
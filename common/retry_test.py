@@ -0,0 +1,91 @@
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Unit tests for retry.py."""
+
+import datetime
+import email.utils
+from unittest import mock
+
+import pytest
+
+from common import retry
+
+
+@pytest.mark.parametrize("method,status_code,expected", [
+    ("GET", 503, True),
+    ("DELETE", 500, True),
+    ("GET", 404, False),
+    ("POST", 503, False),
+    ("POST", 429, True),
+    ("PATCH", 502, False),
+])
+def test_should_retry_status(method: str, status_code: int,
+                             expected: bool) -> None:
+  """Test that only idempotent requests are retried on server errors."""
+  assert retry.should_retry_status(method, status_code) == expected
+
+
+def test_should_retry_error() -> None:
+  """Test that POST is retried only if it did not reach the server."""
+  assert retry.should_retry_error("get", connected=True)
+  assert retry.should_retry_error("POST", connected=False)
+  assert not retry.should_retry_error("POST", connected=True)
+
+
+def test_get_backoff_exponential_with_jitter() -> None:
+  """Test that backoff is capped exponential with full jitter."""
+  with mock.patch.object(retry.random, "uniform",
+                         side_effect=lambda low, high: high):
+    assert retry.get_backoff(1) == retry.BACKOFF_BASE_SECS
+    assert retry.get_backoff(3) == retry.BACKOFF_BASE_SECS * 4
+    assert retry.get_backoff(20) == retry.BACKOFF_MAX_SECS
+
+
+def test_get_backoff_honors_retry_after() -> None:
+  """Test that Retry-After seconds are used instead of the backoff."""
+  assert retry.get_backoff(1, "7") == 7
+  assert retry.get_backoff(1, "100000") == retry.RETRY_AFTER_MAX_SECS
+
+
+def test_parse_retry_after_http_date() -> None:
+  """Test that Retry-After can be given as an HTTP date."""
+  retry_at = (datetime.datetime.now(datetime.timezone.utc) +
+              datetime.timedelta(seconds=30))
+  delay = retry.parse_retry_after(email.utils.format_datetime(retry_at, True))
+  assert 25 < delay <= 30
+  assert retry.parse_retry_after("invalid") is None
+  assert retry.parse_retry_after(None) is None
+
+
+def test_token_bucket_waits_when_empty() -> None:
+  """Test that a request is delayed once the burst capacity is used."""
+  bucket = retry.TokenBucket(rate=2, capacity=2)
+  with mock.patch.object(retry.time, "sleep") as mock_sleep:
+    assert bucket.acquire() == 0
+    assert bucket.acquire() == 0
+    assert bucket.acquire() == pytest.approx(0.5, abs=0.05)
+  mock_sleep.assert_called_once()
+
+
+def test_acquire_disabled() -> None:
+  """Test that a rate limit of 0 never waits."""
+  assert retry.acquire("https://example.com/v1/feeds", 0) == 0
+
+
+def test_retry_count() -> None:
+  """Test that retry counts are recorded per method and URL."""
+  retry.record_retries("get", "https://example.com/v1/feeds", 2)
+  assert retry.get_retry_count("GET", "https://example.com/v1/feeds") == 2
+  assert retry.get_retry_count("POST", "https://example.com/v1/feeds") == 0
@@ -0,0 +1,100 @@
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Authorized session which retries and rate limits its requests."""
+
+import time
+from typing import Any
+
+from google.auth.transport import requests as auth_requests
+import requests
+
+from common import metrics
+from common import profiling
+from common import retry
+
+
+class RetryingSession(auth_requests.AuthorizedSession):
+  """Authorized session applying the rules of common.retry to every request.
+
+  Attributes:
+    max_retries: Maximum number of times a request is sent again.
+    rate_limit: Requests per second allowed per host. 0 disables limiting.
+  """
+
+  def __init__(self,
+               credentials: Any,
+               max_retries: int = retry.DEFAULT_MAX_RETRIES,
+               rate_limit: float = retry.DEFAULT_RATE_LIMIT,
+               **kwargs: Any) -> None:
+    """Initializes the session.
+
+    Args:
+      credentials (Any): Credentials used to authorize requests.
+      max_retries (int): Maximum number of times a request is sent again.
+      rate_limit (float): Requests per second allowed per host. 0 disables
+        rate limiting.
+      **kwargs: Keyword arguments of AuthorizedSession.
+    """
+    super().__init__(credentials, **kwargs)
+    self.max_retries = max_retries
+    self.rate_limit = rate_limit
+
+  def request(self, method: str, url: str, *args: Any,
+              **kwargs: Any) -> requests.Response:
+    """Sends a request, retrying it with backoff while that is safe.
+
+    Args:
+      method (str): Request method.
+      url (str): Request URL.
+      *args: Positional arguments of AuthorizedSession.request.
+      **kwargs: Keyword arguments of AuthorizedSession.request.
+
+    Returns:
+      requests.Response: Last response received.
+
+    Raises:
+      requests.exceptions.RequestException: If the last attempt failed
+        without a response.
+    """
+    retries = 0
+    while True:
+      retry.acquire(url, self.rate_limit)
+      start = time.perf_counter()
+      try:
+        response = super().request(method, url, *args, **kwargs)
+      except requests.exceptions.RequestException as e:
+        profiling.record_request(method, url, start, None, retries)
+        metrics.record_request(method, url, start, retries, request=e.request)
+        # A request which timed out while connecting never reached the server.
+        connected = not isinstance(e, requests.exceptions.ConnectTimeout)
+        if (retries >= self.max_retries or
+            not isinstance(e, (requests.exceptions.ConnectionError,
+                               requests.exceptions.Timeout)) or
+            not retry.should_retry_error(method, connected)):
+          retry.record_retries(method, url, retries)
+          raise
+        retry_after = None
+      else:
+        profiling.record_request(method, url, start, response, retries)
+        metrics.record_request(method, url, start, retries, response=response)
+        if (retries >= self.max_retries or
+            not retry.should_retry_status(method, response.status_code)):
+          retry.record_retries(method, url, retries)
+          return response
+        retry_after = response.headers.get("Retry-After")
+        # Release the connection back to the pool before waiting.
+        response.close()
+      retries += 1
+      time.sleep(retry.get_backoff(retries, retry_after))
@@ -0,0 +1,108 @@
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Unit tests for retrying_session.py."""
+
+from typing import Dict, Optional
+from unittest import mock
+
+from google.auth import credentials
+from google.auth.transport import requests as auth_requests
+import pytest
+import requests
+
+from common import retry
+from common import retrying_session
+
+URL = "https://backstory.googleapis.com/v1/feeds"
+
+
+def make_response(status_code: int,
+                  headers: Optional[Dict[str, str]] = None) -> mock.MagicMock:
+  """Returns a mock response with the given status code and headers."""
+  response = mock.MagicMock(status_code=status_code)
+  response.headers = headers or {}
+  return response
+
+
+@pytest.fixture(name="session")
+def fixture_session() -> retrying_session.RetryingSession:
+  """Session with three retries and no rate limiting."""
+  return retrying_session.RetryingSession(
+      credentials.AnonymousCredentials(), max_retries=3, rate_limit=0)
+
+
+@mock.patch.object(retrying_session.time, "sleep")
+@mock.patch.object(auth_requests.AuthorizedSession, "request")
+def test_request_retries_get(mock_request: mock.MagicMock,
+                             mock_sleep: mock.MagicMock,
+                             session: retrying_session.RetryingSession) -> None:
+  """Test that GET is retried on 503 and honors Retry-After."""
+  mock_request.side_effect = [
+      make_response(503, {"Retry-After": "2"}),
+      requests.exceptions.ReadTimeout(),
+      make_response(200),
+  ]
+  response = session.request("GET", URL, timeout=5)
+
+  assert response.status_code == 200
+  assert mock_request.call_count == 3
+  mock_request.assert_called_with("GET", URL, timeout=5)
+  assert mock_sleep.call_args_list[0] == mock.call(2.0)
+  assert retry.get_retry_count("GET", URL) == 2
+
+
+@mock.patch.object(retrying_session.time, "sleep")
+@mock.patch.object(auth_requests.AuthorizedSession, "request")
+def test_request_gives_up_after_max_retries(
+    mock_request: mock.MagicMock, mock_sleep: mock.MagicMock,
+    session: retrying_session.RetryingSession) -> None:
+  """Test that the last response is returned once retries are exhausted."""
+  mock_request.return_value = make_response(500)
+  response = session.request("DELETE", URL)
+
+  assert response.status_code == 500
+  assert mock_request.call_count == 4
+  assert mock_sleep.call_count == 3
+
+
+@mock.patch.object(retrying_session.time, "sleep")
+@mock.patch.object(auth_requests.AuthorizedSession, "request")
+def test_request_does_not_retry_unsafe_post(
+    mock_request: mock.MagicMock, mock_sleep: mock.MagicMock,
+    session: retrying_session.RetryingSession) -> None:
+  """Test that POST is not retried once it may have reached the server."""
+  mock_request.side_effect = [make_response(503)]
+  assert session.request("POST", URL).status_code == 503
+
+  mock_request.side_effect = [requests.exceptions.ReadTimeout()]
+  with pytest.raises(requests.exceptions.ReadTimeout):
+    session.request("POST", URL)
+  mock_sleep.assert_not_called()
+
+
+@mock.patch.object(retrying_session.time, "sleep")
+@mock.patch.object(auth_requests.AuthorizedSession, "request")
+def test_request_retries_safe_post(
+    mock_request: mock.MagicMock, mock_sleep: mock.MagicMock,
+    session: retrying_session.RetryingSession) -> None:
+  """Test that POST is retried on 429 and on connect timeouts."""
+  mock_request.side_effect = [
+      make_response(429),
+      requests.exceptions.ConnectTimeout(),
+      make_response(200),
+  ]
+  assert session.request("POST", URL, data="{}").status_code == 200
+  assert mock_request.call_count == 3
+  assert mock_sleep.call_count == 2
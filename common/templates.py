@@ -26,3 +26,7 @@ Request:
 Response:
   Body: ${response_body}
 """)
+
+retry_details_template = string.Template("""\
+Retries: ${retries}
+""")
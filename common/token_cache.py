@@ -0,0 +1,174 @@
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""On-disk cache of OAuth 2.0 access tokens shared between CLI invocations."""
+
+import contextlib
+import datetime
+import hashlib
+import json
+import os
+import tempfile
+from typing import Any, Iterator, Optional, Sequence
+
+from google.auth import credentials
+
+from common import profiling
+
+try:
+  import fcntl  # pylint: disable=g-import-not-at-top
+except ImportError:  # Windows
+  fcntl = None
+
+# Cached tokens with less lifetime left than this are minted again.
+REFRESH_MARGIN = datetime.timedelta(minutes=5)
+DATETIME_FORMAT = "%Y-%m-%dT%H:%M:%S.%f"
+KEY_TOKEN = "token"
+KEY_EXPIRY = "expiry"
+
+
+class CachedCredentials(credentials.Credentials):
+  """Credentials which share access tokens through an on-disk cache.
+
+  Tokens are keyed by the hash of the credential file content and the scope
+  set. Cache files are readable only by the current user and are replaced
+  atomically, and minting a new token is serialized between processes with a
+  lock file where the platform supports it.
+  """
+
+  def __init__(self, wrapped: Any, credential_file_path: str,
+               scopes: Sequence[str], cache_dir: str) -> None:
+    """Wraps credentials with the token cache.
+
+    Args:
+      wrapped (Any): Credentials used to mint new tokens.
+      credential_file_path (str): Absolute path of the service account JSON.
+      scopes (Sequence[str]): OAuth 2.0 scopes of the credentials.
+      cache_dir (str): Directory holding the cached tokens.
+    """
+    super().__init__()
+    self._wrapped = wrapped
+    self._credential_file_path = credential_file_path
+    self._scopes = scopes
+    self._cache_dir = cache_dir
+    self._cache_path = None
+
+  @profiling.traced("token refresh", profiling.CATEGORY_AUTH)
+  def refresh(self, request: Any) -> None:
+    """Loads a cached token, or mints and caches a new one.
+
+    Args:
+      request (Any): Callable used to make HTTP requests while minting.
+    """
+    # A token being refreshed was rejected by the server, so the cached copy
+    # of it must not be handed out again.
+    rejected_token = self.token
+    cache_path = self._get_cache_path()
+    if self._load(cache_path, rejected_token):
+      return
+    with _file_lock(f"{cache_path}.lock"):
+      # Another process may have minted a token while we waited for the lock.
+      if self._load(cache_path, rejected_token):
+        return
+      self._wrapped.refresh(request)
+      self.token = self._wrapped.token
+      self.expiry = self._wrapped.expiry
+      _write(cache_path, self.token, self.expiry)
+
+  def _get_cache_path(self) -> str:
+    """Returns the cache file path for the credential file and scopes.
+
+    Returns:
+      str: Path of the cache file.
+    """
+    if self._cache_path is None:
+      with open(self._credential_file_path, "rb") as file:
+        digest = hashlib.sha256(file.read())
+      digest.update("\n".join(sorted(self._scopes)).encode())
+      self._cache_path = os.path.join(self._cache_dir,
+                                      f"{digest.hexdigest()}.json")
+    return self._cache_path
+
+  def _load(self, cache_path: str, rejected_token: Optional[str]) -> bool:
+    """Loads the cached token if it is usable.
+
+    Args:
+      cache_path (str): Path of the cache file.
+      rejected_token (str): Token which must not be reused.
+
+    Returns:
+      bool: True if a cached token was loaded.
+    """
+    try:
+      with open(cache_path, "r") as file:
+        cached = json.load(file)
+      token = cached[KEY_TOKEN]
+      expiry = datetime.datetime.strptime(cached[KEY_EXPIRY], DATETIME_FORMAT)
+    except (OSError, ValueError, KeyError, TypeError):
+      return False
+    if token == rejected_token or (
+        expiry - REFRESH_MARGIN <= datetime.datetime.utcnow()):
+      return False
+    self.token = token
+    self.expiry = expiry
+    return True
+
+
+def _write(cache_path: str, token: str,
+           expiry: Optional[datetime.datetime]) -> None:
+  """Atomically writes a token to a cache file readable only by its owner.
+
+  Args:
+    cache_path (str): Path of the cache file.
+    token (str): Access token.
+    expiry (datetime.datetime): Expiry of the access token in UTC.
+  """
+  if not expiry:
+    return
+  cache_dir = os.path.dirname(cache_path)
+  # mkstemp creates the file with 0600 permissions.
+  fd, temp_path = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+  try:
+    with os.fdopen(fd, "w") as file:
+      json.dump({
+          KEY_TOKEN: token,
+          KEY_EXPIRY: expiry.strftime(DATETIME_FORMAT)
+      }, file)
+    os.replace(temp_path, cache_path)
+  except OSError:
+    if os.path.exists(temp_path):
+      os.remove(temp_path)
+    raise
+
+
+@contextlib.contextmanager
+def _file_lock(lock_path: str) -> Iterator[None]:
+  """Holds an exclusive lock on the given file, creating its directory.
+
+  Args:
+    lock_path (str): Path of the lock file.
+
+  Yields:
+    None, while the lock is held.
+  """
+  os.makedirs(os.path.dirname(lock_path), mode=0o700, exist_ok=True)
+  fd = os.open(lock_path, os.O_RDWR | os.O_CREAT, 0o600)
+  try:
+    if fcntl:
+      fcntl.flock(fd, fcntl.LOCK_EX)
+    yield
+  finally:
+    if fcntl:
+      fcntl.flock(fd, fcntl.LOCK_UN)
+    os.close(fd)
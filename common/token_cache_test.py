@@ -0,0 +1,153 @@
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Unit tests for token_cache.py."""
+
+import datetime
+import json
+import os
+import stat
+from typing import Any
+from unittest import mock
+
+import pytest
+
+from common import token_cache
+
+SCOPES = ["https://www.googleapis.com/auth/chronicle-backstory"]
+
+
+@pytest.fixture()
+def credential_file(tmp_path: Any) -> str:
+  """Returns path of a dummy credential file."""
+  path = tmp_path / "credentials.json"
+  path.write_text('{"client_email": "test@test.com"}')
+  return str(path)
+
+
+def get_wrapped_credentials(token: str, lifetime: datetime.timedelta) -> Any:
+  """Returns mock credentials which mint the given token on refresh.
+
+  Args:
+    token (str): Token to be minted.
+    lifetime (datetime.timedelta): Lifetime of the minted token.
+
+  Returns:
+    mock.MagicMock: Mock credentials.
+  """
+  wrapped = mock.MagicMock()
+
+  def refresh(_):
+    wrapped.token = token
+    wrapped.expiry = datetime.datetime.utcnow() + lifetime
+
+  wrapped.refresh.side_effect = refresh
+  return wrapped
+
+
+def test_refresh_mints_and_caches_token(credential_file: str,
+                                        tmp_path: Any) -> None:
+  """Test that a minted token is written to a private cache file."""
+  cache_dir = str(tmp_path / "tokens")
+  wrapped = get_wrapped_credentials("token-1", datetime.timedelta(hours=1))
+  creds = token_cache.CachedCredentials(wrapped, credential_file, SCOPES,
+                                        cache_dir)
+  creds.refresh(mock.MagicMock())
+
+  assert creds.token == "token-1"
+  wrapped.refresh.assert_called_once()
+  cache_files = [f for f in os.listdir(cache_dir) if f.endswith(".json")]
+  assert len(cache_files) == 1
+  cache_path = os.path.join(cache_dir, cache_files[0])
+  with open(cache_path) as file:
+    assert json.load(file)[token_cache.KEY_TOKEN] == "token-1"
+  if os.name == "posix":
+    assert stat.S_IMODE(os.stat(cache_path).st_mode) == 0o600
+
+
+def test_refresh_reuses_cached_token(credential_file: str,
+                                     tmp_path: Any) -> None:
+  """Test that a second process reuses the cached token."""
+  cache_dir = str(tmp_path / "tokens")
+  first = token_cache.CachedCredentials(
+      get_wrapped_credentials("token-1", datetime.timedelta(hours=1)),
+      credential_file, SCOPES, cache_dir)
+  first.refresh(mock.MagicMock())
+
+  wrapped = get_wrapped_credentials("token-2", datetime.timedelta(hours=1))
+  second = token_cache.CachedCredentials(wrapped, credential_file, SCOPES,
+                                         cache_dir)
+  second.refresh(mock.MagicMock())
+
+  assert second.token == "token-1"
+  assert second.expiry == first.expiry
+  wrapped.refresh.assert_not_called()
+
+
+def test_refresh_mints_token_close_to_expiry(credential_file: str,
+                                             tmp_path: Any) -> None:
+  """Test that a cached token within the refresh margin is not reused."""
+  cache_dir = str(tmp_path / "tokens")
+  token_cache.CachedCredentials(
+      get_wrapped_credentials("token-1", datetime.timedelta(minutes=2)),
+      credential_file, SCOPES, cache_dir).refresh(mock.MagicMock())
+
+  creds = token_cache.CachedCredentials(
+      get_wrapped_credentials("token-2", datetime.timedelta(hours=1)),
+      credential_file, SCOPES, cache_dir)
+  creds.refresh(mock.MagicMock())
+  assert creds.token == "token-2"
+
+
+def test_refresh_skips_rejected_token(credential_file: str,
+                                      tmp_path: Any) -> None:
+  """Test that a token rejected by the server is minted again."""
+  cache_dir = str(tmp_path / "tokens")
+  creds = token_cache.CachedCredentials(
+      get_wrapped_credentials("token-1", datetime.timedelta(hours=1)),
+      credential_file, SCOPES, cache_dir)
+  creds.refresh(mock.MagicMock())
+  creds._wrapped = get_wrapped_credentials(  # pylint: disable=protected-access
+      "token-2", datetime.timedelta(hours=1))
+  creds.refresh(mock.MagicMock())
+  assert creds.token == "token-2"
+
+
+def test_cache_is_keyed_by_scopes(credential_file: str, tmp_path: Any) -> None:
+  """Test that different scope sets do not share tokens."""
+  cache_dir = str(tmp_path / "tokens")
+  token_cache.CachedCredentials(
+      get_wrapped_credentials("token-1", datetime.timedelta(hours=1)),
+      credential_file, SCOPES, cache_dir).refresh(mock.MagicMock())
+
+  creds = token_cache.CachedCredentials(
+      get_wrapped_credentials("token-2", datetime.timedelta(hours=1)),
+      credential_file, ["https://www.googleapis.com/auth/cloud-platform"],
+      cache_dir)
+  creds.refresh(mock.MagicMock())
+  assert creds.token == "token-2"
+
+
+def test_corrupt_cache_file_is_ignored(credential_file: str,
+                                       tmp_path: Any) -> None:
+  """Test that an unreadable cache entry results in a new token."""
+  cache_dir = str(tmp_path / "tokens")
+  creds = token_cache.CachedCredentials(
+      get_wrapped_credentials("token-1", datetime.timedelta(hours=1)),
+      credential_file, SCOPES, cache_dir)
+  os.makedirs(cache_dir)
+  with open(creds._get_cache_path(), "w") as file:  # pylint: disable=protected-access
+    file.write("not json")
+  creds.refresh(mock.MagicMock())
+  assert creds.token == "token-1"
@@ -0,0 +1,308 @@
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Enable, disable or delete every feed matching a set of selectors."""
+
+import concurrent.futures
+import dataclasses
+from typing import Any, AnyStr, Callable, Dict, List, Optional, Tuple
+
+import click
+
+from common import api_utility
+from common import chronicle_auth
+from common import operations
+from common import options
+from common.constants import key_constants
+from feeds import feed_utility
+from feeds.constants import schema
+
+
+@dataclasses.dataclass(frozen=True)
+class BulkAction:
+  """Bulk variant of a feed command."""
+  # Name of the operation run on each feed.
+  operation: str
+  verb: str
+  progressive: str
+  past_tense: str
+  # Feeds already in this state are skipped.
+  skip_state: Optional[str] = None
+  # Custom method of the feed called by the operation, if any.
+  custom_method: Optional[str] = None
+
+  def get_url(self, region: str, url: Optional[str], feed_id: str) -> str:
+    """Returns the URL called by the action for a feed."""
+    return feed_utility.get_feed_resource_url(region, url, feed_id,
+                                              self.custom_method)
+
+
+ENABLE = BulkAction("feeds.enable", "enable", "Enabling", "enabled", "ACTIVE",
+                    "enable")
+DISABLE = BulkAction("feeds.disable", "disable", "Disabling", "disabled",
+                     "INACTIVE", "disable")
+DELETE = BulkAction("feeds.delete", "delete", "Deleting", "deleted")
+
+
+@dataclasses.dataclass
+class FeedSelector:
+  """Selects the feeds a bulk action applies to.
+
+  A feed is selected if it matches every given selector.
+  """
+  log_type: Optional[str] = None
+  state: Optional[str] = None
+  namespace: Optional[str] = None
+  # Label keys, with the required value or None if any value matches.
+  labels: List[Tuple[str, Optional[str]]] = dataclasses.field(
+      default_factory=list)
+  ids: Optional[List[str]] = None
+
+  def is_empty(self) -> bool:
+    """Returns whether no selector is given."""
+    return (not self.log_type and not self.state and not self.namespace and
+            not self.labels and self.ids is None)
+
+  def matches(self, feed: Dict[str, Any]) -> bool:
+    """Returns whether a feed is selected.
+
+    Args:
+      feed (Dict[str, Any]): Feed as returned by the API.
+
+    Returns:
+      bool: Whether the feed matches every given selector.
+    """
+    details = feed.get(schema.KEY_DETAILS, {})
+    if self.ids is not None and feed_utility.get_feed_id(feed) not in self.ids:
+      return False
+    if self.log_type and (details.get(key_constants.KEY_LOG_TYPE, "").upper()
+                          != self.log_type.upper()):
+      return False
+    if self.state and (feed.get(schema.KEY_FEED_STATE, "").upper() !=
+                       self.state.upper()):
+      return False
+    if self.namespace and details.get("namespace") != self.namespace:
+      return False
+    feed_labels = {
+        label["key"]: label.get("value")
+        for label in details.get("labels", [])
+    }
+    return all(
+        key in feed_labels and value in (None, feed_labels[key])
+        for key, value in self.labels)
+
+
+def bulk_options(func: Callable[..., Any]) -> Callable[..., Any]:
+  """Adds the selector options of the bulk variant of a feed command.
+
+  Args:
+    func (Callable): Click command function.
+
+  Returns:
+    Callable: Command function with the selector options added.
+  """
+  for option in reversed([
+      click.option(
+          "--log-type",
+          help="Select the feeds of a log type, e.g. WORKSPACE_USERS."),
+      click.option("--state", help="Select the feeds in a state, e.g. ACTIVE."),
+      click.option("--namespace", help="Select the feeds of a namespace."),
+      click.option(
+          "--label",
+          "labels",
+          multiple=True,
+          metavar="KEY[=VALUE]",
+          help="Select the feeds with a label key, or with a label key and "
+          "value. Can be given more than once."),
+      click.option(
+          "--ids-file",
+          type=click.Path(exists=True, dir_okay=False),
+          help="Select the feeds whose IDs are listed in a file, one per "
+          "line."),
+      click.option(
+          "--dry-run",
+          is_flag=True,
+          help="Only print the selected feeds, without changing them."),
+      click.option(
+          "-y",
+          "--yes",
+          is_flag=True,
+          help="Change the selected feeds without confirmation."),
+      options.concurrency_option,
+  ]):
+    func = option(func)
+  return func
+
+
+def get_selector(log_type: Optional[str], state: Optional[str],
+                 namespace: Optional[str], labels: List[str],
+                 ids_file: Optional[str]) -> FeedSelector:
+  """Builds the feed selector from the selector options.
+
+  Args:
+    log_type (str): Log type of the selected feeds.
+    state (str): State of the selected feeds.
+    namespace (str): Namespace of the selected feeds.
+    labels (List[str]): Labels of the selected feeds, as KEY or KEY=VALUE.
+    ids_file (str): Path of a file listing the IDs of the selected feeds.
+
+  Returns:
+    FeedSelector: Feed selector.
+
+  Raises:
+    OSError: Failed to read the IDs file.
+  """
+  parsed_labels = []
+  for label in labels:
+    key, separator, value = label.partition("=")
+    parsed_labels.append((key, value if separator else None))
+  ids = read_ids_file(ids_file) if ids_file else None
+  return FeedSelector(log_type, state, namespace, parsed_labels, ids)
+
+
+def read_ids_file(ids_file: str) -> List[str]:
+  """Reads feed IDs from a file.
+
+  Blank lines and lines starting with # are ignored. IDs may be given with
+  their feeds/ prefix.
+
+  Args:
+    ids_file (str): Path of the file.
+
+  Returns:
+    List[str]: Feed IDs in file order, without duplicates.
+
+  Raises:
+    OSError: Failed to read the file.
+  """
+  ids = []
+  with open(ids_file, "r") as file:
+    for line in file:
+      feed_id = line.strip()
+      if not feed_id or feed_id.startswith("#"):
+        continue
+      feed_id = feed_id.split("/")[-1]
+      if feed_id not in ids:
+        ids.append(feed_id)
+  return ids
+
+
+def run(action: BulkAction, selector: FeedSelector, credential_file: AnyStr,
+        region: str, url: Optional[str], concurrency: int, dry_run: bool,
+        yes: bool, verbose: bool) -> None:
+  """Runs a bulk action on every selected feed.
+
+  The feeds are selected from a single list call and shown for confirmation.
+  Their state is then changed by up to `concurrency` requests in parallel, and
+  the result of each feed is printed in list order, followed by a summary.
+
+  Args:
+    action (BulkAction): Action to be run.
+    selector (FeedSelector): Selects the feeds the action applies to.
+    credential_file (AnyStr): Path of Service Account JSON.
+    region (str): Region (US, EUROPE, ASIA_SOUTHEAST1).
+    url (str): Base URL to be used for API calls.
+    concurrency (int): Maximum number of requests sent in parallel.
+    dry_run (bool): Only print the selected feeds.
+    yes (bool): Run the action without confirmation.
+    verbose (bool): Option for printing verbose output to console.
+  """
+  client = chronicle_auth.initialize_http_session(credential_file)
+  click.echo("Fetching list of feeds...")
+  feeds_response, error = feed_utility.fetch_feeds(client, region, url)
+  if error:
+    click.echo(f"\n{error}")
+    return
+
+  feeds = [
+      feed for feed in feeds_response.get(schema.KEY_FEEDS, [])
+      if selector.matches(feed)
+  ]
+  if selector.ids is not None:
+    found_ids = {feed_utility.get_feed_id(feed) for feed in feeds}
+    missing_ids = [
+        feed_id for feed_id in selector.ids if feed_id not in found_ids
+    ]
+    if missing_ids:
+      click.echo(f"\nFeed IDs not found: {', '.join(missing_ids)}")
+
+  if not feeds:
+    click.echo("\nNo feeds match the given selectors.")
+    return
+
+  click.echo(f"\nFeeds to {action.verb} ({len(feeds)}):")
+  for feed in feeds:
+    log_type = feed.get(schema.KEY_DETAILS, {}).get(key_constants.KEY_LOG_TYPE)
+    click.echo(f"  {feed_utility.get_feed_id(feed)}  "
+               f"{feed.get(schema.KEY_FEED_STATE)}  {log_type}  "
+               f"{feed.get(schema.KEY_DISPLAY_NAME, '')}".rstrip())
+  if dry_run:
+    click.echo(f"\nDry run: no feeds were {action.past_tense}.")
+    return
+
+  operation_type = operations.OPERATION_TYPES[action.operation]
+  targets = []
+  skipped = []
+  for feed in feeds:
+    if (action.skip_state and
+        feed.get(schema.KEY_FEED_STATE) == action.skip_state):
+      skipped.append(feed_utility.get_feed_id(feed))
+    else:
+      targets.append(
+          operations.Operation(len(targets), action.operation,
+                               feed_utility.get_feed_id(feed)))
+
+  if targets and not yes and not click.confirm(
+      f"\n{action.verb.capitalize()} {len(targets)} feeds?", default=False):
+    click.echo(f"{action.verb.capitalize()} cancelled.")
+    return
+
+  click.echo(f"\n{action.progressive} {len(targets)} feeds...")
+  for feed_id in skipped:
+    click.echo(f"  {feed_id}: skipped (already {action.skip_state})")
+  succeeded = 0
+  with concurrent.futures.ThreadPoolExecutor(
+      max_workers=concurrency) as executor:
+    # Results are printed in list order, regardless of which request
+    # completes first.
+    results = executor.map(
+        lambda operation: operations.run_operation(
+            client, operation,
+            action.get_url(region, url, operation.resource_id)), targets)
+    for result in results:
+      if result["success"]:
+        succeeded += 1
+      click.echo(f"  {result['id']}: {get_outcome(action, result)}")
+      if verbose and "status_code" in result:
+        api_utility.print_request_details(
+            action.get_url(region, url, result["id"]),
+            operation_type.method, None, result["response"])
+
+  click.echo(f"\n{action.past_tense.capitalize()}: {succeeded}, "
+             f"Failed: {len(targets) - succeeded}, Skipped: {len(skipped)}")
+
+
+def get_outcome(action: BulkAction, result: Dict[str, Any]) -> str:
+  """Returns the outcome of an action on a feed for display.
+
+  Args:
+    action (BulkAction): Action run on the feed.
+    result (Dict[str, Any]): Result of the operation.
+
+  Returns:
+    str: Outcome of the action.
+  """
+  if result["success"]:
+    return action.past_tense
+  return operations.get_failure(result)
@@ -0,0 +1,200 @@
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Unit tests for bulk_utility.py."""
+
+import json
+import threading
+from unittest import mock
+
+from click.testing import CliRunner
+
+from feeds import bulk_utility
+from feeds.commands.delete import delete
+from feeds.commands.disable import disable
+from mock_test_utility import MockResponse
+
+runner = CliRunner()
+
+FEEDS = [
+    {
+        "name": "feeds/1",
+        "displayName": "Users",
+        "details": {
+            "logType": "WORKSPACE_USERS",
+            "namespace": "corp",
+            "labels": [{"key": "team", "value": "soc"}]
+        },
+        "feedState": "ACTIVE"
+    },
+    {
+        "name": "feeds/2",
+        "details": {
+            "logType": "WORKSPACE_USERS",
+            "labels": [{"key": "team", "value": "it"}]
+        },
+        "feedState": "INACTIVE"
+    },
+    {
+        "name": "feeds/3",
+        "details": {
+            "logType": "WORKSPACE_GROUPS",
+            "namespace": "corp"
+        },
+        "feedState": "ACTIVE"
+    },
+]
+
+
+def list_response() -> MockResponse:
+  """Returns the response of the list feeds call."""
+  return MockResponse(status_code=200, text=json.dumps({"feeds": FEEDS}))
+
+
+def test_selector_matches() -> None:
+  """Test that feeds are selected if they match every selector."""
+
+  def select(**kwargs):
+    selector = bulk_utility.FeedSelector(**kwargs)
+    return [feed["name"] for feed in FEEDS if selector.matches(feed)]
+
+  assert bulk_utility.FeedSelector().is_empty()
+  assert select(log_type="workspace_users") == ["feeds/1", "feeds/2"]
+  assert select(log_type="WORKSPACE_USERS", state="active") == ["feeds/1"]
+  assert select(namespace="corp") == ["feeds/1", "feeds/3"]
+  assert select(labels=[("team", None)]) == ["feeds/1", "feeds/2"]
+  assert select(labels=[("team", "it")]) == ["feeds/2"]
+  assert select(ids=["3", "4"]) == ["feeds/3"]
+  assert not bulk_utility.FeedSelector(ids=[]).is_empty()
+
+
+def test_get_selector(tmp_path) -> None:
+  """Test that labels and the IDs file are parsed."""
+  ids_file = tmp_path / "ids.txt"
+  ids_file.write_text("# Feeds to pause\n1\n\nfeeds/3\n1\n")
+  selector = bulk_utility.get_selector(None, None, None, ["team", "env=prod"],
+                                       str(ids_file))
+  assert selector.labels == [("team", None), ("env", "prod")]
+  assert selector.ids == ["1", "3"]
+
+
+@mock.patch("feeds.bulk_utility.chronicle_auth.initialize_http_session")
+def test_disable_dry_run(mock_client: mock.MagicMock) -> None:
+  """Test that a dry run only lists the selected feeds."""
+  mock_client.return_value = mock.Mock()
+  mock_client.return_value.request.return_value = list_response()
+
+  result = runner.invoke(disable, ["--namespace", "corp", "--dry-run"])
+  assert result.output == """Fetching list of feeds...
+
+Feeds to disable (2):
+  1  ACTIVE  WORKSPACE_USERS  Users
+  3  ACTIVE  WORKSPACE_GROUPS
+
+Dry run: no feeds were disabled.
+"""
+  mock_client.return_value.request.assert_called_once()
+
+
+@mock.patch("feeds.bulk_utility.chronicle_auth.initialize_http_session")
+def test_disable_runs_in_parallel(mock_client: mock.MagicMock) -> None:
+  """Test that selected feeds are disabled concurrently."""
+  # Both disable requests must be in flight at the same time to pass.
+  barrier = threading.Barrier(2)
+
+  def request(method, url, **kwargs):
+    del kwargs  # Unused.
+    if method == "GET":
+      return list_response()
+    barrier.wait(timeout=5)
+    if url.endswith("/3:disable"):
+      return MockResponse(
+          status_code=500, text="""{"error": {"message": "Internal"}}""")
+    return MockResponse(status_code=200, text="{}")
+
+  mock_client.return_value = mock.Mock()
+  mock_client.return_value.request.side_effect = request
+
+  result = runner.invoke(disable,
+                         ["--state", "ACTIVE", "--concurrency", "2", "--yes"])
+  assert result.output.endswith("""
+Disabling 2 feeds...
+  1: disabled
+  3: failed (Response Code: 500, Error: Internal)
+
+Disabled: 1, Failed: 1, Skipped: 0
+""")
+
+
+@mock.patch("feeds.bulk_utility.chronicle_auth.initialize_http_session")
+def test_disable_skips_inactive_feeds(mock_client: mock.MagicMock) -> None:
+  """Test that feeds already in the target state are not changed."""
+  mock_client.return_value = mock.Mock()
+  mock_client.return_value.request.side_effect = [
+      list_response(), MockResponse(status_code=200, text="{}")
+  ]
+
+  result = runner.invoke(disable, ["--label", "team", "--yes"])
+  assert result.output.endswith("""
+Disabling 1 feeds...
+  2: skipped (already INACTIVE)
+  1: disabled
+
+Disabled: 1, Failed: 0, Skipped: 1
+""")
+  mock_client.return_value.request.assert_called_with(
+      "POST", "https://backstory.googleapis.com/v1/feeds/1:disable", data={})
+
+
+@mock.patch("feeds.bulk_utility.chronicle_auth.initialize_http_session")
+def test_delete_ids_file(mock_client: mock.MagicMock, tmp_path) -> None:
+  """Test that feeds listed in a file are deleted and unknown IDs reported."""
+  ids_file = tmp_path / "ids.txt"
+  ids_file.write_text("2\n9\n")
+  mock_client.return_value = mock.Mock()
+  mock_client.return_value.request.side_effect = [
+      list_response(), MockResponse(status_code=200, text="{}")
+  ]
+
+  result = runner.invoke(delete, ["--ids-file", str(ids_file)], input="y\n")
+  assert "Feed IDs not found: 9" in result.output
+  assert result.output.endswith("""
+Delete 1 feeds? [y/N]: y
+
+Deleting 1 feeds...
+  2: deleted
+
+Deleted: 1, Failed: 0, Skipped: 0
+""")
+
+
+@mock.patch("feeds.bulk_utility.chronicle_auth.initialize_http_session")
+def test_delete_declined(mock_client: mock.MagicMock) -> None:
+  """Test that no feed is deleted if the confirmation is declined."""
+  mock_client.return_value = mock.Mock()
+  mock_client.return_value.request.return_value = list_response()
+
+  result = runner.invoke(delete, ["--state", "ACTIVE"], input="n\n")
+  assert result.output.endswith("""
+Delete 2 feeds? [y/N]: n
+Delete cancelled.
+""")
+  mock_client.return_value.request.assert_called_once_with(
+      "GET", "https://backstory.googleapis.com/v1/feeds")
+
+
+def test_dry_run_without_selector() -> None:
+  """Test that a dry run requires a selector."""
+  result = runner.invoke(delete, ["--dry-run"])
+  assert result.output == "--dry-run requires a selector such as --log-type.\n"
@@ -0,0 +1,111 @@
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Apply the changes needed to bring feeds to their definitions."""
+
+import concurrent.futures
+from typing import AnyStr, Optional
+
+import click
+
+from common import api_utility
+from common import commands_utility
+from common import exception_handler
+from common import options
+from feeds import plan_utility
+from feeds.commands import plan
+
+
+@click.command(
+    help="Create and update feeds to match the definitions of a file. As the "
+    "API has no update mask, an update sends the full displayName and details "
+    "of the live feed with the definition deep-merged into them; secrets that "
+    "the API omits from responses must therefore be given in the definition. "
+    "Changes made to a feed between the plan and the apply are overwritten.")
+@plan.definitions_option
+@click.option(
+    "-y", "--yes", is_flag=True, help="Apply the plan without confirmation.")
+@options.concurrency_option
+@options.url_option
+@options.region_option
+@options.verbose_option
+@options.credential_file_option
+@exception_handler.catch_exception()
+def apply(credential_file: AnyStr, verbose: bool, region: str,
+          url: Optional[str], concurrency: int, yes: bool,
+          definitions_file: str) -> None:
+  """Creates and updates feeds to match their definitions.
+
+  The plan is shown first. Changes of different feeds are then applied by up
+  to `concurrency` requests in parallel, and the result of each one is
+  printed in definitions order.
+
+  Args:
+    credential_file (AnyStr): Path of Service Account JSON.
+    verbose (bool): Option for printing verbose output to console.
+    region (str): Option for selecting regions. Available options - US, EUROPE,
+      ASIA_SOUTHEAST1.
+    url (str): Base URL to be used for API calls.
+    concurrency (int): Maximum number of requests sent in parallel.
+    yes (bool): Apply the plan without confirmation.
+    definitions_file (str): Path of the feed definitions file.
+
+  Raises:
+    OSError: Failed to read the given file, e.g. not found, no read access
+      (https://docs.python.org/library/exceptions.html#os-exceptions).
+    ValueError: Invalid file contents.
+    KeyError: Required key is not present in dictionary.
+    TypeError: If response data is not JSON.
+  """
+  url = commands_utility.lower_or_none(url)
+  planned = plan.make_plan(credential_file, region, url, definitions_file)
+  if not planned:
+    return
+  client, feed_plan = planned
+  click.echo(plan_utility.format_plan(feed_plan))
+  if not feed_plan.changes:
+    click.echo("\nNo changes to apply.")
+    return
+  if not yes and not click.confirm(
+      f"\nApply {len(feed_plan.changes)} changes?", default=False):
+    click.echo("Apply cancelled.")
+    return
+
+  click.echo(f"\nApplying {len(feed_plan.changes)} changes...")
+  succeeded = 0
+  with concurrent.futures.ThreadPoolExecutor(
+      max_workers=concurrency) as executor:
+    # Results are printed in definitions order, regardless of which change
+    # completes first.
+    results = executor.map(
+        lambda change: plan_utility.apply_change(client, region, url, change),
+        feed_plan.changes)
+    for change, result in zip(feed_plan.changes, results):
+      if result["success"]:
+        succeeded += 1
+        outcome = (f"created (ID: {result['id']})"
+                   if change.action == plan_utility.ACTION_CREATE else
+                   "updated")
+      elif "status_code" in result:
+        outcome = f"failed (Response Code: {result['status_code']}"
+        outcome += f", Error: {result['error']})" if result["error"] else ")"
+      else:
+        outcome = f"failed ({result['error']})"
+      click.echo(f"  {result['label']}: {outcome}")
+      if verbose and "status_code" in result:
+        api_utility.print_request_details(result["url"], result["method"],
+                                          change.body, result["response"])
+
+  click.echo(f"\nApplied: {succeeded}, "
+             f"Failed: {len(feed_plan.changes) - succeeded}")
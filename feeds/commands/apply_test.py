@@ -0,0 +1,144 @@
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Unit tests for apply.py."""
+
+import json
+import threading
+from unittest import mock
+
+from click.testing import CliRunner
+
+from feeds.commands.apply import apply
+from mock_test_utility import MockResponse
+
+runner = CliRunner()
+
+DEFINITIONS = """
+feeds:
+  - id: 1
+    details:
+      namespace: prod
+  - displayName: Alerts
+    details:
+      feedSourceType: API
+      logType: WORKSPACE_ALERTS
+  - id: 2
+    details:
+      namespace: corp
+"""
+
+LIVE_FEEDS = {
+    "feeds": [{
+        "name": "feeds/1",
+        "details": {
+            "feedSourceType": "API",
+            "logType": "WORKSPACE_USERS",
+            "namespace": "corp"
+        }
+    }, {
+        "name": "feeds/2",
+        "details": {
+            "feedSourceType": "API",
+            "logType": "WORKSPACE_GROUPS",
+            "namespace": "corp"
+        }
+    }]
+}
+
+
+@mock.patch("feeds.commands.plan.chronicle_auth.initialize_http_session")
+def test_apply(mock_client: mock.MagicMock, tmp_path) -> None:
+  """Test case to check changed feeds are applied in parallel.
+
+  Args:
+    mock_client (mock.MagicMock): Mock object
+    tmp_path (pathlib.Path): Temporary directory
+  """
+  definitions_file = tmp_path / "feeds.yaml"
+  definitions_file.write_text(DEFINITIONS)
+  # Both changes must be in flight at the same time to pass.
+  barrier = threading.Barrier(2)
+
+  def request(method, url, data=None):
+    if method == "GET":
+      return MockResponse(status_code=200, text=json.dumps(LIVE_FEEDS))
+    barrier.wait(timeout=5)
+    if method == "POST":
+      return MockResponse(
+          status_code=200,
+          text=json.dumps({"name": "feeds/3", **json.loads(data)}))
+    return MockResponse(
+        status_code=400, text="""{"error": {"message": "Invalid"}}""")
+
+  mock_client.return_value = mock.Mock()
+  mock_client.return_value.request.side_effect = request
+
+  result = runner.invoke(
+      apply, ["-f", str(definitions_file), "--yes", "--concurrency", "2"])
+  assert result.output.endswith("""
+Plan: 1 to create, 1 to update, 1 unchanged, 0 invalid.
+
+Applying 2 changes...
+  1: failed (Response Code: 400, Error: Invalid)
+  Alerts: created (ID: 3)
+
+Applied: 1, Failed: 1
+""")
+  mock_client.return_value.request.assert_any_call(
+      "PATCH", "https://backstory.googleapis.com/v1/feeds/1",
+      json.dumps({
+          "details": {
+              "feedSourceType": "API",
+              "logType": "WORKSPACE_USERS",
+              "namespace": "prod"
+          }
+      }))
+
+
+@mock.patch("feeds.commands.plan.chronicle_auth.initialize_http_session")
+def test_apply_cancelled(mock_client: mock.MagicMock, tmp_path) -> None:
+  """Test case to check nothing is applied without confirmation.
+
+  Args:
+    mock_client (mock.MagicMock): Mock object
+    tmp_path (pathlib.Path): Temporary directory
+  """
+  definitions_file = tmp_path / "feeds.yaml"
+  definitions_file.write_text(DEFINITIONS)
+  mock_client.return_value = mock.Mock()
+  mock_client.return_value.request.return_value = MockResponse(
+      status_code=200, text=json.dumps(LIVE_FEEDS))
+
+  result = runner.invoke(apply, ["-f", str(definitions_file)], input="n\n")
+  assert result.output.endswith("Apply 2 changes? [y/N]: n\nApply cancelled.\n")
+  mock_client.return_value.request.assert_called_once()
+
+
+@mock.patch("feeds.commands.plan.chronicle_auth.initialize_http_session")
+def test_apply_no_changes(mock_client: mock.MagicMock, tmp_path) -> None:
+  """Test case to check nothing is sent if the feeds match.
+
+  Args:
+    mock_client (mock.MagicMock): Mock object
+    tmp_path (pathlib.Path): Temporary directory
+  """
+  definitions_file = tmp_path / "feeds.yaml"
+  definitions_file.write_text("feeds:\n  - id: 2\n    details: {}\n")
+  mock_client.return_value = mock.Mock()
+  mock_client.return_value.request.return_value = MockResponse(
+      status_code=200, text=json.dumps(LIVE_FEEDS))
+
+  result = runner.invoke(apply, ["-f", str(definitions_file)])
+  assert result.output.endswith("\nNo changes to apply.\n")
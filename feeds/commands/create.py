@@ -17,7 +17,7 @@
 import dataclasses
 import json
 import os.path
-from typing import Any, Dict, Optional
+from typing import List, Optional
 
 import click
 from click._compat import WIN
@@ -28,11 +28,13 @@ from common import commands_utility
 from common import exception_handler
 from common import file_utility
 from common import options
+from common import profiling
 from common.constants import key_constants
 from common.constants import status
 from feeds import feed_schema_utility
 from feeds import feed_templates
 from feeds import feed_utility
+from feeds import log_type_utility
 from feeds.constants import schema
 
 CREATE_BACKUP_FILE = os.path.join(chronicle_auth.CHRONICLE_CLI_ROOT_DIR,
@@ -40,12 +42,23 @@ CREATE_BACKUP_FILE = os.path.join(chronicle_auth.CHRONICLE_CLI_ROOT_DIR,
 
 
 @click.command(help="Create a feed")
+@click.option(
+    "--source-type",
+    help="Source type of the feed, by ID or display name, e.g. API. "
+    "Skips the source type prompt.")
+@click.option(
+    "--log-type",
+    help="Log type of the feed, by ID or display name, e.g. WORKSPACE_USERS. "
+    "Skips the log type prompt.")
 @options.url_option
 @options.region_option
 @options.verbose_option
+@options.refresh_schema_option
 @options.credential_file_option
 @exception_handler.catch_exception()
-def create(credential_file: str, verbose: bool, region: str, url: str) -> None:
+def create(credential_file: str, verbose: bool, region: str, url: str,
+           refresh_schema: bool, source_type: Optional[str],
+           log_type: Optional[str]) -> None:
   """Create feed.
 
   Args:
@@ -54,6 +67,10 @@ def create(credential_file: str, verbose: bool, region: str, url: str) -> None:
     region (str): Option for selecting regions. Available options - US, EUROPE,
       ASIA_SOUTHEAST1.
     url (str): Base URL to be used for API calls.
+    refresh_schema (bool): Option for fetching the feed schema from the API
+      instead of the local cache.
+    source_type (str): ID or display name of the source type of the feed.
+    log_type (str): ID or display name of the log type of the feed.
 
   Raises:
     OSError: Failed to read the given file, e.g. not found, no read access
@@ -63,13 +80,17 @@ def create(credential_file: str, verbose: bool, region: str, url: str) -> None:
     TypeError: If response data is not JSON.
   """
   url = commands_utility.lower_or_none(url)
-  feed_schema = feed_schema_utility.FeedSchema(credential_file, region, url)
+  feed_schema = feed_schema_utility.FeedSchema(credential_file, region, url,
+                                               refresh_schema)
   retry = False
   properties_map = feed_schema.get_log_source_map()
   flattened_response = {}
+  # A feed whose types are given by options is a new feed, so the pending
+  # feed of the backup file is neither offered for retry nor discarded.
+  keep_backup = bool(source_type or log_type)
 
   # Checking condition that backup file exists for any pending feed.
-  if os.path.exists(CREATE_BACKUP_FILE) and (
+  if not keep_backup and os.path.exists(CREATE_BACKUP_FILE) and (
       os.path.getsize(CREATE_BACKUP_FILE)) != 0:
     with open(CREATE_BACKUP_FILE, "r") as file:
       backup_data = json.load(file)
@@ -87,7 +108,12 @@ def create(credential_file: str, verbose: bool, region: str, url: str) -> None:
     feed_display_name = backup_data.get(schema.KEY_DISPLAY_NAME)
     flattened_response = backup_data
   else:
-    properties = log_source_types_from_user(properties_map)
+    try:
+      properties = log_source_types_from_user(
+          feed_schema.get_log_type_index(), source_type, log_type)
+    except ValueError as e:
+      click.echo(e)
+      return
     selected_source_type = properties.selected_source_type
     selected_log_type = properties.selected_log_type
     feed_display_name = properties.feed_display_name
@@ -102,13 +128,14 @@ def create(credential_file: str, verbose: bool, region: str, url: str) -> None:
   # "flattened_response" is received along with the response body,
   # for storing the existing data into the backup file.
   request_body, flattened_response = feed_schema.prepare_request_body(
-      feed_detailed_schema.log_type_schema, selected_source_type,
-      selected_log_type, flattened_response, feed_display_name)
+      feed_schema.get_field_plan(selected_source_type, selected_log_type),
+      selected_source_type, selected_log_type, flattened_response,
+      feed_display_name)
 
   full_url = feed_utility.get_feed_url(region, url)
   method = "POST"
   api_response = feed_schema.client.request(method, full_url, request_body)
-  response = api_utility.check_content_type(api_response.text)
+  response = api_utility.check_content_type(api_response.content)
 
   if api_response.status_code != status.STATUS_OK:
     click.echo(
@@ -128,7 +155,8 @@ def create(credential_file: str, verbose: bool, region: str, url: str) -> None:
 
   click.echo("\nFeed created successfully with Feed ID: "
              f"{response[schema.KEY_NAME][6:]}")
-  file_utility.remove_file(CREATE_BACKUP_FILE)
+  if not keep_backup:
+    file_utility.remove_file(CREATE_BACKUP_FILE)
   if verbose:
     api_utility.print_request_details(full_url, method, request_body, response)
 
@@ -141,49 +169,133 @@ class Properties:
   feed_display_name: Optional[str]
 
 
-def log_source_types_from_user(properties_map: Dict[str, Any]) -> Any:
-  """Remove backup file if exists and fetch data for API request body.
+def log_source_types_from_user(
+    log_type_index: log_type_utility.LogTypeIndex,
+    source_type: Optional[str] = None,
+    log_type: Optional[str] = None) -> Properties:
+  """Fetch source type, log type and display name of the feed from user.
+
+  Source type and log type given as options are used instead of prompting.
 
   Args:
-    properties_map (Dict): Mapping dictionary of source and related log types.
+    log_type_index (LogTypeIndex): Index of source types and log types.
+    source_type (str): ID or display name of the source type.
+    log_type (str): ID or display name of the log type.
 
   Returns:
     properties (dataclass): Contains selected log type and source type.
+
+  Raises:
+    ValueError: Given source type or log type is not found.
   """
   click.echo(f"{feed_templates.properties_template.template}")
-  click.echo("\nList of Source types:")
 
-  for index, each_source in enumerate(list(properties_map.values())):
-    click.echo(f"{index + 1}. {each_source.get(schema.KEY_DISPLAY_NAME)}")
+  selected_source_type = None
+  if source_type:
+    selected_source_type = log_type_utility.resolve_source_type(
+        log_type_index, source_type)
+  if log_type:
+    selected = log_type_utility.resolve_log_type(log_type_index, log_type,
+                                                 selected_source_type)
+    click.echo("\nYou have selected " +
+               click.style(f"{selected.source_display_name}", bold=True))
+  else:
+    if not selected_source_type:
+      selected_source_type = source_type_from_user(log_type_index)
+    click.echo("\nYou have selected " + click.style(
+        f"{log_type_index.source_types[selected_source_type]}", bold=True))
+    selected = log_type_from_user(log_type_index, selected_source_type)
+
+  click.echo("\nYou have selected " +
+             click.style(f"{selected.display_name}", bold=True))
+  feed_display_name = click.prompt(
+      "\nEnter feed display name", show_default=False, default="")
+  return Properties(selected.log_type, selected.source_type, feed_display_name)
+
+
+def source_type_from_user(log_type_index: log_type_utility.LogTypeIndex) -> str:
+  """Prompt user to choose a source type.
+
+  Args:
+    log_type_index (LogTypeIndex): Index of source types and log types.
+
+  Returns:
+    str: ID of the selected source type.
+  """
+  click.echo("\nList of Source types:")
+  source_types = list(log_type_index.source_types)
+  for index, each_source in enumerate(source_types):
+    click.echo(f"{index + 1}. {log_type_index.source_types[each_source]}")
 
   choice = click.prompt(
       "\n[Source type] Enter your choice",
-      type=click.types.IntRange(1, len(properties_map)))
+      type=click.types.IntRange(1, len(source_types)))
+  return source_types[choice - 1]
 
-  selected_source_type = list(properties_map.keys())[choice - 1]
-  click.echo("\nYou have selected " + click.style(
-      f"{properties_map[selected_source_type].get(schema.KEY_DISPLAY_NAME)}",
-      bold=True))
 
-  log_types = properties_map[selected_source_type].get(schema.KEY_LOG_TYPES)
-  out_str = f"{feed_templates.log_type_template.template}"
-  if WIN:
-    out_str = f"{feed_templates.log_type_template_win.template}"
+def log_type_from_user(log_type_index: log_type_utility.LogTypeIndex,
+                       source_type: str) -> log_type_utility.LogType:
+  """Prompt user to choose a log type of a source type.
+
+  The full list is shown in a pager. Instead of a choice number, the user can
+  enter text to narrow the list down to the log types matching it.
+
+  Args:
+    log_type_index (LogTypeIndex): Index of source types and log types.
+    source_type (str): ID of the selected source type.
+
+  Returns:
+    LogType: Selected log type.
+  """
+  log_types = log_type_index.get_log_types(source_type)
+  choices = log_types
+  show_choices = True
+  while True:
+    if show_choices:
+      print_log_types(choices, choices is log_types)
+
+    answer = str(
+        click.prompt(
+            "\n[Log type] Enter your choice, or text to filter the list",
+            default="",
+            show_default=False)).strip()
+    show_choices = True
+    if answer.isdigit() and 1 <= int(answer) <= len(choices):
+      return choices[int(answer) - 1]
+    if answer.isdigit() and int(answer) != 0:
+      click.echo(f"Error: {answer} is not in the range 1 to {len(choices)}.")
+      show_choices = False
+    elif answer.isdigit() or not answer:
+      choices = log_types
+    else:
+      matches = log_type_index.search(answer, source_type)
+      if matches:
+        choices = matches
+      else:
+        click.echo(f"No log types match '{answer}'.")
+        show_choices = False
+
+
+def print_log_types(log_types: List[log_type_utility.LogType],
+                    is_full_list: bool) -> None:
+  """Print numbered log types.
+
+  The full list of log types is shown in a pager, a filtered one is printed.
+
+  Args:
+    log_types (List[LogType]): Log types to print.
+    is_full_list (bool): Whether log_types are all log types of the source
+      type.
+  """
+  out_str = ""
   for index, log_type in enumerate(log_types):
-    out_str = out_str + f"{index + 1}. {log_type[1]} ({log_type[0]})\n"
-
-  choice = 0
-  while choice == 0:
-    click.echo_via_pager(out_str)
-    choice = click.prompt(
-        "\n[Log type] Enter your choice",
-        default=0,
-        show_default=False,
-        type=click.types.IntRange(0, len(log_types)))
-
-  selected_log_type = log_types[choice - 1][0]
-  click.echo("\nYou have selected " +
-             click.style(f"{log_types[choice - 1][1]}", bold=True))
-  feed_display_name = click.prompt(
-      "\nEnter feed display name", show_default=False, default="")
-  return Properties(selected_log_type, selected_source_type, feed_display_name)
+    out_str += f"{index + 1}. {log_type.display_name} ({log_type.log_type})\n"
+
+  if not is_full_list:
+    click.echo(f"\nMatching log types:\n{out_str}", nl=False)
+    return
+  template = feed_templates.log_type_template
+  if WIN:
+    template = feed_templates.log_type_template_win
+  with profiling.span("pager", profiling.CATEGORY_RENDER):
+    click.echo_via_pager(f"{template.template}{out_str}")
@@ -15,13 +15,15 @@
 """Unit tests for create.py."""
 
 import os
-from typing import Tuple
+from typing import Any, Tuple
 from unittest import mock
 
 from click._compat import WIN
 from click.testing import CliRunner
 
+from feeds import log_type_utility
 from feeds.commands.create import create
+from feeds.commands.create import log_type_from_user
 from feeds.commands.create import Properties
 from feeds.tests.fixtures import *  # pylint: disable=wildcard-import
 from feeds.tests.fixtures import create_backup_file
@@ -100,7 +102,8 @@ List of Log types:
 (i) How to select log type?
   - Press ENTER key (scrolls one line at a time) or SPACEBAR key (display next screen).
   - Note down the choice number for the log type that you want to select.
-  - Press 'q' to quit and enter that choice number.
+  - Press 'q' to quit and enter that choice number, or enter text to filter
+    the list.
 =============================================================================
 1. Dummy LogType2 (DUMMY_LOGTYPE2)
 
@@ -133,7 +136,8 @@ List of Log types:
     is case-sensitive.
   - To search for specific log type, press '/' key, enter text and press enter.
   - Note down the choice number for the log type that you want to select.
-  - Press 'q' to quit and enter that choice number.
+  - Press 'q' to quit and enter that choice number, or enter text to filter
+    the list.
   - Press `h` for all the available options to navigate the list.
 =============================================================================
 1. Dummy LogType2 (DUMMY_LOGTYPE2)
@@ -459,3 +463,157 @@ def test_create_success_empty_backup(mock_input: mock.MagicMock,
   expected_output = "Feed created successfully with Feed ID: 123"
   result = runner.invoke(create, ["--credential_file", ""])
   assert expected_output in result.output
+
+
+@mock.patch(
+    "feeds.feed_schema_utility.FeedSchema.prepare_request_body"
+)
+@mock.patch(
+    "feeds.commands.create.CREATE_BACKUP_FILE",
+    TEMP_CREATE_BACKUP_FILE)
+@mock.patch(
+    "feeds.feed_schema_utility.chronicle_auth.initialize_http_session"
+)
+@mock.patch(
+    "feeds.commands.create.click.prompt")
+def test_create_log_type_option(mock_input: mock.MagicMock,
+                                mock_client: mock.MagicMock,
+                                mock_request_body: mock.MagicMock,
+                                get_feed_schema: Tuple[str, str]) -> None:
+  """Test case to check creation of feed with source and log type options.
+
+  Args:
+    mock_input: Mock object for click prompt
+    mock_client: Mock object
+    mock_request_body: Mock object
+    get_feed_schema: Test data
+  """
+  mock_client.return_value = mock.Mock()
+  mock_client.return_value.request.side_effect = [
+      get_feed_schema,
+      MockResponse(status_code=200, text="""{"name": "feeds/123"}""")
+  ]
+  mock_input.side_effect = ["Dummy feed display name"]
+  mock_request_body.return_value = ("{}", {})
+  result = runner.invoke(create, [
+      "--credential_file", "", "--source-type", "dummy source type 2",
+      "--log-type", "dummy_logtype2"
+  ])
+  assert """====================================
+
+You have selected Dummy Source Type 2
+
+You have selected Dummy LogType2
+""" in result.output
+  assert "Feed created successfully with Feed ID: 123" in result.output
+  assert mock_request_body.call_args[0][1:3] == ("DUMMY2", "DUMMY_LOGTYPE2")
+
+
+@mock.patch(
+    "feeds.feed_schema_utility.FeedSchema.prepare_request_body"
+)
+@mock.patch(
+    "feeds.commands.create.CREATE_BACKUP_FILE",
+    TEMP_CREATE_BACKUP_FILE)
+@mock.patch(
+    "feeds.feed_schema_utility.chronicle_auth.initialize_http_session"
+)
+@mock.patch(
+    "feeds.commands.create.click.confirm")
+@mock.patch(
+    "feeds.commands.create.click.prompt")
+def test_create_log_type_option_with_backup(
+    mock_input: mock.MagicMock, mock_confirm: mock.MagicMock,
+    mock_client: mock.MagicMock, mock_request_body: mock.MagicMock,
+    get_feed_schema: Tuple[str, str]) -> None:
+  """Test case to check type options do not retry nor discard a backup.
+
+  Args:
+    mock_input: Mock object for click prompt
+    mock_confirm: Mock object for click confirm
+    mock_client: Mock object
+    mock_request_body: Mock object
+    get_feed_schema: Test data
+  """
+  create_backup_file(TEMP_CREATE_BACKUP_FILE, {
+      "feedSourceType": "DUMMY",
+      "display_source_type": "Dummy Source Type",
+      "logType": "DUMMY_LOGTYPE",
+      "display_log_type": "Dummy LogType"
+  })
+  mock_client.return_value = mock.Mock()
+  mock_client.return_value.request.side_effect = [
+      get_feed_schema,
+      MockResponse(status_code=200, text="""{"name": "feeds/123"}""")
+  ]
+  mock_input.side_effect = ["Dummy feed display name"]
+  mock_request_body.return_value = ("{}", {})
+  result = runner.invoke(create, [
+      "--credential_file", "", "--source-type", "dummy source type 2",
+      "--log-type", "dummy_logtype2"
+  ])
+  assert "Feed created successfully with Feed ID: 123" in result.output
+  assert mock_request_body.call_args[0][1:3] == ("DUMMY2", "DUMMY_LOGTYPE2")
+  mock_confirm.assert_not_called()
+  assert os.path.exists(TEMP_CREATE_BACKUP_FILE)
+  os.remove(TEMP_CREATE_BACKUP_FILE)
+
+
+@mock.patch(
+    "feeds.commands.create.CREATE_BACKUP_FILE",
+    TEMP_CREATE_BACKUP_FILE)
+@mock.patch(
+    "feeds.feed_schema_utility.chronicle_auth.initialize_http_session"
+)
+def test_create_log_type_option_not_found(mock_client: mock.MagicMock,
+                                          get_feed_schema: Tuple[str,
+                                                                 str]) -> None:
+  """Test case to check suggestions for an unknown log type option.
+
+  Args:
+    mock_client: Mock object
+    get_feed_schema: Test data
+  """
+  mock_client.return_value = mock.Mock()
+  mock_client.return_value.request.side_effect = [get_feed_schema]
+  result = runner.invoke(create, [
+      "--credential_file", "", "--source-type", "DUMMY3", "--log-type",
+      "logtype"
+  ])
+  assert result.output.endswith(
+      "Log type 'logtype' not found for source type DUMMY3. "
+      "Did you mean: DUMMY_LOGTYPE3 (Dummy LogType3)?\n")
+  assert mock_client.return_value.request.call_count == 1
+
+
+@mock.patch("feeds.commands.create.click.echo_via_pager")
+@mock.patch("feeds.commands.create.click.prompt")
+def test_log_type_from_user_filter(mock_input: mock.MagicMock,
+                                   mock_pager: mock.MagicMock,
+                                   capsys: Any) -> None:
+  """Test case to check filtering the list of log types by text.
+
+  Args:
+    mock_input: Mock object for click prompt
+    mock_pager: Mock object for click pager
+    capsys: Captured output
+  """
+  log_type_index = log_type_utility.LogTypeIndex({
+      "API": {
+          "displayName": "Third party API",
+          "logTypes": [("AZURE_AD", "Azure AD"),
+                       ("WORKSPACE_USERS", "Workspace Users"),
+                       ("WORKSPACE_GROUPS", "Workspace Groups")]
+      }
+  })
+  mock_input.side_effect = ["okta", "workspace", "5", "2"]
+  result = log_type_from_user(log_type_index, "API")
+  assert result.log_type == "WORKSPACE_USERS"
+  assert mock_pager.call_count == 1
+  assert capsys.readouterr().out == """No log types match 'okta'.
+
+Matching log types:
+1. Workspace Groups (WORKSPACE_GROUPS)
+2. Workspace Users (WORKSPACE_USERS)
+Error: 5 is not in the range 1 to 2.
+"""
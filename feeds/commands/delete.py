@@ -14,7 +14,7 @@
 #
 """Delete feed."""
 
-from typing import AnyStr
+from typing import AnyStr, List, Optional
 
 import click
 
@@ -25,17 +25,24 @@ from common import exception_handler
 from common import options
 from common.constants import key_constants
 from common.constants import status
+from feeds import bulk_utility
 from feeds import feed_utility
 
 
-@click.command(help="Delete a feed")
+@click.command(
+    short_help="Delete a feed",
+    help="Delete a feed. With selectors such as --log-type, delete every "
+    "matching feed instead.")
 @options.url_option
 @options.region_option
 @options.verbose_option
+@bulk_utility.bulk_options
 @options.credential_file_option
 @exception_handler.catch_exception()
-def delete(credential_file: AnyStr, verbose: bool, region: str,
-           url: str) -> None:
+def delete(credential_file: AnyStr, verbose: bool, region: str, url: str,
+           log_type: Optional[str], state: Optional[str],
+           namespace: Optional[str], labels: List[str], ids_file: Optional[str],
+           dry_run: bool, yes: bool, concurrency: int) -> None:
   """Delete a Feed.
 
   Args:
@@ -44,6 +51,14 @@ def delete(credential_file: AnyStr, verbose: bool, region: str,
     region (str): Option for selecting regions. Available options - US, EUROPE,
       ASIA_SOUTHEAST1.
     url (str): Base URL to be used for API calls.
+    log_type (str): Selects the feeds of a log type.
+    state (str): Selects the feeds in a state.
+    namespace (str): Selects the feeds of a namespace.
+    labels (List[str]): Selects the feeds with labels, as KEY or KEY=VALUE.
+    ids_file (str): Path of a file listing the IDs of the selected feeds.
+    dry_run (bool): Only print the selected feeds.
+    yes (bool): Change the selected feeds without confirmation.
+    concurrency (int): Maximum number of requests sent in parallel.
 
   Raises:
     OSError: Failed to read the given file, e.g. not found, no read access
@@ -53,6 +68,16 @@ def delete(credential_file: AnyStr, verbose: bool, region: str,
     TypeError: If response data is not JSON.
   """
   url = commands_utility.lower_or_none(url)
+  selector = bulk_utility.get_selector(log_type, state, namespace, labels,
+                                       ids_file)
+  if not selector.is_empty():
+    bulk_utility.run(bulk_utility.DELETE, selector, credential_file, region,
+                     url, concurrency, dry_run, yes, verbose)
+    return
+  if dry_run:
+    click.echo("--dry-run requires a selector such as --log-type.")
+    return
+
   feed_id = click.prompt("Enter Feed ID", default="", show_default=False)
   if not feed_id:
     click.echo("Feed ID not provided. Please enter Feed ID.")
@@ -63,7 +88,7 @@ def delete(credential_file: AnyStr, verbose: bool, region: str,
   method = "DELETE"
   delete_feeds_response = http_client.request(method, full_url)
   status_code = delete_feeds_response.status_code
-  response = api_utility.check_content_type(delete_feeds_response.text)
+  response = api_utility.check_content_type(delete_feeds_response.content)
 
   if status_code == status.STATUS_OK:
     click.echo(f"\nFeed (ID: {feed_id}) deleted successfully.")
@@ -14,7 +14,7 @@
 #
 """Disable feed."""
 
-from typing import AnyStr
+from typing import AnyStr, List, Optional
 
 import click
 
@@ -24,18 +24,26 @@ from common import exception_handler
 from common import options
 from common.constants import key_constants
 from common.constants import status
+from feeds import bulk_utility
 from feeds import feed_schema_utility
 from feeds import feed_utility
 
 
-@click.command(help="Disable feed with a given feed id.")
+@click.command(
+    help="Disable feed with a given feed id. With selectors such as "
+    "--log-type, disable every matching feed instead.")
 @options.url_option
 @options.region_option
 @options.verbose_option
+@bulk_utility.bulk_options
+@options.refresh_schema_option
 @options.credential_file_option
 @exception_handler.catch_exception()
-def disable(credential_file: AnyStr, verbose: bool, region: str,
-            url: AnyStr) -> None:
+def disable(credential_file: AnyStr, verbose: bool, region: str, url: AnyStr,
+            refresh_schema: bool, log_type: Optional[str], state: Optional[str],
+            namespace: Optional[str], labels: List[str],
+            ids_file: Optional[str], dry_run: bool, yes: bool,
+            concurrency: int) -> None:
   """Disable feed using Feed ID.
 
   Args:
@@ -44,6 +52,16 @@ def disable(credential_file: AnyStr, verbose: bool, region: str,
     region (str): Option for selecting regions. Available options - US, EUROPE,
       ASIA_SOUTHEAST1.
     url (str): Base URL to be used for API calls.
+    refresh_schema (bool): Option for fetching the feed schema from the API
+      instead of the local cache.
+    log_type (str): Selects the feeds of a log type.
+    state (str): Selects the feeds in a state.
+    namespace (str): Selects the feeds of a namespace.
+    labels (List[str]): Selects the feeds with labels, as KEY or KEY=VALUE.
+    ids_file (str): Path of a file listing the IDs of the selected feeds.
+    dry_run (bool): Only print the selected feeds.
+    yes (bool): Change the selected feeds without confirmation.
+    concurrency (int): Maximum number of requests sent in parallel.
 
   Raises:
     OSError: Failed to read the given file, e.g. not found, no read access
@@ -53,7 +71,18 @@ def disable(credential_file: AnyStr, verbose: bool, region: str,
     TypeError: If response data is not JSON.
   """
   url = commands_utility.lower_or_none(url)
-  feed_schema = feed_schema_utility.FeedSchema(credential_file, region, url)
+  selector = bulk_utility.get_selector(log_type, state, namespace, labels,
+                                       ids_file)
+  if not selector.is_empty():
+    bulk_utility.run(bulk_utility.DISABLE, selector, credential_file, region,
+                     url, concurrency, dry_run, yes, verbose)
+    return
+  if dry_run:
+    click.echo("--dry-run requires a selector such as --log-type.")
+    return
+
+  feed_schema = feed_schema_utility.FeedSchema(credential_file, region, url,
+                                               refresh_schema)
   feed_id = click.prompt("Enter Feed ID", default="", show_default=False)
   if not feed_id:
     click.echo("Feed ID not provided. Please enter Feed ID.")
@@ -62,7 +91,7 @@ def disable(credential_file: AnyStr, verbose: bool, region: str,
   full_url = f"{feed_utility.get_feed_url(region, url)}/{feed_id}:disable"
   method = "POST"
   disable_feed_response = feed_schema.client.request(method, full_url, {})
-  response = api_utility.check_content_type(disable_feed_response.text)
+  response = api_utility.check_content_type(disable_feed_response.content)
 
   status_code = disable_feed_response.status_code
 
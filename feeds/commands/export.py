@@ -0,0 +1,94 @@
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Export every feed to a snapshot."""
+
+import os
+from typing import AnyStr, Optional
+
+import click
+
+from common import api_utility
+from common import commands_utility
+from common import exception_handler
+from common import file_utility
+from common import options
+from feeds import feed_schema_utility
+from feeds import feed_utility
+from feeds import snapshot_utility
+from feeds.constants import schema
+
+
+@click.command(
+    name="export",
+    help="Export every feed to an NDJSON snapshot. The snapshot can be "
+    "restored with feeds import.")
+@click.argument("snapshot", type=click.Path(dir_okay=False))
+@options.url_option
+@options.region_option
+@options.refresh_schema_option
+@options.credential_file_option
+@exception_handler.catch_exception()
+def export_command(credential_file: AnyStr, region: str, url: Optional[str],
+                   refresh_schema: bool, snapshot: str) -> None:
+  """Exports every feed to an NDJSON snapshot.
+
+  The feeds are written one per line while the list response is received,
+  so they are never all held in memory. The snapshot only replaces an
+  existing file once it is complete, and the resume file of an import of the
+  replaced snapshot is removed.
+
+  Args:
+    credential_file (AnyStr): Path of Service Account JSON.
+    region (str): Option for selecting regions. Available options - US, EUROPE,
+      ASIA_SOUTHEAST1.
+    url (str): Base URL to be used for API calls.
+    refresh_schema (bool): Option for fetching the feed schema from the API
+      instead of the local cache.
+    snapshot (str): Path of the snapshot file.
+
+  Raises:
+    OSError: Failed to read the given file, e.g. not found, no read access
+      (https://docs.python.org/library/exceptions.html#os-exceptions).
+    KeyError: Required key is not present in dictionary.
+    TypeError: If response data is not JSON.
+  """
+  url = commands_utility.lower_or_none(url)
+  feed_schema = feed_schema_utility.FeedSchema(credential_file, region, url,
+                                               refresh_schema)
+  snapshot = os.path.abspath(snapshot)
+  partial_snapshot = f"{snapshot}.partial"
+  list_feeds_response = feed_schema.client.request(
+      "GET", feed_utility.get_feed_url(region, url), stream=True)
+  try:
+    error = feed_utility.get_list_feeds_error(list_feeds_response)
+    if error:
+      click.echo(error)
+      return
+
+    with file_utility.NdjsonWriter(partial_snapshot) as writer:
+      for feed in api_utility.iter_array_items(
+          list_feeds_response.iter_content(snapshot_utility.CHUNK_SIZE),
+          schema.KEY_FEEDS):
+        writer.write(snapshot_utility.get_snapshot_record(feed_schema, feed))
+  except BaseException:
+    file_utility.remove_file(partial_snapshot)
+    raise
+  finally:
+    list_feeds_response.close()
+
+  os.replace(partial_snapshot, snapshot)
+  # Progress of an import of the replaced snapshot does not apply to this one.
+  file_utility.remove_file(f"{snapshot}.resume")
+  click.echo(f"Exported {writer.count} feeds to: {snapshot}")
@@ -0,0 +1,94 @@
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Unit tests for export.py."""
+
+import json
+import os
+from typing import Any
+from unittest import mock
+
+from click.testing import CliRunner
+
+from feeds.commands.export import export_command
+from feeds.tests.fixtures import *  # pylint: disable=wildcard-import
+from mock_test_utility import MockResponse
+
+runner = CliRunner()
+
+
+@mock.patch(
+    "feeds.feed_schema_utility.chronicle_auth.initialize_http_session"
+)
+def test_export(mock_client: mock.MagicMock, get_feed_schema: MockResponse,
+                list_feeds_data: MockResponse, tmp_path: Any) -> None:
+  """Test case to check feeds are streamed to the snapshot.
+
+  The resume file of an import of the previous snapshot is removed.
+
+  Args:
+    mock_client (mock.MagicMock): Mock object
+    get_feed_schema (MockResponse): Test input data
+    list_feeds_data (MockResponse): Test input data
+    tmp_path (pathlib.Path): Temporary directory
+  """
+  mock_client.return_value = mock.Mock()
+  mock_client.return_value.request.side_effect = [
+      get_feed_schema, list_feeds_data
+  ]
+  snapshot = os.path.join(tmp_path, "feeds.ndjson")
+  with open(f"{snapshot}.resume", "w") as file:
+    file.write("# snapshot sha256:0\n")
+
+  result = runner.invoke(export_command, [snapshot])
+  assert result.output == f"Exported 1 feeds to: {snapshot}\n"
+  mock_client.return_value.request.assert_called_with(
+      "GET", "https://backstory.googleapis.com/v1/feeds", stream=True)
+  with open(snapshot) as file:
+    records = [json.loads(line) for line in file]
+  assert len(records) == 1
+  assert records[0]["display_source_type"] == "Dummy Source Type"
+  assert records[0]["display_log_type"] == "Dummy LogType"
+  assert records[0]["details.namespace"] == "sample_namespace"
+  assert not os.path.exists(f"{snapshot}.partial")
+  assert not os.path.exists(f"{snapshot}.resume")
+
+
+@mock.patch(
+    "feeds.feed_schema_utility.chronicle_auth.initialize_http_session"
+)
+def test_export_truncated_response(mock_client: mock.MagicMock,
+                                   get_feed_schema: MockResponse,
+                                   tmp_path: Any) -> None:
+  """Test case to check an interrupted export keeps the previous snapshot.
+
+  Args:
+    mock_client (mock.MagicMock): Mock object
+    get_feed_schema (MockResponse): Test input data
+    tmp_path (pathlib.Path): Temporary directory
+  """
+  mock_client.return_value = mock.Mock()
+  mock_client.return_value.request.side_effect = [
+      get_feed_schema,
+      MockResponse(status_code=200, text='{"feeds": [{"name": "feeds/1"')
+  ]
+  snapshot = os.path.join(tmp_path, "feeds.ndjson")
+  with open(snapshot, "w") as file:
+    file.write("previous\n")
+
+  result = runner.invoke(export_command, [snapshot])
+  assert result.output == "Failed with exception: URL is not reachable.\n"
+  with open(snapshot) as file:
+    assert file.read() == "previous\n"
+  assert not os.path.exists(f"{snapshot}.partial")
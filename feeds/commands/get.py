@@ -14,14 +14,16 @@
 #
 """Get feed details."""
 
-from typing import AnyStr
+from typing import AnyStr, List
 
 import click
 
 from common import api_utility
+from common import chronicle_auth
 from common import commands_utility
 from common import exception_handler
 from common import options
+from common import regions
 from common.constants import key_constants
 from common.constants import status
 from feeds import feed_schema_utility
@@ -33,19 +35,30 @@ from feeds.constants import schema
 @click.command(help="Get feed details using Feed ID")
 @options.url_option
 @options.region_option
+@options.regions_option
+@options.all_regions_option
 @options.verbose_option
+@options.refresh_schema_option
 @options.credential_file_option
 @exception_handler.catch_exception()
-def get(credential_file: AnyStr, verbose: bool, region: str,
-        url: AnyStr) -> None:
+def get(credential_file: AnyStr, verbose: bool, region: str, url: AnyStr,
+        refresh_schema: bool, region_list: List[str],
+        all_regions: bool) -> None:
   """Get feed details using Feed ID.
 
+  With --regions or --all-regions, the regions are searched concurrently and
+  the feed of the first region that has it is shown.
+
   Args:
     credential_file (str): Path of Service Account JSON.
     verbose (bool): Option for printing verbose output to console.
     region (str): Option for selecting regions. Available options - US, EUROPE,
       ASIA_SOUTHEAST1.
     url (str): Base URL to be used for API calls.
+    refresh_schema (bool): Option for fetching the feed schema from the API
+      instead of the local cache.
+    region_list (List[str]): Regions to search for the feed.
+    all_regions (bool): Option for searching all regions for the feed.
 
   Raises:
     OSError: Failed to read the given file, e.g. not found, no read access
@@ -55,16 +68,40 @@ def get(credential_file: AnyStr, verbose: bool, region: str,
     TypeError: If response data is not JSON.
   """
   url = commands_utility.lower_or_none(url)
-  feed_schema = feed_schema_utility.FeedSchema(credential_file, region, url)
+  region_list = regions.get_regions(region_list, all_regions)
+  url_error = regions.get_url_error(region_list, url)
+  if url_error:
+    click.echo(url_error)
+    return
+
+  if not region_list:
+    feed_schema = feed_schema_utility.FeedSchema(credential_file, region, url,
+                                                 refresh_schema)
   feed_id = click.prompt("Enter Feed ID", default="", show_default=False)
   if not feed_id:
     click.echo("Feed ID not provided. Please enter Feed ID.")
     return
 
-  full_url = f"{feed_utility.get_feed_url(region, url)}/{feed_id}"
   method = "GET"
-  get_feed_response = feed_schema.client.request(method, full_url)
-  response = api_utility.check_content_type(get_feed_response.text)
+  if region_list:
+    client = chronicle_auth.initialize_http_session(credential_file)
+    found, misses = regions.find_first(
+        lambda candidate: client.request(
+            method, f"{feed_utility.get_feed_url(candidate, url)}/{feed_id}"),
+        region_list,
+        lambda response: response.status_code == status.STATUS_OK)
+    if not found:
+      regions.print_not_found("Feed", misses)
+      return
+    region, get_feed_response = found.region, found.result
+    click.echo(f"Region: {region}")
+    feed_schema = feed_schema_utility.FeedSchema(credential_file, region, url,
+                                                 refresh_schema)
+    full_url = f"{feed_utility.get_feed_url(region, url)}/{feed_id}"
+  else:
+    full_url = f"{feed_utility.get_feed_url(region, url)}/{feed_id}"
+    get_feed_response = feed_schema.client.request(method, full_url)
+  response = api_utility.check_content_type(get_feed_response.content)
 
   status_code = get_feed_response.status_code
 
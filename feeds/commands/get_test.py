@@ -218,3 +218,91 @@ def test_get_verbose_option(input_patch: mock.MagicMock,
                      "  Labels:\n    k: v\n")
   assert expected_output in result.output
   assert "HTTP Request Details" in result.output
+
+
+@mock.patch(
+    "feeds.feed_schema_utility.chronicle_auth.initialize_http_session"
+)
+@mock.patch("feeds.commands.get.click.prompt")
+def test_get_regions(input_patch: mock.MagicMock, mock_client: mock.MagicMock,
+                     get_feed_schema: MockResponse,
+                     get_feed_data: MockResponse) -> None:
+  """Test case to check the feed is found in one of several regions.
+
+  Args:
+    input_patch (mock.MagicMock): Mock object
+    mock_client (mock.MagicMock): Mock object
+    get_feed_schema (MockResponse): Test input data
+    get_feed_data (MockResponse): Test input data
+  """
+
+  def request(method, url):
+    del method  # Unused.
+    if url.endswith("/feedSchema"):
+      return get_feed_schema
+    if url.startswith("https://europe-backstory"):
+      return get_feed_data
+    return MockResponse(
+        status_code=404, text="""{"error": {"message": "Not found"}}""")
+
+  input_patch.return_value = "123"
+  mock_client.return_value = mock.Mock()
+  mock_client.return_value.request.side_effect = request
+
+  # Method Call
+  result = runner.invoke(get, ["--all-regions"])
+  assert result.output.startswith("Region: EUROPE\n")
+  assert "ID: 123" in result.output
+  mock_client.return_value.request.assert_any_call(
+      "GET", "https://europe-backstory.googleapis.com/v1/feedSchema")
+
+
+@mock.patch(
+    "feeds.feed_schema_utility.chronicle_auth.initialize_http_session"
+)
+@mock.patch("feeds.commands.get.click.prompt")
+def test_get_regions_not_found(input_patch: mock.MagicMock,
+                               mock_client: mock.MagicMock) -> None:
+  """Test case to check the feed is not found in any of several regions.
+
+  Args:
+    input_patch (mock.MagicMock): Mock object
+    mock_client (mock.MagicMock): Mock object
+  """
+  input_patch.return_value = "123"
+  mock_client.return_value = mock.Mock()
+  mock_client.return_value.request.return_value = MockResponse(
+      status_code=404, text="""{"error": {"message": "Not found"}}""")
+
+  # Method Call
+  result = runner.invoke(get, ["--regions", "us,europe"])
+  assert result.output == "Feed not found in regions: US, EUROPE.\n"
+
+
+@mock.patch(
+    "feeds.feed_schema_utility.chronicle_auth.initialize_http_session"
+)
+@mock.patch("feeds.commands.get.click.prompt")
+def test_get_regions_error(input_patch: mock.MagicMock,
+                           mock_client: mock.MagicMock) -> None:
+  """Test case to check region errors are not reported as feed not found.
+
+  Args:
+    input_patch (mock.MagicMock): Mock object
+    mock_client (mock.MagicMock): Mock object
+  """
+  input_patch.return_value = "123"
+  mock_client.return_value = mock.Mock()
+  mock_client.return_value.request.side_effect = (
+      lambda method, url: MockResponse(
+          status_code=403,
+          text="""{"error": {"message": "Permission denied"}}""")
+      if url.startswith("https://backstory") else MockResponse(
+          status_code=404, text="""{"error": {"message": "Not found"}}"""))
+
+  # Method Call
+  result = runner.invoke(get, ["--regions", "us,europe"])
+  assert result.output == (
+      "Feed could not be fetched from the following regions:\n"
+      "\nRegion: US\nResponse Code: 403\nError: Permission denied\n"
+      "\nRegion: EUROPE\nResponse Code: 404\nError: Not found\n")
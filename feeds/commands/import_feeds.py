@@ -0,0 +1,175 @@
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Recreate feeds from a snapshot."""
+
+import collections
+import concurrent.futures
+import json
+from typing import Any, AnyStr, Dict, Optional
+
+import click
+
+from common import api_utility
+from common import chronicle_auth
+from common import commands_utility
+from common import exception_handler
+from common import operations
+from common import options
+from feeds import feed_utility
+from feeds import plan_utility
+from feeds import snapshot_utility
+from feeds.constants import schema
+
+
+@click.command(
+    name="import",
+    help="Recreate the feeds of a snapshot made by feeds export. An "
+    "interrupted import continues where it stopped when run again.")
+@click.argument("snapshot", type=click.Path(exists=True, dir_okay=False))
+@click.option(
+    "--resume-file",
+    help="Path of the file recording the restored feeds. "
+    "Default: <snapshot>.resume")
+@options.concurrency_option
+@options.url_option
+@options.region_option
+@options.verbose_option
+@options.credential_file_option
+@exception_handler.catch_exception()
+def import_command(credential_file: AnyStr, verbose: bool, region: str,
+                   url: Optional[str], concurrency: int,
+                   resume_file: Optional[str], snapshot: str) -> None:
+  """Recreates the feeds of a snapshot.
+
+  The snapshot is read line by line and up to `concurrency` feeds are
+  created in parallel. Each created feed is recorded in the resume file right
+  away, and records found in it are skipped, so running the command again
+  after an interruption or failures only creates the remaining feeds. Feeds
+  that were disabled when exported are disabled once created. A resume file
+  written for another snapshot is refused.
+
+  Args:
+    credential_file (AnyStr): Path of Service Account JSON.
+    verbose (bool): Option for printing verbose output to console.
+    region (str): Option for selecting regions. Available options - US, EUROPE,
+      ASIA_SOUTHEAST1.
+    url (str): Base URL to be used for API calls.
+    concurrency (int): Maximum number of requests sent in parallel.
+    resume_file (str): Path of the file recording the restored feeds.
+    snapshot (str): Path of the snapshot file.
+
+  Raises:
+    OSError: Failed to read the given file, e.g. not found, no read access
+      (https://docs.python.org/library/exceptions.html#os-exceptions).
+    TypeError: If response data is not JSON.
+  """
+  url = commands_utility.lower_or_none(url)
+  resume_file = resume_file or f"{snapshot}.resume"
+  client = chronicle_auth.initialize_http_session(credential_file)
+  counts = collections.Counter()
+
+  def restore(key: str, record: Dict[str, Any],
+              change: plan_utility.FeedChange) -> Dict[str, Any]:
+    # Each step is recorded in the resume file as soon as its request
+    # completes, even if the import is being interrupted, so that no created
+    # feed is missing from it.
+    feed_id = checkpoint.created.get(key)
+    if feed_id is not None:
+      result = {"success": True, "id": feed_id, "resumed": True}
+    else:
+      result = plan_utility.apply_change(client, region, url, change)
+      if not result["success"]:
+        return result
+      feed_id = result["id"]
+      if not snapshot_utility.is_inactive(record):
+        checkpoint.record(key, feed_id)
+        return result
+      checkpoint.record(key, feed_id, snapshot_utility.STATUS_CREATED)
+    # Feeds are created enabled, so disabled feeds are disabled again.
+    disable_result = operations.run_operation(
+        client, operations.Operation(change.index, "feeds.disable", feed_id),
+        feed_utility.get_feed_resource_url(region, url, feed_id, "disable"))
+    if disable_result["success"]:
+      checkpoint.record(key, feed_id)
+    return {**result, "disable": disable_result}
+
+  def report(line_number: int, change: plan_utility.FeedChange,
+             future: "concurrent.futures.Future[Dict[str, Any]]") -> None:
+    result = future.result()
+    if not result["success"]:
+      counts["failed"] += 1
+      outcome = (f"failed (Response Code: {result['status_code']}, "
+                 f"Error: {result['error']})"
+                 if "status_code" in result else f"failed ({result['error']})")
+    else:
+      outcome = (f"already created (ID: {result['id']})" if "resumed" in result
+                 else f"created (ID: {result['id']})")
+      disable_result = result.get("disable")
+      if disable_result and not disable_result["success"]:
+        counts["failed"] += 1
+        outcome += ", disable " + operations.get_failure(disable_result)
+      else:
+        counts["imported"] += 1
+        outcome += ", disabled" if disable_result else ""
+    click.echo(f"  [{line_number}] {change.label}: {outcome}")
+    if verbose and "status_code" in result:
+      api_utility.print_request_details(result["url"], result["method"],
+                                        change.body, result["response"])
+
+  try:
+    checkpoint = snapshot_utility.Checkpoint(resume_file, snapshot)
+  except ValueError as e:
+    click.echo(e)
+    return
+
+  with checkpoint:
+    if checkpoint.done:
+      click.echo(f"Resuming: {len(checkpoint.done)} feeds already imported.")
+    click.echo(f"Importing feeds from: {snapshot}")
+    with open(snapshot, "r") as file, concurrent.futures.ThreadPoolExecutor(
+        max_workers=concurrency) as executor:
+      # Only a bounded number of records is read ahead of the requests, and
+      # results are reported in snapshot order.
+      pending = collections.deque()
+      for line_number, line in enumerate(file, 1):
+        if not line.strip():
+          continue
+        try:
+          record = json.loads(line)
+          key = snapshot_utility.get_record_key(line_number, record)
+          if key in checkpoint.done:
+            counts["skipped"] += 1
+            continue
+          body = snapshot_utility.get_request_body(record)
+        except (ValueError, KeyError, AttributeError) as e:
+          counts["failed"] += 1
+          click.echo(f"  [{line_number}] invalid record: {e}")
+          continue
+        change = plan_utility.FeedChange(
+            line_number, plan_utility.ACTION_CREATE,
+            body.get(schema.KEY_DISPLAY_NAME) or
+            record.get(schema.KEY_NAME, ""), body=body)
+        future = executor.submit(restore, key, record, change)
+        pending.append((line_number, change, future))
+        if len(pending) >= 2 * concurrency:
+          report(*pending.popleft())
+      while pending:
+        report(*pending.popleft())
+
+  click.echo(f"\nImported: {counts['imported']}, Failed: {counts['failed']}, "
+             f"Already imported: {counts['skipped']}")
+  click.echo(f"Progress saved to: {resume_file}")
+  if counts["failed"]:
+    click.echo("Run the command again to retry the failed feeds.")
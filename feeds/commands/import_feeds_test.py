@@ -0,0 +1,197 @@
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Unit tests for import_feeds.py."""
+
+import json
+import os
+import threading
+from typing import Any, Sequence
+from unittest import mock
+
+from click.testing import CliRunner
+
+from feeds.commands.import_feeds import import_command
+from mock_test_utility import MockResponse
+
+runner = CliRunner()
+
+
+def write_snapshot(tmp_path: Any,
+                   count: int,
+                   inactive: Sequence[int] = ()) -> str:
+  """Writes a snapshot of feeds named Feed 1 to Feed <count>."""
+  snapshot = os.path.join(tmp_path, "feeds.ndjson")
+  with open(snapshot, "w") as file:
+    for number in range(1, count + 1):
+      file.write(
+          json.dumps({
+              "name": f"feeds/old{number}",
+              "displayName": f"Feed {number}",
+              "feed_state": "INACTIVE" if number in inactive else "ACTIVE",
+              "details.namespace": "corp",
+              "feedSourceType": "API",
+              "logType": "WORKSPACE_USERS",
+          }) + "\n")
+  return snapshot
+
+
+def create_response(method: str, url: str, data: str) -> MockResponse:
+  """Returns the response of a create feed request."""
+  del method, url  # Unused.
+  body = json.loads(data)
+  if body["displayName"] == "Feed 2":
+    return MockResponse(
+        status_code=400, text="""{"error": {"message": "Invalid"}}""")
+  feed_id = body["displayName"].replace("Feed ", "new")
+  return MockResponse(
+      status_code=200, text=json.dumps({"name": f"feeds/{feed_id}", **body}))
+
+
+@mock.patch(
+    "feeds.commands.import_feeds.chronicle_auth.initialize_http_session")
+def test_import_and_resume(mock_client: mock.MagicMock, tmp_path: Any) -> None:
+  """Test case to check an import only retries what is left when run again.
+
+  Args:
+    mock_client (mock.MagicMock): Mock object
+    tmp_path (pathlib.Path): Temporary directory
+  """
+  snapshot = write_snapshot(tmp_path, 3)
+  mock_client.return_value = mock.Mock()
+  mock_client.return_value.request.side_effect = create_response
+
+  result = runner.invoke(import_command, [snapshot, "--concurrency", "2"])
+  assert result.output == f"""Importing feeds from: {snapshot}
+  [1] Feed 1: created (ID: new1)
+  [2] Feed 2: failed (Response Code: 400, Error: Invalid)
+  [3] Feed 3: created (ID: new3)
+
+Imported: 2, Failed: 1, Already imported: 0
+Progress saved to: {snapshot}.resume
+Run the command again to retry the failed feeds.
+"""
+  mock_client.return_value.request.assert_any_call(
+      "POST", "https://backstory.googleapis.com/v1/feeds",
+      json.dumps({
+          "details": {
+              "namespace": "corp",
+              "feedSourceType": "API",
+              "logType": "WORKSPACE_USERS"
+          },
+          "displayName": "Feed 1"
+      }))
+
+  mock_client.return_value.request.reset_mock()
+  result = runner.invoke(import_command, [snapshot])
+  assert result.output.startswith("Resuming: 2 feeds already imported.\n")
+  assert "Imported: 0, Failed: 1, Already imported: 2" in result.output
+  mock_client.return_value.request.assert_called_once()
+
+
+@mock.patch(
+    "feeds.commands.import_feeds.chronicle_auth.initialize_http_session")
+def test_import_concurrency(mock_client: mock.MagicMock, tmp_path: Any) -> None:
+  """Test case to check feeds are created concurrently.
+
+  Args:
+    mock_client (mock.MagicMock): Mock object
+    tmp_path (pathlib.Path): Temporary directory
+  """
+  snapshot = write_snapshot(tmp_path, 4)
+  resume_file = os.path.join(tmp_path, "progress")
+  # Pairs of requests must be in flight at the same time to pass.
+  barrier = threading.Barrier(2)
+
+  def request(method, url, data):
+    barrier.wait(timeout=5)
+    return create_response(method, url, data)
+
+  mock_client.return_value = mock.Mock()
+  mock_client.return_value.request.side_effect = request
+
+  result = runner.invoke(
+      import_command,
+      [snapshot, "--concurrency", "2", "--resume-file", resume_file])
+  assert "Imported: 3, Failed: 1, Already imported: 0" in result.output
+  with open(resume_file) as file:
+    header, *lines = file.read().splitlines()
+  assert header.startswith("# snapshot sha256:")
+  assert sorted(lines) == [
+      "feeds/old1\tnew1\trestored", "feeds/old3\tnew3\trestored",
+      "feeds/old4\tnew4\trestored"
+  ]
+
+
+@mock.patch(
+    "feeds.commands.import_feeds.chronicle_auth.initialize_http_session")
+def test_import_inactive(mock_client: mock.MagicMock, tmp_path: Any) -> None:
+  """Test case to check disabled feeds are disabled once created.
+
+  Args:
+    mock_client (mock.MagicMock): Mock object
+    tmp_path (pathlib.Path): Temporary directory
+  """
+  snapshot = write_snapshot(tmp_path, 1, inactive=[1])
+  disable_url = "https://backstory.googleapis.com/v1/feeds/new1:disable"
+  disable_responses = [
+      MockResponse(
+          status_code=500, text="""{"error": {"message": "Internal"}}"""),
+      MockResponse(status_code=200, text="{}"),
+  ]
+
+  def request(method, url, data):
+    if url == disable_url:
+      return disable_responses.pop(0)
+    return create_response(method, url, data)
+
+  mock_client.return_value = mock.Mock()
+  mock_client.return_value.request.side_effect = request
+
+  result = runner.invoke(import_command, [snapshot])
+  assert ("  [1] Feed 1: created (ID: new1), disable failed "
+          "(Response Code: 500, Error: Internal)\n") in result.output
+  assert "Imported: 0, Failed: 1, Already imported: 0" in result.output
+
+  # Only the state of the created feed is restored when run again.
+  mock_client.return_value.request.reset_mock()
+  result = runner.invoke(import_command, [snapshot])
+  assert "  [1] Feed 1: already created (ID: new1), disabled\n" in result.output
+  assert "Imported: 1, Failed: 0, Already imported: 0" in result.output
+  mock_client.return_value.request.assert_called_once_with(
+      "POST", disable_url, data={})
+
+
+@mock.patch(
+    "feeds.commands.import_feeds.chronicle_auth.initialize_http_session")
+def test_import_other_snapshot(mock_client: mock.MagicMock,
+                               tmp_path: Any) -> None:
+  """Test case to check a resume file is not applied to another snapshot.
+
+  Args:
+    mock_client (mock.MagicMock): Mock object
+    tmp_path (pathlib.Path): Temporary directory
+  """
+  snapshot = write_snapshot(tmp_path, 3)
+  mock_client.return_value = mock.Mock()
+  mock_client.return_value.request.side_effect = create_response
+  runner.invoke(import_command, [snapshot])
+
+  write_snapshot(tmp_path, 4)
+  mock_client.return_value.request.reset_mock()
+  result = runner.invoke(import_command, [snapshot])
+  assert result.output == (
+      f"Resume file {snapshot}.resume was written for another snapshot. "
+      "Remove it or pass another --resume-file to import this snapshot.\n")
+  mock_client.return_value.request.assert_not_called()
@@ -14,8 +14,9 @@
 #
 """List feeds."""
 
+import contextlib
 import os
-from typing import AnyStr
+from typing import Any, AnyStr, Dict, List, Optional, Tuple
 
 import click
 
@@ -24,8 +25,8 @@ from common import commands_utility
 from common import exception_handler
 from common import file_utility
 from common import options
+from common import regions
 from common.constants import key_constants
-from common.constants import status
 from feeds import feed_schema_utility
 from feeds import feed_templates
 from feeds import feed_utility
@@ -35,20 +36,27 @@ from feeds.constants import schema
 @click.command(name="list", help="List all feeds")
 @options.url_option
 @options.region_option
+@options.regions_option
+@options.all_regions_option
 @options.export_option
 @click.option(
     "-f",
     "--file-format",
-    type=click.Choice(["TXT", "CSV", "JSON"], case_sensitive=False),
+    type=click.Choice(["TXT", "CSV", "JSON", "NDJSON"], case_sensitive=False),
     default="CSV",
     help="Format of the file to be exported")
 @options.verbose_option
+@options.refresh_schema_option
 @options.credential_file_option
 @exception_handler.catch_exception()
 def list_command(credential_file: AnyStr, verbose: bool, file_format: AnyStr,
-                 export: AnyStr, region: str, url: str) -> None:
+                 export: AnyStr, region: str, url: str, refresh_schema: bool,
+                 region_list: List[str], all_regions: bool) -> None:
   """List all feeds.
 
+  With --regions or --all-regions, the feeds of the regions are fetched
+  concurrently and listed region by region.
+
   Args:
     credential_file (AnyStr): Path of Service Account JSON.
     verbose (bool): Option for printing verbose output to console.
@@ -57,6 +65,10 @@ def list_command(credential_file: AnyStr, verbose: bool, file_format: AnyStr,
     region (str): Option for selecting regions. Available options - US, EUROPE,
       ASIA_SOUTHEAST1.
     url (str): Base URL to be used for API calls.
+    refresh_schema (bool): Option for fetching the feed schema from the API
+      instead of the local cache.
+    region_list (List[str]): Regions to list the feeds of.
+    all_regions (bool): Option for listing the feeds of all regions.
 
   Raises:
     OSError: Failed to read the given file, e.g. not found, no read access
@@ -66,30 +78,150 @@ def list_command(credential_file: AnyStr, verbose: bool, file_format: AnyStr,
     TypeError: If response data is not JSON.
   """
   url = commands_utility.lower_or_none(url)
+  region_list = regions.get_regions(region_list, all_regions)
+  url_error = regions.get_url_error(region_list, url)
+  if url_error:
+    click.echo(url_error)
+    return
+  if region_list:
+    list_feeds_in_regions(credential_file, verbose, file_format, export,
+                          region_list, refresh_schema)
+    return
+
   list_feed_errors = []
-  feed_schema = feed_schema_utility.FeedSchema(credential_file, region, url)
+  feed_schema = feed_schema_utility.FeedSchema(credential_file, region, url,
+                                               refresh_schema)
   full_url = feed_utility.get_feed_url(region, url)
   method = "GET"
-  list_feeds_response = feed_schema.client.request(method, full_url)
-  status_code = list_feeds_response.status_code
-  feeds_response = api_utility.check_content_type(list_feeds_response.text)
-
-  if status_code != status.STATUS_OK:
-    error_message = feeds_response[key_constants.KEY_ERROR][
-        key_constants.KEY_MESSAGE]
-    click.echo(
-        f"\nError while fetching list of feeds.\nResponse Code: {status_code}"
-        f"\nError: {error_message}")
+  feeds_response, error = feed_utility.fetch_feeds(feed_schema.client, region,
+                                                   url)
+  if error:
+    click.echo(f"\n{error}")
     return
 
   if not feeds_response:
     click.echo("No feeds found.")
     return
 
-  feed_rows = []
-
   feeds = feeds_response[schema.KEY_FEEDS]
+  with contextlib.ExitStack() as exit_stack:
+    writer = None
+    if export:
+      export_path = os.path.abspath(export) + f".{file_format.lower()}"
+      writer = exit_stack.enter_context(
+          feed_utility.get_export_writer(export_path, file_format))
+    list_feeds(feed_schema, feeds, writer, file_format, list_feed_errors)
+
+  if list_feed_errors:
+    click.echo("\nFollowing Feed(s) failed with error:")
+    for error_feed in list_feed_errors:
+      click.echo(f"{error_feed['name']} - {error_feed['error']}")
+
+  if export:
+    click.echo(f"\nFeed list details exported successfully to: {export_path}")
+
+  if verbose:
+    api_utility.print_request_details(full_url, method, None, feeds_response)
+
+
+def list_feeds_in_regions(credential_file: AnyStr, verbose: bool,
+                          file_format: str, export: AnyStr,
+                          region_list: List[str],
+                          refresh_schema: bool) -> None:
+  """Lists the feeds of several regions.
+
+  The feed schemas and feeds of all regions are fetched concurrently. Feeds
+  are then printed and exported in the order of the regions, tagged with
+  their region.
+
+  Args:
+    credential_file (AnyStr): Path of Service Account JSON.
+    verbose (bool): Option for printing verbose output to console.
+    file_format (str): Format of the content to be exported.
+    export (AnyStr): Path of file to export output of list command.
+    region_list (List[str]): Regions to list the feeds of.
+    refresh_schema (bool): Option for fetching the feed schemas from the API
+      instead of the local cache.
+  """
+  method = "GET"
+
+  def fetch(region: str) -> Tuple[feed_schema_utility.FeedSchema, str, Any]:
+    feed_schema = feed_schema_utility.FeedSchema(credential_file, region, None,
+                                                 refresh_schema)
+    full_url = feed_utility.get_feed_url(region, None)
+    return feed_schema, full_url, feed_schema.client.request(method, full_url)
+
+  region_results = regions.fan_out(fetch, region_list)
+  list_feed_errors = []
+  with contextlib.ExitStack() as exit_stack:
+    writer = None
+    if export:
+      export_path = os.path.abspath(export) + f".{file_format.lower()}"
+      writer = exit_stack.enter_context(
+          feed_utility.get_export_writer(
+              export_path, file_format, tag_regions=True))
+
+    for region_result in region_results:
+      click.echo(f"\nRegion: {region_result.region}")
+      if region_result.error:
+        click.echo("Error while fetching list of feeds.\n"
+                   f"Error: {region_result.error}")
+        continue
+
+      feed_schema, full_url, list_feeds_response = region_result.result
+      feeds_response = api_utility.check_content_type(
+          list_feeds_response.content)
+      error = feed_utility.get_list_feeds_error(list_feeds_response)
+      if error:
+        click.echo(error)
+      elif not feeds_response:
+        click.echo("No feeds found.")
+      else:
+        region_errors = []
+        list_feeds(feed_schema, feeds_response[schema.KEY_FEEDS], writer,
+                   file_format, region_errors, region_result.region)
+        list_feed_errors.extend({
+            "name": f"{error['name']} ({region_result.region})",
+            "error": error["error"]
+        } for error in region_errors)
+
+      if verbose:
+        api_utility.print_request_details(full_url, method, None,
+                                          feeds_response)
+
+  if list_feed_errors:
+    click.echo("\nFollowing Feed(s) failed with error:")
+    for error_feed in list_feed_errors:
+      click.echo(f"{error_feed['name']} - {error_feed['error']}")
+
+  if export:
+    click.echo(f"\nFeed list details exported successfully to: {export_path}")
+
+
+def list_feeds(feed_schema: feed_schema_utility.FeedSchema,
+               feeds: List[Dict[str, Any]],
+               writer: Optional[file_utility.FileWriter],
+               file_format: str,
+               list_feed_errors: List[Dict[str, str]],
+               region: Optional[str] = None) -> None:
+  """Prints and exports listed feeds.
+
+  Args:
+    feed_schema (FeedSchema): Feed schema of the region of the feeds.
+    feeds (List[Dict[str, Any]]): Feeds as returned by the API.
+    writer (FileWriter): Writer of the exported feeds, None if they are not
+      exported.
+    file_format (str): Format of the content to be exported.
+    list_feed_errors (List[Dict[str, str]]): Feeds that could not be listed,
+      extended with the failing feeds.
+    region (str): Region the feeds are tagged with in the export, None if a
+      single region is listed.
+  """
   for feed in feeds:
+    # JSON formats export the feeds as returned by the API.
+    if writer and file_format in (file_utility.FILE_FORMAT_JSON,
+                                  file_utility.FILE_FORMAT_NDJSON):
+      writer.write({"region": region, **feed} if region else feed)
     try:
       detail_schema = feed_schema.get_detailed_schema(
           feed[schema.KEY_DETAILS][schema.KEY_FEED_SOURCE_TYPE],
@@ -117,20 +249,19 @@ def list_command(credential_file: AnyStr, verbose: bool, file_format: AnyStr,
           namespace=f"{namespace}",
           labels=f"{labels}")
 
-      if export:
-        feed_rows.append([
-            feed[schema.KEY_NAME][6:],
-            feed.get(schema.KEY_DISPLAY_NAME),
-            detail_schema.display_source_type,
-            detail_schema.log_type_schema[schema.KEY_DISPLAY_NAME],
-            feed[schema.KEY_FEED_STATE],
-            (field_response.replace("\n", "")[14:]).strip()
-            if file_format == file_utility.FILE_FORMAT_CSV else field_response,
-            (namespace.replace("\n", "")[10:]).strip()
-            if file_format == file_utility.FILE_FORMAT_CSV else namespace,
-            (labels.replace("\n", "")[7:]).strip()
-            if file_format == file_utility.FILE_FORMAT_CSV else labels,
-        ])
+      feed_row = [
+          feed[schema.KEY_NAME][6:],
+          feed.get(schema.KEY_DISPLAY_NAME),
+          detail_schema.display_source_type,
+          detail_schema.log_type_schema[schema.KEY_DISPLAY_NAME],
+          feed[schema.KEY_FEED_STATE],
+          (field_response.replace("\n", "")[14:]).strip()
+          if file_format == file_utility.FILE_FORMAT_CSV else field_response,
+          (namespace.replace("\n", "")[10:]).strip()
+          if file_format == file_utility.FILE_FORMAT_CSV else namespace,
+          (labels.replace("\n", "")[7:]).strip()
+          if file_format == file_utility.FILE_FORMAT_CSV else labels,
+      ]
     except KeyError as e:
       list_feed_errors.append({
           "name": feed[schema.KEY_NAME][6:],
@@ -147,20 +278,8 @@ def list_command(credential_file: AnyStr, verbose: bool, file_format: AnyStr,
     click.echo(feed_template_str)
     click.echo("=" * 60)
 
-  if list_feed_errors:
-    click.echo("\nFollowing Feed(s) failed with error:")
-    for error_feed in list_feed_errors:
-      click.echo(f"{error_feed['name']} - {error_feed['error']}")
-
-  if export:
-    export_path = os.path.abspath(export) + f".{file_format.lower()}"
-    if file_format == file_utility.FILE_FORMAT_CSV:
-      file_utility.export_csv(export_path, schema.FEED_COLUMN_HEADER, feed_rows)
-    elif file_format == file_utility.FILE_FORMAT_JSON:
-      file_utility.export_json(export_path, feeds)
-    else:
-      feed_utility.export_txt(export_path, feed_rows)
-    click.echo(f"\nFeed list details exported successfully to: {export_path}")
-
-  if verbose:
-    api_utility.print_request_details(full_url, method, None, feeds_response)
+    if writer and file_format == file_utility.FILE_FORMAT_CSV:
+      writer.write([region, *feed_row] if region else feed_row)
+    elif writer and file_format == file_utility.FILE_FORMAT_TXT:
+      feed_txt = feed_utility.get_feed_txt(feed_row)
+      writer.write(f"Region: {region}\n{feed_txt}" if region else feed_txt)
@@ -14,6 +14,7 @@
 #
 """Unit test cases for list.py."""
 
+import json
 from typing import Dict, Tuple
 from unittest import mock
 
@@ -23,6 +24,7 @@ from feeds.commands.list import list_command
 from feeds.tests.fixtures import *  # pylint: disable=wildcard-import
 from feeds.tests.fixtures import TEMP_EXPORT_CSV_FILE
 from feeds.tests.fixtures import TEMP_EXPORT_JSON_FILE
+from feeds.tests.fixtures import TEMP_EXPORT_NDJSON_FILE
 from feeds.tests.fixtures import TEMP_EXPORT_TXT_FILE
 from mock_test_utility import MockResponse
 
@@ -247,3 +249,108 @@ def test_list_export_json(mock_client: mock.MagicMock,
       list_command,
       ["--export", TEMP_EXPORT_JSON_FILE[:-5], "--file-format", "json"])
   assert "Feed list details exported successfully" in result.output
+
+
+@mock.patch(
+    "feeds.feed_schema_utility.chronicle_auth.initialize_http_session"
+)
+def test_list_export_ndjson(mock_client: mock.MagicMock,
+                            get_feed_schema: Dict[str, str],
+                            list_feeds_data: Dict[str, str]) -> None:
+  """Test case to check feed list details exported in NDJSON format.
+
+  Args:
+    mock_client (mock.MagicMock): Mock object
+    get_feed_schema (Tuple): Test input data
+    list_feeds_data (Tuple): Test input data
+  """
+  mock_client.return_value = mock.Mock()
+  mock_client.return_value.request.side_effect = [
+      get_feed_schema, list_feeds_data
+  ]
+
+  # Method Call
+  result = runner.invoke(
+      list_command,
+      ["--export", TEMP_EXPORT_NDJSON_FILE[:-7], "--file-format", "ndjson"])
+  assert "Feed list details exported successfully" in result.output
+  with open(TEMP_EXPORT_NDJSON_FILE) as file:
+    exported_feeds = [json.loads(line) for line in file]
+  assert exported_feeds == json.loads(list_feeds_data.text)["feeds"]
+
+
+@mock.patch(
+    "feeds.feed_schema_utility.chronicle_auth.initialize_http_session"
+)
+def test_list_regions(mock_client: mock.MagicMock,
+                      get_feed_schema: Dict[str, str],
+                      list_feeds_data: Dict[str, str]) -> None:
+  """Test case to check feeds of several regions are listed and tagged.
+
+  Args:
+    mock_client (mock.MagicMock): Mock object
+    get_feed_schema (Tuple): Test input data
+    list_feeds_data (Tuple): Test input data
+  """
+
+  def request(method, url, **kwargs):
+    del method, kwargs  # Unused.
+    if url.endswith("/feedSchema"):
+      return get_feed_schema
+    if url.startswith("https://europe-backstory"):
+      return MockResponse(status_code=200, text="{}")
+    return list_feeds_data
+
+  mock_client.return_value = mock.Mock()
+  mock_client.return_value.request.side_effect = request
+
+  # Method Call
+  result = runner.invoke(list_command, [
+      "--regions", "us,europe", "--export", TEMP_EXPORT_NDJSON_FILE[:-7],
+      "--file-format", "ndjson"
+  ])
+  assert result.output.index("Region: US") < result.output.index(
+      "ID: 123") < result.output.index("Region: EUROPE\nNo feeds found.")
+  with open(TEMP_EXPORT_NDJSON_FILE) as file:
+    exported_feeds = [json.loads(line) for line in file]
+  assert exported_feeds == [{
+      "region": "US",
+      **json.loads(list_feeds_data.text)["feeds"][0]
+  }]
+
+
+@mock.patch(
+    "feeds.feed_schema_utility.chronicle_auth.initialize_http_session"
+)
+def test_list_regions_export_csv(mock_client: mock.MagicMock,
+                                 get_feed_schema: Dict[str, str],
+                                 list_feeds_data: Dict[str, str]) -> None:
+  """Test case to check CSV exports of several regions have a Region column.
+
+  Args:
+    mock_client (mock.MagicMock): Mock object
+    get_feed_schema (Tuple): Test input data
+    list_feeds_data (Tuple): Test input data
+  """
+  mock_client.return_value = mock.Mock()
+  mock_client.return_value.request.side_effect = (
+      lambda method, url, **kwargs: get_feed_schema
+      if url.endswith("/feedSchema") else list_feeds_data)
+
+  # Method Call
+  result = runner.invoke(
+      list_command,
+      ["--regions", "europe", "--export", TEMP_EXPORT_CSV_FILE[:-4]])
+  assert "Feed list details exported successfully" in result.output
+  with open(TEMP_EXPORT_CSV_FILE) as file:
+    rows = file.read().splitlines()
+  assert rows[0].startswith("Region,ID,")
+  assert rows[1].startswith("EUROPE,123,")
+
+
+def test_list_regions_with_url() -> None:
+  """Test case to check a custom URL cannot be used with several regions."""
+  result = runner.invoke(
+      list_command, ["--all-regions", "--url", "https://example.com"])
+  assert result.output == (
+      "--url cannot be combined with --regions or --all-regions.\n")
@@ -0,0 +1,100 @@
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Plan the changes needed to bring feeds to their definitions."""
+
+from typing import Any, AnyStr, Optional, Tuple
+
+import click
+
+from common import chronicle_auth
+from common import commands_utility
+from common import exception_handler
+from common import options
+from feeds import feed_utility
+from feeds import plan_utility
+from feeds.constants import schema
+
+definitions_option = click.option(
+    "-f",
+    "--file",
+    "definitions_file",
+    required=True,
+    type=click.Path(exists=True, dir_okay=False),
+    help="Path of the YAML or JSON file with the feed definitions.")
+
+
+@click.command(
+    help="Show the changes apply would make to feeds. Definitions are diffed "
+    "against the live feeds without changing them.")
+@definitions_option
+@options.url_option
+@options.region_option
+@options.credential_file_option
+@exception_handler.catch_exception()
+def plan(credential_file: AnyStr, region: str, url: Optional[str],
+         definitions_file: str) -> None:
+  """Shows the changes needed to bring feeds to their definitions.
+
+  Args:
+    credential_file (AnyStr): Path of Service Account JSON.
+    region (str): Option for selecting regions. Available options - US, EUROPE,
+      ASIA_SOUTHEAST1.
+    url (str): Base URL to be used for API calls.
+    definitions_file (str): Path of the feed definitions file.
+
+  Raises:
+    OSError: Failed to read the given file, e.g. not found, no read access
+      (https://docs.python.org/library/exceptions.html#os-exceptions).
+    ValueError: Invalid file contents.
+    KeyError: Required key is not present in dictionary.
+    TypeError: If response data is not JSON.
+  """
+  planned = make_plan(credential_file, region,
+                      commands_utility.lower_or_none(url), definitions_file)
+  if planned:
+    click.echo(plan_utility.format_plan(planned[1]))
+
+
+def make_plan(credential_file: AnyStr, region: str, url: Optional[str],
+              definitions_file: str) -> Optional[Tuple[Any, plan_utility.Plan]]:
+  """Diffs the feed definitions of a file against the live feeds.
+
+  The live feeds are fetched with a single list call.
+
+  Args:
+    credential_file (AnyStr): Path of Service Account JSON.
+    region (str): Region (US, EUROPE, ASIA_SOUTHEAST1).
+    url (str): Base URL to be used for API calls.
+    definitions_file (str): Path of the feed definitions file.
+
+  Returns:
+    Tuple[Any, Plan]: HTTP session used to fetch the live feeds, and the
+    plan. None if the plan could not be made, after printing why.
+  """
+  try:
+    definitions = plan_utility.load_definitions(definitions_file)
+  except ValueError as e:
+    click.echo(f"Invalid definitions: {e}")
+    return None
+
+  client = chronicle_auth.initialize_http_session(credential_file)
+  click.echo("Fetching list of feeds...\n")
+  feeds_response, error = feed_utility.fetch_feeds(client, region, url)
+  if error:
+    click.echo(error)
+    return None
+
+  return client, plan_utility.make_plan(
+      definitions, feeds_response.get(schema.KEY_FEEDS, []))
@@ -0,0 +1,86 @@
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Unit tests for plan.py."""
+
+import json
+from unittest import mock
+
+from click.testing import CliRunner
+
+from feeds.commands.plan import plan
+from mock_test_utility import MockResponse
+
+runner = CliRunner()
+
+LIVE_FEEDS = {
+    "feeds": [{
+        "name": "feeds/1",
+        "displayName": "Users",
+        "details": {
+            "feedSourceType": "API",
+            "logType": "WORKSPACE_USERS",
+            "namespace": "corp"
+        },
+        "feedState": "ACTIVE"
+    }]
+}
+
+
+@mock.patch("feeds.commands.plan.chronicle_auth.initialize_http_session")
+def test_plan(mock_client: mock.MagicMock, tmp_path) -> None:
+  """Test case to check the planned changes are printed.
+
+  Args:
+    mock_client (mock.MagicMock): Mock object
+    tmp_path (pathlib.Path): Temporary directory
+  """
+  definitions_file = tmp_path / "feeds.yaml"
+  definitions_file.write_text("""
+feeds:
+  - displayName: Users
+    details:
+      namespace: prod
+      labels:
+        - key: team
+          value: soc
+""")
+  mock_client.return_value = mock.Mock()
+  mock_client.return_value.request.return_value = MockResponse(
+      status_code=200, text=json.dumps(LIVE_FEEDS))
+
+  result = runner.invoke(plan, ["-f", str(definitions_file)])
+  assert result.output == """Fetching list of feeds...
+
+~ update feed 1 (Users)
+    details.namespace: "corp" -> "prod"
+    details.labels: null -> [{"key": "team", "value": "soc"}]
+
+Plan: 0 to create, 1 to update, 0 unchanged, 0 invalid.
+"""
+  mock_client.return_value.request.assert_called_once()
+
+
+def test_plan_invalid_definitions(tmp_path) -> None:
+  """Test case to check invalid definitions are reported.
+
+  Args:
+    tmp_path (pathlib.Path): Temporary directory
+  """
+  definitions_file = tmp_path / "feeds.yaml"
+  definitions_file.write_text("operations: []\n")
+
+  result = runner.invoke(plan, ["-f", str(definitions_file)])
+  assert result.output == (
+      "Invalid definitions: Definitions must contain a list of 'feeds'.\n")
@@ -42,9 +42,11 @@ UPDATE_BACKUP_FILE = os.path.join(chronicle_auth.CHRONICLE_CLI_ROOT_DIR,
 @options.url_option
 @options.region_option
 @options.verbose_option
+@options.refresh_schema_option
 @options.credential_file_option
 @exception_handler.catch_exception()
-def update(credential_file: str, verbose: bool, region: str, url: str) -> None:
+def update(credential_file: str, verbose: bool, region: str, url: str,
+           refresh_schema: bool) -> None:
   """Update feed.
 
   Args:
@@ -53,6 +55,8 @@ def update(credential_file: str, verbose: bool, region: str, url: str) -> None:
     region (str): Option for selecting regions. Available options - US, EUROPE,
       ASIA_SOUTHEAST1.
     url (str): Base URL to be used for API calls.
+    refresh_schema (bool): Option for fetching the feed schema from the API
+      instead of the local cache.
 
   Raises:
     OSError: Failed to read the given file, e.g. not found, no read access
@@ -62,7 +66,8 @@ def update(credential_file: str, verbose: bool, region: str, url: str) -> None:
     TypeError: If response data is not JSON.
   """
   url = commands_utility.lower_or_none(url)
-  feed_schema = feed_schema_utility.FeedSchema(credential_file, region, url)
+  feed_schema = feed_schema_utility.FeedSchema(credential_file, region, url,
+                                               refresh_schema)
   retry = False
 
   feed_id = click.prompt("Enter Feed ID", default="", show_default=False)
@@ -118,15 +123,17 @@ def update(credential_file: str, verbose: bool, region: str, url: str) -> None:
   # "flattened_response" is received along with the response body,
   # for storing the existing data into the backup file.
   updated_body, flattened_response = feed_schema.prepare_request_body(
-      detail_schema.log_type_schema, selected_source_type, selected_log_type,
-      flattened_response, feed_display_name)
+      feed_schema.get_field_plan(selected_source_type, selected_log_type),
+      selected_source_type, selected_log_type, flattened_response,
+      feed_display_name)
 
   full_url = f"{feed_utility.get_feed_url(region, url)}/{feed_id}"
   method = "PATCH"
   update_feeds_response = feed_schema.client.request(method, full_url,
                                                      updated_body)
 
-  update_response = api_utility.check_content_type(update_feeds_response.text)
+  update_response = api_utility.check_content_type(
+      update_feeds_response.content)
 
   if update_feeds_response.status_code != status.STATUS_OK:
     error_msg = update_response[key_constants.KEY_ERROR][
@@ -180,7 +187,7 @@ def fetch_feed_request_data(feed_schema: Any, region: str, url: str,
   """
   get_feed_response = feed_schema.client.request(
       "GET", f"{feed_utility.get_feed_url(region, url)}/{feed_id}")
-  response = api_utility.check_content_type(get_feed_response.text)
+  response = api_utility.check_content_type(get_feed_response.content)
 
   status_code = get_feed_response.status_code
   if status_code != status.STATUS_OK:
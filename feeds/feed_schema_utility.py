@@ -18,19 +18,34 @@ import dataclasses
 import datetime
 import getpass
 import json
+import os
 from typing import Any, AnyStr, Dict, List, Optional, Tuple
 
 import click
 
 from common import api_utility
 from common import chronicle_auth
+from common import profiling
+from common import response_cache
 from common import uri
 from common.constants import key_constants
+from common.constants import path_constants
 from common.constants import status
 from feeds import feed_utility
+from feeds import field_plan_utility
+from feeds import log_type_utility
 from feeds.constants import schema
 
 API_VERSION = "v1"
+SCHEMA_CACHE_DIR = os.path.join(path_constants.CHRONICLE_CLI_ROOT_DIR, "cache",
+                                "feed_schema")
+# Cached feed schemas younger than this are used without contacting the API.
+SCHEMA_CACHE_TTL = datetime.timedelta(hours=24)
+
+# Feed schemas loaded by this process, keyed by URL, so that long-lived
+# processes like the interactive shell do not read the cache file again for
+# every command. The schemas are shared and must not be modified.
+_loaded_schemas: Dict[str, response_cache.CachedResponse] = {}
 
 
 @dataclasses.dataclass
@@ -44,24 +59,55 @@ class DetailedSchema:
 class FeedSchema:
   """Class to fetch and process feed schema."""
 
-  def __init__(self, credential_file_path: AnyStr, region: str,
-               custom_url: AnyStr) -> None:
+  def __init__(self,
+               credential_file_path: AnyStr,
+               region: str,
+               custom_url: AnyStr,
+               refresh_schema: bool = False) -> None:
     """Fetch feed schema.
 
     Args:
       credential_file_path (str): Path of credential file.
       region (str): Region (US, EUROPE, ASIA_SOUTHEAST1).
       custom_url (str): Base URL to be used for API calls.
+      refresh_schema (bool): Fetch the feed schema from the API even if a
+        fresh copy is cached.
     """
     self.client = chronicle_auth.initialize_http_session(credential_file_path)
     self.current_time = datetime.datetime.utcnow()
     self.pre_body = {}
     self.region = region
     self.custom_url = custom_url
-    self.schema_response = self.get_latest_schema()
+    self.schema_response = self.get_latest_schema(refresh_schema)
+
+  @property
+  def schema_response(self) -> Dict[str, Any]:
+    """Feed schema response."""
+    return self._schema_response
+
+  @schema_response.setter
+  def schema_response(self, value: Dict[str, Any]) -> None:
+    """Sets the feed schema response and drops lookups built from the old one.
+
+    Args:
+      value (Dict[str, Any]): Feed schema response.
+    """
+    self._schema_response = value
+    self._schema_index = None
+    self._log_source_map = None
+    self._log_type_index = None
+    self._field_plans = {}
 
-  def get_latest_schema(self) -> Dict[str, Any]:
-    """Get feed schema from API.
+  @profiling.traced("feed schema", profiling.CATEGORY_SCHEMA)
+  def get_latest_schema(self, refresh_schema: bool = False) -> Dict[str, Any]:
+    """Get feed schema from the cache or from API.
+
+    A schema younger than SCHEMA_CACHE_TTL, loaded earlier by this process or
+    cached on disk, is used as is. An older one is revalidated with the API,
+    which only sends the schema again if it has changed.
+
+    Args:
+      refresh_schema (bool): Ignore the cached schema.
 
     Returns:
       Dict[str, str]: Feed schema response.
@@ -69,18 +115,43 @@ class FeedSchema:
     Raises:
       Exception: Raised when status code is not 200.
     """
-    feed_schema_response = self.client.request(
-        "GET", get_feed_schema_url(self.region, self.custom_url))
+    feed_schema_url = get_feed_schema_url(self.region, self.custom_url)
+    loaded = None if refresh_schema else _loaded_schemas.get(feed_schema_url)
+    if loaded and loaded.is_fresh(SCHEMA_CACHE_TTL):
+      return loaded.body
+
+    schema_cache = response_cache.ResponseCache(SCHEMA_CACHE_DIR)
+    cached = None if refresh_schema else schema_cache.load(feed_schema_url)
+    if cached and cached.is_fresh(SCHEMA_CACHE_TTL):
+      _loaded_schemas[feed_schema_url] = cached
+      return cached.body
+
+    validation_headers = cached.get_validation_headers() if cached else {}
+    if validation_headers:
+      feed_schema_response = self.client.request(
+          "GET", feed_schema_url, headers=validation_headers)
+      if feed_schema_response.status_code == status.STATUS_NOT_MODIFIED:
+        schema_cache.touch(feed_schema_url, cached)
+        _loaded_schemas[feed_schema_url] = dataclasses.replace(
+            cached, fetched_at=datetime.datetime.utcnow())
+        return cached.body
+    else:
+      feed_schema_response = self.client.request("GET", feed_schema_url)
+
     status_code = feed_schema_response.status_code
-    response = api_utility.check_content_type(feed_schema_response.text)
+    response = api_utility.check_content_type(feed_schema_response.content)
     if status_code != status.STATUS_OK:
       error_message = response[key_constants.KEY_ERROR][
           key_constants.KEY_MESSAGE]
       if status_code == status.STATUS_NOT_FOUND:
         error_message += "\nIs the region specified correctly?"
       raise Exception(error_message)
+    schema_cache.store(feed_schema_url, response, feed_schema_response.headers)
+    _loaded_schemas[feed_schema_url] = response_cache.CachedResponse(
+        response, None, None, datetime.datetime.utcnow())
     return response
 
+  @profiling.traced("schema lookup", profiling.CATEGORY_SCHEMA)
   def get_detailed_schema(self, user_source_type: AnyStr,
                           user_log_type: AnyStr) -> Any:
     """Get detailed schema for specific source and log type.
@@ -95,16 +166,60 @@ class FeedSchema:
         2. Schema of Log type
         3. Error message.
     """
-    all_schema = self.schema_response[schema.KEY_FEED_SOURCE_TYPE_SCHEMAS]
-    for source_type in all_schema:
-      if user_source_type == source_type[schema.KEY_FEED_SOURCE_TYPE]:
-        for logtype_schema in source_type[schema.KEY_LOG_TYPE_SCHEMAS]:
-          if user_log_type == logtype_schema[key_constants.KEY_LOG_TYPE]:
-            return DetailedSchema(source_type[schema.KEY_DISPLAY_NAME],
-                                  logtype_schema, None)
+    detailed_schema = self._get_schema_index().get(
+        (user_source_type, user_log_type))
+    if detailed_schema:
+      return detailed_schema
 
     return DetailedSchema(None, None, "Schema Not Found.")
 
+  def get_field_plan(
+      self, user_source_type: AnyStr,
+      user_log_type: AnyStr) -> Optional[field_plan_utility.LogTypePlan]:
+    """Get compiled fields for specific source and log type.
+
+    The log type schema is compiled on first use and reused until the schema
+    response changes.
+
+    Args:
+      user_source_type (str): Source type.
+      user_log_type (str): Log type.
+
+    Returns:
+      LogTypePlan: Compiled fields of the log type, or None if there is no
+      schema for the source and log type.
+    """
+    key = (user_source_type, user_log_type)
+    if key not in self._field_plans:
+      detailed_schema = self.get_detailed_schema(user_source_type,
+                                                 user_log_type)
+      self._field_plans[key] = None if detailed_schema.error else (
+          field_plan_utility.compile_log_type(detailed_schema.log_type_schema))
+    return self._field_plans[key]
+
+  def _get_schema_index(self) -> Dict[Tuple[str, str], DetailedSchema]:
+    """Get detailed schemas keyed by source type and log type.
+
+    The index is built on first use and reused until the schema response
+    changes, so looking up the schema of a feed takes constant time.
+
+    Returns:
+      Dict: Map of (source type, log type) to the detailed schema. When the
+      feed schema lists a pair more than once, the first entry is kept.
+    """
+    if self._schema_index is None:
+      schema_index = {}
+      all_schema = self.schema_response[schema.KEY_FEED_SOURCE_TYPE_SCHEMAS]
+      for source_type in all_schema:
+        for logtype_schema in source_type.get(schema.KEY_LOG_TYPE_SCHEMAS, []):
+          schema_index.setdefault(
+              (source_type[schema.KEY_FEED_SOURCE_TYPE],
+               logtype_schema[key_constants.KEY_LOG_TYPE]),
+              DetailedSchema(source_type[schema.KEY_DISPLAY_NAME],
+                             logtype_schema, None))
+      self._schema_index = schema_index
+    return self._schema_index
+
   def get_log_source_map(self) -> Dict[str, Any]:
     """Generate source type and log type mapping from feed schema.
 
@@ -123,7 +238,11 @@ class FeedSchema:
             }
           ...
         }
+      The map is built once per schema response and shared between calls.
     """
+    if self._log_source_map is not None:
+      return self._log_source_map
+
     source_log_mapping = {}
     response = self.schema_response[schema.KEY_FEED_SOURCE_TYPE_SCHEMAS]
 
@@ -144,37 +263,43 @@ class FeedSchema:
       source_log_mapping[source_type[schema.KEY_FEED_SOURCE_TYPE]][
           schema.KEY_LOG_TYPES] = log_types
 
+    self._log_source_map = source_log_mapping
     return source_log_mapping
 
-  def process_input_detailed_schema(self, detailed_schema: List[Dict[str, Any]],
-                                    flattened_response: Dict[str, Any]) -> None:
-    """Prompt inputs for given schema and generate request body.
+  def get_log_type_index(self) -> log_type_utility.LogTypeIndex:
+    """Get the search index over the log types of the log source map.
 
-    Args:
-      detailed_schema (List): List of schema dictionaries for fields
-      flattened_response (Dict): Flattened response of existing feed.
+    Returns:
+      LogTypeIndex: Index built once per schema response and shared between
+      calls.
     """
-    for each in detailed_schema:
-      enum_choices = []
-      for each_choice in each.get(schema.KEY_ENUMFIELD_SCHEMAS, []):
-        enum_choices.append((each_choice[schema.KEY_DISPLAY_NAME],
-                             each_choice[schema.KEY_FIELD_VALUE]))
+    if self._log_type_index is None:
+      self._log_type_index = log_type_utility.LogTypeIndex(
+          self.get_log_source_map())
+    return self._log_type_index
 
-      existing_value = flattened_response.get(each[schema.KEY_FIELD_PATH], "")
+  def process_input_detailed_schema(
+      self, fields: List[field_plan_utility.FieldPlan],
+      flattened_response: Dict[str, Any]) -> None:
+    """Prompt inputs for given fields and generate request body.
 
-      field_value = process_field_input(each, enum_choices, existing_value)
-      self.pre_body.update({f"{each[schema.KEY_FIELD_PATH]}": field_value})
+    Args:
+      fields (List[FieldPlan]): Compiled fields.
+      flattened_response (Dict): Flattened response of existing feed.
+    """
+    for field in fields:
+      existing_value = flattened_response.get(field.path, "")
+      field_value = process_field_input(field, existing_value)
+      self.pre_body[field.path] = field_value
 
       # Add data entered by user for not existing field in flattened_response.
       # The data will be added only if the field is not the secret or password.
-      if each[schema.KEY_FIELD_TYPE] not in [
-          schema.STR_SECRET_FIELD_TYPE, schema.MULTILINE_SECRET_FIELD_TYPE
-      ]:
-        flattened_response[each[schema.KEY_FIELD_PATH]] = field_value
+      if not field.is_secret:
+        flattened_response[field.path] = field_value
 
   def prepare_request_body(
       self,
-      detailed_schema: Any,
+      field_plan: field_plan_utility.LogTypePlan,
       selected_source_type: AnyStr,
       selected_log_type: AnyStr,
       flattened_response: Dict[str, Any],
@@ -182,7 +307,8 @@ class FeedSchema:
     """Prepare request body for create command.
 
     Args:
-      detailed_schema: Feed schema for selected source and log type.
+      field_plan (LogTypePlan): Compiled fields of selected source and log
+        type.
       selected_source_type (str): Source type.
       selected_log_type (str): Log type.
       flattened_response (Dict): Flattened response of existing feed.
@@ -192,38 +318,27 @@ class FeedSchema:
       AnyStr: Request body.
       flattened_response (Dict): Flattened response of existing feed.
     """
-    schema_set_choices = []
     # Evaluating Feed Schema Alternative options.
-    for each_alternative in detailed_schema.get(
-        schema.KEY_DETAILS_FEED_SCHEMA_ALT, []):
+    for field_sets in field_plan.alternatives:
       click.echo("\nChoose from following available options:")
-      if each_alternative.get(schema.KEY_DETAILS_FEED_SCHEMA_SET):
-        for option_num, each_schema_set in enumerate(
-            each_alternative.get(schema.KEY_DETAILS_FEED_SCHEMA_SET, []),
-            start=1):
-          schema_set_choices.append(each_schema_set[schema.KEY_DISPLAY_NAME])
-          click.echo(
-              f"{option_num}. {each_schema_set[schema.KEY_DISPLAY_NAME]}")
+      if field_sets:
+        for option_num, field_set in enumerate(field_sets, start=1):
+          click.echo(f"{option_num}. {field_set.display_name}")
 
         schema_set_index = int(
             click.prompt(
                 "\nEnter your choice",
-                type=click.types.IntRange(1, len(schema_set_choices)),
+                type=click.types.IntRange(1, len(field_sets)),
                 show_default=False))
 
-        detailed_schema_set = each_alternative.get(
-            schema.KEY_DETAILS_FEED_SCHEMA_SET)[schema_set_index - 1]
-
         # Prompt for input fields according to option selected by user and
         # update request body.
         # For example: 'OAuth password grant' in Salesforce log type
         self.process_input_detailed_schema(
-            detailed_schema_set[schema.KEY_DETAILED_FEED_SCHEMAS],
-            flattened_response)
+            field_sets[schema_set_index - 1].fields, flattened_response)
 
     # Prompt for other input fields and update request body.
-    self.process_input_detailed_schema(
-        detailed_schema[schema.KEY_DETAILED_FEED_SCHEMAS], flattened_response)
+    self.process_input_detailed_schema(field_plan.fields, flattened_response)
 
     self.process_namespace_input(flattened_response)
     self.process_labels_input(flattened_response)
@@ -260,6 +375,9 @@ class FeedSchema:
 
     Args:
       flattened_response (Dict): Flattened response of existing feed.
+
+    Raises:
+      ValueError: A line is not in 'key:value' format.
     """
     click.echo("\nLabels (The ingestion metadata labels in 'key:value' format"
                " to apply to all logs ingested through this feed, "
@@ -275,116 +393,180 @@ class FeedSchema:
         break
       contents.append(line)
 
-    labels = []
-    for kv in contents:
-      key, value = kv.split(":")
-      labels.append({"key": key, "value": value})
+    try:
+      pairs = field_plan_utility.get_pairs("\n".join(contents))
+    except ValueError as e:
+      raise ValueError(f"Labels {e}") from e
+    labels = [{"key": key, "value": value} for key, value in pairs]
     flattened_response[schema.KEY_DETAILS_LABELS] = labels
     self.pre_body[schema.KEY_DETAILS_LABELS] = labels
 
 
-def process_field_input(field: Dict[str, Any],
-                        choices: List[Any],
-                        existing_value: Optional[str] = None) -> Any:
+def process_field_input(field: field_plan_utility.FieldPlan,
+                        existing_value: Optional[Any] = None) -> Any:
   """Generate prompts according to field type.
 
   Args:
-    field (Dict): Schema for each field.
-    choices (List): Enum choices.
-    existing_value (str): Existing value of field for update command.
+    field (FieldPlan): Compiled field.
+    existing_value (Any): Existing value of field for update command.
 
   Returns:
     Field value for request body.
   """
-  prompt_text = (f"\n{field[schema.KEY_DISPLAY_NAME]} "
-                 f"({field[schema.KEY_DESCRIPTION]})")
-  is_required_value = None if field.get("isRequired") else ""
+  is_required_value = None if field.is_required else ""
   default_value = existing_value or is_required_value
-  show_default_value = bool(existing_value)
+  prompt_field = _FIELD_PROMPTS.get(field.field_type, prompt_text_field)
+  return prompt_field(field, default_value, bool(existing_value))
 
-  if field.get(schema.KEY_IS_REQUIRED):
-    prompt_text = (f"\n(*) {field[schema.KEY_DISPLAY_NAME]} "
-                   f"({field[schema.KEY_DESCRIPTION]})")
 
-  if field.get(schema.KEY_FIELD_TYPE) == schema.ENUM_FIELD_TYPE:
-    click.echo(f"{prompt_text}\nChoose:")
-    for choice_index, choice in enumerate(choices):
-      click.echo(f"{choice_index + 1}. {choice[0]}")
+def prompt_enum_field(field: field_plan_utility.FieldPlan, default_value: Any,
+                      show_default_value: bool) -> str:
+  """Prompt user to choose the value of an enum field.
 
-    selected_choice = click.prompt(
-        "",
-        prompt_suffix="\n=> ",
-        show_default=show_default_value,
-        type=click.types.IntRange(1, len(choices)),
-        default=(None if field.get(schema.KEY_IS_REQUIRED) else 1))
-
-    field_value = choices[selected_choice - 1][1]
-    click.echo("\nYou have selected " +
-               click.style(f"{choices[selected_choice - 1][0]}", bold=True))
-
-  elif field[schema.KEY_FIELD_TYPE] == schema.STR_SECRET_FIELD_TYPE:
-    field_value = click.prompt(
-        prompt_text,
-        show_default=show_default_value,
-        default=default_value,
-        prompt_suffix="\n=> ",
-        hide_input=True)
+  Args:
+    field (FieldPlan): Compiled field.
+    default_value (Any): Default value.
+    show_default_value (bool): Whether to show the default value.
 
-  elif field.get(schema.KEY_FIELD_TYPE) in [
-      schema.STR_MULTILINE_FIELD_TYPE, schema.MAP_STR_FIELD_TYPE,
-      schema.MULTILINE_SECRET_FIELD_TYPE, schema.KV_LIST_FIELD_TYPE
-  ]:
-    click.echo(f"{prompt_text}\n"
-               "Enter/Paste your content. On a new line, press Ctrl-D (Linux)"
-               " / [Ctrl-Z + Enter] (Windows) to save it:")
+  Returns:
+    str: Value of the selected choice.
+  """
+  del default_value  # Unused, choices are entered by number.
+  click.echo(f"{field.prompt_text}\nChoose:")
+  for choice_index, choice in enumerate(field.choices):
+    click.echo(f"{choice_index + 1}. {choice[0]}")
 
-    contents = []
-    while True:
-      try:
-        if field.get(
-            schema.KEY_FIELD_TYPE) == schema.MULTILINE_SECRET_FIELD_TYPE:
-          line = getpass.getpass(prompt="")
-        else:
-          line = input()
-      except EOFError:
-        break
-      contents.append(line)
-    field_value = "\n".join(contents)
-
-    if field.get(schema.KEY_FIELD_TYPE) == schema.KV_LIST_FIELD_TYPE:
-      field_value = []
-      for kv in contents:
-        key, value = kv.split(":")
-        field_value.append({"key": key, "value": value})
-    elif field.get(schema.KEY_FIELD_TYPE) == schema.MAP_STR_FIELD_TYPE:
-      field_value = {}
-      for kv in contents:
-        key, value = kv.split(":")
-        field_value.update({key: value})
-
-  elif field.get(schema.KEY_FIELD_TYPE) == schema.STR_LIST_FIELD_TYPE:
-    field_value = click.prompt(
-        prompt_text,
-        show_default=show_default_value,
-        default=default_value,
-        prompt_suffix="\n=> ")
-
-    field_value = field_value.split(",")
-
-  elif field[schema.KEY_FIELD_TYPE] == schema.BOOL_FIELD_TYPE:
-    field_value = click.confirm(
-        prompt_text,
-        default=default_value if default_value else False,
-        prompt_suffix="\n=> ")
-
-  else:
-    field_value = click.prompt(
-        prompt_text,
-        default=default_value,
-        prompt_suffix="\n=> ",
-        show_default=show_default_value)
+  selected_choice = click.prompt(
+      "",
+      prompt_suffix="\n=> ",
+      show_default=show_default_value,
+      type=click.types.IntRange(1, len(field.choices)),
+      default=(None if field.is_required else 1))
+
+  click.echo("\nYou have selected " +
+             click.style(f"{field.choices[selected_choice - 1][0]}", bold=True))
+  return field.choices[selected_choice - 1][1]
+
+
+def prompt_secret_field(field: field_plan_utility.FieldPlan,
+                        default_value: Any, show_default_value: bool) -> str:
+  """Prompt user for the value of a secret field, hiding the input.
+
+  Args:
+    field (FieldPlan): Compiled field.
+    default_value (Any): Default value.
+    show_default_value (bool): Whether to show the default value.
+
+  Returns:
+    str: Entered value.
+  """
+  return click.prompt(
+      field.prompt_text,
+      show_default=show_default_value,
+      default=default_value,
+      prompt_suffix="\n=> ",
+      hide_input=True)
+
+
+def prompt_multiline_field(field: field_plan_utility.FieldPlan,
+                           default_value: Any,
+                           show_default_value: bool) -> Any:
+  """Prompt user for the lines of a multiline field.
+
+  Args:
+    field (FieldPlan): Compiled field.
+    default_value (Any): Default value.
+    show_default_value (bool): Whether to show the default value.
+
+  Returns:
+    Any: Entered lines, converted to the type of the field.
+  """
+  del default_value, show_default_value  # Unused.
+  click.echo(f"{field.prompt_text}\n"
+             "Enter/Paste your content. On a new line, press Ctrl-D (Linux)"
+             " / [Ctrl-Z + Enter] (Windows) to save it:")
+
+  contents = []
+  while True:
+    try:
+      if field.field_type == schema.MULTILINE_SECRET_FIELD_TYPE:
+        line = getpass.getpass(prompt="")
+      else:
+        line = input()
+    except EOFError:
+      break
+    contents.append(line)
+  return field.parse("\n".join(contents))
+
+
+def prompt_list_field(field: field_plan_utility.FieldPlan, default_value: Any,
+                      show_default_value: bool) -> List[str]:
+  """Prompt user for the comma separated values of a list field.
+
+  Args:
+    field (FieldPlan): Compiled field.
+    default_value (Any): Default value.
+    show_default_value (bool): Whether to show the default value.
 
-  return field_value
+  Returns:
+    List[str]: Entered values.
+  """
+  field_value = click.prompt(
+      field.prompt_text,
+      show_default=show_default_value,
+      default=default_value,
+      prompt_suffix="\n=> ")
+  return field.parse(field_value)
+
+
+def prompt_bool_field(field: field_plan_utility.FieldPlan, default_value: Any,
+                      show_default_value: bool) -> bool:
+  """Prompt user to confirm the value of a boolean field.
+
+  Args:
+    field (FieldPlan): Compiled field.
+    default_value (Any): Default value.
+    show_default_value (bool): Whether to show the default value.
+
+  Returns:
+    bool: Entered value.
+  """
+  del show_default_value  # Unused.
+  return click.confirm(
+      field.prompt_text,
+      default=default_value if default_value else False,
+      prompt_suffix="\n=> ")
+
+
+def prompt_text_field(field: field_plan_utility.FieldPlan, default_value: Any,
+                      show_default_value: bool) -> Any:
+  """Prompt user for the value of a field entered as text.
+
+  Args:
+    field (FieldPlan): Compiled field.
+    default_value (Any): Default value.
+    show_default_value (bool): Whether to show the default value.
+
+  Returns:
+    Any: Entered value.
+  """
+  return click.prompt(
+      field.prompt_text,
+      default=default_value,
+      prompt_suffix="\n=> ",
+      show_default=show_default_value)
+
+
+_FIELD_PROMPTS = {
+    schema.ENUM_FIELD_TYPE: prompt_enum_field,
+    schema.STR_SECRET_FIELD_TYPE: prompt_secret_field,
+    schema.STR_MULTILINE_FIELD_TYPE: prompt_multiline_field,
+    schema.MAP_STR_FIELD_TYPE: prompt_multiline_field,
+    schema.MULTILINE_SECRET_FIELD_TYPE: prompt_multiline_field,
+    schema.KV_LIST_FIELD_TYPE: prompt_multiline_field,
+    schema.STR_LIST_FIELD_TYPE: prompt_list_field,
+    schema.BOOL_FIELD_TYPE: prompt_bool_field,
+}
 
 
 def get_feed_schema_url(region: str, custom_url: str) -> str:
@@ -398,3 +580,11 @@ def get_feed_schema_url(region: str, custom_url: str) -> str:
     str: Feed schema URL.
   """
   return uri.get_base_url(region, custom_url) + f"/{API_VERSION}/feedSchema"
+
+
+def clear_loaded_schemas() -> None:
+  """Forgets the feed schemas loaded by this process.
+
+  The next FeedSchema reads the schema from the cache file or the API again.
+  """
+  _loaded_schemas.clear()
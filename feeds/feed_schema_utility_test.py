@@ -22,6 +22,7 @@ from unittest import mock
 import pytest
 
 from feeds import feed_schema_utility
+from feeds import field_plan_utility
 from feeds.tests.fixtures import *  # pylint: disable=wildcard-import
 from mock_test_utility import MockResponse
 
@@ -71,6 +72,75 @@ def test_get_latest_schema_400(client: feed_schema_utility.FeedSchema):
   assert error.value.args[0] == "400 error"
 
 
+def test_get_latest_schema_cached(get_schema_response: List[Any],
+                                  client: feed_schema_utility.FeedSchema):
+  """Test case to check that a fresh cached schema is used without API call.
+
+  Args:
+    get_schema_response: Test data.
+    client: Patch object of class FeedSchema.
+  """
+  expected_output = get_schema_response[1]
+  client.client.request.return_value = MockResponse(
+      status_code=200, text=json.dumps(expected_output))
+  assert client.get_latest_schema() == expected_output
+  assert client.get_latest_schema() == expected_output
+  assert client.client.request.call_count == 1
+
+  assert client.get_latest_schema(refresh_schema=True) == expected_output
+  assert client.client.request.call_count == 2
+
+
+def test_get_latest_schema_loaded(get_schema_response: List[Any],
+                                  client: feed_schema_utility.FeedSchema):
+  """Test case to check that a schema loaded earlier is not read again.
+
+  Args:
+    get_schema_response: Test data.
+    client: Patch object of class FeedSchema.
+  """
+  expected_output = get_schema_response[1]
+  client.client.request.return_value = MockResponse(
+      status_code=200, text=json.dumps(expected_output))
+  assert client.get_latest_schema() == expected_output
+
+  with mock.patch.object(feed_schema_utility.response_cache.ResponseCache,
+                         "load") as mock_load:
+    assert client.get_latest_schema() == expected_output
+    mock_load.assert_not_called()
+
+  feed_schema_utility.clear_loaded_schemas()
+  assert client.get_latest_schema() == expected_output
+  assert client.client.request.call_count == 1
+
+
+def test_get_latest_schema_revalidated(get_schema_response: List[Any],
+                                       client: feed_schema_utility.FeedSchema):
+  """Test case to check revalidation of an expired cached schema.
+
+  Args:
+    get_schema_response: Test data.
+    client: Patch object of class FeedSchema.
+  """
+  expected_output = get_schema_response[1]
+  client.client.request.side_effect = [
+      MockResponse(
+          status_code=200,
+          text=json.dumps(expected_output),
+          headers={"ETag": '"v1"'}),
+      MockResponse(status_code=304, text=""),
+  ]
+  assert client.get_latest_schema() == expected_output
+  with mock.patch.object(feed_schema_utility, "SCHEMA_CACHE_TTL",
+                         datetime.timedelta(0)):
+    assert client.get_latest_schema() == expected_output
+
+  client.client.request.assert_called_with(
+      "GET",
+      "https://dummy.com/v1/feedSchema",
+      headers={"If-None-Match": '"v1"'})
+
+
 def test_get_detailed_schema_success(client: feed_schema_utility.FeedSchema,
                                      get_detailed_schema_input: Dict[str, str]):
   """Test case for get detailed schema.
@@ -119,6 +189,70 @@ def test_get_log_source_map(client: feed_schema_utility.FeedSchema,
   }
 
 
+def test_get_detailed_schema_after_schema_change(
+    client: feed_schema_utility.FeedSchema,
+    get_detailed_schema_input: Dict[str, Any]):
+  """Test case to check that lookups follow a replaced schema response.
+
+  Args:
+    client: Patch object of class FeedSchema.
+    get_detailed_schema_input: Test input data.
+  """
+  client.schema_response = get_detailed_schema_input
+  assert not client.get_detailed_schema("DUMMY", "DUMMY_LOGTYPE").error
+  assert client.get_log_source_map() is client.get_log_source_map()
+  assert client.get_log_type_index() is client.get_log_type_index()
+  assert client.get_log_type_index().find("Dummy LogType")
+
+  client.schema_response = {"feedSourceTypeSchemas": []}
+  assert client.get_detailed_schema("DUMMY", "DUMMY_LOGTYPE").error == (
+      "Schema Not Found.")
+  assert not client.get_log_source_map()
+  assert not client.get_log_type_index().find("Dummy LogType")
+
+
+def test_get_field_plan(client: feed_schema_utility.FeedSchema,
+                        get_detailed_schema_input: Dict[str, Any]):
+  """Test case to check that field plans are compiled once per schema.
+
+  Args:
+    client: Patch object of class FeedSchema.
+    get_detailed_schema_input: Test input data.
+  """
+  client.schema_response = get_detailed_schema_input
+  field_plan = client.get_field_plan("DUMMY", "DUMMY_LOGTYPE")
+  assert [field.path for field in field_plan.fields] == [
+      "details.dummy_settings.field1", "details.dummy_settings.field2"
+  ]
+  assert client.get_field_plan("DUMMY", "DUMMY_LOGTYPE") is field_plan
+  assert client.get_field_plan("DUMMY", "UNKNOWN") is None
+
+  client.schema_response = {"feedSourceTypeSchemas": []}
+  assert client.get_field_plan("DUMMY", "DUMMY_LOGTYPE") is None
+
+
+def test_get_detailed_schema_first_match(
+    client: feed_schema_utility.FeedSchema):
+  """Test case to check that the first of duplicate schemas is returned.
+
+  Args:
+    client: Patch object of class FeedSchema.
+  """
+  client.schema_response = {
+      "feedSourceTypeSchemas": [{
+          "displayName": "First",
+          "feedSourceType": "API",
+          "logTypeSchemas": [{"logType": "DUMMY", "displayName": "Dummy"}]
+      }, {
+          "displayName": "Second",
+          "feedSourceType": "API",
+          "logTypeSchemas": [{"logType": "DUMMY", "displayName": "Dummy"}]
+      }]
+  }
+  assert client.get_detailed_schema("API", "DUMMY").display_source_type == (
+      "First")
+
+
 @mock.patch(
     "feeds.feed_schema_utility.process_field_input"
 )
@@ -139,8 +273,13 @@ def test_process_input_detailed_schema(mock_process_field_input: mock.MagicMock,
       "fieldPath": "api.key",
       "type": "STRING_SECRET"
   }]
-  client.process_input_detailed_schema(test_data, {})
+  flattened_response = {}
+  client.process_input_detailed_schema(
+      [field_plan_utility.compile_field(field) for field in test_data],
+      flattened_response)
   assert client.pre_body == {"api.key": "value"}
+  # Secrets are not kept for the backup file.
+  assert not flattened_response
 
 
 @mock.patch("feeds.feed_schema_utility.input")
@@ -166,9 +305,9 @@ def test_prepare_request_body(mock_process_field_input: mock.MagicMock,
   mock_click_prompt.side_effect = [1, "sample_namespace"]
   mock_process_field_input.side_effect = ["dummy", "dummy", "dummy"]
   mock_input.side_effect = ["k:v", EOFError]
-  result = client.prepare_request_body(get_detailed_schema.log_type_schema,
-                                       "API", "WORKDAY", {},
-                                       "Dummy feed display name")
+  result = client.prepare_request_body(
+      field_plan_utility.compile_log_type(get_detailed_schema.log_type_schema),
+      "API", "WORKDAY", {}, "Dummy feed display name")
   # pylint: disable=implicit-str-concat
   expected_output = (
       '{"details": {"httpSettings": {"oauthAccessToken": "dummy"}, '
@@ -204,7 +343,8 @@ def test_process_field_input_other(input_patch: mock.MagicMock):
       "type": "OTHER",
       "isRequired": True
   }
-  result_value = feed_schema_utility.process_field_input(test_field_data, [])
+  result_value = feed_schema_utility.process_field_input(
+      field_plan_utility.compile_field(test_field_data))
   assert result_value == "test"
 
 
@@ -223,12 +363,20 @@ def test_process_field_input_enum(input_patch: mock.MagicMock, capfd: Any):
       "fieldPath": "api.region",
       "displayName": "Region",
       "description": "Region",
-      "type": "ENUM"
+      "type": "ENUM",
+      "enumFieldSchemas": [{
+          "displayName": "us-east-1",
+          "value": "US_EAST_1"
+      }, {
+          "displayName": "asia",
+          "value": "ASIA"
+      }, {
+          "displayName": "europe",
+          "value": "EUROPE"
+      }]
   }
-  test_choices = [("us-east-1", "US_EAST_1"), ("asia", "ASIA"),
-                  ("europe", "EUROPE")]
   result_value = feed_schema_utility.process_field_input(
-      test_field_data, test_choices)
+      field_plan_utility.compile_field(test_field_data))
   assert result_value == "ASIA"
   output, _ = capfd.readouterr()
   assert "\nRegion (Region)\nChoose:\n1. us-east-1\n2. asia\n3. europe" in output
@@ -249,7 +397,8 @@ def test_process_field_input_bool(confirm_patch: mock.MagicMock):
       "description": "bool",
       "type": "BOOL"
   }
-  result_value = feed_schema_utility.process_field_input(test_field_data, [])
+  result_value = feed_schema_utility.process_field_input(
+      field_plan_utility.compile_field(test_field_data))
   assert result_value
 
 
@@ -267,7 +416,8 @@ def test_process_field_input_str_list(input_patch: mock.MagicMock):
       "description": "str list",
       "type": "STRING_LIST"
   }
-  result_value = feed_schema_utility.process_field_input(test_field_data, [])
+  result_value = feed_schema_utility.process_field_input(
+      field_plan_utility.compile_field(test_field_data))
   assert result_value == ["a", "b"]
 
 
@@ -285,7 +435,8 @@ def test_process_field_input_str_secret(input_patch: mock.MagicMock):
       "description": "str secret",
       "type": "STRING_SECRET"
   }
-  result_value = feed_schema_utility.process_field_input(test_field_data, [])
+  result_value = feed_schema_utility.process_field_input(
+      field_plan_utility.compile_field(test_field_data))
   assert result_value == "test secret"
 
 
@@ -302,7 +453,8 @@ def test_process_field_input_kv_list(input_patch: mock.MagicMock):
       "description": "KEY_VALUE_LIST",
       "type": "KEY_VALUE_LIST"
   }
-  result_value = feed_schema_utility.process_field_input(test_field_data, [])
+  result_value = feed_schema_utility.process_field_input(
+      field_plan_utility.compile_field(test_field_data))
   assert result_value == [{"key": "k", "value": "v"}]
 
 
@@ -319,7 +471,8 @@ def test_process_field_input_map_str(input_patch: mock.MagicMock):
       "description": "MAP_STRING_STRING",
       "type": "MAP_STRING_STRING"
   }
-  result_value = feed_schema_utility.process_field_input(test_field_data, [])
+  result_value = feed_schema_utility.process_field_input(
+      field_plan_utility.compile_field(test_field_data))
   assert result_value == {"k": "v"}
 
 
@@ -338,7 +491,8 @@ def test_process_field_input_str_multiline(input_patch: mock.MagicMock):
       "description": "STRING_MULTILINE_SECRET",
       "type": "STRING_MULTILINE_SECRET"
   }
-  result_value = feed_schema_utility.process_field_input(test_field_data, [])
+  result_value = feed_schema_utility.process_field_input(
+      field_plan_utility.compile_field(test_field_data))
   assert result_value == "k:v"
 
 
@@ -366,6 +520,28 @@ def test_process_labels_input(input_patch: mock.MagicMock,
     input_patch: Mock object for click prompt
     client: Mock object
   """
-  input_patch.side_effect = ["k:v", EOFError]
+  input_patch.side_effect = ["k:v", "", "url:https://example.com", EOFError]
   client.process_labels_input({})
-  assert client.pre_body == {"details.labels": [{"key": "k", "value": "v"}]}
+  assert client.pre_body == {
+      "details.labels": [{
+          "key": "k",
+          "value": "v"
+      }, {
+          "key": "url",
+          "value": "https://example.com"
+      }]
+  }
+
+
+@mock.patch("feeds.feed_schema_utility.input")
+def test_process_labels_input_invalid(input_patch: mock.MagicMock,
+                                      client: feed_schema_utility.FeedSchema):
+  """Test processing of input labels without a separator.
+
+  Args:
+    input_patch: Mock object for click prompt
+    client: Mock object
+  """
+  input_patch.side_effect = ["k", EOFError]
+  with pytest.raises(ValueError, match="Labels has 'k', which is not in"):
+    client.process_labels_input({})
@@ -42,7 +42,8 @@ List of Log types:
     is case-sensitive.
   - To search for specific log type, press '/' key, enter text and press enter.
   - Note down the choice number for the log type that you want to select.
-  - Press 'q' to quit and enter that choice number.
+  - Press 'q' to quit and enter that choice number, or enter text to filter
+    the list.
   - Press `h` for all the available options to navigate the list.
 =============================================================================
 """)
@@ -53,7 +54,8 @@ List of Log types:
 (i) How to select log type?
   - Press ENTER key (scrolls one line at a time) or SPACEBAR key (display next screen).
   - Note down the choice number for the log type that you want to select.
-  - Press 'q' to quit and enter that choice number.
+  - Press 'q' to quit and enter that choice number, or enter text to filter
+    the list.
 =============================================================================
 """)
 
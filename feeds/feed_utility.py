@@ -15,10 +15,14 @@
 """Utility functions."""
 
 import json
-from typing import Any, AnyStr, Dict, List
+from typing import Any, AnyStr, Dict, List, Optional, Tuple
 
+from common import api_utility
+from common import case_conversion
+from common import file_utility
 from common import uri
 from common.constants import key_constants
+from common.constants import status
 from feeds import feed_templates
 from feeds.constants import schema
 
@@ -98,32 +102,101 @@ def deflatten_dict(input_dict: Dict[AnyStr, Any]) -> Dict[AnyStr, Any]:
   return output_dict
 
 
-def snake_to_camel(word: AnyStr) -> AnyStr:
-  """Convert snakecase word to camelcase word.
+# Key conversions are memoized, see common/case_conversion.py.
+snake_to_camel = case_conversion.to_camel_case
+
+
+def get_feed_url(region: str, custom_url: str) -> str:
+  """Get feed URL according to selected region.
 
   Args:
-    word (str): Snakecase word.
+    region (str): Region (US, EUROPE, ASIA_SOUTHEAST1).
+    custom_url (str): Base URL to be used for API calls.
 
   Returns:
-    str: Camelcase word.
+    str: Feed URL.
   """
-  components = word.split("_")
-  # We capitalize the first letter of each component except the first one
-  # with the 'title' method and join them together.
-  return components[0] + "".join(each.title() for each in components[1:])
+  return uri.get_base_url(region, custom_url) + f"/{API_VERSION}/feeds"
 
 
-def get_feed_url(region: str, custom_url: str) -> str:
-  """Get feed URL according to selected region.
+def get_feed_resource_url(region: str, custom_url: Optional[str],
+                          feed_id: str,
+                          custom_method: Optional[str] = None) -> str:
+  """Get the URL of a feed, or of a custom method run on it.
 
   Args:
     region (str): Region (US, EUROPE, ASIA_SOUTHEAST1).
     custom_url (str): Base URL to be used for API calls.
+    feed_id (str): ID of the feed.
+    custom_method (str): Custom method, e.g. enable or disable. None for the
+      feed itself.
 
   Returns:
     str: Feed URL.
   """
-  return uri.get_base_url(region, custom_url) + f"/{API_VERSION}/feeds"
+  feed_url = f"{get_feed_url(region, custom_url)}/{feed_id}"
+  return f"{feed_url}:{custom_method}" if custom_method else feed_url
+
+
+def get_feed_id(feed: Dict[str, Any]) -> str:
+  """Returns the ID of a feed, without its feeds/ prefix.
+
+  Args:
+    feed (Dict[str, Any]): Feed as returned by the API.
+
+  Returns:
+    str: Feed ID.
+  """
+  return feed.get(schema.KEY_NAME, "").split("/")[-1]
+
+
+def get_list_feeds_error(list_feeds_response: Any) -> Optional[str]:
+  """Returns the error of a list feeds request for display.
+
+  Args:
+    list_feeds_response (Any): Response of the list feeds request.
+
+  Returns:
+    str: Error message, None if the request succeeded.
+
+  Raises:
+    KeyError: Required key is not present in the error response.
+    TypeError: If response data is not JSON.
+  """
+  status_code = list_feeds_response.status_code
+  if status_code == status.STATUS_OK:
+    return None
+  feeds_response = api_utility.check_content_type(list_feeds_response.content)
+  error_message = feeds_response[key_constants.KEY_ERROR][
+      key_constants.KEY_MESSAGE]
+  return (f"Error while fetching list of feeds.\nResponse Code: {status_code}"
+          f"\nError: {error_message}")
+
+
+def fetch_feeds(client: Any, region: str,
+                custom_url: Optional[str]) -> Tuple[Dict[str, Any],
+                                                    Optional[str]]:
+  """Fetches the list of feeds with a single list call.
+
+  Args:
+    client (Any): HTTP session object to send authorized requests and receive
+      responses.
+    region (str): Region (US, EUROPE, ASIA_SOUTHEAST1).
+    custom_url (str): Base URL to be used for API calls.
+
+  Returns:
+    Tuple[Dict[str, Any], str]: List feeds response, and the error message
+    for display if the request failed, None otherwise.
+
+  Raises:
+    KeyError: Required key is not present in the error response.
+    TypeError: If response data is not JSON.
+  """
+  list_feeds_response = client.request("GET", get_feed_url(region, custom_url))
+  error = get_list_feeds_error(list_feeds_response)
+  if error:
+    return {}, error
+  return api_utility.check_content_type(list_feeds_response.content), None
 
 
 def export_txt(export_path: AnyStr, feed_rows: List[List[str]]) -> None:
@@ -133,20 +206,87 @@ def export_txt(export_path: AnyStr, feed_rows: List[List[str]]) -> None:
     export_path (AnyStr): Path of file to export output of list command.
     feed_rows (List[List[str]]): Array of all listed feed details.
   """
-  with open(export_path, "w") as file_out:
-    for feed_id, feed_display_name, source_type, log_type, feed_state, feed_details, namespace, labels in feed_rows:
-      feed_template_str = feed_templates.feed_template.substitute(
-          feed_id=f"{feed_id}",
-          feed_display_name=get_feed_display_name(
-              {"displayName": feed_display_name}),
-          source_type=f"{source_type}",
-          log_type=f"{log_type}",
-          feed_state=f"{feed_state}",
-          feed_details=f"{feed_details}",
-          namespace=f"{namespace}",
-          labels=f"{labels}")
-      file_out.write(feed_template_str)
-      file_out.write(f"\n{'=' * 60}\n")
+  with file_utility.TxtWriter(export_path) as writer:
+    for feed_row in feed_rows:
+      writer.write(get_feed_txt(feed_row))
+
+
+def get_feed_txt(feed_row: List[str]) -> str:
+  """Render a feed row for the txt export.
+
+  Args:
+    feed_row (List[str]): Listed feed details.
+
+  Returns:
+    str: Feed details followed by a separator line.
+  """
+  (feed_id, feed_display_name, source_type, log_type, feed_state, feed_details,
+   namespace, labels) = feed_row
+  feed_template_str = feed_templates.feed_template.substitute(
+      feed_id=f"{feed_id}",
+      feed_display_name=get_feed_display_name(
+          {"displayName": feed_display_name}),
+      source_type=f"{source_type}",
+      log_type=f"{log_type}",
+      feed_state=f"{feed_state}",
+      feed_details=f"{feed_details}",
+      namespace=f"{namespace}",
+      labels=f"{labels}")
+  return f"{feed_template_str}\n{'=' * 60}\n"
+
+
+def get_export_writer(export_path: AnyStr,
+                      file_format: str,
+                      tag_regions: bool = False) -> file_utility.FileWriter:
+  """Create the writer for exporting listed feeds.
+
+  Args:
+    export_path (AnyStr): Path of file to export output of list command.
+    file_format (str): Format of the content to be exported. Supported formats:
+      CSV, JSON, NDJSON, TXT
+    tag_regions (bool): Whether feeds of several regions are exported, in
+      which case CSV rows start with a Region column.
+
+  Returns:
+    file_utility.FileWriter: Writer accepting CSV rows, feeds for the JSON
+    formats, or rendered feed text for TXT.
+  """
+  if file_format == file_utility.FILE_FORMAT_CSV:
+    column_headers = schema.FEED_COLUMN_HEADER
+    if tag_regions:
+      column_headers = ["Region", *column_headers]
+    return file_utility.CsvWriter(export_path, column_headers)
+  if file_format == file_utility.FILE_FORMAT_JSON:
+    return file_utility.JsonArrayWriter(export_path)
+  if file_format == file_utility.FILE_FORMAT_NDJSON:
+    return file_utility.NdjsonWriter(export_path)
+  return file_utility.TxtWriter(export_path)
+
+
+def get_backup_data(flattened_response: Dict[str, Any],
+                    display_source_type: str, source_type: str,
+                    display_log_type: str, log_type: str,
+                    feed_display_name: str) -> Dict[str, Any]:
+  """Returns the data of a feed backup.
+
+  Args:
+    flattened_response (Dict): Flattened response of existing feed, updated
+      in place.
+    display_source_type (str): Display name of the Source Type.
+    source_type (str): Source Type value in string.
+    display_log_type (str): Display name of the Log Type.
+    log_type (str): Log Type value in string.
+    feed_display_name (str): Feed display name
+
+  Returns:
+    Dict[str, Any]: Flattened feed along with its source and log type.
+  """
+  flattened_response[schema.KEY_FEED_SOURCE_TYPE] = source_type
+  flattened_response[schema.KEY_DISPLAY_SOURCE_TYPE] = display_source_type
+  flattened_response[key_constants.KEY_LOG_TYPE] = log_type
+  flattened_response[schema.KEY_DISPLAY_LOG_TYPE] = display_log_type
+  flattened_response[schema.KEY_DISPLAY_NAME] = feed_display_name
+  return flattened_response
 
 
 def write_backup(filename: str, flattened_response: Dict[str, Any],
@@ -165,12 +305,11 @@ def write_backup(filename: str, flattened_response: Dict[str, Any],
     feed_display_name (str): Feed display name
   """
   with open(filename, "w") as file:
-    flattened_response[schema.KEY_FEED_SOURCE_TYPE] = source_type
-    flattened_response[schema.KEY_DISPLAY_SOURCE_TYPE] = display_source_type
-    flattened_response[key_constants.KEY_LOG_TYPE] = log_type
-    flattened_response[schema.KEY_DISPLAY_LOG_TYPE] = display_log_type
-    flattened_response[schema.KEY_DISPLAY_NAME] = feed_display_name
-    file.write(json.dumps(flattened_response))
+    file.write(
+        json.dumps(
+            get_backup_data(flattened_response, display_source_type,
+                            source_type, display_log_type, log_type,
+                            feed_display_name)))
 
 
 def get_feed_display_name(feed: Dict[str, str]) -> str:
@@ -15,8 +15,11 @@
 """Unit tests for feed_utility.py."""
 
 from typing import Dict
+from unittest import mock
+
 from feeds import feed_utility
 from feeds.tests.fixtures import *  # pylint: disable=wildcard-import
+from mock_test_utility import MockResponse
 
 
 def test_defflatten_dict() -> None:
@@ -72,3 +75,29 @@ def test_get_feed_display_name() -> None:
 def test_get_feed_display_name_none() -> None:
   """Test feed display name if not exist in feed dictonary."""
   assert not feed_utility.get_feed_display_name({})
+
+
+def test_get_feed_resource_url() -> None:
+  """Test the URL of a feed and of a custom method run on it."""
+  assert (feed_utility.get_feed_resource_url("EUROPE", None, "123") ==
+          "https://europe-backstory.googleapis.com/v1/feeds/123")
+  assert (feed_utility.get_feed_resource_url(
+      "US", "https://example.com", "123", "disable") ==
+          "https://example.com/v1/feeds/123:disable")
+
+
+def test_get_feed_id() -> None:
+  """Test feed ID without its feeds/ prefix."""
+  assert feed_utility.get_feed_id({"name": "feeds/123"}) == "123"
+
+
+def test_fetch_feeds_error() -> None:
+  """Test error of a failed list feeds request."""
+  client = mock.Mock()
+  client.request.return_value = MockResponse(
+      status_code=400, text="""{"error": {"message": "Invalid"}}""")
+  assert feed_utility.fetch_feeds(client, "US", None) == (
+      {}, "Error while fetching list of feeds.\nResponse Code: 400\n"
+      "Error: Invalid")
+  client.request.assert_called_once_with(
+      "GET", "https://backstory.googleapis.com/v1/feeds")
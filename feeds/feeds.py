@@ -18,28 +18,29 @@ import os
 
 import click
 
-from common import chronicle_auth
-from feeds.commands import create
-from feeds.commands import delete
-from feeds.commands import disable
-from feeds.commands import enable
-from feeds.commands import get
-from feeds.commands import list  # pylint: disable=redefined-builtin
-from feeds.commands import update
+from common import lazy_group
+from common.constants import path_constants
 
 
-@click.group(name="feeds", help="Feed Management Workflows")
+@click.group(
+    name="feeds",
+    cls=lazy_group.LazyGroup,
+    lazy_subcommands={
+        "apply": "feeds.commands.apply.apply",
+        "create": "feeds.commands.create.create",
+        "delete": "feeds.commands.delete.delete",
+        "disable": "feeds.commands.disable.disable",
+        "enable": "feeds.commands.enable.enable",
+        "export": "feeds.commands.export.export_command",
+        "get": "feeds.commands.get.get",
+        "import": "feeds.commands.import_feeds.import_command",
+        "list": "feeds.commands.list.list_command",
+        "plan": "feeds.commands.plan.plan",
+        "update": "feeds.commands.update.update",
+    },
+    help="Feed Management Workflows")
 def feeds() -> None:
   """Feeds group commands."""
-  feed_dir = os.path.join(chronicle_auth.CHRONICLE_CLI_ROOT_DIR, "feeds")
+  feed_dir = os.path.join(path_constants.CHRONICLE_CLI_ROOT_DIR, "feeds")
   if not os.path.exists(feed_dir):
     os.mkdir(feed_dir)
-
-
-feeds.add_command(get.get)
-feeds.add_command(list.list_command)
-feeds.add_command(create.create)
-feeds.add_command(update.update)
-feeds.add_command(delete.delete)
-feeds.add_command(enable.enable)
-feeds.add_command(disable.disable)
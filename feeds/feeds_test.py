@@ -26,11 +26,15 @@ def test_feeds() -> None:
   """Test case for feeds."""
   result = runner.invoke(feeds)
   expected_output = """Commands:
+  apply    Create and update feeds to match the definitions of a file.
   create   Create a feed
   delete   Delete a feed
   disable  Disable feed with a given feed id.
   enable   Enable feed with a given feed id.
+  export   Export every feed to an NDJSON snapshot.
   get      Get feed details using Feed ID
+  import   Recreate the feeds of a snapshot made by feeds export.
   list     List all feeds
+  plan     Show the changes apply would make to feeds.
   update   Update feed details using Feed ID"""
   assert expected_output in result.output
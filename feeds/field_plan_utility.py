@@ -0,0 +1,363 @@
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Field plans compiled from the feed schema of a log type.
+
+A field plan holds what is needed to prompt for, validate and convert the
+value of a feed field, worked out once from the field schema: the prompt
+text, the required and secret flags, the enum choices and the parser of the
+field type.
+"""
+
+import dataclasses
+from typing import Any, Callable, Dict, List, Tuple
+
+from feeds.constants import schema
+
+SECRET_FIELD_TYPES = (schema.STR_SECRET_FIELD_TYPE,
+                      schema.MULTILINE_SECRET_FIELD_TYPE)
+
+
+@dataclasses.dataclass
+class FieldPlan:
+  """Field of a log type, compiled from its field schema."""
+  path: str
+  display_name: str
+  field_type: str
+  is_required: bool
+  is_secret: bool
+  prompt_text: str
+  # Display name and value of each choice of an enum field.
+  choices: List[Tuple[str, str]]
+  # Choice values keyed by lowercase value and display name.
+  choice_values: Dict[str, str]
+  parser: Callable[["FieldPlan", Any], Any]
+
+  def parse(self, value: Any) -> Any:
+    """Validates a value of the field and converts it for the request body.
+
+    Args:
+      value (Any): Value as entered by the user or read from a definition.
+
+    Returns:
+      Any: Value for the request body.
+
+    Raises:
+      ValueError: The value is not valid for the field.
+    """
+    return self.parser(self, value)
+
+
+@dataclasses.dataclass
+class FieldSetPlan:
+  """Set of fields that is one option of a field schema alternative."""
+  display_name: str
+  fields: List[FieldPlan]
+
+
+@dataclasses.dataclass
+class LogTypePlan:
+  """Fields of a log type, compiled from its log type schema."""
+  display_name: str
+  fields: List[FieldPlan]
+  # Options of each alternative, of which one is to be filled in.
+  alternatives: List[List[FieldSetPlan]]
+  fields_by_path: Dict[str, FieldPlan]
+
+  def convert(self,
+              values: Dict[str, Any],
+              partial: bool = False) -> Tuple[Dict[str, Any], List[str]]:
+    """Validates flattened feed values and converts them for the request body.
+
+    Values of paths that are not fields of the log type, like the namespace,
+    are kept as they are.
+
+    Args:
+      values (Dict[str, Any]): Values keyed by field path, e.g.
+        "details.workday_settings.hostname".
+      partial (bool): Whether values only hold the fields to change, in which
+        case missing required fields are not reported.
+
+    Returns:
+      Tuple[Dict[str, Any], List[str]]: Converted values, and the error of
+      each invalid or missing field.
+    """
+    converted = {}
+    errors = []
+    for path, value in values.items():
+      field = self.fields_by_path.get(path)
+      if not field:
+        converted[path] = value
+        continue
+      try:
+        converted[path] = field.parse(value)
+      except ValueError as e:
+        errors.append(f"{field.display_name} ({path}) {e}")
+
+    if partial:
+      return converted, errors
+
+    required_fields = [field for field in self.fields if field.is_required]
+    for field_sets in self.alternatives:
+      chosen = [
+          field_set for field_set in field_sets
+          if any(field.path in values for field in field_set.fields)
+      ]
+      if chosen:
+        required_fields.extend(
+            field for field in chosen[0].fields if field.is_required)
+      elif field_sets and all(
+          any(field.is_required
+              for field in field_set.fields)
+          for field_set in field_sets):
+        errors.append("Missing the fields of one of: " + ", ".join(
+            field_set.display_name for field_set in field_sets) + ".")
+    for field in required_fields:
+      if field.path not in values:
+        errors.append(f"{field.display_name} ({field.path}) is required.")
+    return converted, errors
+
+
+def compile_log_type(log_type_schema: Dict[str, Any]) -> LogTypePlan:
+  """Compiles the schema of a log type.
+
+  Args:
+    log_type_schema (Dict[str, Any]): Log type schema from the feed schema.
+
+  Returns:
+    LogTypePlan: Compiled fields of the log type.
+  """
+  fields = [
+      compile_field(field)
+      for field in log_type_schema.get(schema.KEY_DETAILED_FEED_SCHEMAS, [])
+  ]
+  alternatives = []
+  for alternative in log_type_schema.get(schema.KEY_DETAILS_FEED_SCHEMA_ALT,
+                                         []):
+    alternatives.append([
+        FieldSetPlan(field_set[schema.KEY_DISPLAY_NAME], [
+            compile_field(field)
+            for field in field_set.get(schema.KEY_DETAILED_FEED_SCHEMAS, [])
+        ])
+        for field_set in alternative.get(schema.KEY_DETAILS_FEED_SCHEMA_SET, [])
+    ])
+
+  fields_by_path = {}
+  for field_sets in alternatives:
+    for field_set in field_sets:
+      for field in field_set.fields:
+        fields_by_path.setdefault(field.path, field)
+  for field in fields:
+    fields_by_path[field.path] = field
+  return LogTypePlan(
+      log_type_schema.get(schema.KEY_DISPLAY_NAME, ""), fields, alternatives,
+      fields_by_path)
+
+
+def compile_field(field: Dict[str, Any]) -> FieldPlan:
+  """Compiles the schema of a field.
+
+  Args:
+    field (Dict[str, Any]): Field schema from the feed schema.
+
+  Returns:
+    FieldPlan: Compiled field.
+  """
+  field_type = field.get(schema.KEY_FIELD_TYPE, "")
+  is_required = bool(field.get(schema.KEY_IS_REQUIRED))
+  display_name = field.get(schema.KEY_DISPLAY_NAME, "")
+  prompt_text = f"{display_name} ({field.get(schema.KEY_DESCRIPTION, '')})"
+  if is_required:
+    prompt_text = f"(*) {prompt_text}"
+
+  choices = []
+  choice_values = {}
+  for choice in field.get(schema.KEY_ENUMFIELD_SCHEMAS, []):
+    value = choice[schema.KEY_FIELD_VALUE]
+    choices.append((choice[schema.KEY_DISPLAY_NAME], value))
+    choice_values.setdefault(value.lower(), value)
+  for choice_name, value in choices:
+    choice_values.setdefault(choice_name.lower(), value)
+
+  return FieldPlan(
+      path=field.get(schema.KEY_FIELD_PATH, ""),
+      display_name=display_name,
+      field_type=field_type,
+      is_required=is_required,
+      is_secret=field_type in SECRET_FIELD_TYPES,
+      prompt_text=f"\n{prompt_text}",
+      choices=choices,
+      choice_values=choice_values,
+      parser=_PARSERS.get(field_type, parse_string))
+
+
+def parse_string(field: FieldPlan, value: Any) -> str:
+  """Parses the value of a string field.
+
+  Args:
+    field (FieldPlan): Field of the value.
+    value (Any): String or number.
+
+  Returns:
+    str: Value as a string.
+
+  Raises:
+    ValueError: The value is not a string or a number.
+  """
+  del field  # Unused.
+  if isinstance(value, bool) or not isinstance(value, (str, int, float)):
+    raise ValueError("must be a string.")
+  return str(value)
+
+
+def parse_string_list(field: FieldPlan, value: Any) -> List[str]:
+  """Parses the value of a string list field.
+
+  Args:
+    field (FieldPlan): Field of the value.
+    value (Any): List of strings, or comma separated string.
+
+  Returns:
+    List[str]: Strings of the value.
+
+  Raises:
+    ValueError: The value is not a list of strings.
+  """
+  del field  # Unused.
+  if isinstance(value, str):
+    return value.split(",")
+  if isinstance(value, list) and all(isinstance(item, str) for item in value):
+    return value
+  raise ValueError("must be a list of strings.")
+
+
+def parse_bool(field: FieldPlan, value: Any) -> bool:
+  """Parses the value of a boolean field.
+
+  Args:
+    field (FieldPlan): Field of the value.
+    value (Any): Boolean, or "true" or "false" in any case.
+
+  Returns:
+    bool: Value as a boolean.
+
+  Raises:
+    ValueError: The value is not a boolean.
+  """
+  del field  # Unused.
+  if isinstance(value, bool):
+    return value
+  if isinstance(value, str) and value.lower() in ("true", "false"):
+    return value.lower() == "true"
+  raise ValueError("must be true or false.")
+
+
+def parse_enum(field: FieldPlan, value: Any) -> str:
+  """Parses the value of an enum field.
+
+  Args:
+    field (FieldPlan): Field of the value.
+    value (Any): Value or display name of a choice, in any case.
+
+  Returns:
+    str: Value of the choice.
+
+  Raises:
+    ValueError: The value is not one of the choices of the field.
+  """
+  choice = field.choice_values.get(value.lower()) if isinstance(
+      value, str) else None
+  if choice is None:
+    raise ValueError("must be one of: " +
+                     ", ".join(value for _, value in field.choices) + ".")
+  return choice
+
+
+def parse_key_value_list(field: FieldPlan, value: Any) -> List[Dict[str, str]]:
+  """Parses the value of a key value list field.
+
+  Args:
+    field (FieldPlan): Field of the value.
+    value (Any): List of key value mappings, mapping, or "key:value" lines.
+
+  Returns:
+    List[Dict[str, str]]: Key value mappings.
+
+  Raises:
+    ValueError: The value is not a list of keys and values.
+  """
+  del field  # Unused.
+  if isinstance(value, list) and all(
+      isinstance(item, dict) and set(item) == {"key", "value"}
+      for item in value):
+    return value
+  return [{"key": key, "value": item} for key, item in get_pairs(value)]
+
+
+def parse_string_map(field: FieldPlan, value: Any) -> Dict[str, str]:
+  """Parses the value of a string to string map field.
+
+  Args:
+    field (FieldPlan): Field of the value.
+    value (Any): Mapping, or "key:value" lines.
+
+  Returns:
+    Dict[str, str]: Mapping of the value.
+
+  Raises:
+    ValueError: The value is not a mapping of strings.
+  """
+  del field  # Unused.
+  return dict(get_pairs(value))
+
+
+def get_pairs(value: Any) -> List[Tuple[str, str]]:
+  """Gets the keys and values of a mapping or of "key:value" lines.
+
+  Args:
+    value (Any): Mapping of strings, or "key:value" lines.
+
+  Returns:
+    List[Tuple[str, str]]: Keys and values in order.
+
+  Raises:
+    ValueError: The value is neither a mapping of strings nor "key:value"
+      lines.
+  """
+  if isinstance(value, dict) and all(
+      isinstance(key, str) and isinstance(item, str)
+      for key, item in value.items()):
+    return list(value.items())
+  if not isinstance(value, str):
+    raise ValueError("must be a mapping of strings.")
+
+  pairs = []
+  for line in value.splitlines():
+    if not line.strip():
+      continue
+    key, separator, item = line.partition(":")
+    if not separator:
+      raise ValueError(f"has '{line}', which is not in 'key:value' format.")
+    pairs.append((key, item))
+  return pairs
+
+
+_PARSERS: Dict[str, Callable[[FieldPlan, Any], Any]] = {
+    schema.ENUM_FIELD_TYPE: parse_enum,
+    schema.BOOL_FIELD_TYPE: parse_bool,
+    schema.STR_LIST_FIELD_TYPE: parse_string_list,
+    schema.KV_LIST_FIELD_TYPE: parse_key_value_list,
+    schema.MAP_STR_FIELD_TYPE: parse_string_map,
+}
+
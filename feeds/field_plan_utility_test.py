@@ -0,0 +1,231 @@
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Unit tests for field_plan_utility.py."""
+
+from typing import Any, Dict
+
+import pytest
+
+from feeds import field_plan_utility
+
+LOG_TYPE_SCHEMA = {
+    "displayName": "Salesforce",
+    "logType": "SALESFORCE",
+    "detailsFieldSchemaAlternatives": [{
+        "detailsFieldSchemaSets": [{
+            "displayName": "OAuth password grant",
+            "detailsFieldSchemas": [{
+                "fieldPath": "details.salesforce_settings.username",
+                "displayName": "Username",
+                "type": "STRING",
+                "isRequired": True
+            }]
+        }, {
+            "displayName": "OAuth client credentials",
+            "detailsFieldSchemas": [{
+                "fieldPath": "details.salesforce_settings.client_secret",
+                "displayName": "Client secret",
+                "type": "STRING_SECRET",
+                "isRequired": True
+            }]
+        }]
+    }],
+    "detailsFieldSchemas": [{
+        "fieldPath": "details.salesforce_settings.hostname",
+        "displayName": "API Hostname",
+        "description": "Hostname",
+        "type": "STRING",
+        "isRequired": True
+    }, {
+        "fieldPath": "details.salesforce_settings.region",
+        "displayName": "Region",
+        "type": "ENUM",
+        "enumFieldSchemas": [{
+            "displayName": "US East",
+            "value": "US_EAST_1"
+        }, {
+            "displayName": "Europe",
+            "value": "EUROPE"
+        }]
+    }, {
+        "fieldPath": "details.salesforce_settings.enabled",
+        "displayName": "Enabled",
+        "type": "BOOL"
+    }, {
+        "fieldPath": "details.salesforce_settings.scopes",
+        "displayName": "Scopes",
+        "type": "STRING_LIST"
+    }, {
+        "fieldPath": "details.salesforce_settings.headers",
+        "displayName": "Headers",
+        "type": "KEY_VALUE_LIST"
+    }, {
+        "fieldPath": "details.salesforce_settings.params",
+        "displayName": "Params",
+        "type": "MAP_STRING_STRING"
+    }]
+}
+
+
+@pytest.fixture(name="plan")
+def fixture_plan() -> field_plan_utility.LogTypePlan:
+  """Return compiled test log type schema."""
+  return field_plan_utility.compile_log_type(LOG_TYPE_SCHEMA)
+
+
+def test_compile_log_type(plan: field_plan_utility.LogTypePlan) -> None:
+  """Test case to check compiling a log type schema.
+
+  Args:
+    plan: Compiled test log type schema.
+  """
+  assert plan.display_name == "Salesforce"
+  assert [field.display_name for field in plan.fields] == [
+      "API Hostname", "Region", "Enabled", "Scopes", "Headers", "Params"
+  ]
+  assert [[field_set.display_name
+           for field_set in field_sets]
+          for field_sets in plan.alternatives] == [[
+              "OAuth password grant", "OAuth client credentials"
+          ]]
+  assert len(plan.fields_by_path) == 8
+
+  hostname = plan.fields[0]
+  assert hostname.is_required
+  assert not hostname.is_secret
+  assert hostname.prompt_text == "\n(*) API Hostname (Hostname)"
+  assert plan.fields_by_path[
+      "details.salesforce_settings.client_secret"].is_secret
+  assert plan.fields[1].choices == [("US East", "US_EAST_1"),
+                                    ("Europe", "EUROPE")]
+
+
+@pytest.mark.parametrize("path,value,expected", [
+    ("details.salesforce_settings.hostname", 443, "443"),
+    ("details.salesforce_settings.region", "europe", "EUROPE"),
+    ("details.salesforce_settings.region", "us east", "US_EAST_1"),
+    ("details.salesforce_settings.enabled", "True", True),
+    ("details.salesforce_settings.enabled", False, False),
+    ("details.salesforce_settings.scopes", "a,b", ["a", "b"]),
+    ("details.salesforce_settings.scopes", ["a"], ["a"]),
+    ("details.salesforce_settings.headers", "k:v\nurl:http://x", [{
+        "key": "k",
+        "value": "v"
+    }, {
+        "key": "url",
+        "value": "http://x"
+    }]),
+    ("details.salesforce_settings.headers", {
+        "k": "v"
+    }, [{
+        "key": "k",
+        "value": "v"
+    }]),
+    ("details.salesforce_settings.headers", [{
+        "key": "k",
+        "value": "v"
+    }], [{
+        "key": "k",
+        "value": "v"
+    }]),
+    ("details.salesforce_settings.params", "k:v", {
+        "k": "v"
+    }),
+    ("details.salesforce_settings.params", "", {}),
+])
+def test_parse(plan: field_plan_utility.LogTypePlan, path: str, value: Any,
+               expected: Any) -> None:
+  """Test case to check conversion of field values.
+
+  Args:
+    plan: Compiled test log type schema.
+    path: Field path.
+    value: Value to convert.
+    expected: Expected converted value.
+  """
+  assert plan.fields_by_path[path].parse(value) == expected
+
+
+@pytest.mark.parametrize("path,value,error", [
+    ("details.salesforce_settings.hostname", ["x"], "must be a string."),
+    ("details.salesforce_settings.region", "ASIA",
+     "must be one of: US_EAST_1, EUROPE."),
+    ("details.salesforce_settings.enabled", "yes", "must be true or false."),
+    ("details.salesforce_settings.scopes", [1], "must be a list of strings."),
+    ("details.salesforce_settings.headers", "k",
+     "has 'k', which is not in 'key:value' format."),
+    ("details.salesforce_settings.params", ["k"],
+     "must be a mapping of strings."),
+])
+def test_parse_invalid(plan: field_plan_utility.LogTypePlan, path: str,
+                       value: Any, error: str) -> None:
+  """Test case to check errors of invalid field values.
+
+  Args:
+    plan: Compiled test log type schema.
+    path: Field path.
+    value: Invalid value.
+    error: Expected error.
+  """
+  with pytest.raises(ValueError) as e:
+    plan.fields_by_path[path].parse(value)
+  assert str(e.value) == error
+
+
+def test_convert(plan: field_plan_utility.LogTypePlan) -> None:
+  """Test case to check validation and conversion of feed values.
+
+  Args:
+    plan: Compiled test log type schema.
+  """
+  values: Dict[str, Any] = {
+      "details.salesforce_settings.hostname": "example.com",
+      "details.salesforce_settings.region": "Europe",
+      "details.salesforce_settings.username": "user",
+      "details.namespace": "corp",
+  }
+  assert plan.convert(values) == ({
+      "details.salesforce_settings.hostname": "example.com",
+      "details.salesforce_settings.region": "EUROPE",
+      "details.salesforce_settings.username": "user",
+      "details.namespace": "corp",
+  }, [])
+
+
+def test_convert_errors(plan: field_plan_utility.LogTypePlan) -> None:
+  """Test case to check reporting of invalid and missing fields.
+
+  Args:
+    plan: Compiled test log type schema.
+  """
+  values = {"details.salesforce_settings.enabled": "maybe"}
+  _, errors = plan.convert(values)
+  assert errors == [
+      "Enabled (details.salesforce_settings.enabled) must be true or false.",
+      "Missing the fields of one of: OAuth password grant, "
+      "OAuth client credentials.",
+      "API Hostname (details.salesforce_settings.hostname) is required.",
+  ]
+
+  _, errors = plan.convert(values, partial=True)
+  assert errors == [
+      "Enabled (details.salesforce_settings.enabled) must be true or false."
+  ]
+
+  _, errors = plan.convert({
+      "details.salesforce_settings.hostname": "example.com",
+      "details.salesforce_settings.client_secret": "secret",
+  })
+  assert not errors
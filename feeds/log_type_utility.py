@@ -0,0 +1,294 @@
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Search index over the source types and log types of the feed schema."""
+
+import dataclasses
+import difflib
+import re
+from typing import Any, Dict, List, Optional, Tuple
+
+from feeds.constants import schema
+
+# Fuzzy matching is skipped for shorter queries, which match almost anything.
+MIN_FUZZY_QUERY_LENGTH = 3
+# Minimum similarity of a word to the query for it to count as a typo of it.
+MIN_FUZZY_RATIO = 0.8
+
+# Ranks of a match, best first.
+RANK_EXACT = 0
+RANK_PREFIX = 1
+RANK_WORD_PREFIX = 2
+RANK_SUBSTRING = 3
+RANK_SUBSEQUENCE = 4
+RANK_TYPO = 5
+
+
+@dataclasses.dataclass(frozen=True)
+class LogType:
+  """Log type of a source type."""
+  source_type: str
+  source_display_name: str
+  log_type: str
+  display_name: str
+
+
+@dataclasses.dataclass(frozen=True)
+class _Entry:
+  """Log type with the normalized forms of its ID and display name."""
+  log_type: LogType
+  keys: Tuple[str, str]
+  compact_keys: Tuple[str, str]
+  words: Tuple[str, ...]
+
+
+def normalize(text: str) -> str:
+  """Normalizes text for matching.
+
+  Letters are lowercased and runs of other characters become one space, so
+  "AZURE_AD", "Azure AD" and "azure-ad" are all "azure ad".
+
+  Args:
+    text (str): Text to normalize.
+
+  Returns:
+    str: Normalized text.
+  """
+  return " ".join(re.findall(r"[a-z0-9]+", text.lower()))
+
+
+def is_subsequence(query: str, text: str) -> bool:
+  """Checks whether the characters of query appear in text in order.
+
+  Args:
+    query (str): Characters to look for.
+    text (str): Text to look in.
+
+  Returns:
+    bool: True if text contains the characters of query in order.
+  """
+  characters = iter(text)
+  return all(character in characters for character in query)
+
+
+class LogTypeIndex:
+  """Finds log types by ID or display name.
+
+  The index is built once from the log source map of the feed schema. Exact
+  lookups take constant time, and searches compare the query against names
+  normalized in advance.
+  """
+
+  def __init__(self, log_source_map: Dict[str, Any]) -> None:
+    """Builds the index.
+
+    Args:
+      log_source_map (Dict): Map of source types to their display name and
+        log types, as returned by FeedSchema.get_log_source_map().
+    """
+    self.source_types: Dict[str, str] = {}
+    self._source_types_by_name: Dict[str, str] = {}
+    self._entries: List[_Entry] = []
+    self._entries_by_source: Dict[str, List[_Entry]] = {}
+    self._exact: Dict[str, List[LogType]] = {}
+
+    for source_type, properties in log_source_map.items():
+      source_display_name = properties.get(schema.KEY_DISPLAY_NAME, "")
+      self.source_types[source_type] = source_display_name
+      for name in (source_type, source_display_name):
+        self._source_types_by_name.setdefault(normalize(name), source_type)
+
+      entries = self._entries_by_source.setdefault(source_type, [])
+      for log_type_id, display_name in properties.get(schema.KEY_LOG_TYPES,
+                                                      []):
+        log_type = LogType(source_type, source_display_name, log_type_id,
+                           display_name)
+        keys = (normalize(log_type_id), normalize(display_name))
+        entry = _Entry(
+            log_type, keys, tuple(key.replace(" ", "") for key in keys),
+            tuple(sorted(set(" ".join(keys).split()))))
+        entries.append(entry)
+        self._entries.append(entry)
+        for key in set(keys):
+          self._exact.setdefault(key, []).append(log_type)
+
+  def find_source_type(self, name: str) -> Optional[str]:
+    """Finds a source type by ID or display name, ignoring case.
+
+    Args:
+      name (str): ID or display name of the source type.
+
+    Returns:
+      str: ID of the source type, or None if there is no such source type.
+    """
+    return self._source_types_by_name.get(normalize(name))
+
+  def get_log_types(self, source_type: str) -> List[LogType]:
+    """Gets the log types of a source type in schema order.
+
+    Args:
+      source_type (str): ID of the source type.
+
+    Returns:
+      List[LogType]: Log types of the source type.
+    """
+    return [
+        entry.log_type for entry in self._entries_by_source.get(source_type, [])
+    ]
+
+  def find(self,
+           name: str,
+           source_type: Optional[str] = None) -> List[LogType]:
+    """Finds the log types with an ID or display name, ignoring case.
+
+    Args:
+      name (str): ID or display name of the log type.
+      source_type (str): Only find log types of this source type.
+
+    Returns:
+      List[LogType]: Matching log types, one per source type that has it.
+    """
+    return [
+        log_type for log_type in self._exact.get(normalize(name), [])
+        if source_type in (None, log_type.source_type)
+    ]
+
+  def search(self,
+             query: str,
+             source_type: Optional[str] = None,
+             limit: Optional[int] = None) -> List[LogType]:
+    """Searches log types by ID and display name.
+
+    Matches are ranked: exact matches first, then names starting with the
+    query, names with a word starting with the query, names containing the
+    query, names containing the letters of the query in order, and finally
+    names with a word that is a likely typo of the query. Matches of the same
+    rank are sorted by display name.
+
+    Args:
+      query (str): Text to search for.
+      source_type (str): Only search log types of this source type.
+      limit (int): Maximum number of results.
+
+    Returns:
+      List[LogType]: Matching log types, best match first.
+    """
+    if source_type is None:
+      entries = self._entries
+    else:
+      entries = self._entries_by_source.get(source_type, [])
+
+    query = normalize(query)
+    if not query:
+      return [entry.log_type for entry in entries][:limit]
+
+    ranked = []
+    for entry in entries:
+      rank = get_rank(entry, query)
+      if rank is not None:
+        ranked.append((rank, entry.log_type.display_name.lower(), entry))
+    ranked.sort(key=lambda match: match[:2])
+    return [entry.log_type for _, _, entry in ranked][:limit]
+
+
+def get_rank(entry: _Entry, query: str) -> Optional[int]:
+  """Gets how well a log type matches a normalized query.
+
+  Args:
+    entry (_Entry): Indexed log type.
+    query (str): Normalized query.
+
+  Returns:
+    int: Rank of the match, lower is better, or None if it does not match.
+  """
+  if query in entry.keys:
+    return RANK_EXACT
+  if any(key.startswith(query) for key in entry.keys):
+    return RANK_PREFIX
+  if any(f" {query}" in key for key in entry.keys):
+    return RANK_WORD_PREFIX
+  if any(query in key for key in entry.keys):
+    return RANK_SUBSTRING
+  if len(query) < MIN_FUZZY_QUERY_LENGTH:
+    return None
+  compact_query = query.replace(" ", "")
+  if any(is_subsequence(compact_query, key) for key in entry.compact_keys):
+    return RANK_SUBSEQUENCE
+  if all(
+      difflib.get_close_matches(word, entry.words, 1, MIN_FUZZY_RATIO)
+      for word in query.split()):
+    return RANK_TYPO
+  return None
+
+
+def resolve_source_type(log_type_index: LogTypeIndex, name: str) -> str:
+  """Gets the ID of a source type given by ID or display name.
+
+  Args:
+    log_type_index (LogTypeIndex): Index of the feed schema.
+    name (str): ID or display name of the source type.
+
+  Returns:
+    str: ID of the source type.
+
+  Raises:
+    ValueError: There is no such source type.
+  """
+  source_type = log_type_index.find_source_type(name)
+  if source_type:
+    return source_type
+  message = f"Source type '{name}' not found."
+  suggestions = difflib.get_close_matches(
+      name.upper(), list(log_type_index.source_types), 3, 0.6)
+  if suggestions:
+    message += f" Did you mean: {', '.join(suggestions)}?"
+  raise ValueError(message)
+
+
+def resolve_log_type(log_type_index: LogTypeIndex,
+                     name: str,
+                     source_type: Optional[str] = None) -> LogType:
+  """Gets the log type given by ID or display name.
+
+  Args:
+    log_type_index (LogTypeIndex): Index of the feed schema.
+    name (str): ID or display name of the log type.
+    source_type (str): ID of the source type of the log type. Needed only
+      when more than one source type has the log type.
+
+  Returns:
+    LogType: Log type.
+
+  Raises:
+    ValueError: There is no such log type, or more than one source type has
+      it and source_type is not given.
+  """
+  log_types = log_type_index.find(name, source_type)
+  if len(log_types) == 1:
+    return log_types[0]
+  if log_types:
+    source_types = ", ".join(log_type.source_type for log_type in log_types)
+    raise ValueError(f"Log type '{name}' is available for more than one "
+                     f"source type: {source_types}. Specify the source type.")
+
+  message = f"Log type '{name}' not found"
+  if source_type:
+    message += f" for source type {source_type}"
+  message += "."
+  suggestions = log_type_index.search(name, source_type, limit=5)
+  if suggestions:
+    message += " Did you mean: " + ", ".join(
+        f"{log_type.log_type} ({log_type.display_name})"
+        for log_type in suggestions) + "?"
+  raise ValueError(message)
@@ -0,0 +1,160 @@
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Unit tests for log_type_utility.py."""
+
+import pytest
+
+from feeds import log_type_utility
+
+LOG_SOURCE_MAP = {
+    "API": {
+        "displayName": "Third party API",
+        "logTypes": [
+            ("AZURE_AD", "Azure AD"),
+            ("AZURE_AD_AUDIT", "Azure AD Directory Audit"),
+            ("CLOUDFLARE", "Cloudflare"),
+            ("MICROSOFT_DEFENDER_ENDPOINT", "Microsoft Defender for Endpoint"),
+            ("WORKSPACE_USERS", "Workspace Users"),
+        ]
+    },
+    "AMAZON_S3": {
+        "displayName": "Amazon S3",
+        "logTypes": [("CLOUDFLARE", "Cloudflare")]
+    },
+}
+
+
+@pytest.fixture(name="index")
+def fixture_index() -> log_type_utility.LogTypeIndex:
+  """Return index over test data."""
+  return log_type_utility.LogTypeIndex(LOG_SOURCE_MAP)
+
+
+def get_ids(log_types):
+  """Return the IDs of log types."""
+  return [log_type.log_type for log_type in log_types]
+
+
+def test_normalize() -> None:
+  """Test case to check that names are compared regardless of style."""
+  assert log_type_utility.normalize("AZURE_AD") == "azure ad"
+  assert log_type_utility.normalize(" Azure-AD ") == "azure ad"
+
+
+def test_find(index: log_type_utility.LogTypeIndex) -> None:
+  """Test case to check exact lookups by ID and display name.
+
+  Args:
+    index: Test index.
+  """
+  assert index.find("azure_ad") == [
+      log_type_utility.LogType("API", "Third party API", "AZURE_AD",
+                               "Azure AD")
+  ]
+  assert get_ids(index.find("Workspace Users")) == ["WORKSPACE_USERS"]
+  assert len(index.find("CLOUDFLARE")) == 2
+  assert len(index.find("CLOUDFLARE", "AMAZON_S3")) == 1
+  assert not index.find("AZURE")
+
+
+def test_find_source_type(index: log_type_utility.LogTypeIndex) -> None:
+  """Test case to check source type lookup by ID and display name.
+
+  Args:
+    index: Test index.
+  """
+  assert index.find_source_type("amazon_s3") == "AMAZON_S3"
+  assert index.find_source_type("Third party API") == "API"
+  assert index.find_source_type("S3") is None
+
+
+def test_search_ranking(index: log_type_utility.LogTypeIndex) -> None:
+  """Test case to check the order of search results.
+
+  Args:
+    index: Test index.
+  """
+  assert get_ids(index.search("azure ad", "API")) == [
+      "AZURE_AD", "AZURE_AD_AUDIT"
+  ]
+  # Word prefix before substring.
+  assert get_ids(index.search("defender", "API")) == [
+      "MICROSOFT_DEFENDER_ENDPOINT"
+  ]
+  assert get_ids(index.search("users", "API")) == ["WORKSPACE_USERS"]
+  assert get_ids(index.search("orkspace", "API")) == ["WORKSPACE_USERS"]
+
+
+def test_search_fuzzy(index: log_type_utility.LogTypeIndex) -> None:
+  """Test case to check matching of abbreviations and typos.
+
+  Args:
+    index: Test index.
+  """
+  assert get_ids(index.search("msdef", "API")) == [
+      "MICROSOFT_DEFENDER_ENDPOINT"
+  ]
+  assert get_ids(index.search("cloudflair", "API")) == ["CLOUDFLARE"]
+  assert not index.search("xy", "API")
+
+
+def test_search_all_source_types(index: log_type_utility.LogTypeIndex) -> None:
+  """Test case to check search across source types and the result limit.
+
+  Args:
+    index: Test index.
+  """
+  assert [(log_type.source_type, log_type.log_type)
+          for log_type in index.search("cloudflare")] == [
+              ("API", "CLOUDFLARE"), ("AMAZON_S3", "CLOUDFLARE")
+          ]
+  assert len(index.search("", limit=3)) == 3
+  assert len(index.search("")) == 6
+
+
+def test_resolve_source_type(index: log_type_utility.LogTypeIndex) -> None:
+  """Test case to check resolving a source type given by the user.
+
+  Args:
+    index: Test index.
+  """
+  assert log_type_utility.resolve_source_type(index, "Amazon S3") == (
+      "AMAZON_S3")
+  with pytest.raises(ValueError) as error:
+    log_type_utility.resolve_source_type(index, "AMAZON_S4")
+  assert str(error.value) == ("Source type 'AMAZON_S4' not found. "
+                              "Did you mean: AMAZON_S3?")
+
+
+def test_resolve_log_type(index: log_type_utility.LogTypeIndex) -> None:
+  """Test case to check resolving a log type given by the user.
+
+  Args:
+    index: Test index.
+  """
+  assert log_type_utility.resolve_log_type(
+      index, "Cloudflare", "AMAZON_S3").source_type == "AMAZON_S3"
+
+  with pytest.raises(ValueError) as error:
+    log_type_utility.resolve_log_type(index, "Cloudflare")
+  assert str(error.value) == (
+      "Log type 'Cloudflare' is available for more than one source type: "
+      "API, AMAZON_S3. Specify the source type.")
+
+  with pytest.raises(ValueError) as error:
+    log_type_utility.resolve_log_type(index, "azure", "API")
+  assert str(error.value) == (
+      "Log type 'azure' not found for source type API. Did you mean: "
+      "AZURE_AD (Azure AD), AZURE_AD_AUDIT (Azure AD Directory Audit)?")
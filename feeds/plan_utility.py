@@ -0,0 +1,345 @@
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Plan and apply declarative feed definitions."""
+
+import collections
+import dataclasses
+import json
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+import yaml
+
+from common import api_utility
+from common import commands_utility
+from common.constants import key_constants
+from common.constants import status
+from feeds import feed_utility
+from feeds.constants import schema
+
+KEY_ID = "id"
+# Keys a feed definition may have. Feed state is changed with the enable and
+# disable commands and is not managed by definitions.
+DEFINITION_KEYS = (KEY_ID, schema.KEY_DISPLAY_NAME, schema.KEY_DETAILS)
+# Keys of a live feed sent back by an update.
+UPDATE_KEYS = (schema.KEY_DISPLAY_NAME, schema.KEY_DETAILS)
+# Flattened keys which identify the kind of a feed and cannot be updated.
+IDENTITY_KEYS = ("details.feed_source_type", "details.log_type")
+
+ACTION_CREATE = "create"
+ACTION_UPDATE = "update"
+
+
+@dataclasses.dataclass
+class FeedChange:
+  """Change needed to bring a feed to its definition."""
+  # Position of the definition in the definitions file.
+  index: int
+  action: str
+  label: str
+  feed_id: Optional[str] = None
+  # Changed flattened keys with their live and desired values.
+  fields: Dict[str, Tuple[Any, Any]] = dataclasses.field(default_factory=dict)
+  # Request body. Updates hold the whole feed, see make_plan.
+  body: Dict[str, Any] = dataclasses.field(default_factory=dict)
+
+
+@dataclasses.dataclass
+class Plan:
+  """Changes needed to bring the live feeds to their definitions."""
+  changes: List[FeedChange]
+  unchanged: int
+  # Definitions which cannot be planned, with the reason.
+  errors: List[str]
+
+
+@dataclasses.dataclass(frozen=True)
+class PlanTarget:
+  """Feed a definition applies to."""
+  # ID of the live feed, or None if the feed is to be created.
+  feed_id: Optional[str]
+  # Display name of the feed to be created.
+  display_name: Optional[str] = None
+
+  @property
+  def duplicate_error(self) -> str:
+    """Error reported for definitions applying to the same feed."""
+    if self.feed_id:
+      return f"Feed {self.feed_id} has several definitions."
+    return (f"Several definitions would create feeds named "
+            f"'{self.display_name}'.")
+
+
+def load_definitions(definitions_path: str) -> List[Dict[str, Any]]:
+  """Loads and validates feed definitions.
+
+  The definitions file is a YAML or JSON file with a list of feeds, e.g.
+
+    feeds:
+      - id: 123
+        displayName: Workspace users
+        details:
+          feedSourceType: API
+          logType: WORKSPACE_USERS
+          namespace: corp
+
+  A definition without an ID refers to the live feed with the same display
+  name, and is created if there is none.
+
+  Args:
+    definitions_path (str): Path of the definitions file.
+
+  Returns:
+    List[Dict[str, Any]]: Feed definitions in file order.
+
+  Raises:
+    OSError: Failed to read the definitions file.
+    ValueError: Invalid definitions.
+  """
+  with open(definitions_path, "r") as file:
+    try:
+      definitions = yaml.safe_load(file)
+    except yaml.YAMLError as e:
+      raise ValueError(f"Definitions are not valid YAML: {e}") from e
+
+  if not isinstance(definitions, dict) or not isinstance(
+      definitions.get(schema.KEY_FEEDS), list):
+    raise ValueError(
+        f"Definitions must contain a list of '{schema.KEY_FEEDS}'.")
+
+  for position, definition in enumerate(definitions[schema.KEY_FEEDS], 1):
+    if not isinstance(definition, dict):
+      raise ValueError(f"Feed {position} must be a mapping.")
+    unknown_keys = set(definition) - set(DEFINITION_KEYS)
+    if unknown_keys:
+      raise ValueError(f"Feed {position} has unsupported keys: "
+                       f"{', '.join(sorted(unknown_keys))}.")
+    if KEY_ID not in definition and not definition.get(
+        schema.KEY_DISPLAY_NAME):
+      raise ValueError(
+          f"Feed {position} needs an '{KEY_ID}' or a "
+          f"'{schema.KEY_DISPLAY_NAME}'.")
+    if not isinstance(definition.get(schema.KEY_DETAILS, {}), dict):
+      raise ValueError(f"Feed {position} has invalid '{schema.KEY_DETAILS}'.")
+  return definitions[schema.KEY_FEEDS]
+
+
+def merge_dicts(base: Dict[str, Any],
+                changes: Dict[str, Any]) -> Dict[str, Any]:
+  """Returns a dictionary with changes deep-merged into it.
+
+  Args:
+    base (Dict[str, Any]): Dictionary to be merged into, left unchanged.
+    changes (Dict[str, Any]): Values replacing those of base. Nested
+      dictionaries are merged and any other value replaces the base value.
+
+  Returns:
+    Dict[str, Any]: Merged dictionary.
+  """
+  merged = dict(base)
+  for key, value in changes.items():
+    if isinstance(value, dict) and isinstance(merged.get(key), dict):
+      merged[key] = merge_dicts(merged[key], value)
+    else:
+      merged[key] = value
+  return merged
+
+
+def make_plan(definitions: List[Dict[str, Any]],
+              live_feeds: List[Dict[str, Any]]) -> Plan:
+  """Diffs feed definitions against the live feeds.
+
+  Both sides are flattened and only the fields given in a definition are
+  compared, so fields a definition leaves out keep their live value. As the
+  update call has no update mask and replaces the details of a feed, the body
+  of an update is the live feed with its definition merged into it.
+
+  Definitions which refer to the same live feed, or which would create feeds
+  with the same display name, are all reported as errors.
+
+  Args:
+    definitions (List[Dict[str, Any]]): Feed definitions.
+    live_feeds (List[Dict[str, Any]]): Feeds as returned by the API.
+
+  Returns:
+    Plan: Changes needed to bring the live feeds to their definitions.
+  """
+  feeds_by_id = {feed_utility.get_feed_id(feed): feed for feed in live_feeds}
+  feeds_by_name = {}
+  for feed in live_feeds:
+    feeds_by_name.setdefault(feed.get(schema.KEY_DISPLAY_NAME), []).append(feed)
+
+  planned = [
+      plan_definition(index, definition, feeds_by_id, feeds_by_name)
+      for index, definition in enumerate(definitions)
+  ]
+  target_counts = collections.Counter(
+      target for target, _ in planned if target)
+  plan = Plan([], 0, [])
+  reported_targets = set()
+  for target, outcome in planned:
+    if target and target_counts[target] > 1:
+      if target not in reported_targets:
+        reported_targets.add(target)
+        plan.errors.append(target.duplicate_error)
+    elif isinstance(outcome, FeedChange):
+      plan.changes.append(outcome)
+    elif outcome:
+      plan.errors.append(outcome)
+    else:
+      plan.unchanged += 1
+  return plan
+
+
+def plan_definition(
+    index: int, definition: Dict[str, Any], feeds_by_id: Dict[str, Any],
+    feeds_by_name: Dict[str, List[Dict[str, Any]]]
+) -> Tuple[Optional[PlanTarget], Union[FeedChange, str, None]]:
+  """Diffs a feed definition against the live feed it refers to.
+
+  Args:
+    index (int): Position of the definition in the definitions file.
+    definition (Dict[str, Any]): Feed definition.
+    feeds_by_id (Dict[str, Any]): Live feeds by ID.
+    feeds_by_name (Dict[str, List[Dict[str, Any]]]): Live feeds by display
+      name.
+
+  Returns:
+    Tuple[PlanTarget, Union[FeedChange, str, None]]: Feed the definition
+    applies to, None if it does not refer to a single feed. Change needed to
+    bring the feed to its definition, the reason the definition cannot be
+    planned, or None if the feed is unchanged.
+  """
+  display_name = definition.get(schema.KEY_DISPLAY_NAME)
+  desired = commands_utility.flatten_dict(
+      {k: v for k, v in definition.items() if k != KEY_ID})
+  if KEY_ID in definition:
+    feed_id = str(definition[KEY_ID]).split("/")[-1]
+    live_feed = feeds_by_id.get(feed_id)
+    if not live_feed:
+      return None, f"Feed {feed_id} does not exist."
+  else:
+    matches = feeds_by_name.get(display_name, [])
+    if len(matches) > 1:
+      return None, (f"Several feeds are named '{display_name}'. Give the ID "
+                    "of the feed to manage.")
+    if not matches:
+      target = PlanTarget(None, display_name)
+      missing_keys = [key for key in IDENTITY_KEYS if key not in desired]
+      if missing_keys:
+        return target, (f"Feed '{display_name}' cannot be created "
+                        f"without {', '.join(missing_keys)}.")
+      return target, FeedChange(
+          index,
+          ACTION_CREATE,
+          display_name,
+          fields={key: (None, value) for key, value in desired.items()},
+          body=feed_utility.deflatten_dict(desired))
+    live_feed = matches[0]
+
+  feed_id = feed_utility.get_feed_id(live_feed)
+  target = PlanTarget(feed_id)
+  label = f"{feed_id} ({display_name})" if display_name else feed_id
+  live = commands_utility.flatten_dict(live_feed)
+  identity_changes = [
+      key for key in IDENTITY_KEYS
+      if key in desired and desired[key] != live.get(key)
+  ]
+  if identity_changes:
+    return target, (f"Feed {label} cannot change "
+                    f"{', '.join(identity_changes)}.")
+
+  fields = {
+      key: (live.get(key), value)
+      for key, value in desired.items()
+      if live.get(key) != value
+  }
+  if not fields:
+    return target, None
+  body = merge_dicts(
+      {key: live_feed[key] for key in UPDATE_KEYS if key in live_feed},
+      {key: value for key, value in definition.items() if key != KEY_ID})
+  return target, FeedChange(index, ACTION_UPDATE, label, feed_id, fields, body)
+
+
+def format_plan(plan: Plan) -> str:
+  """Formats a plan for display.
+
+  Args:
+    plan (Plan): Plan to be displayed.
+
+  Returns:
+    str: Planned changes followed by a summary.
+  """
+  lines = []
+  for change in plan.changes:
+    symbol = "+" if change.action == ACTION_CREATE else "~"
+    lines.append(f"{symbol} {change.action} feed {change.label}")
+    for key, (live_value, desired_value) in change.fields.items():
+      if change.action == ACTION_CREATE:
+        lines.append(f"    {key}: {json.dumps(desired_value)}")
+      else:
+        lines.append(f"    {key}: {json.dumps(live_value)} -> "
+                     f"{json.dumps(desired_value)}")
+  for error in plan.errors:
+    lines.append(f"! {error}")
+  creates = sum(change.action == ACTION_CREATE for change in plan.changes)
+  lines.append(f"\nPlan: {creates} to create, "
+               f"{len(plan.changes) - creates} to update, "
+               f"{plan.unchanged} unchanged, {len(plan.errors)} invalid.")
+  return "\n".join(lines)
+
+
+def apply_change(client: Any, region: str, custom_url: Optional[str],
+                 change: FeedChange) -> Dict[str, Any]:
+  """Applies a planned change and returns its result.
+
+  Failures are reported in the result instead of being raised, so a failed
+  change does not stop the remaining ones.
+
+  Args:
+    client (Any): HTTP session object to send authorized requests and receive
+      responses.
+    region (str): Region (US, EUROPE, ASIA_SOUTHEAST1).
+    custom_url (str): Base URL to be used for API calls.
+    change (FeedChange): Change to be applied.
+
+  Returns:
+    Dict[str, Any]: Result of the change with whether it succeeded, the ID of
+    the feed, and the response code or the error message.
+  """
+  feed_url = feed_utility.get_feed_url(region, custom_url)
+  if change.action == ACTION_CREATE:
+    method, change_url = "POST", feed_url
+  else:
+    method, change_url = "PATCH", f"{feed_url}/{change.feed_id}"
+  result = {"label": change.label, "url": change_url, "method": method}
+  try:
+    response = client.request(method, change_url, json.dumps(change.body))
+    parsed_response = api_utility.check_content_type(response.content)
+  except Exception as e:  # pylint: disable=broad-except
+    result.update({"success": False, "error": str(e)})
+    return result
+
+  result.update({
+      "success": response.status_code == status.STATUS_OK,
+      "status_code": response.status_code,
+      "response": parsed_response,
+  })
+  if response.status_code == status.STATUS_OK:
+    result["id"] = feed_utility.get_feed_id(parsed_response) or change.feed_id
+  else:
+    result["error"] = parsed_response.get(key_constants.KEY_ERROR, {}).get(
+        key_constants.KEY_MESSAGE)
+  return result
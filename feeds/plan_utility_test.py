@@ -0,0 +1,216 @@
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Unit tests for plan_utility.py."""
+
+import json
+from unittest import mock
+
+import pytest
+
+from feeds import plan_utility
+from mock_test_utility import MockResponse
+
+LIVE_FEEDS = [
+    {
+        "name": "feeds/1",
+        "displayName": "Users",
+        "details": {
+            "feedSourceType": "API",
+            "logType": "WORKSPACE_USERS",
+            "namespace": "corp",
+            "workspaceUsersSettings": {
+                "workspaceCustomerId": "C01"
+            }
+        },
+        "feedState": "ACTIVE"
+    },
+    {
+        "name": "feeds/2",
+        "displayName": "Groups",
+        "details": {
+            "feedSourceType": "API",
+            "logType": "WORKSPACE_GROUPS"
+        },
+        "feedState": "ACTIVE"
+    },
+]
+
+
+def test_load_definitions(tmp_path) -> None:
+  """Test that definitions are loaded and validated."""
+  definitions_file = tmp_path / "feeds.yaml"
+  definitions_file.write_text("feeds:\n  - id: 1\n    displayName: Users\n")
+  assert plan_utility.load_definitions(str(definitions_file)) == [{
+      "id": 1,
+      "displayName": "Users"
+  }]
+
+  definitions_file.write_text("feeds:\n  - feedState: ACTIVE\n")
+  with pytest.raises(ValueError, match="unsupported keys: feedState"):
+    plan_utility.load_definitions(str(definitions_file))
+  definitions_file.write_text("feeds:\n  - details: {}\n")
+  with pytest.raises(ValueError, match="needs an 'id' or a 'displayName'"):
+    plan_utility.load_definitions(str(definitions_file))
+
+
+def test_make_plan_merges_live_feed() -> None:
+  """Test that an update holds the live feed with the changed fields."""
+  feed_plan = plan_utility.make_plan([{
+      "id": "feeds/1",
+      "details": {
+          "namespace": "prod",
+          "workspaceUsersSettings": {
+              "workspaceCustomerId": "C01"
+          }
+      }
+  }, {
+      "displayName": "Groups",
+      "details": {
+          "logType": "WORKSPACE_GROUPS"
+      }
+  }], LIVE_FEEDS)
+
+  assert feed_plan.unchanged == 1
+  assert not feed_plan.errors
+  [change] = feed_plan.changes
+  assert change.action == plan_utility.ACTION_UPDATE
+  assert change.feed_id == "1"
+  assert change.fields == {"details.namespace": ("corp", "prod")}
+  assert change.body == {
+      "displayName": "Users",
+      "details": {
+          "feedSourceType": "API",
+          "logType": "WORKSPACE_USERS",
+          "namespace": "prod",
+          "workspaceUsersSettings": {
+              "workspaceCustomerId": "C01"
+          }
+      }
+  }
+  assert LIVE_FEEDS[0]["details"]["namespace"] == "corp"
+
+
+def test_merge_dicts() -> None:
+  """Test that nested dictionaries are merged and other values replaced."""
+  assert plan_utility.merge_dicts({
+      "a": {
+          "b": 1,
+          "c": [1]
+      },
+      "d": 1
+  }, {"a": {
+      "c": [2]
+  }}) == {
+      "a": {
+          "b": 1,
+          "c": [2]
+      },
+      "d": 1
+  }
+
+
+def test_make_plan_creates_and_reports_errors() -> None:
+  """Test that unknown feeds are created and invalid definitions reported."""
+  feed_plan = plan_utility.make_plan([
+      {
+          "displayName": "Alerts",
+          "details": {
+              "feedSourceType": "API",
+              "logType": "WORKSPACE_ALERTS"
+          }
+      },
+      {
+          "displayName": "Activity"
+      },
+      {
+          "id": 3
+      },
+      {
+          "id": 2,
+          "details": {
+              "logType": "WORKSPACE_USERS"
+          }
+      },
+  ], LIVE_FEEDS)
+
+  [change] = feed_plan.changes
+  assert change.action == plan_utility.ACTION_CREATE
+  assert change.body == {
+      "displayName": "Alerts",
+      "details": {
+          "feedSourceType": "API",
+          "logType": "WORKSPACE_ALERTS"
+      }
+  }
+  assert feed_plan.errors == [
+      "Feed 'Activity' cannot be created without details.feed_source_type, "
+      "details.log_type.",
+      "Feed 3 does not exist.",
+      "Feed 2 cannot change details.log_type.",
+  ]
+  assert plan_utility.format_plan(feed_plan).endswith(
+      "Plan: 1 to create, 0 to update, 0 unchanged, 3 invalid.")
+
+
+def test_make_plan_reports_duplicates() -> None:
+  """Test that definitions of the same feed are all reported as errors."""
+  new_feed = {
+      "displayName": "Alerts",
+      "details": {
+          "feedSourceType": "API",
+          "logType": "WORKSPACE_ALERTS"
+      }
+  }
+  feed_plan = plan_utility.make_plan([
+      {
+          "id": 1,
+          "details": {
+              "namespace": "prod"
+          }
+      },
+      new_feed,
+      {
+          "displayName": "Users"
+      },
+      new_feed,
+      {
+          "id": 2
+      },
+  ], LIVE_FEEDS)
+
+  assert not feed_plan.changes
+  assert feed_plan.unchanged == 1
+  assert feed_plan.errors == [
+      "Feed 1 has several definitions.",
+      "Several definitions would create feeds named 'Alerts'.",
+  ]
+
+
+def test_apply_change() -> None:
+  """Test that updates are sent as PATCH requests of the planned body."""
+  client = mock.MagicMock()
+  client.request.return_value = MockResponse(
+      status_code=200, text=json.dumps(LIVE_FEEDS[0]))
+  change = plan_utility.FeedChange(
+      0, plan_utility.ACTION_UPDATE, "1 (Users)", "1",
+      {"details.namespace": ("corp", "prod")},
+      {"details": {"namespace": "prod"}})
+
+  result = plan_utility.apply_change(client, "US", None, change)
+  assert result["success"]
+  assert result["id"] == "1"
+  client.request.assert_called_once_with(
+      "PATCH", "https://backstory.googleapis.com/v1/feeds/1",
+      '{"details": {"namespace": "prod"}}')
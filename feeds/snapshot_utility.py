@@ -0,0 +1,225 @@
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Feed snapshots written by feeds export and restored by feeds import."""
+
+import hashlib
+import os
+import threading
+from typing import Any, Dict, Optional
+
+from common import commands_utility
+from common.constants import key_constants
+from feeds import feed_schema_utility
+from feeds import feed_utility
+from feeds.constants import schema
+
+# Size of the chunks a streamed list response is read in.
+CHUNK_SIZE = 64 * 1024
+
+# Prefix of the first line of a resume file, followed by the fingerprint of
+# its snapshot.
+RESUME_HEADER = "# snapshot "
+
+# Status of a record whose feed was created but whose state is still to be
+# restored.
+STATUS_CREATED = "created"
+# Status of a record whose feed was created in its exported state.
+STATUS_RESTORED = "restored"
+
+# Key of the feed state in snapshot records.
+KEY_RECORD_FEED_STATE = commands_utility.convert_to_snakecase(
+    schema.KEY_FEED_STATE)
+STATE_INACTIVE = "INACTIVE"
+
+
+def get_snapshot_record(feed_schema: feed_schema_utility.FeedSchema,
+                        feed: Dict[str, Any]) -> Dict[str, Any]:
+  """Returns the snapshot record of a feed.
+
+  Records have the layout of the backups written by feeds create and update.
+
+  Args:
+    feed_schema (FeedSchema): Feed schema used to look up display names.
+    feed (Dict[str, Any]): Feed as returned by the API.
+
+  Returns:
+    Dict[str, Any]: Flattened feed along with its source and log type.
+  """
+  details = feed.get(schema.KEY_DETAILS, {})
+  source_type = details.get(schema.KEY_FEED_SOURCE_TYPE)
+  log_type = details.get(key_constants.KEY_LOG_TYPE)
+  display_source_type, display_log_type = source_type, log_type
+  detail_schema = feed_schema.get_detailed_schema(source_type, log_type)
+  if not detail_schema.error:
+    display_source_type = detail_schema.display_source_type
+    display_log_type = detail_schema.log_type_schema[schema.KEY_DISPLAY_NAME]
+  return feed_utility.get_backup_data(
+      commands_utility.flatten_dict(feed), display_source_type, source_type,
+      display_log_type, log_type, feed.get(schema.KEY_DISPLAY_NAME))
+
+
+def get_request_body(record: Dict[str, Any]) -> Dict[str, Any]:
+  """Returns the body of the request creating the feed of a snapshot record.
+
+  Args:
+    record (Dict[str, Any]): Snapshot record.
+
+  Returns:
+    Dict[str, Any]: Create feed request body.
+  """
+  body = feed_utility.deflatten_dict({
+      key: value
+      for key, value in record.items()
+      if key.startswith(f"{schema.KEY_DETAILS}.")
+  })
+  body.setdefault(schema.KEY_DETAILS, {}).update({
+      schema.KEY_FEED_SOURCE_TYPE: record[schema.KEY_FEED_SOURCE_TYPE],
+      key_constants.KEY_LOG_TYPE: record[key_constants.KEY_LOG_TYPE],
+  })
+  if record.get(schema.KEY_DISPLAY_NAME):
+    body[schema.KEY_DISPLAY_NAME] = record[schema.KEY_DISPLAY_NAME]
+  return body
+
+
+def is_inactive(record: Dict[str, Any]) -> bool:
+  """Returns whether the feed of a snapshot record was disabled.
+
+  Feeds are always created enabled, so these have to be disabled once
+  created.
+
+  Args:
+    record (Dict[str, Any]): Snapshot record.
+
+  Returns:
+    bool: True if the exported feed was disabled.
+  """
+  return record.get(KEY_RECORD_FEED_STATE) == STATE_INACTIVE
+
+
+def get_record_key(line_number: int, record: Dict[str, Any]) -> str:
+  """Returns the key a snapshot record is tracked by in the resume file.
+
+  Args:
+    line_number (int): Line number of the record in the snapshot.
+    record (Dict[str, Any]): Snapshot record.
+
+  Returns:
+    str: Name of the exported feed, or the line number for records without
+    one.
+  """
+  return record.get(schema.KEY_NAME) or f"line {line_number}"
+
+
+def get_fingerprint(snapshot_path: str) -> str:
+  """Returns the fingerprint of a snapshot.
+
+  Args:
+    snapshot_path (str): Path of the snapshot file.
+
+  Returns:
+    str: SHA-256 digest of the snapshot.
+
+  Raises:
+    OSError: Failed to read the snapshot.
+  """
+  digest = hashlib.sha256()
+  with open(snapshot_path, "rb") as file:
+    for chunk in iter(lambda: file.read(CHUNK_SIZE), b""):
+      digest.update(chunk)
+  return f"sha256:{digest.hexdigest()}"
+
+
+class Checkpoint:
+  """Records which records of a snapshot have been restored.
+
+  Each restored record is appended to the resume file as soon as it is
+  created, so an interrupted import skips it when run again. A record whose
+  feed was created but not yet disabled is recorded with the created status,
+  so that only its state is restored when run again. Records are tracked by
+  the name of the exported feed, and the resume file starts with the
+  fingerprint of its snapshot so that it is never applied to another one.
+  Records may be added from several threads.
+  """
+
+  def __init__(self, resume_path: str, snapshot_path: str) -> None:
+    """Loads the restored records and opens the resume file for appending.
+
+    Args:
+      resume_path (str): Path of the resume file.
+      snapshot_path (str): Path of the snapshot being restored.
+
+    Raises:
+      OSError: Failed to read or open the resume file or the snapshot.
+      ValueError: The resume file was written for another snapshot.
+    """
+    self.resume_path = resume_path
+    fingerprint = get_fingerprint(snapshot_path)
+    header = f"{RESUME_HEADER}{fingerprint}\n"
+    # IDs of the restored feeds by the keys of their snapshot records.
+    self.done: Dict[str, str] = {}
+    # IDs of the created feeds whose state is still to be restored.
+    self.created: Dict[str, str] = {}
+    lines = []
+    if os.path.exists(resume_path):
+      with open(resume_path, "r") as file:
+        lines = file.readlines()
+    if lines and lines[0] != header:
+      raise ValueError(
+          f"Resume file {resume_path} was written for another snapshot. "
+          "Remove it or pass another --resume-file to import this snapshot.")
+    for line in lines[1:]:
+      key, _, entry = line.rstrip("\n").partition("\t")
+      feed_id, _, record_status = entry.partition("\t")
+      if key:
+        self._add(key, feed_id, record_status or STATUS_RESTORED)
+    self._file = open(resume_path, "a")
+    if not lines:
+      self._file.write(header)
+      self._file.flush()
+    self._lock = threading.Lock()
+
+  def __enter__(self) -> "Checkpoint":
+    return self
+
+  def __exit__(self, *args: Any) -> None:
+    self.close()
+
+  def _add(self, key: str, feed_id: str, record_status: str) -> None:
+    if record_status == STATUS_CREATED:
+      self.created[key] = feed_id
+    else:
+      self.created.pop(key, None)
+      self.done[key] = feed_id
+
+  def record(self,
+             key: str,
+             feed_id: Optional[str],
+             record_status: str = STATUS_RESTORED) -> None:
+    """Records the progress of a snapshot record.
+
+    Args:
+      key (str): Key of the record, see get_record_key.
+      feed_id (str): ID of the created feed.
+      record_status (str): STATUS_CREATED if the state of the feed is still to
+        be restored, STATUS_RESTORED otherwise.
+    """
+    with self._lock:
+      self._file.write(f"{key}\t{feed_id or ''}\t{record_status}\n")
+      self._file.flush()
+      self._add(key, feed_id or "", record_status)
+
+  def close(self) -> None:
+    """Closes the resume file."""
+    self._file.close()
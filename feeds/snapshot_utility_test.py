@@ -0,0 +1,97 @@
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Unit tests for snapshot_utility.py."""
+
+from unittest import mock
+
+import pytest
+
+from feeds import feed_schema_utility
+from feeds import snapshot_utility
+
+FEED = {
+    "name": "feeds/123",
+    "displayName": "Users",
+    "details": {
+        "feedSourceType": "API",
+        "logType": "WORKSPACE_USERS",
+        "namespace": "corp",
+        "workspaceUsersSettings": {
+            "workspaceCustomerId": "C01"
+        }
+    },
+    "feedState": "ACTIVE"
+}
+
+
+def test_snapshot_record_round_trip() -> None:
+  """Test that a snapshot record recreates the feed it was made from."""
+  feed_schema = mock.Mock()
+  feed_schema.get_detailed_schema.return_value = (
+      feed_schema_utility.DetailedSchema("Third party API",
+                                         {"displayName": "Workspace Users"},
+                                         None))
+
+  record = snapshot_utility.get_snapshot_record(feed_schema, FEED)
+  assert record == {
+      "name": "feeds/123",
+      "display_name": "Users",
+      "displayName": "Users",
+      "details.feed_source_type": "API",
+      "details.log_type": "WORKSPACE_USERS",
+      "details.namespace": "corp",
+      "details.workspace_users_settings.workspace_customer_id": "C01",
+      "feed_state": "ACTIVE",
+      "feedSourceType": "API",
+      "display_source_type": "Third party API",
+      "logType": "WORKSPACE_USERS",
+      "display_log_type": "Workspace Users",
+  }
+  assert snapshot_utility.get_request_body(record) == {
+      "displayName": "Users",
+      "details": FEED["details"]
+  }
+
+
+def test_checkpoint(tmp_path) -> None:
+  """Test that restored records are kept in the resume file."""
+  snapshot_path = str(tmp_path / "snapshot.ndjson")
+  with open(snapshot_path, "w") as file:
+    file.write('{"name": "feeds/1"}\n')
+  resume_path = f"{snapshot_path}.resume"
+  with snapshot_utility.Checkpoint(resume_path, snapshot_path) as checkpoint:
+    assert not checkpoint.done
+    checkpoint.record("feeds/1", "a")
+    checkpoint.record("line 3", "b")
+    checkpoint.record("feeds/2", "c", snapshot_utility.STATUS_CREATED)
+
+  with snapshot_utility.Checkpoint(resume_path, snapshot_path) as checkpoint:
+    assert checkpoint.done == {"feeds/1": "a", "line 3": "b"}
+    assert checkpoint.created == {"feeds/2": "c"}
+
+
+def test_checkpoint_other_snapshot(tmp_path) -> None:
+  """Test that a resume file is refused once its snapshot changes."""
+  snapshot_path = str(tmp_path / "snapshot.ndjson")
+  with open(snapshot_path, "w") as file:
+    file.write('{"name": "feeds/1"}\n')
+  resume_path = f"{snapshot_path}.resume"
+  with snapshot_utility.Checkpoint(resume_path, snapshot_path) as checkpoint:
+    checkpoint.record("feeds/1", "a")
+
+  with open(snapshot_path, "a") as file:
+    file.write('{"name": "feeds/2"}\n')
+  with pytest.raises(ValueError, match="another snapshot"):
+    snapshot_utility.Checkpoint(resume_path, snapshot_path)
@@ -29,6 +29,7 @@ TEST_DATA_DIR = os.path.dirname(__file__)
 TEMP_EXPORT_TXT_FILE = os.path.join(TEST_DATA_DIR, "dummy.txt")
 TEMP_EXPORT_CSV_FILE = os.path.join(TEST_DATA_DIR, "dummy.csv")
 TEMP_EXPORT_JSON_FILE = os.path.join(TEST_DATA_DIR, "dummy_export.json")
+TEMP_EXPORT_NDJSON_FILE = os.path.join(TEST_DATA_DIR, "dummy_export.ndjson")
 TEMP_CREATE_BACKUP_FILE = os.path.join(TEST_DATA_DIR, "create_backup.json")
 TEMP_UPDATE_BACKUP_FILE = os.path.join(TEST_DATA_DIR, "update_backup.json")
 TEMP_SERVICE_ACCOUNT_FILE = os.path.join(TEST_DATA_DIR, "service_account.json")
@@ -403,6 +404,23 @@ def client() -> Any:
   return mocked_client
 
 
+@pytest.fixture(scope="function", autouse=True)
+def schema_cache_dir(tmp_path: Any) -> Any:
+  """Use an empty feed schema cache in every test.
+
+  Args:
+    tmp_path: Temporary directory unique to the test.
+
+  Yields:
+    str: Path of the feed schema cache directory.
+  """
+  cache_dir = str(tmp_path / "feed_schema")
+  feed_schema_utility.clear_loaded_schemas()
+  with mock.patch.object(feed_schema_utility, "SCHEMA_CACHE_DIR", cache_dir):
+    yield cache_dir
+  feed_schema_utility.clear_loaded_schemas()
+
+
 @pytest.fixture(scope="function", autouse=True)
 def cleanup(request: Any):
   """Cleanup a testing file once we are finished."""
@@ -411,7 +429,7 @@ def cleanup(request: Any):
     files = [
         TEMP_EXPORT_CSV_FILE, TEMP_EXPORT_TXT_FILE, TEMP_CREATE_BACKUP_FILE,
         TEMP_UPDATE_BACKUP_FILE, TEMP_EXPORT_JSON_FILE,
-        TEMP_SERVICE_ACCOUNT_FILE
+        TEMP_EXPORT_NDJSON_FILE, TEMP_SERVICE_ACCOUNT_FILE
     ]
     for file_path in files:
       try:
@@ -62,7 +62,7 @@ def fetch_collectors(url: str, method: str, client: Any) -> Any:
   list_collectors_response = client.request(method, url)
   status_code = list_collectors_response.status_code
   list_collectors_response = api_utility.check_content_type(
-      list_collectors_response.text)
+      list_collectors_response.content)
 
   if not list_collectors_response:
     collector_errors[schema.KEY_COLLECTORS][
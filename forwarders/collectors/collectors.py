@@ -18,25 +18,24 @@ import os
 
 import click
 
-from common import chronicle_auth
-from forwarders.collectors.commands import create
-from forwarders.collectors.commands import delete
-from forwarders.collectors.commands import get
-from forwarders.collectors.commands import list  # pylint: disable=redefined-builtin
-from forwarders.collectors.commands import update
+from common import lazy_group
+from common.constants import path_constants
 
 
-@click.group(name="collectors", help="Collector Management Workflows")
+@click.group(
+    name="collectors",
+    cls=lazy_group.LazyGroup,
+    lazy_subcommands={
+        "create": "forwarders.collectors.commands.create.create",
+        "delete": "forwarders.collectors.commands.delete.delete",
+        "get": "forwarders.collectors.commands.get.get",
+        "list": "forwarders.collectors.commands.list.list_command",
+        "update": "forwarders.collectors.commands.update.update",
+    },
+    help="Collector Management Workflows")
 def collectors() -> None:
   """Collectors group commands."""
-  collector_dir = os.path.join(chronicle_auth.CHRONICLE_CLI_ROOT_DIR,
+  collector_dir = os.path.join(path_constants.CHRONICLE_CLI_ROOT_DIR,
                                "collectors")
   if not os.path.exists(collector_dir):
     os.mkdir(collector_dir)
-
-
-collectors.add_command(get.get)
-collectors.add_command(list.list_command)
-collectors.add_command(create.create)
-collectors.add_command(update.update)
-collectors.add_command(delete.delete)
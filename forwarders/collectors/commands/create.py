@@ -113,7 +113,7 @@ def create_collector(forwarder_id: str, url: str, client: Any, verbose: bool,
     create_collector_response = client.request(method, collector_url,
                                                json.dumps(request_body))
 
-    response = api_utility.check_content_type(create_collector_response.text)
+    response = api_utility.check_content_type(create_collector_response.content)
 
     if create_collector_response.status_code != status.STATUS_OK:
       click.echo(
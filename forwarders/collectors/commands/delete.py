@@ -72,7 +72,8 @@ def delete(credential_file: AnyStr, verbose: bool, region: str,
 
   collector_response = client.request(method, collector_url)
   status_code = collector_response.status_code
-  collector_response = api_utility.check_content_type(collector_response.text)
+  collector_response = api_utility.check_content_type(
+      collector_response.content)
 
   if status_code == status.STATUS_OK:
     click.echo(f"\nCollector (ID: {collector_id}) deleted successfully.")
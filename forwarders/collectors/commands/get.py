@@ -117,7 +117,7 @@ def get_collector(region: str, url: str, method: str, client: Any,
 
   get_collector_response = client.request(method, collector_url)
   collector_response = api_utility.check_content_type(
-      get_collector_response.text)
+      get_collector_response.content)
   status_code = get_collector_response.status_code
 
   if status_code == status.STATUS_OK:
@@ -124,7 +124,8 @@ def update(credential_file: str, verbose: bool, region: str, url: str) -> None:
     updated_collector_response = client.request(
         method, collector_url, params=params, json=request_body)
 
-    response = api_utility.check_content_type(updated_collector_response.text)
+    response = api_utility.check_content_type(
+        updated_collector_response.content)
 
     if updated_collector_response.status_code != status.STATUS_OK:
       click.echo(
@@ -95,7 +95,7 @@ def create(credential_file: str, verbose: bool, region: str, url: str) -> None:
     create_forwarder_response = client.request(method, forwarder_url,
                                                json.dumps(request_body))
 
-    response = api_utility.check_content_type(create_forwarder_response.text)
+    response = api_utility.check_content_type(create_forwarder_response.content)
 
     if create_forwarder_response.status_code != status.STATUS_OK:
       click.echo(
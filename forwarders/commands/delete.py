@@ -67,7 +67,8 @@ def delete(credential_file: AnyStr, verbose: bool, region: str,
   click.echo("\nDeleting forwarder and all its associated collectors...")
   forwarder_response = client.request(method, forwarder_url)
   status_code = forwarder_response.status_code
-  forwarder_response = api_utility.check_content_type(forwarder_response.text)
+  forwarder_response = api_utility.check_content_type(
+      forwarder_response.content)
 
   if status_code == status.STATUS_OK:
     click.echo(
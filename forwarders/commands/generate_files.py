@@ -72,7 +72,7 @@ def generate_files(credential_file: AnyStr, verbose: bool, region: str,
 
   generate_forwarders_response = client.request(method, forwarder_url)
   forwarder_response = api_utility.check_content_type(
-      generate_forwarders_response.text)
+      generate_forwarders_response.content)
   status_code = generate_forwarders_response.status_code
 
   download_path = os.path.abspath(file_path) if file_path else os.path.abspath(
@@ -15,7 +15,7 @@
 """Get forwarder details using forwarder ID."""
 
 import dataclasses
-from typing import Any, AnyStr, Dict, List
+from typing import Any, AnyStr, Dict, List, Optional
 
 import click
 
@@ -24,6 +24,7 @@ from common import chronicle_auth
 from common import commands_utility
 from common import exception_handler
 from common import options
+from common import regions
 from common.constants import key_constants
 from common.constants import status
 from forwarders import forwarder_utility
@@ -34,18 +35,26 @@ from forwarders.constants import schema
 @click.command(help="Get forwarder details using Forwarder ID")
 @options.url_option
 @options.region_option
+@options.regions_option
+@options.all_regions_option
 @options.verbose_option
 @options.credential_file_option
 @exception_handler.catch_exception()
-def get(credential_file: AnyStr, verbose: bool, region: str, url: str) -> None:
+def get(credential_file: AnyStr, verbose: bool, region: str, url: str,
+        region_list: List[str], all_regions: bool) -> None:
   """Gets forwarder details using Forwarder ID.
 
+  With --regions or --all-regions, the regions are searched concurrently and
+  the forwarder of the first region that has it is shown.
+
   Args:
     credential_file (str): Path of Service Account JSON.
     verbose (bool): Option for printing verbose output to console.
     region (str): Option for selecting regions. Available options - US, EUROPE,
       ASIA_SOUTHEAST1.
     url (str): Base URL to be used for API calls.
+    region_list (List[str]): Regions to search for the forwarder.
+    all_regions (bool): Option for searching all regions for the forwarder.
 
   Raises:
     OSError: Failed to read the given file, e.g. not found, no read access
@@ -55,19 +64,31 @@ def get(credential_file: AnyStr, verbose: bool, region: str, url: str) -> None:
     TypeError: If response data is not JSON.
   """
 
+  url = commands_utility.lower_or_none(url)
+  region_list = regions.get_regions(region_list, all_regions)
+  url_error = regions.get_url_error(region_list, url)
+  if url_error:
+    click.echo(url_error)
+    return
+
   forwarder_id = click.prompt(
       "Enter Forwarder ID", default="", show_default=False)
   if not forwarder_id:
     click.echo("Forwarder ID not provided. Please enter Forwarder ID.")
     return
 
-  url = commands_utility.lower_or_none(url)
   client = chronicle_auth.initialize_http_session(credential_file)
   method = "GET"
 
   click.echo("\nFetching forwarder and its all associated collectors...")
-  get_forwarder_response = get_forwarder(region, url, method, client,
-                                         forwarder_id)
+  if region_list:
+    get_forwarder_response = find_forwarder(region_list, method, client,
+                                            forwarder_id)
+    if not get_forwarder_response:
+      return
+  else:
+    get_forwarder_response = get_forwarder(region, url, method, client,
+                                           forwarder_id)
 
   (forwarder_url, forwarder_response,
    collector_verbose_list, collectors_response) = getattr(
@@ -134,10 +155,10 @@ def get_forwarder(region: str, url: str, method: str, client: Any,
     GetForwarderResponse: Object contains Forwarder url, Forwarder response,
     list of collectors verbose and list of collectors.
   """
-  forwarder_url = f"{forwarder_utility.get_forwarder_url(region, url)}/{forwarder_id}"
+  forwarder_url = get_forwarder_url(region, url, forwarder_id)
   get_forwarder_response = client.request(method, forwarder_url)
   forwarder_response = api_utility.check_content_type(
-      get_forwarder_response.text)
+      get_forwarder_response.content)
   status_code = get_forwarder_response.status_code
   list_collectors_response = None
 
@@ -161,6 +182,58 @@ def get_forwarder(region: str, url: str, method: str, client: Any,
       getattr(list_collectors_response, "collectors_response", {}))
 
 
+def find_forwarder(region_list: List[str], method: str, client: Any,
+                   forwarder_id: str) -> Optional[GetForwarderResponse]:
+  """Gets a forwarder from the first of several regions that has it.
+
+  Args:
+    region_list (List[str]): Regions to search for the forwarder.
+    method (str): Method to be used for API calls.
+    client (Any): HTTP session object to send authorized requests and receive
+      responses.
+    forwarder_id (str): Id of the forwarder.
+
+  Returns:
+    GetForwarderResponse: Object contains Forwarder url, Forwarder response,
+    list of collectors verbose and list of collectors. None if no region has
+    the forwarder.
+  """
+  found, misses = regions.find_first(
+      lambda region: client.request(
+          method, get_forwarder_url(region, None, forwarder_id)),
+      region_list,
+      lambda response: response.status_code == status.STATUS_OK)
+  if not found:
+    regions.print_not_found("Forwarder", misses)
+    return None
+
+  region, get_forwarder_response = found.region, found.result
+  click.echo(f"\nRegion: {region}")
+  forwarder_response = api_utility.check_content_type(
+      get_forwarder_response.content)
+  list_collectors_response = list_collectors(region, None, forwarder_response,
+                                             method, client)
+  return GetForwarderResponse(
+      get_forwarder_url(region, None, forwarder_id), forwarder_response,
+      list_collectors_response.collector_verbose_list,
+      list_collectors_response.collectors_response)
+
+
+def get_forwarder_url(region: str, url: str, forwarder_id: str) -> str:
+  """Gets the URL of a forwarder.
+
+  Args:
+    region (str): Option for selecting regions. Available options - US, EUROPE,
+      ASIA_SOUTHEAST1.
+    url (str): Base URL to be used for API calls.
+    forwarder_id (str): Id of the forwarder.
+
+  Returns:
+    str: Forwarder URL.
+  """
+  return f"{forwarder_utility.get_forwarder_url(region, url)}/{forwarder_id}"
+
+
 @dataclasses.dataclass
 class ListCollectorsResponse:
   """ListCollectorResponse dataclass."""
@@ -365,3 +365,64 @@ def test_prompt_text() -> None:
   # Method call
   result = runner.invoke(get)
   assert "Enter Forwarder ID:" in result.output
+
+
+@mock.patch(
+    "forwarders.commands.get.chronicle_auth.initialize_http_session"
+)
+@mock.patch(
+    "forwarders.commands.get.click.prompt")
+def test_get_regions(input_patch: mock.MagicMock, mock_client: mock.MagicMock,
+                     get_forwarder_data: Dict[str, Any],
+                     list_collectors_data: Dict[str, Any]) -> None:
+  """Test case to check the forwarder is found in one of several regions.
+
+  Args:
+    input_patch (mock.MagicMock): Mock object
+    mock_client (mock.MagicMock): Mock object
+    get_forwarder_data (Dict): Test data to fetch forwarder.
+    list_collectors_data (Dict): Test data to fetch list of collectors.
+  """
+
+  def request(method, url):
+    del method  # Unused.
+    if not url.startswith("https://europe-backstory"):
+      return MockResponse(
+          status_code=404, text="""{"error": {"message": "Not found"}}""")
+    if "/collectors" in url:
+      return list_collectors_data
+    return get_forwarder_data
+
+  mock_client.return_value = mock.Mock()
+  input_patch.return_value = "123"
+  mock_client.return_value.request.side_effect = request
+  # Method Call
+  result = runner.invoke(get, ["--regions", "us,europe", "--verbose"])
+  assert "\nRegion: EUROPE\n\nForwarder Details:" in result.output
+  assert "collector pqr" in result.output
+  assert ("URL: https://europe-backstory.googleapis.com/v2/forwarders/123\n"
+          in result.output)
+
+
+@mock.patch(
+    "forwarders.commands.get.chronicle_auth.initialize_http_session"
+)
+@mock.patch(
+    "forwarders.commands.get.click.prompt")
+def test_get_regions_not_found(input_patch: mock.MagicMock,
+                               mock_client: mock.MagicMock) -> None:
+  """Test case to check the forwarder is not found in any region.
+
+  Args:
+    input_patch (mock.MagicMock): Mock object
+    mock_client (mock.MagicMock): Mock object
+  """
+  mock_client.return_value = mock.Mock()
+  input_patch.return_value = "123"
+  mock_client.return_value.request.return_value = MockResponse(
+      status_code=404, text="""{"error": {"message": "Not found"}}""")
+  # Method Call
+  result = runner.invoke(get, ["--regions", "us,europe"])
+  assert result.output == (
+      "\nFetching forwarder and its all associated collectors...\n"
+      "Forwarder not found in regions: US, EUROPE.\n")
@@ -13,10 +13,12 @@
 # limitations under the License.
 #
 """List all forwarders for the customer."""
+import concurrent.futures
+import contextlib
 import copy
 import dataclasses
 import os
-from typing import Any, AnyStr, Dict, List
+from typing import Any, AnyStr, Dict, List, Optional
 
 import click
 
@@ -26,6 +28,7 @@ from common import commands_utility
 from common import exception_handler
 from common import file_utility
 from common import options
+from common import regions
 from common.constants import key_constants
 from common.constants import status
 from forwarders import forwarder_utility
@@ -36,28 +39,39 @@ from forwarders.constants import schema
 @click.command(name="list", help="List all forwarders")
 @options.url_option
 @options.region_option
+@options.regions_option
+@options.all_regions_option
 @options.verbose_option
 @options.export_option
 @click.option(
     "-f",
     "--file-format",
-    type=click.Choice(["TXT", "CSV", "JSON"], case_sensitive=False),
+    type=click.Choice(["TXT", "CSV", "JSON", "NDJSON"], case_sensitive=False),
     default="CSV",
     help="Format of the file to be exported")
+@options.concurrency_option
 @options.credential_file_option
 @exception_handler.catch_exception()
-def list_command(credential_file: AnyStr, verbose: bool, file_format: AnyStr,
-                 export: AnyStr, region: str, url: str) -> None:
+def list_command(credential_file: AnyStr, verbose: bool, concurrency: int,
+                 file_format: AnyStr, export: AnyStr, region: str, url: str,
+                 region_list: List[str], all_regions: bool) -> None:
   """List all forwarders and its associated collectors for the customer.
 
+  With --regions or --all-regions, the forwarders of the regions are fetched
+  concurrently and listed region by region.
+
   Args:
     credential_file (AnyStr): Path of Service Account JSON.
     verbose (bool): Option for printing verbose output to console.
+    concurrency (int): Maximum number of collector list requests sent in
+      parallel.
     file_format (AnyStr): Format of the content to be exported.
     export (AnyStr): Path of file to export output of list command.
     region (str): Option for selecting regions. Available options - US, EUROPE,
       ASIA_SOUTHEAST1.
     url (str): Base URL to be used for API calls.
+    region_list (List[str]): Regions to list the forwarders of.
+    all_regions (bool): Option for listing the forwarders of all regions.
 
   Raises:
     OSError: Failed to read the given file, e.g. not found, no read access
@@ -66,15 +80,26 @@ def list_command(credential_file: AnyStr, verbose: bool, file_format: AnyStr,
     KeyError: Required key is not present in dictionary.
     TypeError: If response data is not JSON.
   """
-  click.echo("Fetching list of forwarders...")
   url = commands_utility.lower_or_none(url)
+  region_list = regions.get_regions(region_list, all_regions)
+  url_error = regions.get_url_error(region_list, url)
+  if url_error:
+    click.echo(url_error)
+    return
+
+  click.echo("Fetching list of forwarders...")
   client = chronicle_auth.initialize_http_session(credential_file)
+  if region_list:
+    list_forwarders_in_regions(client, verbose, concurrency, file_format,
+                               export, region_list)
+    return
+
   forwarder_url = forwarder_utility.get_forwarder_url(region, url)
   method = "GET"
   list_forwarders_response = client.request(method, forwarder_url)
 
   forwarders_response = api_utility.check_content_type(
-      list_forwarders_response.text)
+      list_forwarders_response.content)
   status_code = list_forwarders_response.status_code
 
   if status_code != status.STATUS_OK:
@@ -92,12 +117,17 @@ def list_command(credential_file: AnyStr, verbose: bool, file_format: AnyStr,
   # List of forwarders.
   forwarders = copy.deepcopy(forwarders_response[schema.KEY_FORWARDERS])
 
-  collector_verbose_list, final_json_response, collector_rows, forwarder_rows = list_forwarders_and_associated_collectors(
-      export, region, url, client, forwarders, method)
-
-  if export:
-    export_data(export, file_format, final_json_response, forwarder_rows,
-                collector_rows)
+  with contextlib.ExitStack() as exit_stack:
+    exporter = None
+    if export:
+      exporter = exit_stack.enter_context(
+          ForwardersExporter(export, file_format))
+    collector_verbose_list = list_forwarders_and_associated_collectors(
+        exporter, region, url, client, forwarders, method, concurrency)
+
+  if exporter:
+    click.echo("\nForwarders list details exported successfully to: "
+               f"{exporter.get_export_paths()}")
   if verbose:
     api_utility.print_request_details(forwarder_url, method, None,
                                       forwarders_response)
@@ -107,6 +137,73 @@ def list_command(credential_file: AnyStr, verbose: bool, file_format: AnyStr,
           getattr(verbose_data, "response"))
 
 
+def list_forwarders_in_regions(client: Any, verbose: bool, concurrency: int,
+                               file_format: str, export: AnyStr,
+                               region_list: List[str]) -> None:
+  """Lists the forwarders of several regions.
+
+  The forwarders of all regions are fetched concurrently. They are then
+  printed and exported in the order of the regions, tagged with their region.
+
+  Args:
+    client (Any): HTTP session object to send authorized requests and receive
+      responses.
+    verbose (bool): Option for printing verbose output to console.
+    concurrency (int): Maximum number of collector list requests sent in
+      parallel.
+    file_format (str): Format of the content to be exported.
+    export (AnyStr): Path of file to export output of list command.
+    region_list (List[str]): Regions to list the forwarders of.
+  """
+  method = "GET"
+  region_results = regions.fan_out(
+      lambda region: client.request(
+          method, forwarder_utility.get_forwarder_url(region, None)),
+      region_list)
+
+  with contextlib.ExitStack() as exit_stack:
+    exporter = None
+    if export:
+      exporter = exit_stack.enter_context(
+          ForwardersExporter(export, file_format, tag_regions=True))
+
+    for region_result in region_results:
+      region = region_result.region
+      click.echo(f"\nRegion: {region}")
+      if region_result.error:
+        click.echo("Error while fetching list of forwarders.\n"
+                   f"Error: {region_result.error}")
+        continue
+
+      forwarder_url = forwarder_utility.get_forwarder_url(region, None)
+      forwarders_response = api_utility.check_content_type(
+          region_result.result.content)
+      status_code = region_result.result.status_code
+      collector_verbose_list = []
+      if status_code != status.STATUS_OK:
+        error_message = forwarders_response[key_constants.KEY_ERROR][
+            key_constants.KEY_MESSAGE]
+        click.echo("Error while fetching list of forwarders.\n"
+                   f"Response Code: {status_code}\nError: {error_message}")
+      elif not forwarders_response:
+        click.echo("No forwarders found.")
+      else:
+        forwarders = copy.deepcopy(forwarders_response[schema.KEY_FORWARDERS])
+        collector_verbose_list = list_forwarders_and_associated_collectors(
+            exporter, region, None, client, forwarders, method, concurrency)
+
+      if verbose:
+        api_utility.print_request_details(forwarder_url, method, None,
+                                          forwarders_response)
+        for verbose_data in collector_verbose_list:
+          api_utility.print_request_details(verbose_data.url, method, None,
+                                            verbose_data.response)
+
+  if exporter:
+    click.echo("\nForwarders list details exported successfully to: "
+               f"{exporter.get_export_paths()}")
+
+
 @dataclasses.dataclass
 class Verbose:
   """Verbose dataclass."""
@@ -114,14 +211,23 @@ class Verbose:
   response: Any
 
 
-def list_forwarders_and_associated_collectors(export: AnyStr, region: str,
-                                              url: str, client: Any,
-                                              forwarders: List[Dict[str, Any]],
-                                              method: str) -> Any:
+def list_forwarders_and_associated_collectors(
+    exporter: Optional["ForwardersExporter"],
+    region: str,
+    url: str,
+    client: Any,
+    forwarders: List[Dict[str, Any]],
+    method: str,
+    concurrency: int = 1) -> List[Verbose]:
   """List all forwarders and its associated collectors for the customer.
 
+  Collectors of up to `concurrency` forwarders are fetched in parallel, while
+  forwarders are still printed and exported in their original order. Each
+  forwarder is exported as soon as it is printed.
+
   Args:
-    export (AnyStr): Path of file to export output of list command.
+    exporter (ForwardersExporter): Exporter of the listed forwarders, None if
+      they are not exported.
     region (str): Option for selecting regions. Available options - US, EUROPE,
       ASIA_SOUTHEAST1.
     url (str): Base URL to be used for API calls.
@@ -129,120 +235,222 @@ def list_forwarders_and_associated_collectors(export: AnyStr, region: str,
       responses.
     forwarders (List[Dict[str, Any]]): List of forwarders.
     method (str): Method to be used for API calls.
+    concurrency (int): Maximum number of collector list requests sent in
+      parallel.
 
   Returns:
-    Any:
-      collector_verbose_list - Contains list of Verbose object with
-      collector request url and method for verbose output
+    List[Verbose]: Collector request URLs and responses for verbose output.
   """
   collector_verbose_list = []
-  forwarder_rows = []
-  collector_rows = []
-
-  # Contains forwarder and collector response.
-  final_json_response = {}
-  final_json_response[schema.KEY_FORWARDERS] = []
+  collector_urls = []
   for forwarder in forwarders:
-
     forwarder_id = forwarder_utility.get_resource_id(forwarder)
     forwarder.update({schema.KEY_NAME: forwarder_id})
-    collector_url = collector_utility.get_collector_url(region, url,
-                                                        forwarder_id)
-
-    # Fetch collectors for respective forwarders.
-    collectors_api_response, collectors = collector_utility.fetch_collectors(
-        collector_url, method, client)
-
-    # Store URL and API response for each collector to
-    # print verbose on console later.
-    collector_verbose_list.append(
-        Verbose(collector_url, collectors_api_response))
-
-    for collector in collectors_api_response.get(schema.KEY_COLLECTORS, []):
-
-      if "error" not in collector:
-
-        # Converts list of collectors to nested dictionary object with key name
-        # "Collector [<collector_uuid>]" for easy readability in yaml output.
-        # Example-{"collectors":{"Collector [<collector_uuid>]":{"name":""}}}
-        collector_id = forwarder_utility.get_resource_id(collector)
-        collector.update({schema.KEY_NAME: collector_id})
-        collector = forwarder_utility.change_dict_keys_order(collector)
-
-        if export:
-          collector_rows.append(get_collector_csv_rows(forwarder, collector))
-
-        # Remove ID from the dictionary to avoid displaying
-        # it multiple times on the console.
-        collector.pop(schema.KEY_ID, None)
-
-        collectors[
-            schema.KEY_COLLECTORS][f"Collector [{collector_id}]"] = collector
-
-    forwarder_details = commands_utility.convert_dict_keys_to_human_readable(
-        forwarder_utility.change_dict_keys_order(forwarder))
+    collector_urls.append(
+        collector_utility.get_collector_url(region, url, forwarder_id))
+
+  with concurrent.futures.ThreadPoolExecutor(
+      max_workers=concurrency) as executor:
+    # Fetch collectors for respective forwarders. Results are returned in the
+    # order of the forwarders, regardless of which request completes first.
+    fetched_collectors = executor.map(
+        lambda collector_url: collector_utility.fetch_collectors(
+            collector_url, method, client), collector_urls)
+    for forwarder, collector_url, (collectors_api_response,
+                                   collectors) in zip(forwarders,
+                                                      collector_urls,
+                                                      fetched_collectors):
+      # Store URL and API response for each collector to
+      # print verbose on console later.
+      collector_verbose_list.append(
+          Verbose(collector_url, collectors_api_response))
+
+      collector_rows = []
+      process_forwarder_collectors(exporter, forwarder,
+                                   collectors_api_response, collectors,
+                                   collector_rows)
+
+      forwarder[schema.KEY_COLLECTORS] = collectors[schema.KEY_COLLECTORS]
+      if exporter:
+        exporter.write(forwarder, collector_rows, region)
+
+  return collector_verbose_list
+
+
+def process_forwarder_collectors(exporter: Optional["ForwardersExporter"],
+                                 forwarder: Dict[str, Any],
+                                 collectors_api_response: Dict[str, Any],
+                                 collectors: Dict[str, Any],
+                                 collector_rows: List[List[Any]]) -> None:
+  """Prints a forwarder along with its collectors.
 
-    display_output = {}
-    # Capitalize keyword ID to display output on console.
-    if forwarder_details.get(schema.KEY_ID.capitalize()):
-      display_output[schema.KEY_ID] = forwarder_details.pop(
-          schema.KEY_ID.capitalize())
-    display_output.update(forwarder_details)
-
-    click.echo("\nForwarder Details:\n")
-    click.echo(commands_utility.convert_dict_to_yaml(display_output))
-    click.echo(
-        commands_utility.convert_dict_to_yaml(
-            commands_utility.convert_dict_keys_to_human_readable(collectors)))
-    click.echo(f"{forwarder_utility.PRINT_SEPARATOR}")
-
-    forwarder[schema.KEY_COLLECTORS] = collectors[schema.KEY_COLLECTORS]
-    final_json_response[schema.KEY_FORWARDERS].append(forwarder)
-
-    if export:
-      forwarder_rows.append(get_forwarder_csv_rows(forwarder))
-
-  return collector_verbose_list, final_json_response, collector_rows, forwarder_rows
+  Args:
+    exporter (ForwardersExporter): Exporter of the listed forwarders, None if
+      they are not exported.
+    forwarder (Dict[str, Any]): Forwarder to be printed.
+    collectors_api_response (Dict[str, Any]): List collectors API response of
+      the forwarder.
+    collectors (Dict[str, Any]): Collectors of the forwarder, keyed by
+      collector. Holds the error message if collectors could not be listed.
+    collector_rows (List[List[Any]]): List of collector rows to be exported,
+      extended with the collectors of the forwarder.
+  """
+  for collector in collectors_api_response.get(schema.KEY_COLLECTORS, []):
+    if "error" not in collector:
+
+      # Converts list of collectors to nested dictionary object with key name
+      # "Collector [<collector_uuid>]" for easy readability in yaml output.
+      # Example-{"collectors":{"Collector [<collector_uuid>]":{"name":""}}}
+      collector_id = forwarder_utility.get_resource_id(collector)
+      collector.update({schema.KEY_NAME: collector_id})
+      collector = forwarder_utility.change_dict_keys_order(collector)
+
+      if exporter:
+        collector_rows.append(get_collector_csv_rows(forwarder, collector))
+
+      # Remove ID from the dictionary to avoid displaying
+      # it multiple times on the console.
+      collector.pop(schema.KEY_ID, None)
+
+      collectors[
+          schema.KEY_COLLECTORS][f"Collector [{collector_id}]"] = collector
+
+  forwarder_details = commands_utility.convert_dict_keys_to_human_readable(
+      forwarder_utility.change_dict_keys_order(forwarder))
+
+  display_output = {}
+  # Capitalize keyword ID to display output on console.
+  if forwarder_details.get(schema.KEY_ID.capitalize()):
+    display_output[schema.KEY_ID] = forwarder_details.pop(
+        schema.KEY_ID.capitalize())
+  display_output.update(forwarder_details)
+
+  click.echo("\nForwarder Details:\n")
+  click.echo(commands_utility.convert_dict_to_yaml(display_output))
+  click.echo(
+      commands_utility.convert_dict_to_yaml(
+          commands_utility.convert_dict_keys_to_human_readable(collectors)))
+  click.echo(f"{forwarder_utility.PRINT_SEPARATOR}")
 
 
-def export_data(export_path: str, file_format: str,
-                json_response: Dict[str, Any], forwarder_rows: List[List[str]],
-                collector_rows: List[List[str]]) -> None:
-  """Exports data into csv, json, text format.
+class ForwardersExporter:
+  """Exports listed forwarders to files while they are listed.
 
-  Args:
-    export_path (str): Path of file to export output of list command.
-    file_format (str): Format of the content to be exported. Supported formats:
-      CSV, JSON, TXT
-    json_response (Dict[str, Any]): Json response including all forwarders and
-      collectors.
-    forwarder_rows (List[List[str]]): List of rows export into csv.
-    collector_rows (List[List[str]]): List of rows export into csv.
+  Supported formats are CSV, with separate files for forwarders and
+  collectors, JSON, NDJSON with one forwarder per line, and TXT.
   """
-  export_path = os.path.abspath(export_path) + f".{file_format.lower()}"
 
-  if (file_format == file_utility.FILE_FORMAT_JSON) and (json_response.get(
-      schema.KEY_FORWARDERS)):
-    file_utility.export_json(export_path, json_response)
-  elif file_format == file_utility.FILE_FORMAT_CSV:
+  def __init__(self,
+               export_path: str,
+               file_format: str,
+               tag_regions: bool = False) -> None:
+    """Initializes the exporter.
+
+    Args:
+      export_path (str): Path of file to export output of list command.
+      file_format (str): Format of the content to be exported. Supported
+        formats: CSV, JSON, NDJSON, TXT
+      tag_regions (bool): Whether forwarders of several regions are exported,
+        in which case each exported forwarder and collector records its
+        region.
+    """
+    self.file_format = file_format
+    self.tag_regions = tag_regions
+    self.export_path = (
+        os.path.abspath(export_path) + f".{file_format.lower()}")
     # Since we need two distinct files for forwarders and collectors and
     # the export path already contains the file format extension,
     # we must slice the export path in order to change the filename.
-    export_path_forwarder = f"{export_path[:-4]}_{schema.KEY_FORWARDERS}.{file_format.lower()}"
-    export_path_collectors = f"{export_path[:-4]}_{schema.KEY_COLLECTORS}.{file_format.lower()}"
-
-    if forwarder_rows:
-      file_utility.export_csv(export_path_forwarder,
-                              schema.FORWARDER_COLUMN_HEADER, forwarder_rows)
-    if collector_rows:
-      file_utility.export_csv(export_path_collectors,
-                              schema.COLLECTOR_COLUMN_HEADER, collector_rows)
-
-    export_path = f"{export_path_forwarder} and {export_path_collectors}"
-  elif file_format == file_utility.FILE_FORMAT_TXT:
-    forwarder_utility.export_txt(export_path, json_response)
-  click.echo(
-      f"\nForwarders list details exported successfully to: {export_path}")
+    self.export_path_forwarders = (
+        f"{self.export_path[:-4]}_{schema.KEY_FORWARDERS}.{file_format.lower()}"
+    )
+    self.export_path_collectors = (
+        f"{self.export_path[:-4]}_{schema.KEY_COLLECTORS}.{file_format.lower()}"
+    )
+    self._forwarder_writer = None
+    self._collector_writer = None
+    if file_format == file_utility.FILE_FORMAT_NDJSON:
+      self._forwarder_writer = file_utility.NdjsonWriter(self.export_path)
+    elif file_format == file_utility.FILE_FORMAT_TXT:
+      self._forwarder_writer = file_utility.TxtWriter(self.export_path)
+
+  def __enter__(self) -> "ForwardersExporter":
+    return self
+
+  def __exit__(self, *args: Any) -> None:
+    self.close()
+
+  def write(self,
+            forwarder: Dict[str, Any],
+            collector_rows: List[List[Any]],
+            region: Optional[str] = None) -> None:
+    """Exports a forwarder along with its collectors.
+
+    Args:
+      forwarder (Dict[str, Any]): Forwarder including its collectors.
+      collector_rows (List[List[Any]]): CSV rows of the collectors.
+      region (str): Region of the forwarder, recorded if regions are tagged.
+    """
+    if self.tag_regions:
+      forwarder = {"region": region, **forwarder}
+      collector_rows = [[region, *row] for row in collector_rows]
+    if self.file_format == file_utility.FILE_FORMAT_CSV:
+      if not self._forwarder_writer:
+        self._forwarder_writer = file_utility.CsvWriter(
+            self.export_path_forwarders,
+            self._get_column_headers(schema.FORWARDER_COLUMN_HEADER))
+      forwarder_row = get_forwarder_csv_rows(forwarder)
+      if self.tag_regions:
+        forwarder_row = [region, *forwarder_row]
+      self._forwarder_writer.write(forwarder_row)
+      if collector_rows and not self._collector_writer:
+        self._collector_writer = file_utility.CsvWriter(
+            self.export_path_collectors,
+            self._get_column_headers(schema.COLLECTOR_COLUMN_HEADER))
+      if collector_rows:
+        self._collector_writer.write_rows(collector_rows)
+    elif self.file_format == file_utility.FILE_FORMAT_JSON:
+      # The file is only created once there is a forwarder to export.
+      if not self._forwarder_writer:
+        self._forwarder_writer = file_utility.JsonArrayWriter(
+            self.export_path, schema.KEY_FORWARDERS)
+      self._forwarder_writer.write(forwarder)
+    elif self.file_format == file_utility.FILE_FORMAT_NDJSON:
+      self._forwarder_writer.write(forwarder)
+    else:
+      forwarder_txt = forwarder_utility.get_forwarder_txt(forwarder)
+      if self.tag_regions:
+        forwarder_txt = f"\n\nRegion: {region}{forwarder_txt}"
+      self._forwarder_writer.write(forwarder_txt)
+
+  def _get_column_headers(self, column_headers: List[str]) -> List[str]:
+    """Returns CSV column headers, led by a Region column if regions are tagged.
+
+    Args:
+      column_headers (List[str]): Column headers of the exported resource.
+
+    Returns:
+      List[str]: Column headers of the exported file.
+    """
+    if self.tag_regions:
+      return ["Region", *column_headers]
+    return column_headers
+
+  def close(self) -> None:
+    """Closes the exported files."""
+    for writer in (self._forwarder_writer, self._collector_writer):
+      if writer:
+        writer.close()
+
+  def get_export_paths(self) -> str:
+    """Returns the paths of the exported files for display.
+
+    Returns:
+      str: Exported file paths.
+    """
+    if self.file_format == file_utility.FILE_FORMAT_CSV:
+      return f"{self.export_path_forwarders} and {self.export_path_collectors}"
+    return self.export_path
 
 
 def get_forwarder_csv_rows(forwarder: Dict[str, Any]) -> List[Any]:
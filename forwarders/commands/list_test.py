@@ -13,7 +13,11 @@
 # limitations under the License.
 #
 """Unit tests for list.py."""
+import csv
+import json
 import os
+import re
+import time
 from typing import Any, Dict
 from unittest import mock
 
@@ -23,6 +27,7 @@ from forwarders.commands.list import list_command
 from forwarders.tests.fixtures import *  # pylint: disable=wildcard-import
 from forwarders.tests.fixtures import TEMP_EXPORT_CSV_FILE
 from forwarders.tests.fixtures import TEMP_EXPORT_JSON_FILE
+from forwarders.tests.fixtures import TEMP_EXPORT_NDJSON_FILE
 from forwarders.tests.fixtures import TEMP_EXPORT_TXT_FILE
 from mock_test_utility import MockResponse
 
@@ -277,6 +282,38 @@ def test_list_export_json(mock_client: mock.MagicMock,
       ["--export", TEMP_EXPORT_JSON_FILE[:-5], "--file-format", "JSON"])
   assert "Forwarders list details exported successfully" in result.output
   assert os.path.exists(TEMP_EXPORT_JSON_FILE)
+  with open(TEMP_EXPORT_JSON_FILE) as file:
+    exported = json.load(file)
+  assert [forwarder["displayName"] for forwarder in exported["forwarders"]
+         ] == ["forwarder 1"]
+
+
+@mock.patch(
+    "forwarders.commands.list.chronicle_auth.initialize_http_session"
+)
+def test_list_export_ndjson(mock_client: mock.MagicMock,
+                            list_forwarder_data: Dict[str, str],
+                            list_collectors_data: Dict[str, Any]) -> None:
+  """Test case to check forwarders exported in NDJSON format.
+
+  Args:
+    mock_client (mock.MagicMock): Mock object
+    list_forwarder_data (Tuple): Test data to fetch forwarder.
+    list_collectors_data (Tuple): Test data to fetch list of collectors.
+  """
+  mock_client.return_value = mock.Mock()
+  mock_client.return_value.request.side_effect = [
+      list_forwarder_data, list_collectors_data
+  ]
+  result = runner.invoke(
+      list_command,
+      ["--export", TEMP_EXPORT_NDJSON_FILE[:-7], "--file-format", "ndjson"])
+  assert "Forwarders list details exported successfully" in result.output
+  with open(TEMP_EXPORT_NDJSON_FILE) as file:
+    exported_forwarders = [json.loads(line) for line in file]
+  assert len(exported_forwarders) == 1
+  assert exported_forwarders[0]["displayName"] == "forwarder 1"
+  assert exported_forwarders[0]["collectors"]
 
 
 @mock.patch(
@@ -512,3 +549,103 @@ Request:
   Body: None
 Response:
   Body: {'collectors': [{'name': 'asdf1234-1234-abcd-efgh', 'displayName': 'collector pqr', 'config': {'logType': 'Type of logs collected.', 'metadata': {'assetNamespace': 'test_namespace', 'labels': [{'key': 'my_key_1', 'value': 'my_value_1'}, {'key': 'my_key_2', 'value': 'my_value_2'}]}, 'regexFilter': [{'description': 'Describes what is being filtered and why', 'regexp': 'The regular expression used to match against each incoming line', 'behavior': 'ALLOW'}, {'description': 'Describes what is being filtered and why', 'regexp': 'The regular expression used to match against each incoming line', 'behavior': 'BLOCK'}], 'diskBuffer': {'state': 'ACTIVE', 'directoryPath': 'Directory path for files written.', 'maxFileBufferBytes': 3999}, 'maxSecondsPerBatch': 10, 'maxBytesPerBatch': 1048576, 'fileSettings': {'filePath': 'Path of file to monitor.'}}, 'state': 'ACTIVE'}]}""" in result.output
+
+
+@mock.patch(
+    "forwarders.commands.list.chronicle_auth.initialize_http_session"
+)
+def test_list_concurrency_keeps_forwarder_order(
+    mock_client: mock.MagicMock) -> None:
+  """Test that collectors fetched in parallel are printed in forwarder order.
+
+  Args:
+    mock_client (mock.MagicMock): Mock object
+  """
+  forwarder_ids = [f"forwarder-{i}" for i in range(5)]
+  forwarders_response = MockResponse(
+      status_code=200,
+      text=json.dumps({
+          "forwarders": [{
+              "name": f"forwarders/{forwarder_id}",
+              "displayName": forwarder_id,
+              "config": {},
+              "state": "ACTIVE"
+          } for forwarder_id in forwarder_ids]
+      }))
+
+  def request(method: str, url: str) -> MockResponse:
+    if url.endswith("/forwarders"):
+      return forwarders_response
+    forwarder_id = url.split("/")[-2]
+    if forwarder_id == "forwarder-0":
+      # Make the first forwarder complete last.
+      time.sleep(0.1)
+      return MockResponse(
+          status_code=400, text="""{"error": {"message": "Failed."}}""")
+    return MockResponse(
+        status_code=200,
+        text=json.dumps({
+            "collectors": [{
+                "name": f"forwarders/{forwarder_id}/collectors/c-{forwarder_id}",
+                "displayName": f"collector of {forwarder_id}",
+                "config": {},
+                "state": "ACTIVE"
+            }]
+        }))
+
+  mock_client.return_value = mock.Mock()
+  mock_client.return_value.request.side_effect = request
+  result = runner.invoke(list_command, ["--concurrency", "5", "--verbose"])
+
+  assert result.exit_code == 0
+  displayed_forwarders = re.findall(r"Display name: (forwarder-\d)",
+                                    result.output)
+  assert displayed_forwarders == forwarder_ids
+  assert ("Collectors:\n  Error:\n    Response code: 400\n    Message: Failed."
+          in result.output)
+  verbose_urls = re.findall(r"/forwarders/(forwarder-\d)/collectors",
+                            result.output)
+  assert verbose_urls == forwarder_ids
+
+
+@mock.patch(
+    "forwarders.commands.list.chronicle_auth.initialize_http_session"
+)
+def test_list_regions_export_csv(mock_client: mock.MagicMock,
+                                 list_forwarders_data: Dict[str, Any],
+                                 list_collectors_data: Dict[str, Any]) -> None:
+  """Test case to check forwarders of several regions are listed and tagged.
+
+  Args:
+    mock_client (mock.MagicMock): Mock object
+    list_forwarders_data (Dict): Test data to fetch list of forwarders.
+    list_collectors_data (Dict): Test data to fetch list of collectors.
+  """
+
+  def request(method, url):
+    del method  # Unused.
+    if url.startswith("https://europe-backstory"):
+      return MockResponse(
+          status_code=403, text="""{"error": {"message": "Denied"}}""")
+    if "/collectors" in url:
+      return list_collectors_data
+    return list_forwarders_data
+
+  mock_client.return_value = mock.Mock()
+  mock_client.return_value.request.side_effect = request
+  result = runner.invoke(list_command, [
+      "--regions", "europe,us", "--export", TEMP_EXPORT_CSV_FILE[:-4]
+  ])
+  assert result.output.index(
+      "Region: EUROPE\nError while fetching list of forwarders.\n"
+      "Response Code: 403\nError: Denied") < result.output.index(
+          "Region: US\n\nForwarder Details:")
+  export_path = TEMP_EXPORT_CSV_FILE[:-4]
+  with open(f"{export_path}_forwarders.csv", newline="") as file:
+    forwarder_rows = list(csv.reader(file))
+  with open(f"{export_path}_collectors.csv", newline="") as file:
+    collector_rows = list(csv.reader(file))
+  assert forwarder_rows[0][:2] == ["Region", "ID"]
+  assert [row[0] for row in forwarder_rows[1:]] == ["US", "US"]
+  assert collector_rows[0][0] == "Region"
+  assert [row[0] for row in collector_rows[1:]] == ["US", "US"]
@@ -120,7 +120,8 @@ def update(credential_file: str, verbose: bool, region: str, url: str) -> None:
       updated_forwarder_response = client.request(
           method, full_url, params=params, json=request_body)
 
-      response = api_utility.check_content_type(updated_forwarder_response.text)
+      response = api_utility.check_content_type(
+          updated_forwarder_response.content)
 
       if updated_forwarder_response.status_code == status.STATUS_OK:
         click.echo(
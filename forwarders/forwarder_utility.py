@@ -24,6 +24,7 @@ from click._compat import WIN
 
 from common import commands_utility
 from common import file_utility
+from common import profiling
 from common import uri
 from forwarders import forwarder_templates
 from forwarders.constants import schema
@@ -51,16 +52,26 @@ def export_txt(export_path: AnyStr, final_json_response: Dict[str,
         f.write(f"\n{PRINT_SEPARATOR}")
     else:
       for forwarder in final_json_response.get(schema.KEY_FORWARDERS, []):
-        f.write("\n\nForwarder Details:\n\n")
-        f.write(
-            commands_utility.convert_dict_to_yaml(
-                commands_utility.convert_dict_keys_to_human_readable(
-                    change_dict_keys_order(forwarder))))
-        f.write(
-            commands_utility.convert_dict_to_yaml(
-                commands_utility.convert_dict_keys_to_human_readable(
-                    {schema.KEY_COLLECTORS: forwarder[schema.KEY_COLLECTORS]})))
-        f.write(f"{PRINT_SEPARATOR}")
+        f.write(get_forwarder_txt(forwarder))
+
+
+def get_forwarder_txt(forwarder: Dict[str, Any]) -> str:
+  """Returns the text exported for a forwarder along with its collectors.
+
+  Args:
+    forwarder (Dict[str, Any]): Forwarder including its collectors.
+
+  Returns:
+    str: Forwarder details to be written to a txt file.
+  """
+  forwarder_details = commands_utility.convert_dict_to_yaml(
+      commands_utility.convert_dict_keys_to_human_readable(
+          change_dict_keys_order(forwarder)))
+  collector_details = commands_utility.convert_dict_to_yaml(
+      commands_utility.convert_dict_keys_to_human_readable(
+          {schema.KEY_COLLECTORS: forwarder[schema.KEY_COLLECTORS]}))
+  return ("\n\nForwarder Details:\n\n" + forwarder_details +
+          collector_details + PRINT_SEPARATOR)
 
 
 def get_labels_str(forwarder_response: Dict[str, Any]) -> str:
@@ -165,7 +176,8 @@ def preview_changes(request_body: Dict[str, Any]):
     preview_template_str = f"{forwarder_templates.preview_template_win.template}\n"
   preview_template_str = preview_template_str + commands_utility.convert_dict_to_yaml(
       commands_utility.convert_dict_keys_to_human_readable(request_body))
-  click.echo_via_pager(preview_template_str)
+  with profiling.span("pager", profiling.CATEGORY_RENDER):
+    click.echo_via_pager(preview_template_str)
 
 
 def write_backup(file_path: str,
@@ -18,29 +18,26 @@ import os
 
 import click
 
-from common import chronicle_auth
-from forwarders.collectors.collectors import collectors
-from forwarders.commands import create
-from forwarders.commands import delete
-from forwarders.commands import generate_files
-from forwarders.commands import get
-from forwarders.commands import list  # pylint: disable=redefined-builtin
-from forwarders.commands import update
+from common import lazy_group
+from common.constants import path_constants
 
 
-@click.group(name="forwarders", help="Forwarder Management Workflows")
+@click.group(
+    name="forwarders",
+    cls=lazy_group.LazyGroup,
+    lazy_subcommands={
+        "collectors": "forwarders.collectors.collectors.collectors",
+        "create": "forwarders.commands.create.create",
+        "delete": "forwarders.commands.delete.delete",
+        "generate_files": "forwarders.commands.generate_files.generate_files",
+        "get": "forwarders.commands.get.get",
+        "list": "forwarders.commands.list.list_command",
+        "update": "forwarders.commands.update.update",
+    },
+    help="Forwarder Management Workflows")
 def forwarders() -> None:
   """Forwarders group commands."""
-  forwarder_dir = os.path.join(chronicle_auth.CHRONICLE_CLI_ROOT_DIR,
+  forwarder_dir = os.path.join(path_constants.CHRONICLE_CLI_ROOT_DIR,
                                "forwarders")
   if not os.path.exists(forwarder_dir):
     os.mkdir(forwarder_dir)
-
-
-forwarders.add_command(collectors)
-forwarders.add_command(get.get)
-forwarders.add_command(list.list_command)
-forwarders.add_command(create.create)
-forwarders.add_command(update.update)
-forwarders.add_command(delete.delete)
-forwarders.add_command(generate_files.generate_files)
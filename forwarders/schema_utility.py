@@ -14,6 +14,7 @@
 #
 """Schema utility functions and classes."""
 
+import functools
 import json
 import os
 from typing import Any, Dict, List, Optional
@@ -28,6 +29,24 @@ FORWARDER_SCHEMA_FILE = "forwarder_schema.json"
 COLLECTOR_SCHEMA_FILE = "collector_schema.json"
 
 
+@functools.lru_cache(maxsize=None)
+def load_schema_file(file_name: str) -> Dict[str, Any]:
+  """Reads a forwarder or collector schema file.
+
+  The file is parsed once per process and the result is shared between
+  callers, so it must not be modified.
+
+  Args:
+    file_name (str): Name of the schema file, e.g. FORWARDER_SCHEMA_FILE.
+
+  Returns:
+    Dict[str, Any]: Parsed schema.
+  """
+  with open(os.path.join(os.path.dirname(__file__), SCHEMAS_DIR, file_name),
+            "r") as f:
+    return json.load(f)
+
+
 def format_display_name(display_name: str) -> str:
   """Returns string to be printed on console to show section names.
 
@@ -167,15 +186,9 @@ class Schema:
     """
     try:
       if self.schema_type == schema.KEY_FORWARDER_SCHEMA:
-        file_path = os.path.join(
-            os.path.dirname(__file__), SCHEMAS_DIR, FORWARDER_SCHEMA_FILE)
+        detailed_schema = load_schema_file(FORWARDER_SCHEMA_FILE)
       elif self.schema_type == schema.KEY_COLLECTOR_SCHEMA:
-        file_path = os.path.join(
-            os.path.dirname(__file__), SCHEMAS_DIR, COLLECTOR_SCHEMA_FILE)
-
-      # Read forwarder or collector schema from the specified file path.
-      with open(file_path, "r") as f:
-        detailed_schema = json.load(f)
+        detailed_schema = load_schema_file(COLLECTOR_SCHEMA_FILE)
     except FileNotFoundError as e:  # pylint: disable=broad-except
       click.echo("Failed with exception:" + str(e))
 
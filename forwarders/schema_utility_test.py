@@ -422,3 +422,14 @@ def test_validate_syslog_udp_settings():
       "type": "INT"
   }
   assert schema_object.validate_syslog_udp_settings(field_schema, request_body)
+
+
+def test_get_schema_parsed_once():
+  """Test that schema files are parsed once and shared between schemas."""
+  forwarder_schema = schema_utility.Schema(schema.KEY_FORWARDER_SCHEMA, {})
+  collector_schema = schema_utility.Schema(schema.KEY_COLLECTOR_SCHEMA, {})
+
+  assert schema_utility.Schema(schema.KEY_FORWARDER_SCHEMA,
+                               {}).schema is forwarder_schema.schema
+  assert collector_schema.schema is not forwarder_schema.schema
+  assert schema.KEY_COLLECTOR_SCHEMA in collector_schema.schema
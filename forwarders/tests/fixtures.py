@@ -26,6 +26,7 @@ TEST_DATA_DIR = os.path.dirname(__file__)
 TEMP_EXPORT_TXT_FILE = os.path.join(TEST_DATA_DIR, "dummy.txt")
 TEMP_EXPORT_CSV_FILE = os.path.join(TEST_DATA_DIR, "dummy.csv")
 TEMP_EXPORT_JSON_FILE = os.path.join(TEST_DATA_DIR, "dummy_export.json")
+TEMP_EXPORT_NDJSON_FILE = os.path.join(TEST_DATA_DIR, "dummy_export.ndjson")
 TEMP_CREATE_BACKUP_FILE = os.path.join(TEST_DATA_DIR, "create_backup.json")
 TEMP_UPDATE_BACKUP_FILE = os.path.join(TEST_DATA_DIR, "update_backup.json")
 TEMP_SERVICE_ACCOUNT_FILE = os.path.join(TEST_DATA_DIR, "service_account.json")
@@ -221,7 +222,7 @@ def cleanup(request: Any):
   def remove_test_files():
     files = [
         TEMP_EXPORT_CSV_FILE, TEMP_EXPORT_TXT_FILE, TEMP_EXPORT_JSON_FILE,
-        TEMP_SERVICE_ACCOUNT_FILE
+        TEMP_EXPORT_NDJSON_FILE, TEMP_SERVICE_ACCOUNT_FILE
     ]
     for file_path in files:
       try:
@@ -0,0 +1,150 @@
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Query the local inventory."""
+
+import json
+import os
+from typing import List, Optional, Sequence, Tuple
+
+import click
+
+from common import commands_utility
+from common import exception_handler
+from common import options
+from inventory import store
+
+ALL_KINDS = "all"
+# Kinds of resources by the name used on the command line.
+KIND_CHOICES = {
+    "feeds": store.KIND_FEED,
+    "forwarders": store.KIND_FORWARDER,
+    "collectors": store.KIND_COLLECTOR,
+    "parsers": store.KIND_CBN_PARSER,
+    "extensions": store.KIND_PARSER_EXTENSION,
+}
+COLUMNS = (("KIND", "kind"), ("ID", "id"), ("NAME", "display_name"),
+           ("LOG TYPE", "log_type"), ("STATE", "state"),
+           ("NAMESPACE", "namespace"))
+
+
+@click.command(
+    name="query",
+    help="Query the local inventory without calling the API. Run "
+    "'inventory sync' first.")
+@click.argument(
+    "kind",
+    type=click.Choice([ALL_KINDS, *KIND_CHOICES], case_sensitive=False),
+    default=ALL_KINDS)
+@click.option("--log-type", help="Filter on log type, e.g. WORKSPACE_USERS.")
+@click.option("--state", help="Filter on state, e.g. ACTIVE.")
+@click.option("--namespace", help="Filter on asset namespace.")
+@click.option(
+    "--label",
+    "labels",
+    multiple=True,
+    metavar="KEY[=VALUE]",
+    help="Filter on a label key, or on a label key and value. Can be given "
+    "more than once.")
+@click.option(
+    "--json",
+    "as_json",
+    is_flag=True,
+    help="Print the matching resources as JSON lines, as returned by the API.")
+@options.database_option
+@options.url_option
+@options.region_option
+@options.credential_file_option
+@exception_handler.catch_exception()
+def query(credential_file: Optional[str], region: str, url: Optional[str],
+          database: str, as_json: bool, labels: Sequence[str],
+          namespace: Optional[str], state: Optional[str],
+          log_type: Optional[str], kind: str) -> None:
+  """Prints the inventory resources matching all given filters.
+
+  Args:
+    credential_file (str): Path of the Service Account JSON the inventory was
+      synced with.
+    region (str): Option for selecting regions. Available options - US, EUROPE,
+      ASIA_SOUTHEAST1.
+    url (str): Base URL the inventory was synced from.
+    database (str): Path of the inventory database.
+    as_json (bool): Option for printing the resources as JSON lines.
+    labels (Sequence[str]): Label filters, as KEY or KEY=VALUE.
+    namespace (str): Asset namespace filter.
+    state (str): State filter.
+    log_type (str): Log type filter.
+    kind (str): Kind of the resources, or "all".
+  """
+  scope = store.get_scope(region, commands_utility.lower_or_none(url),
+                          credential_file)
+  if not os.path.exists(database):
+    click.echo(f"Inventory of {scope} is empty. Run 'inventory sync' first.")
+    return
+
+  kinds = (
+      store.KINDS if kind.lower() == ALL_KINDS else
+      [KIND_CHOICES[kind.lower()]])
+  with store.InventoryStore(database) as inventory:
+    synced_at = inventory.get_synced_at(scope)
+    if not synced_at:
+      click.echo(f"Inventory of {scope} is empty. Run 'inventory sync' first.")
+      return
+    rows = inventory.query(scope, kinds, log_type, state, namespace,
+                           parse_labels(labels))
+
+  if as_json:
+    for row in rows:
+      click.echo(
+          json.dumps({
+              "kind": row["kind"],
+              "id": row["id"],
+              "resource": json.loads(row["body"]),
+          }))
+    return
+
+  if rows:
+    table = [[header for header, _ in COLUMNS]]
+    table.extend([row[column] or "-" for _, column in COLUMNS] for row in rows)
+    widths = [max(len(line[index]) for line in table)
+              for index in range(len(COLUMNS))]
+    for line in table:
+      click.echo("  ".join(
+          value.ljust(width) for value, width in zip(line, widths)).rstrip())
+    click.echo()
+  last_synced = max(
+      (synced_at[synced_kind] for synced_kind in kinds
+       if synced_kind in synced_at),
+      default=None)
+  summary = f"Resources found: {len(rows)}."
+  if last_synced:
+    summary += f" Last synced: {last_synced:%Y-%m-%d %H:%M:%S} UTC."
+  click.echo(summary)
+
+
+def parse_labels(labels: Sequence[str]) -> List[Tuple[str, Optional[str]]]:
+  """Parses label filters.
+
+  Args:
+    labels (Sequence[str]): Label filters, as KEY or KEY=VALUE.
+
+  Returns:
+    List[Tuple[str, str]]: Label keys and values. The value is None for
+    filters on the key only.
+  """
+  parsed_labels = []
+  for label in labels:
+    key, separator, value = label.partition("=")
+    parsed_labels.append((key, value if separator else None))
+  return parsed_labels
@@ -0,0 +1,107 @@
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Unit tests for query.py."""
+
+import json
+import os
+from typing import Any
+
+from click.testing import CliRunner
+import pytest
+
+from inventory import store
+from inventory.commands.query import query
+
+runner = CliRunner()
+# Scope of the US region synced with the default credential file.
+SCOPE = store.get_scope("US", None, None)
+
+
+@pytest.fixture(name="database")
+def fixture_database(tmp_path: Any) -> str:
+  """Inventory with a feed and a forwarder of the US region."""
+  database = os.path.join(tmp_path, "inventory.db")
+  with store.InventoryStore(database) as inventory:
+    inventory.sync(SCOPE, store.KIND_FEED, [
+        store.Record(
+            kind=store.KIND_FEED,
+            resource_id="123",
+            body={"name": "feeds/123"},
+            display_name="Workspace users",
+            log_type="WORKSPACE_USERS",
+            state="ACTIVE",
+            labels=[("team", "soc")])
+    ])
+    inventory.sync(SCOPE, store.KIND_FORWARDER, [
+        store.Record(
+            kind=store.KIND_FORWARDER,
+            resource_id="abc",
+            body={"name": "forwarders/abc"},
+            state="ACTIVE",
+            namespace="prod")
+    ])
+  return database
+
+
+def test_query(database: str) -> None:
+  """Test that matching resources are printed as a table."""
+  result = runner.invoke(query, ["--database", database, "--state", "active"])
+
+  lines = result.output.splitlines()
+  assert lines[:3] == [
+      "KIND       ID   NAME             LOG TYPE         STATE   NAMESPACE",
+      "feed       123  Workspace users  WORKSPACE_USERS  ACTIVE  -",
+      "forwarder  abc  -                -                ACTIVE  prod",
+  ]
+  assert lines[4].startswith("Resources found: 2. Last synced: ")
+
+
+def test_query_kind_and_label(database: str) -> None:
+  """Test that the kind and label filters are applied."""
+  result = runner.invoke(
+      query, ["feeds", "--database", database, "--label", "team=soc"])
+  assert "Resources found: 1." in result.output
+
+  result = runner.invoke(
+      query, ["forwarders", "--database", database, "--label", "team"])
+  assert result.output.startswith("Resources found: 0.")
+
+
+def test_query_json(database: str) -> None:
+  """Test that --json prints the stored API representation."""
+  result = runner.invoke(
+      query, ["--database", database, "--namespace", "prod", "--json"])
+
+  assert json.loads(result.output) == {
+      "kind": store.KIND_FORWARDER,
+      "id": "abc",
+      "resource": {
+          "name": "forwarders/abc"
+      }
+  }
+
+
+def test_query_not_synced(database: str, tmp_path: Any) -> None:
+  """Test the message shown for regions and databases never synced."""
+  result = runner.invoke(query, ["--database", database, "--region", "EUROPE"])
+  assert result.output == (
+      f"Inventory of {store.get_scope('EUROPE', None, None)} is empty. Run "
+      "'inventory sync' first.\n")
+
+  missing_database = os.path.join(tmp_path, "missing.db")
+  result = runner.invoke(query, ["--database", missing_database])
+  assert result.output == (
+      f"Inventory of {SCOPE} is empty. Run 'inventory sync' first.\n")
+  assert not os.path.exists(missing_database)
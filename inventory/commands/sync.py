@@ -0,0 +1,354 @@
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Mirror tenant resources into the local inventory."""
+
+import concurrent.futures
+from typing import Any, AnyStr, Callable, Dict, Optional, Tuple
+
+import click
+
+from common import api_utility
+from common import chronicle_auth
+from common import commands_utility
+from common import exception_handler
+from common import options
+from common import paginator
+from common.constants import key_constants
+from common.constants import status
+from feeds import feed_utility
+from feeds.constants import schema as feed_schema
+from forwarders import forwarder_utility
+from forwarders.collectors import collector_utility
+from forwarders.constants import schema as forwarder_schema
+from inventory import resources
+from inventory import store
+from parsers import url as parser_url
+from parsers.constants import key_constants as parser_constants
+
+
+@click.command(
+    name="sync",
+    help="Mirror feeds, forwarders, collectors and parsers into the local "
+    "inventory")
+@click.option(
+    "--full",
+    is_flag=True,
+    help="Download every list again, even if the API reports it unchanged.")
+@click.option(
+    "--project-id",
+    help="GCP project ID of the tenant. Parser extensions are synced only if "
+    "the project and customer IDs are given.")
+@click.option("--customer-id", help="Customer ID of the tenant.")
+@options.database_option
+@options.concurrency_option
+@options.env_option
+@options.url_option
+@options.region_option
+@options.credential_file_option
+@exception_handler.catch_exception()
+def sync(credential_file: AnyStr, region: str, url: Optional[str], env: str,
+         concurrency: int, database: str, customer_id: Optional[str],
+         project_id: Optional[str], full: bool) -> None:
+  """Mirrors tenant resources into the local inventory.
+
+  Lists the API reports unchanged since the last sync are not downloaded
+  again, and only resources which were added, changed or removed are written.
+
+  Args:
+    credential_file (AnyStr): Path of Service Account JSON.
+    region (str): Option for selecting regions. Available options - US, EUROPE,
+      ASIA_SOUTHEAST1.
+    url (str): Base URL to be used for API calls.
+    env (str): Option for selecting environment. Available options - prod, test.
+    concurrency (int): Maximum number of API requests sent in parallel.
+    database (str): Path of the inventory database.
+    customer_id (str): Customer ID of the tenant.
+    project_id (str): GCP project ID of the tenant.
+    full (bool): Option for downloading every list again.
+
+  Raises:
+    OSError: Failed to read the given file, e.g. not found, no read access
+      (https://docs.python.org/library/exceptions.html#os-exceptions).
+    ValueError: Invalid file contents.
+    KeyError: Required key is not present in dictionary.
+    TypeError: If response data is not JSON.
+  """
+  url = commands_utility.lower_or_none(url)
+  scope = store.get_scope(region, url, credential_file)
+  client = chronicle_auth.initialize_http_session(credential_file)
+
+  click.echo("Syncing inventory...\n")
+  with store.InventoryStore(database) as inventory:
+    sync_list(inventory, client, scope, "Feeds", store.KIND_FEED,
+              feed_utility.get_feed_url(region, url), feed_schema.KEY_FEEDS,
+              resources.get_feed_record, full)
+    forwarder_counts = sync_list(inventory, client, scope, "Forwarders",
+                                 store.KIND_FORWARDER,
+                                 forwarder_utility.get_forwarder_url(
+                                     region, url),
+                                 forwarder_schema.KEY_FORWARDERS,
+                                 resources.get_forwarder_record, full)
+    # Collectors are synced even if the forwarder list is unchanged, since
+    # they can change without their forwarder changing.
+    if forwarder_counts:
+      sync_collectors(inventory, client, scope, region, url, full,
+                      concurrency)
+    sync_list(
+        inventory,
+        client,
+        scope,
+        "Parsers",
+        store.KIND_CBN_PARSER,
+        parser_url.get_url(region, "list", env),
+        parser_constants.KEY_CBN_PARSER,
+        resources.get_cbn_parser_record,
+        full,
+        timeout=parser_url.HTTP_REQUEST_TIMEOUT_IN_SECS)
+    if project_id and customer_id:
+      sync_parser_extensions(inventory, credential_file, scope, region, env,
+                             project_id, customer_id)
+    else:
+      click.echo("Parser extensions: skipped, --project-id and --customer-id "
+                 "not given.")
+
+  click.echo(f"\nInventory synced to: {inventory.path}")
+
+
+def sync_list(inventory: store.InventoryStore,
+              client: Any,
+              scope: str,
+              label: str,
+              kind: str,
+              list_url: str,
+              items_key: str,
+              get_record: Callable[[Dict[str, Any]], store.Record],
+              full: bool,
+              **request_kwargs: Any) -> Optional[store.SyncCounts]:
+  """Syncs the resources of a list API.
+
+  Args:
+    inventory (store.InventoryStore): Inventory to sync.
+    client (Any): HTTP session object to send authorized requests and receive
+      responses.
+    scope (str): Scope of the resources.
+    label (str): Name of the resources shown on console.
+    kind (str): Kind of the resources.
+    list_url (str): URL of the list API.
+    items_key (str): Key of the list of resources in the response.
+    get_record (Callable): Function converting a resource into a record.
+    full (bool): Option for downloading the list even if it is unchanged.
+    **request_kwargs: Keyword arguments passed on to client.request.
+
+  Returns:
+    store.SyncCounts: Number of resources changed, None if the list could not
+    be fetched.
+  """
+  response = fetch(inventory, client, scope, list_url, full,
+                   **request_kwargs)
+  if response.status_code == status.STATUS_NOT_MODIFIED:
+    counts = store.SyncCounts(unchanged=len(inventory.get_ids(scope, kind)))
+    inventory.mark_synced(scope, kind)
+    click.echo(f"{label}: not modified, {counts.unchanged} stored.")
+    return counts
+
+  parsed_response = api_utility.check_content_type(response.content)
+  if response.status_code != status.STATUS_OK:
+    print_fetch_error(label.lower(), response.status_code, parsed_response)
+    return None
+
+  counts = inventory.sync(
+      scope, kind,
+      [get_record(item) for item in parsed_response.get(items_key, [])])
+  inventory.store_validators(scope, list_url, response.headers)
+  click.echo(f"{label}: {format_counts(counts)}")
+  return counts
+
+
+def sync_collectors(inventory: store.InventoryStore, client: Any, scope: str,
+                    region: str, custom_url: Optional[str], full: bool,
+                    concurrency: int) -> None:
+  """Syncs the collectors of every stored forwarder.
+
+  Args:
+    inventory (store.InventoryStore): Inventory to sync.
+    client (Any): HTTP session object to send authorized requests and receive
+      responses.
+    scope (str): Scope of the resources.
+    region (str): Region of the tenant.
+    custom_url (str): Base URL to be used for API calls.
+    full (bool): Option for downloading the lists even if they are unchanged.
+    concurrency (int): Maximum number of API requests sent in parallel.
+  """
+  counts = store.SyncCounts(
+      removed=inventory.remove_orphans(scope, store.KIND_COLLECTOR,
+                                       store.KIND_FORWARDER))
+  forwarder_ids = inventory.get_ids(scope, store.KIND_FORWARDER)
+  # The database is only used from this thread, so the validation headers
+  # are looked up before the requests are sent in parallel.
+  requests = []
+  for forwarder_id in forwarder_ids:
+    collector_url = collector_utility.get_collector_url(
+        region, custom_url, forwarder_id)
+    headers = {} if full else inventory.get_validation_headers(
+        scope, collector_url)
+    requests.append((forwarder_id, collector_url, headers))
+
+  def fetch_collectors(request: Tuple[str, str, Dict[str, str]]) -> Any:
+    """Fetches the collectors of a forwarder, returning any error raised."""
+    try:
+      return client.request("GET", request[1], headers=request[2])
+    except Exception as e:  # pylint: disable=broad-except
+      return e
+
+  errors = 0
+  with concurrent.futures.ThreadPoolExecutor(
+      max_workers=concurrency) as executor:
+    responses = executor.map(fetch_collectors, requests)
+    for (forwarder_id, collector_url, _), response in zip(requests, responses):
+      if isinstance(response, Exception):
+        print_fetch_error(f"collectors of forwarder {forwarder_id}", None,
+                          {key_constants.KEY_ERROR: {
+                              key_constants.KEY_MESSAGE: str(response)
+                          }})
+        errors += 1
+        continue
+      if response.status_code == status.STATUS_NOT_MODIFIED:
+        counts.unchanged += len(
+            inventory.get_ids(scope, store.KIND_COLLECTOR, forwarder_id))
+        continue
+      parsed_response = api_utility.check_content_type(response.content)
+      if response.status_code != status.STATUS_OK:
+        print_fetch_error(f"collectors of forwarder {forwarder_id}",
+                          response.status_code, parsed_response)
+        errors += 1
+        continue
+      counts.add(
+          inventory.sync(
+              scope,
+              store.KIND_COLLECTOR, [
+                  resources.get_collector_record(forwarder_id, collector)
+                  for collector in parsed_response.get(
+                      forwarder_schema.KEY_COLLECTORS, [])
+              ],
+              parent_id=forwarder_id))
+      inventory.store_validators(scope, collector_url, response.headers)
+
+  if not errors:
+    inventory.mark_synced(scope, store.KIND_COLLECTOR)
+  summary = f"Collectors: {format_counts(counts)}"
+  if errors:
+    summary += f" {errors} of {len(forwarder_ids)} forwarders failed."
+  click.echo(summary)
+
+
+def sync_parser_extensions(inventory: store.InventoryStore,
+                           credential_file: AnyStr, scope: str, region: str,
+                           env: str, project_id: str, customer_id: str) -> None:
+  """Syncs the parser extensions of every log type.
+
+  The list is paginated, so it is always downloaded in full. Resources are
+  only written if they changed, and nothing is removed unless every page was
+  fetched.
+
+  Args:
+    inventory (store.InventoryStore): Inventory to sync.
+    credential_file (AnyStr): Path of Service Account JSON.
+    scope (str): Scope of the resources.
+    region (str): Region of the tenant.
+    env (str): Environment for API calls (prod, test).
+    project_id (str): GCP project ID of the tenant.
+    customer_id (str): Customer ID of the tenant.
+  """
+  list_extensions_url = parser_url.get_dataplane_url(
+      region,
+      "list_extensions",
+      env, {
+          "project": project_id,
+          "location": region.lower(),
+          "instance": customer_id,
+          "log_type": "-",
+      },
+      page_size=paginator.DEFAULT_PAGE_SIZE)
+  client = chronicle_auth.initialize_dataplane_http_session(credential_file)
+  extensions = []
+  for page in paginator.iter_pages(
+      client,
+      "GET",
+      list_extensions_url,
+      parser_constants.KEY_PARSER_EXTENSIONS,
+      timeout=parser_url.HTTP_REQUEST_TIMEOUT_IN_SECS):
+    if page.status_code != status.STATUS_OK:
+      print_fetch_error("parser extensions", page.status_code, page.response)
+      return
+    extensions.extend(page.items)
+
+  counts = inventory.sync(
+      scope, store.KIND_PARSER_EXTENSION,
+      [resources.get_parser_extension_record(item) for item in extensions])
+  click.echo(f"Parser extensions: {format_counts(counts)}")
+
+
+def fetch(inventory: store.InventoryStore, client: Any, scope: str,
+          list_url: str, full: bool, **request_kwargs: Any) -> Any:
+  """Fetches a list, asking the API to skip it if it is unchanged.
+
+  Args:
+    inventory (store.InventoryStore): Inventory holding the validators of the
+      last sync.
+    client (Any): HTTP session object to send authorized requests and receive
+      responses.
+    scope (str): Scope the list is synced into.
+    list_url (str): URL of the list API.
+    full (bool): Option for downloading the list even if it is unchanged.
+    **request_kwargs: Keyword arguments passed on to client.request.
+
+  Returns:
+    Response of the list API.
+  """
+  headers = {} if full else inventory.get_validation_headers(scope, list_url)
+  if headers:
+    request_kwargs["headers"] = headers
+  return client.request("GET", list_url, **request_kwargs)
+
+
+def format_counts(counts: store.SyncCounts) -> str:
+  """Returns the counts of a sync as shown on console.
+
+  Args:
+    counts (store.SyncCounts): Number of resources changed.
+
+  Returns:
+    str: Counts of a sync.
+  """
+  return (f"{counts.added} added, {counts.updated} updated, "
+          f"{counts.removed} removed, {counts.unchanged} unchanged.")
+
+
+def print_fetch_error(label: str, status_code: Optional[int],
+                      parsed_response: Dict[str, Any]) -> None:
+  """Prints the error of a failed list request.
+
+  Args:
+    label (str): Name of the resources, e.g. "feeds".
+    status_code (int): Response status code, None if no response was
+      received.
+    parsed_response (Dict[str, Any]): Parsed response body.
+  """
+  error_message = parsed_response.get(key_constants.KEY_ERROR,
+                                      {}).get(key_constants.KEY_MESSAGE)
+  response_code = ("" if status_code is None else
+                   f"Response Code: {status_code}\n")
+  click.echo(f"Error while fetching {label}.\n"
+             f"{response_code}Error: {error_message}")
@@ -0,0 +1,306 @@
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Unit tests for sync.py."""
+
+import json
+import os
+from typing import Any
+from unittest import mock
+
+from click.testing import CliRunner
+import requests
+
+from inventory import store
+from inventory.commands.sync import sync
+from mock_test_utility import MockResponse
+
+runner = CliRunner()
+# Scope of the US region synced with the default credential file.
+SCOPE = store.get_scope("US", None, None)
+
+FEEDS = {
+    "feeds": [{
+        "name": "feeds/123",
+        "displayName": "Workspace users",
+        "feedState": "ACTIVE",
+        "details": {
+            "logType": "WORKSPACE_USERS",
+            "namespace": "prod",
+            "labels": [{
+                "key": "team",
+                "value": "soc"
+            }]
+        }
+    }]
+}
+FORWARDERS = {
+    "forwarders": [{
+        "name": "forwarders/abc",
+        "displayName": "Forwarder",
+        "state": "ACTIVE",
+        "config": {
+            "metadata": {
+                "assetNamespace": "prod"
+            }
+        }
+    }]
+}
+COLLECTORS = {
+    "collectors": [{
+        "name": "forwarders/abc/collectors/def",
+        "displayName": "Collector",
+        "state": "ACTIVE",
+        "config": {
+            "logType": "WINDOWS_DNS"
+        }
+    }]
+}
+PARSERS = {
+    "cbnParsers": [{
+        "configId": "xyz",
+        "logType": "WINDOWS_DNS",
+        "state": "LIVE"
+    }]
+}
+
+
+def ok(body: Any, etag: str) -> MockResponse:
+  """Returns a 200 response with an ETag."""
+  return MockResponse(
+      status_code=200, text=json.dumps(body), headers={"ETag": etag})
+
+
+def not_modified() -> MockResponse:
+  """Returns a 304 response."""
+  return MockResponse(status_code=304, text="")
+
+
+@mock.patch("inventory.commands.sync.chronicle_auth.initialize_http_session")
+def test_sync_and_resync(mock_client: mock.MagicMock, tmp_path: Any) -> None:
+  """Test that a resync only downloads and writes what changed."""
+  database = os.path.join(tmp_path, "inventory.db")
+  mock_client.return_value = mock.Mock()
+  mock_client.return_value.request.side_effect = [
+      ok(FEEDS, '"1"'),
+      ok(FORWARDERS, '"2"'),
+      ok(COLLECTORS, '"3"'),
+      ok(PARSERS, '"4"'),
+      not_modified(),
+      not_modified(),
+      not_modified(),
+      ok({}, '"5"'),
+  ]
+
+  result = runner.invoke(sync, ["--database", database])
+
+  assert result.output == f"""Syncing inventory...
+
+Feeds: 1 added, 0 updated, 0 removed, 0 unchanged.
+Forwarders: 1 added, 0 updated, 0 removed, 0 unchanged.
+Collectors: 1 added, 0 updated, 0 removed, 0 unchanged.
+Parsers: 1 added, 0 updated, 0 removed, 0 unchanged.
+Parser extensions: skipped, --project-id and --customer-id not given.
+
+Inventory synced to: {database}
+"""
+
+  result = runner.invoke(sync, ["--database", database])
+
+  assert result.output == f"""Syncing inventory...
+
+Feeds: not modified, 1 stored.
+Forwarders: not modified, 1 stored.
+Collectors: 0 added, 0 updated, 0 removed, 1 unchanged.
+Parsers: 0 added, 0 updated, 1 removed, 0 unchanged.
+Parser extensions: skipped, --project-id and --customer-id not given.
+
+Inventory synced to: {database}
+"""
+  calls = mock_client.return_value.request.call_args_list
+  assert calls[4].kwargs["headers"] == {"If-None-Match": '"1"'}
+  assert calls[6].kwargs["headers"] == {"If-None-Match": '"3"'}
+  assert "/v2/forwarders/abc/collectors" in calls[6].args[1]
+  with store.InventoryStore(database) as inventory:
+    assert inventory.get_ids(SCOPE, store.KIND_COLLECTOR) == ["abc/def"]
+    rows = inventory.query(SCOPE, labels=[("team", "soc")])
+    assert [row["id"] for row in rows] == ["123"]
+
+
+@mock.patch("inventory.commands.sync.chronicle_auth.initialize_http_session")
+def test_sync_full(mock_client: mock.MagicMock, tmp_path: Any) -> None:
+  """Test that --full sends no conditional headers."""
+  database = os.path.join(tmp_path, "inventory.db")
+  with store.InventoryStore(database) as inventory:
+    inventory.store_validators(SCOPE,
+                               "https://backstory.googleapis.com/v1/feeds",
+                               {"ETag": '"1"'})
+  mock_client.return_value = mock.Mock()
+  mock_client.return_value.request.side_effect = [
+      ok(FEEDS, '"1"'),
+      ok({}, '"2"'),
+      ok({}, '"3"'),
+  ]
+
+  runner.invoke(sync, ["--database", database, "--full"])
+
+  first_call = mock_client.return_value.request.call_args_list[0]
+  assert "headers" not in first_call.kwargs
+
+
+@mock.patch("inventory.commands.sync.chronicle_auth.initialize_http_session")
+def test_sync_error_keeps_inventory(mock_client: mock.MagicMock,
+                                    tmp_path: Any) -> None:
+  """Test that a failed list leaves the stored resources untouched."""
+  database = os.path.join(tmp_path, "inventory.db")
+  mock_client.return_value = mock.Mock()
+  mock_client.return_value.request.side_effect = [
+      MockResponse(
+          status_code=500, text='{"error": {"message": "internal error"}}'),
+      MockResponse(
+          status_code=403, text='{"error": {"message": "permission denied"}}'),
+      ok(PARSERS, '"4"'),
+  ]
+
+  result = runner.invoke(sync, ["--database", database])
+
+  assert result.output == f"""Syncing inventory...
+
+Error while fetching feeds.
+Response Code: 500
+Error: internal error
+Error while fetching forwarders.
+Response Code: 403
+Error: permission denied
+Parsers: 1 added, 0 updated, 0 removed, 0 unchanged.
+Parser extensions: skipped, --project-id and --customer-id not given.
+
+Inventory synced to: {database}
+"""
+
+
+@mock.patch(
+    "inventory.commands.sync.chronicle_auth.initialize_dataplane_http_session")
+@mock.patch("inventory.commands.sync.chronicle_auth.initialize_http_session")
+def test_sync_parser_extensions(mock_client: mock.MagicMock,
+                                mock_dataplane_client: mock.MagicMock,
+                                tmp_path: Any) -> None:
+  """Test that parser extensions of every page are synced."""
+  database = os.path.join(tmp_path, "inventory.db")
+  mock_client.return_value = mock.Mock()
+  mock_client.return_value.request.side_effect = [
+      ok({}, '"1"'), ok({}, '"2"'), ok({}, '"3"')
+  ]
+  extension_name = ("projects/p/locations/us/instances/c/logTypes/{}/"
+                    "parserExtensions/{}")
+  mock_dataplane_client.return_value = mock.Mock()
+  mock_dataplane_client.return_value.request.side_effect = [
+      MockResponse(
+          status_code=200,
+          text=json.dumps({
+              "parserExtensions": [{
+                  "name": extension_name.format("DNS", "e1"),
+                  "state": "LIVE"
+              }],
+              "nextPageToken": "next"
+          })),
+      MockResponse(
+          status_code=200,
+          text=json.dumps({
+              "parserExtensions": [{
+                  "name": extension_name.format("OKTA", "e2"),
+                  "state": "LIVE"
+              }]
+          })),
+  ]
+
+  result = runner.invoke(sync, [
+      "--database", database, "--project-id", "p", "--customer-id", "c"
+  ])
+
+  assert "Parser extensions: 2 added, 0 updated, 0 removed, 0 unchanged." in (
+      result.output)
+  with store.InventoryStore(database) as inventory:
+    rows = inventory.query(SCOPE, log_type="okta")
+    assert [(row["kind"], row["id"]) for row in rows] == [
+        (store.KIND_PARSER_EXTENSION, "e2")
+    ]
+
+
+@mock.patch("inventory.commands.sync.chronicle_auth.initialize_http_session")
+def test_sync_credentials_of_same_region(mock_client: mock.MagicMock,
+                                         tmp_path: Any) -> None:
+  """Test that tenants of the same region are kept apart."""
+  database = os.path.join(tmp_path, "inventory.db")
+  credential_files = []
+  for tenant in ("a", "b"):
+    credential_file = os.path.join(tmp_path, f"{tenant}.json")
+    with open(credential_file, "w") as file:
+      json.dump({"client_email": f"cli@{tenant}.iam.gserviceaccount.com"},
+                file)
+    credential_files.append(credential_file)
+  other_feeds = {"feeds": [{"name": "feeds/456", "feedState": "ACTIVE"}]}
+  mock_client.return_value = mock.Mock()
+  mock_client.return_value.request.side_effect = [
+      ok(FEEDS, '"1"'), ok({}, '"2"'), ok({}, '"3"'),
+      ok(other_feeds, '"4"'), ok({}, '"5"'), ok({}, '"6"'),
+  ]
+
+  for credential_file in credential_files:
+    runner.invoke(sync, ["--database", database, "-c", credential_file])
+
+  # The second tenant was not asked whether the list of the first changed.
+  assert "headers" not in (
+      mock_client.return_value.request.call_args_list[3].kwargs)
+  with store.InventoryStore(database) as inventory:
+    assert inventory.get_ids("US (cli@a.iam.gserviceaccount.com)",
+                             store.KIND_FEED) == ["123"]
+    assert inventory.get_ids("US (cli@b.iam.gserviceaccount.com)",
+                             store.KIND_FEED) == ["456"]
+
+
+@mock.patch("inventory.commands.sync.chronicle_auth.initialize_http_session")
+def test_sync_collectors_request_error(mock_client: mock.MagicMock,
+                                       tmp_path: Any) -> None:
+  """Test that a failed collectors request does not abort the sync."""
+  database = os.path.join(tmp_path, "inventory.db")
+  forwarders = {
+      "forwarders": [{
+          "name": "forwarders/abc"
+      }, {
+          "name": "forwarders/xyz"
+      }]
+  }
+
+  def request(method, url, **kwargs):
+    del method, kwargs  # Unused.
+    if url.endswith("/v2/forwarders"):
+      return ok(forwarders, '"2"')
+    if "/forwarders/xyz/" in url:
+      raise requests.exceptions.ReadTimeout("Read timed out.")
+    if "/forwarders/abc/" in url:
+      return ok(COLLECTORS, '"3"')
+    return ok({}, '"1"')
+
+  mock_client.return_value = mock.Mock()
+  mock_client.return_value.request.side_effect = request
+
+  result = runner.invoke(sync, ["--database", database, "--concurrency", "2"])
+
+  assert """Forwarders: 2 added, 0 updated, 0 removed, 0 unchanged.
+Error while fetching collectors of forwarder xyz.
+Error: Read timed out.
+Collectors: 1 added, 0 updated, 0 removed, 0 unchanged. 1 of 2 forwarders failed.
+Parsers: 0 added""" in result.output
+  assert result.output.endswith(f"Inventory synced to: {database}\n")
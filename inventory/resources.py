@@ -0,0 +1,149 @@
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Conversion of API resources into inventory records."""
+
+from typing import Any, Dict, List, Optional, Tuple
+
+from common.constants import key_constants
+from feeds.constants import schema as feed_schema
+from forwarders import forwarder_utility
+from forwarders.constants import schema as forwarder_schema
+from inventory import store
+from parsers import parser_utility
+from parsers.constants import key_constants as parser_constants
+
+KEY_NAMESPACE = "namespace"
+KEY_LABELS = "labels"
+KEY_LABEL_KEY = "key"
+
+
+def get_feed_record(feed: Dict[str, Any]) -> store.Record:
+  """Returns the inventory record of a feed.
+
+  Args:
+    feed (Dict[str, Any]): Feed as returned by the API.
+
+  Returns:
+    store.Record: Inventory record.
+  """
+  details = feed.get(feed_schema.KEY_DETAILS, {})
+  return store.Record(
+      kind=store.KIND_FEED,
+      resource_id=feed[feed_schema.KEY_NAME].split("/")[-1],
+      body=feed,
+      display_name=feed.get(feed_schema.KEY_DISPLAY_NAME),
+      log_type=details.get(key_constants.KEY_LOG_TYPE),
+      state=feed.get(feed_schema.KEY_FEED_STATE),
+      namespace=details.get(KEY_NAMESPACE),
+      labels=get_labels(details))
+
+
+def get_forwarder_record(forwarder: Dict[str, Any]) -> store.Record:
+  """Returns the inventory record of a forwarder.
+
+  Args:
+    forwarder (Dict[str, Any]): Forwarder as returned by the API.
+
+  Returns:
+    store.Record: Inventory record.
+  """
+  metadata = forwarder.get(forwarder_schema.KEY_CONFIG,
+                           {}).get(forwarder_schema.KEY_METADATA, {})
+  return store.Record(
+      kind=store.KIND_FORWARDER,
+      resource_id=forwarder_utility.get_resource_id(forwarder),
+      body=forwarder,
+      display_name=forwarder.get(forwarder_schema.KEY_DISPLAY_NAME),
+      state=forwarder.get(forwarder_schema.KEY_STATE),
+      namespace=metadata.get(forwarder_schema.KEY_ASSET_NAMESPACE),
+      labels=get_labels(metadata))
+
+
+def get_collector_record(forwarder_id: str,
+                         collector: Dict[str, Any]) -> store.Record:
+  """Returns the inventory record of a collector.
+
+  Args:
+    forwarder_id (str): ID of the forwarder the collector belongs to.
+    collector (Dict[str, Any]): Collector as returned by the API.
+
+  Returns:
+    store.Record: Inventory record.
+  """
+  config = collector.get(forwarder_schema.KEY_CONFIG, {})
+  metadata = config.get(forwarder_schema.KEY_METADATA, {})
+  return store.Record(
+      kind=store.KIND_COLLECTOR,
+      # Collector IDs are only unique within their forwarder.
+      resource_id=(
+          f"{forwarder_id}/{forwarder_utility.get_resource_id(collector)}"),
+      body=collector,
+      parent_id=forwarder_id,
+      display_name=collector.get(forwarder_schema.KEY_DISPLAY_NAME),
+      log_type=config.get(forwarder_schema.KEY_LOG_TYPE),
+      state=collector.get(forwarder_schema.KEY_STATE),
+      namespace=metadata.get(forwarder_schema.KEY_ASSET_NAMESPACE),
+      labels=get_labels(metadata))
+
+
+def get_cbn_parser_record(parser: Dict[str, Any]) -> store.Record:
+  """Returns the inventory record of a CBN parser.
+
+  Args:
+    parser (Dict[str, Any]): Parser as returned by the API.
+
+  Returns:
+    store.Record: Inventory record.
+  """
+  return store.Record(
+      kind=store.KIND_CBN_PARSER,
+      resource_id=parser[parser_constants.KEY_CONFIG_ID],
+      body=parser,
+      log_type=parser.get(key_constants.KEY_LOG_TYPE),
+      state=parser.get(parser_constants.KEY_STATE))
+
+
+def get_parser_extension_record(extension: Dict[str, Any]) -> store.Record:
+  """Returns the inventory record of a parser extension.
+
+  Args:
+    extension (Dict[str, Any]): Parser extension as returned by the API.
+
+  Returns:
+    store.Record: Inventory record.
+  """
+  resource_components = parser_utility.process_resource_name(
+      extension[parser_constants.KEY_NAME])
+  return store.Record(
+      kind=store.KIND_PARSER_EXTENSION,
+      resource_id=resource_components[parser_constants.KEY_PARSER_EXTENSIONS],
+      body=extension,
+      log_type=resource_components.get(parser_constants.KEY_LOGTYPES),
+      state=extension.get(parser_constants.KEY_STATE))
+
+
+def get_labels(resource: Dict[str, Any]) -> List[Tuple[str, Optional[str]]]:
+  """Returns the labels of a resource as key and value pairs.
+
+  Args:
+    resource (Dict[str, Any]): Part of the resource holding the labels, e.g.
+      the details of a feed. Example - {'labels': [{'key': 'k1', 'value':
+      'v1'}]}
+
+  Returns:
+    List[Tuple[str, str]]: Label keys and values.
+  """
+  return [(label[KEY_LABEL_KEY], label.get(forwarder_schema.KEY_VALUE))
+          for label in resource.get(KEY_LABELS, [])]
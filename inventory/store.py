@@ -0,0 +1,429 @@
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Local SQLite mirror of tenant resources."""
+
+import dataclasses
+import datetime
+import hashlib
+import json
+import os
+import sqlite3
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from common import response_cache
+from common.constants import path_constants
+
+KIND_FEED = "feed"
+KIND_FORWARDER = "forwarder"
+KIND_COLLECTOR = "collector"
+KIND_CBN_PARSER = "parser"
+KIND_PARSER_EXTENSION = "extension"
+KINDS = (KIND_FEED, KIND_FORWARDER, KIND_COLLECTOR, KIND_CBN_PARSER,
+         KIND_PARSER_EXTENSION)
+DATETIME_FORMAT = "%Y-%m-%dT%H:%M:%S.%f"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS resources (
+  scope TEXT NOT NULL,
+  kind TEXT NOT NULL,
+  id TEXT NOT NULL,
+  parent_id TEXT,
+  display_name TEXT,
+  log_type TEXT COLLATE NOCASE,
+  state TEXT COLLATE NOCASE,
+  namespace TEXT,
+  body TEXT NOT NULL,
+  body_hash TEXT NOT NULL,
+  PRIMARY KEY (scope, kind, id)
+);
+CREATE INDEX IF NOT EXISTS resources_log_type ON resources (scope, log_type);
+CREATE INDEX IF NOT EXISTS resources_state ON resources (scope, state);
+CREATE INDEX IF NOT EXISTS resources_namespace ON resources (scope, namespace);
+CREATE INDEX IF NOT EXISTS resources_parent
+  ON resources (scope, kind, parent_id);
+CREATE TABLE IF NOT EXISTS labels (
+  scope TEXT NOT NULL,
+  kind TEXT NOT NULL,
+  id TEXT NOT NULL,
+  key TEXT NOT NULL,
+  value TEXT
+);
+CREATE INDEX IF NOT EXISTS labels_resource ON labels (scope, kind, id);
+CREATE INDEX IF NOT EXISTS labels_key_value ON labels (scope, key, value);
+CREATE TABLE IF NOT EXISTS list_validators (
+  scope TEXT NOT NULL,
+  url TEXT NOT NULL,
+  etag TEXT,
+  last_modified TEXT,
+  PRIMARY KEY (scope, url)
+);
+CREATE TABLE IF NOT EXISTS syncs (
+  scope TEXT NOT NULL,
+  kind TEXT NOT NULL,
+  synced_at TEXT NOT NULL,
+  PRIMARY KEY (scope, kind)
+);
+"""
+
+
+@dataclasses.dataclass
+class Record:
+  """Resource stored in the inventory."""
+  kind: str
+  resource_id: str
+  body: Dict[str, Any]
+  parent_id: Optional[str] = None
+  display_name: Optional[str] = None
+  log_type: Optional[str] = None
+  state: Optional[str] = None
+  namespace: Optional[str] = None
+  labels: List[Tuple[str, str]] = dataclasses.field(default_factory=list)
+
+
+@dataclasses.dataclass
+class SyncCounts:
+  """Number of resources changed by a sync."""
+  added: int = 0
+  updated: int = 0
+  removed: int = 0
+  unchanged: int = 0
+
+  def add(self, other: "SyncCounts") -> None:
+    """Adds the counts of another sync.
+
+    Args:
+      other (SyncCounts): Counts to add.
+    """
+    self.added += other.added
+    self.updated += other.updated
+    self.removed += other.removed
+    self.unchanged += other.unchanged
+
+
+def get_scope(region: str, custom_url: Optional[str],
+              credential_file: Optional[str]) -> str:
+  """Returns the scope separating resources of different tenants.
+
+  Tenants are told apart by the service account of the credential file, so
+  several tenants of the same region can share an inventory.
+
+  Args:
+    region (str): Region of the tenant.
+    custom_url (str): Base URL used for API calls, if any.
+    credential_file (str): Path of Service Account JSON. The default
+      credential file is used if None.
+
+  Returns:
+    str: Custom URL if given, region otherwise, followed by the service
+    account in parentheses.
+  """
+  base = custom_url.lower() if custom_url else region.upper()
+  return f"{base} ({get_credential_identity(credential_file)})"
+
+
+def get_credential_identity(credential_file: Optional[str]) -> str:
+  """Returns the service account of a credential file.
+
+  Args:
+    credential_file (str): Path of Service Account JSON. The default
+      credential file is used if None.
+
+  Returns:
+    str: E-mail of the service account. If the file cannot be read, a hash of
+    its absolute path instead.
+  """
+  path = os.path.abspath(credential_file or
+                         path_constants.DEFAULT_CRED_FILE_PATH)
+  try:
+    with open(path, "r") as file:
+      client_email = json.load(file).get("client_email")
+  except (OSError, ValueError, AttributeError):
+    client_email = None
+  if client_email:
+    return client_email
+  return "file:" + hashlib.sha256(path.encode()).hexdigest()[:16]
+
+
+class InventoryStore:
+  """SQLite database of resources, kept in sync incrementally.
+
+  Every resource is stored with the hash of its API representation, so a sync
+  only writes resources which were added, changed or removed. Validators of
+  list responses are stored as well, so unchanged lists are not downloaded
+  again. The database is readable only by the current user, since resource
+  configurations may contain secrets.
+  """
+
+  def __init__(self, path: str) -> None:
+    """Opens the database, creating it if needed.
+
+    Args:
+      path (str): Path of the database file.
+    """
+    path = os.path.abspath(path)
+    if not os.path.exists(path):
+      os.makedirs(os.path.dirname(path), mode=0o700, exist_ok=True)
+      os.close(os.open(path, os.O_RDWR | os.O_CREAT, 0o600))
+    self.path = path
+    self._connection = sqlite3.connect(path)
+    self._connection.row_factory = sqlite3.Row
+    self._connection.executescript(_SCHEMA)
+
+  def __enter__(self) -> "InventoryStore":
+    return self
+
+  def __exit__(self, *args: Any) -> None:
+    self.close()
+
+  def close(self) -> None:
+    """Closes the database."""
+    self._connection.close()
+
+  def sync(self,
+           scope: str,
+           kind: str,
+           records: Iterable[Record],
+           parent_id: Optional[str] = None) -> SyncCounts:
+    """Replaces the stored resources of a kind with the given ones.
+
+    Args:
+      scope (str): Scope of the resources.
+      kind (str): Kind of the resources.
+      records (Iterable[Record]): Current resources.
+      parent_id (str): Replace only the resources of this parent, e.g. the
+        collectors of a forwarder.
+
+    Returns:
+      SyncCounts: Number of resources added, updated, removed and unchanged.
+    """
+    query = "SELECT id, body_hash FROM resources WHERE scope = ? AND kind = ?"
+    params = [scope, kind]
+    if parent_id is not None:
+      query += " AND parent_id = ?"
+      params.append(parent_id)
+    stored_hashes = dict(self._connection.execute(query, params).fetchall())
+    counts = SyncCounts()
+    with self._connection:
+      for record in records:
+        body = json.dumps(record.body, sort_keys=True, separators=(",", ":"))
+        body_hash = hashlib.sha256(body.encode()).hexdigest()
+        stored_hash = stored_hashes.pop(record.resource_id, None)
+        if stored_hash == body_hash:
+          counts.unchanged += 1
+          continue
+        if stored_hash is None:
+          counts.added += 1
+        else:
+          counts.updated += 1
+        self._write(scope, record, body, body_hash)
+      for resource_id in stored_hashes:
+        self._delete(scope, kind, resource_id)
+      counts.removed = len(stored_hashes)
+      self.mark_synced(scope, kind)
+    return counts
+
+  def mark_synced(self, scope: str, kind: str) -> None:
+    """Records that the resources of a kind are up to date.
+
+    Args:
+      scope (str): Scope of the resources.
+      kind (str): Kind of the resources.
+    """
+    with self._connection:
+      self._connection.execute(
+          "INSERT OR REPLACE INTO syncs VALUES (?, ?, ?)",
+          (scope, kind, datetime.datetime.utcnow().strftime(DATETIME_FORMAT)))
+
+  def remove_orphans(self, scope: str, kind: str, parent_kind: str) -> int:
+    """Removes resources whose parent is no longer stored.
+
+    Args:
+      scope (str): Scope of the resources.
+      kind (str): Kind of the child resources, e.g. KIND_COLLECTOR.
+      parent_kind (str): Kind of the parent resources, e.g. KIND_FORWARDER.
+
+    Returns:
+      int: Number of resources removed.
+    """
+    orphans = self._connection.execute(
+        "SELECT id FROM resources WHERE scope = ? AND kind = ? AND parent_id "
+        "NOT IN (SELECT id FROM resources WHERE scope = ? AND kind = ?)",
+        (scope, kind, scope, parent_kind)).fetchall()
+    with self._connection:
+      for (resource_id,) in orphans:
+        self._delete(scope, kind, resource_id)
+    return len(orphans)
+
+  def get_ids(self,
+              scope: str,
+              kind: str,
+              parent_id: Optional[str] = None) -> List[str]:
+    """Returns the IDs of the stored resources of a kind.
+
+    Args:
+      scope (str): Scope of the resources.
+      kind (str): Kind of the resources.
+      parent_id (str): Return only the resources of this parent.
+
+    Returns:
+      List[str]: Resource IDs.
+    """
+    query = "SELECT id FROM resources WHERE scope = ? AND kind = ?"
+    params = [scope, kind]
+    if parent_id is not None:
+      query += " AND parent_id = ?"
+      params.append(parent_id)
+    return [
+        row[0]
+        for row in self._connection.execute(query + " ORDER BY id", params)
+    ]
+
+  def get_validation_headers(self, scope: str, url: str) -> Dict[str, str]:
+    """Returns request headers asking the server whether a list changed.
+
+    Args:
+      scope (str): Scope the list was synced into.
+      url (str): Request URL.
+
+    Returns:
+      Dict[str, str]: Conditional request headers. Empty if the URL was not
+        synced or the server sent no validators.
+    """
+    row = self._connection.execute(
+        "SELECT etag, last_modified FROM list_validators "
+        "WHERE scope = ? AND url = ?", (scope, url)).fetchone()
+    headers = {}
+    if row and row["etag"]:
+      headers[response_cache.HEADER_IF_NONE_MATCH] = row["etag"]
+    if row and row["last_modified"]:
+      headers[response_cache.HEADER_IF_MODIFIED_SINCE] = row["last_modified"]
+    return headers
+
+  def store_validators(self, scope: str, url: str,
+                       headers: Dict[str, str]) -> None:
+    """Stores the validators of a synced list response.
+
+    Args:
+      scope (str): Scope the list was synced into.
+      url (str): Request URL.
+      headers (Dict[str, str]): Response headers.
+    """
+    etag = headers.get(response_cache.HEADER_ETAG)
+    last_modified = headers.get(response_cache.HEADER_LAST_MODIFIED)
+    with self._connection:
+      if etag or last_modified:
+        self._connection.execute(
+            "INSERT OR REPLACE INTO list_validators VALUES (?, ?, ?, ?)",
+            (scope, url, etag, last_modified))
+      else:
+        self._connection.execute(
+            "DELETE FROM list_validators WHERE scope = ? AND url = ?",
+            (scope, url))
+
+  def get_synced_at(self, scope: str) -> Dict[str, datetime.datetime]:
+    """Returns when each kind of resource was last synced.
+
+    Args:
+      scope (str): Scope of the resources.
+
+    Returns:
+      Dict[str, datetime.datetime]: Time of the last sync in UTC by kind.
+    """
+    return {
+        row["kind"]: datetime.datetime.strptime(row["synced_at"],
+                                                DATETIME_FORMAT)
+        for row in self._connection.execute(
+            "SELECT kind, synced_at FROM syncs WHERE scope = ?", (scope,))
+    }
+
+  def query(self,
+            scope: str,
+            kinds: Sequence[str] = KINDS,
+            log_type: Optional[str] = None,
+            state: Optional[str] = None,
+            namespace: Optional[str] = None,
+            labels: Sequence[Tuple[str, Optional[str]]] = ()) -> List[Any]:
+    """Returns the stored resources matching all given filters.
+
+    Args:
+      scope (str): Scope of the resources.
+      kinds (Sequence[str]): Kinds of the resources.
+      log_type (str): Log type, case insensitive.
+      state (str): State, case insensitive.
+      namespace (str): Asset namespace.
+      labels (Sequence[Tuple[str, str]]): Label keys and values. A value of
+        None matches any value of the key.
+
+    Returns:
+      List[sqlite3.Row]: Matching resources ordered by kind and ID.
+    """
+    conditions = [
+        "scope = ?", f"kind IN ({', '.join('?' * len(kinds))})"
+    ]
+    params = [scope, *kinds]
+    for column, value in (("log_type", log_type), ("state", state),
+                          ("namespace", namespace)):
+      if value is not None:
+        conditions.append(f"{column} = ?")
+        params.append(value)
+    for key, value in labels:
+      condition = ("EXISTS (SELECT 1 FROM labels WHERE labels.scope = "
+                   "resources.scope AND labels.kind = resources.kind AND "
+                   "labels.id = resources.id AND labels.key = ?")
+      params.append(key)
+      if value is not None:
+        condition += " AND labels.value = ?"
+        params.append(value)
+      conditions.append(condition + ")")
+    return self._connection.execute(
+        "SELECT * FROM resources WHERE " + " AND ".join(conditions) +
+        " ORDER BY kind, id", params).fetchall()
+
+  def _write(self, scope: str, record: Record, body: str,
+             body_hash: str) -> None:
+    """Inserts or replaces a resource and its labels.
+
+    Args:
+      scope (str): Scope of the resource.
+      record (Record): Resource.
+      body (str): Serialized API representation of the resource.
+      body_hash (str): Hash of the body.
+    """
+    self._connection.execute(
+        "INSERT OR REPLACE INTO resources VALUES "
+        "(?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+        (scope, record.kind, record.resource_id, record.parent_id,
+         record.display_name, record.log_type, record.state, record.namespace,
+         body, body_hash))
+    self._connection.execute(
+        "DELETE FROM labels WHERE scope = ? AND kind = ? AND id = ?",
+        (scope, record.kind, record.resource_id))
+    self._connection.executemany(
+        "INSERT INTO labels VALUES (?, ?, ?, ?, ?)",
+        [(scope, record.kind, record.resource_id, key, value)
+         for key, value in record.labels])
+
+  def _delete(self, scope: str, kind: str, resource_id: str) -> None:
+    """Deletes a resource and its labels.
+
+    Args:
+      scope (str): Scope of the resource.
+      kind (str): Kind of the resource.
+      resource_id (str): ID of the resource.
+    """
+    for table in ("resources", "labels"):
+      self._connection.execute(
+          f"DELETE FROM {table} WHERE scope = ? AND kind = ? AND id = ?",
+          (scope, kind, resource_id))
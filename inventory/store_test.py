@@ -0,0 +1,158 @@
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Unit tests for store.py."""
+
+import json
+import os
+import stat
+from typing import Any
+
+import pytest
+
+from inventory import store
+
+SCOPE = "US"
+
+
+def make_feed(resource_id: str, state: str = "ACTIVE") -> store.Record:
+  """Returns a feed record with a label."""
+  return store.Record(
+      kind=store.KIND_FEED,
+      resource_id=resource_id,
+      body={"name": f"feeds/{resource_id}", "feedState": state},
+      log_type="WORKSPACE_USERS",
+      state=state,
+      namespace="prod",
+      labels=[("team", resource_id)])
+
+
+@pytest.fixture(name="inventory")
+def fixture_inventory(tmp_path: Any) -> Any:
+  with store.InventoryStore(os.path.join(tmp_path, "dir",
+                                         "inventory.db")) as inventory:
+    yield inventory
+
+
+def test_database_readable_by_owner_only(
+    inventory: store.InventoryStore) -> None:
+  """Test that the database is created with 0600 permissions."""
+  assert stat.S_IMODE(os.stat(inventory.path).st_mode) == 0o600
+
+
+def test_sync_counts_changes(inventory: store.InventoryStore) -> None:
+  """Test that only added, changed and removed resources are counted."""
+  assert inventory.sync(SCOPE, store.KIND_FEED,
+                        [make_feed("1"), make_feed("2")]) == store.SyncCounts(
+                            added=2)
+
+  counts = inventory.sync(
+      SCOPE, store.KIND_FEED,
+      [make_feed("1"), make_feed("2", "INACTIVE"), make_feed("3")])
+
+  assert counts == store.SyncCounts(added=1, updated=1, removed=0, unchanged=1)
+  assert inventory.sync(SCOPE, store.KIND_FEED,
+                        [make_feed("3")]) == store.SyncCounts(
+                            removed=2, unchanged=1)
+  assert inventory.get_ids(SCOPE, store.KIND_FEED) == ["3"]
+  assert inventory.get_ids("EUROPE", store.KIND_FEED) == []
+
+
+def test_query_filters(inventory: store.InventoryStore) -> None:
+  """Test that filters are combined and match case insensitively."""
+  inventory.sync(SCOPE, store.KIND_FEED,
+                 [make_feed("1"), make_feed("2", "INACTIVE")])
+
+  rows = inventory.query(SCOPE, log_type="workspace_users", state="inactive")
+  assert [row["id"] for row in rows] == ["2"]
+  rows = inventory.query(SCOPE, labels=[("team", "1")], namespace="prod")
+  assert [row["id"] for row in rows] == ["1"]
+  assert len(inventory.query(SCOPE, labels=[("team", None)])) == 2
+  assert not inventory.query(SCOPE, kinds=[store.KIND_FORWARDER])
+
+
+def test_sync_replaces_labels(inventory: store.InventoryStore) -> None:
+  """Test that labels of an updated resource are replaced."""
+  inventory.sync(SCOPE, store.KIND_FEED, [make_feed("1")])
+  feed = make_feed("1")
+  feed.body["displayName"] = "Renamed"
+  feed.labels = [("owner", "me")]
+  inventory.sync(SCOPE, store.KIND_FEED, [feed])
+
+  assert not inventory.query(SCOPE, labels=[("team", None)])
+  assert len(inventory.query(SCOPE, labels=[("owner", "me")])) == 1
+
+
+def test_sync_of_parent_and_orphans(inventory: store.InventoryStore) -> None:
+  """Test that children are synced per parent and removed with it."""
+  inventory.sync(SCOPE, store.KIND_FORWARDER, [
+      store.Record(store.KIND_FORWARDER, "f1", {}),
+      store.Record(store.KIND_FORWARDER, "f2", {})
+  ])
+  for parent_id in ("f1", "f2"):
+    inventory.sync(
+        SCOPE,
+        store.KIND_COLLECTOR,
+        [store.Record(store.KIND_COLLECTOR, f"{parent_id}/c", {}, parent_id)],
+        parent_id=parent_id)
+  assert inventory.get_ids(SCOPE, store.KIND_COLLECTOR, "f1") == ["f1/c"]
+
+  inventory.sync(SCOPE, store.KIND_FORWARDER,
+                 [store.Record(store.KIND_FORWARDER, "f2", {})])
+
+  assert inventory.remove_orphans(SCOPE, store.KIND_COLLECTOR,
+                                  store.KIND_FORWARDER) == 1
+  assert inventory.get_ids(SCOPE, store.KIND_COLLECTOR) == ["f2/c"]
+
+
+def test_validators(inventory: store.InventoryStore) -> None:
+  """Test that validators of a response are sent as conditional headers."""
+  url = "https://backstory.googleapis.com/v1/feeds"
+  assert not inventory.get_validation_headers(SCOPE, url)
+
+  inventory.store_validators(SCOPE, url, {"ETag": '"abc"'})
+  assert inventory.get_validation_headers(SCOPE, url) == {
+      "If-None-Match": '"abc"'
+  }
+  assert not inventory.get_validation_headers("EUROPE", url)
+
+  inventory.store_validators(SCOPE, url, {})
+  assert not inventory.get_validation_headers(SCOPE, url)
+
+
+def test_get_scope(tmp_path: Any) -> None:
+  """Test that the scope tells apart service accounts and base URLs."""
+  credential_file = os.path.join(tmp_path, "credential.json")
+  with open(credential_file, "w") as file:
+    json.dump({"client_email": "cli@p.iam.gserviceaccount.com"}, file)
+
+  assert store.get_scope("us", None, credential_file) == (
+      "US (cli@p.iam.gserviceaccount.com)")
+  assert store.get_scope("US", "https://Test.com", credential_file) == (
+      "https://test.com (cli@p.iam.gserviceaccount.com)")
+  missing_file = os.path.join(tmp_path, "missing.json")
+  assert store.get_scope("US", None, missing_file).startswith("US (file:")
+  assert store.get_scope("US", None, missing_file) != store.get_scope(
+      "US", None, credential_file)
+
+
+def test_synced_at(inventory: store.InventoryStore) -> None:
+  """Test that the time of the last sync is recorded per kind."""
+  assert not inventory.get_synced_at(SCOPE)
+  inventory.sync(SCOPE, store.KIND_FEED, [])
+  inventory.mark_synced(SCOPE, store.KIND_CBN_PARSER)
+
+  assert set(inventory.get_synced_at(SCOPE)) == {
+      store.KIND_FEED, store.KIND_CBN_PARSER
+  }
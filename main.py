@@ -16,39 +16,125 @@
 
 import os
 import subprocess
+from typing import Optional
 
 import click
 from click._compat import WIN
 
-from common import chronicle_auth
-from feeds.feeds import feeds
-from forwarders.forwarders import forwarders
-from parsers.parsers import parsers
-from tools.bigquery import bigquery
+from common import http_client
+from common import lazy_group
+from common import metrics
+from common import profiling
+from common import retry
+from common.constants import path_constants
 
 
 @click.group(
     name="cli",
+    cls=lazy_group.LazyGroup,
+    lazy_subcommands={
+        "batch": "batch.batch.batch",
+        "bigquery": "tools.bigquery.bigquery",
+        "feeds": "feeds.feeds.feeds",
+        "forwarders": "forwarders.forwarders.forwarders",
+        "inventory": "inventory.inventory.inventory",
+        "parsers": "parsers.parsers.parsers",
+        "shell": "shell.shell.shell",
+    },
     context_settings=dict(help_option_names=["-h", "--help"]),
     help="Chronicle CLI is a CLI tool for managing Chronicle user workflows for e.g. Feed Management workflows."
 )
-def cli() -> None:
-  """Chronicle CLI commands."""
-  if not os.path.exists(chronicle_auth.CHRONICLE_CLI_ROOT_DIR):
+@click.option(
+    "--pool-size",
+    type=click.IntRange(min=1),
+    default=http_client.DEFAULT_POOL_SIZE,
+    show_default=True,
+    help="Maximum number of pooled HTTP connections per host.")
+@click.option(
+    "--keep-alive/--no-keep-alive",
+    default=http_client.DEFAULT_KEEP_ALIVE,
+    show_default=True,
+    help="Reuse HTTP connections between API calls.")
+@click.option(
+    "--max-retries",
+    type=click.IntRange(min=0),
+    default=retry.DEFAULT_MAX_RETRIES,
+    show_default=True,
+    help="Maximum number of retries of a failed API call.")
+@click.option(
+    "--rate-limit",
+    type=click.FloatRange(min=0),
+    default=retry.DEFAULT_RATE_LIMIT,
+    show_default=True,
+    help="Maximum API calls per second per host. 0 disables rate limiting.")
+@click.option(
+    "--profile",
+    type=click.Path(dir_okay=False),
+    metavar="PATH",
+    help="Write a cProfile dump to PATH.prof and a Chrome trace of HTTP "
+    "requests and rendering phases to PATH.trace.json.")
+@click.option(
+    "--metrics-file",
+    type=click.Path(dir_okay=False),
+    metavar="PATH",
+    help="Write request counts, retries, bytes transferred, latency "
+    "histograms per endpoint and peak memory to PATH in the OpenMetrics text "
+    "format.")
+def cli(pool_size: int, keep_alive: bool, max_retries: int, rate_limit: float,
+        profile: Optional[str], metrics_file: Optional[str]) -> None:
+  """Chronicle CLI commands.
+
+  Args:
+    pool_size (int): Maximum number of pooled HTTP connections per host.
+    keep_alive (bool): Option for reusing HTTP connections between API calls.
+    max_retries (int): Maximum number of retries of a failed API call.
+    rate_limit (float): Maximum API calls per second per host.
+    profile (str): Path prefix of the profiling output files.
+    metrics_file (str): Path of the metrics file.
+  """
+  if profile:
+    profiling.start(profile)
+    click.get_current_context().call_on_close(_stop_profiling)
+  if metrics_file:
+    metrics.start()
+    click.get_current_context().call_on_close(
+        lambda: _stop_metrics(metrics_file))
+  http_client.configure(
+      pool_size=pool_size,
+      keep_alive=keep_alive,
+      max_retries=max_retries,
+      rate_limit=rate_limit)
+  if not os.path.exists(path_constants.CHRONICLE_CLI_ROOT_DIR):
     click.echo(
         "'~/.chronicle_cli' directory is not present.\nCreating directory...")
-    os.mkdir(chronicle_auth.CHRONICLE_CLI_ROOT_DIR)
+    os.mkdir(path_constants.CHRONICLE_CLI_ROOT_DIR)
     if WIN:
-      subprocess.call(["attrib", "+H", chronicle_auth.CHRONICLE_CLI_ROOT_DIR])
+      subprocess.call(
+          ["attrib", "+H", path_constants.CHRONICLE_CLI_ROOT_DIR])
     click.echo(
-        f"Directory '{chronicle_auth.CHRONICLE_CLI_ROOT_DIR}' created successfully."
+        f"Directory '{path_constants.CHRONICLE_CLI_ROOT_DIR}' created successfully."
     )
 
 
-cli.add_command(feeds)
-cli.add_command(forwarders)
-cli.add_command(parsers)
-cli.add_command(bigquery)
+def _stop_profiling() -> None:
+  """Stops profiling and reports where the output files were written."""
+  paths = profiling.stop()
+  if paths:
+    click.echo(f"Profile written to {paths[0]}", err=True)
+    click.echo(f"Trace written to {paths[1]}", err=True)
+
+
+def _stop_metrics(metrics_file: str) -> None:
+  """Stops collecting metrics and writes them, reporting a failed write.
+
+  Args:
+    metrics_file (str): Path of the metrics file.
+  """
+  try:
+    metrics.stop(metrics_file)
+  except OSError as e:
+    click.echo(f"Failed to write metrics: {e}", err=True)
+
 
 if __name__ == "__main__":
   cli()
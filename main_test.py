@@ -13,11 +13,41 @@
 # limitations under the License.
 #
 """Unit tests for main.py."""
+import json
+import os
+import subprocess
+import sys
+
 from click.testing import CliRunner
 from main import cli
 
 runner = CliRunner()
 
+# Budget for importing the CLI and resolving a single command, in seconds.
+IMPORT_TIME_BUDGET_SECS = 1.5
+COMMAND_PACKAGES = ("batch", "feeds", "forwarders", "inventory", "parsers",
+                    "tools")
+
+
+def run_in_fresh_interpreter(script: str) -> dict:
+  """Runs the script in a new interpreter and returns its JSON output.
+
+  The test session has already imported every module, so import behaviour
+  can only be observed from a separate process.
+
+  Args:
+    script (str): Python code printing a JSON document as its last line.
+
+  Returns:
+    dict: Parsed JSON output of the script.
+  """
+  output = subprocess.run([sys.executable, "-c", script],
+                          cwd=os.path.dirname(os.path.abspath(__file__)),
+                          check=True,
+                          capture_output=True,
+                          text=True).stdout
+  return json.loads(output.splitlines()[-1])
+
 
 def test_main() -> None:
   """Test case for main."""
@@ -28,11 +58,61 @@ def test_main() -> None:
   Feed Management workflows.
 
 Options:
-  -h, --help  Show this message and exit.
+  --pool-size INTEGER RANGE       Maximum number of pooled HTTP connections per
+                                  host.  [default: 10; x>=1]
+  --keep-alive / --no-keep-alive  Reuse HTTP connections between API calls.
+                                  [default: keep-alive]
+  --max-retries INTEGER RANGE     Maximum number of retries of a failed API
+                                  call.  [default: 5; x>=0]
+  --rate-limit FLOAT RANGE        Maximum API calls per second per host. 0
+                                  disables rate limiting.  [default: 20.0; x>=0]
+  --profile PATH                  Write a cProfile dump to PATH.prof and a
+                                  Chrome trace of HTTP requests and rendering
+                                  phases to PATH.trace.json.
+  --metrics-file PATH             Write request counts, retries, bytes
+                                  transferred, latency histograms per endpoint
+                                  and peak memory to PATH in the OpenMetrics
+                                  text format.
+  -h, --help                      Show this message and exit.
 
 Commands:
+  batch       Run bulk operations from a manifest
   bigquery    Manage Big Query export
   feeds       Feed Management Workflows
   forwarders  Forwarder Management Workflows
+  inventory   Mirror and query tenant resources locally
   parsers     Manage config based parsers
+  shell       Run commands interactively in one process
 """ == result.output
+
+
+def test_help_imports_no_command_modules() -> None:
+  """Test that listing the command groups imports no command modules."""
+  result = run_in_fresh_interpreter(
+      "import json, sys\n"
+      "from click.testing import CliRunner\n"
+      "import main\n"
+      "CliRunner().invoke(main.cli, ['--help'])\n"
+      "print(json.dumps(sorted(sys.modules)))")
+  assert not [module for module in result if ".commands." in module]
+  assert "yaml" not in result
+  assert "google.auth" not in result
+
+
+def test_single_command_import_time() -> None:
+  """Test that resolving one command stays within the import time budget."""
+  result = run_in_fresh_interpreter(
+      "import json, sys, time\n"
+      "start = time.perf_counter()\n"
+      "import main\n"
+      "main.cli.get_command(None, 'feeds').get_command(None, 'get')\n"
+      "elapsed = time.perf_counter() - start\n"
+      "print(json.dumps({'elapsed': elapsed, 'modules': sorted(sys.modules)}))")
+  command_modules = [
+      module for module in result["modules"]
+      if module.startswith(COMMAND_PACKAGES) and ".commands." in module
+  ]
+  assert command_modules == ["feeds.commands.get"]
+  assert result["elapsed"] < IMPORT_TIME_BUDGET_SECS, (
+      f"Importing a single command took {result['elapsed']:.2f}s, over the "
+      f"{IMPORT_TIME_BUDGET_SECS}s budget.")
@@ -14,6 +14,8 @@
 #
 """Utility classes or functions for tests."""
 
+from typing import Dict, Iterator, Optional
+
 
 class MockResponse:
   """Mock response.
@@ -21,8 +23,28 @@ class MockResponse:
   Attributes:
     status_code: Response status code
     text: Response content
+    content: Response content as bytes
+    headers: Response headers
   """
 
-  def __init__(self, status_code: int, text: str):
+  def __init__(self,
+               status_code: int,
+               text: str,
+               headers: Optional[Dict[str, str]] = None):
     self.status_code = status_code
     self.text = text
+    self.headers = headers or {}
+
+  @property
+  def content(self) -> bytes:
+    """Response content as bytes."""
+    return self.text.encode("utf-8")
+
+  def iter_content(self, chunk_size: int = 1) -> Iterator[bytes]:
+    """Response content as chunks of bytes."""
+    content = self.content
+    for start in range(0, len(content), chunk_size):
+      yield content[start:start + chunk_size]
+
+  def close(self) -> None:
+    """Releases the connection of the response."""
@@ -67,7 +67,7 @@ def archive(credential_file: AnyStr, verbose: bool, region: str,
   response = client.request(
       method, archive_parser_url, timeout=url.HTTP_REQUEST_TIMEOUT_IN_SECS)
 
-  parsed_response = api_utility.check_content_type(response.text)
+  parsed_response = api_utility.check_content_type(response.content)
 
   if response.status_code != status.STATUS_OK:
     click.echo(
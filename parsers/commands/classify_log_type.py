@@ -118,7 +118,7 @@ def classify_log_type(
   response = client.request(
       method, classify_log_type_url,
       json=data, timeout=url.HTTP_REQUEST_TIMEOUT_IN_SECS)
-  parsed_response = api_utility.check_content_type(response.text)
+  parsed_response = api_utility.check_content_type(response.content)
 
   if response.status_code != status.STATUS_OK:
     click.echo(
@@ -107,7 +107,7 @@ def deactivate_parser(
   method = "POST"
   response = client.request(
       method, deactivate_parser_url, timeout=url.HTTP_REQUEST_TIMEOUT_IN_SECS)
-  parsed_response = api_utility.check_content_type(response.text)
+  parsed_response = api_utility.check_content_type(response.content)
 
   if response.status_code != status.STATUS_OK:
     click.echo(
@@ -71,7 +71,7 @@ def download(credential_file: AnyStr, verbose: bool, region: str,
     download_parser_url = f'{url.get_url(region, "list", env)}/{config_id}'
     response = http_client.request(
         method, download_parser_url, timeout=url.HTTP_REQUEST_TIMEOUT_IN_SECS)
-    download_parser_response = api_utility.check_content_type(response.text)
+    download_parser_response = api_utility.check_content_type(response.content)
   else:
     # Get the parser of `log_type` from list of parsers
     log_type = click.prompt("Enter Log Type", show_default=False, default="")
@@ -81,7 +81,7 @@ def download(credential_file: AnyStr, verbose: bool, region: str,
     download_parser_url = url.get_url(region, "list", env)
     response = http_client.request(
         method, download_parser_url, timeout=url.HTTP_REQUEST_TIMEOUT_IN_SECS)
-    download_parser_response = api_utility.check_content_type(response.text)
+    download_parser_response = api_utility.check_content_type(response.content)
     if key_constants.KEY_CBN_PARSER not in download_parser_response:
       click.echo("No CBN parsers currently configured.")
       return
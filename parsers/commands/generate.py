@@ -105,7 +105,7 @@ def call_get_sample_logs(credential_file: str, region: str, env: str,
   client = chronicle_auth.initialize_http_session(credential_file)
   response = client.request(
       'POST', get_sample_log_url, data, headers=url.HTTP_REQUEST_HEADERS)
-  sample_logs = api_utility.check_content_type(response.text)
+  sample_logs = api_utility.check_content_type(response.content)
   if response.status_code != status.STATUS_OK:
     click.echo(
         f'Error while fetching status for parser.\nResponse Code: {response.status_code}'
@@ -126,7 +126,7 @@ def get_extension(
   method = "GET"
   response = client.request(
       method, get_extension_url, timeout=url.HTTP_REQUEST_TIMEOUT_IN_SECS)
-  parsed_response = api_utility.check_content_type(response.text)
+  parsed_response = api_utility.check_content_type(response.content)
 
   if response.status_code != status.STATUS_OK:
     click.echo(
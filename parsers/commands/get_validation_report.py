@@ -21,6 +21,7 @@ from common import api_utility
 from common import chronicle_auth
 from common import exception_handler
 from common import options
+from common import paginator
 from common.constants import http_method
 from common.constants import key_constants as common_constants
 from common.constants import status
@@ -151,7 +152,7 @@ def get_validation_report(
       method,
       get_validation_report_url,
       timeout=url.HTTP_REQUEST_TIMEOUT_IN_SECS)
-  parsed_response = api_utility.check_content_type(response.text)
+  parsed_response = api_utility.check_content_type(response.content)
 
   if response.status_code != status.STATUS_OK:
     click.echo(
@@ -324,30 +325,32 @@ def list_parsing_errors(
 
   client = chronicle_auth.initialize_dataplane_http_session(credential_file)
   method = "GET"
-  response = client.request(method, list_parsing_errors_url,
-                            timeout=url.HTTP_REQUEST_TIMEOUT_IN_SECS)
-  parsed_response = api_utility.check_content_type(response.text)
-
-  if response.status_code != status.STATUS_OK:
-    raise ValueError(
-        f"Error while fetching parsing errors for {message}.\n"
-        f"Response Code: {response.status_code}\n"
-        f"Error: "
-        f"{parsed_response[common_constants.KEY_ERROR][common_constants.KEY_MESSAGE]}"
-    )
-
-  if parser_constants.KEY_PARSING_ERRORS not in parsed_response:
-    return "-"
+  # Joined once at the end, as repeated concatenation copies the text
+  # gathered so far for every error.
+  errors = []
+  for page in paginator.iter_pages(
+      client,
+      method,
+      list_parsing_errors_url,
+      parser_constants.KEY_PARSING_ERRORS,
+      timeout=url.HTTP_REQUEST_TIMEOUT_IN_SECS):
+    if page.status_code != status.STATUS_OK:
+      raise ValueError(
+          f"Error while fetching parsing errors for {message}.\n"
+          f"Response Code: {page.status_code}\n"
+          f"Error: "
+          f"{page.response[common_constants.KEY_ERROR][common_constants.KEY_MESSAGE]}"
+      )
 
-  errors = ""
-  for parsing_error in parsed_response[parser_constants.KEY_PARSING_ERRORS]:
-    log = parsing_error.get(parser_constants.KEY_LOG_DATA, "-")
-    error = parsing_error[parser_constants.KEY_ERROR]
-    errors += parser_templates.parsing_errors_details_template.substitute(
-        log=log,
-        error=error,
-    )
+    for parsing_error in page.items:
+      log = parsing_error.get(parser_constants.KEY_LOG_DATA, "-")
+      error = parsing_error[parser_constants.KEY_ERROR]
+      errors.append(
+          parser_templates.parsing_errors_details_template.substitute(
+              log=log,
+              error=error,
+          ))
   if not errors:
     return "-"
 
-  return errors
+  return "".join(errors)
@@ -24,6 +24,7 @@ from common import chronicle_auth
 from common import exception_handler
 from common import file_utility
 from common import options
+from common import report_renderer
 from common.constants import key_constants as common_constants
 from common.constants import status
 from parsers import parser_templates
@@ -83,7 +84,7 @@ def history(credential_file: AnyStr, verbose: bool, region: str, env: str,
       history_url,
       headers=url.HTTP_REQUEST_HEADERS,
       timeout=url.HTTP_REQUEST_TIMEOUT_IN_SECS)
-  parsed_response = api_utility.check_content_type(response.text)
+  parsed_response = api_utility.check_content_type(response.content)
 
   if response.status_code != status.STATUS_OK:
     click.echo(
@@ -96,34 +97,36 @@ def history(credential_file: AnyStr, verbose: bool, region: str, env: str,
     click.echo('No CBN parser currently configured.')
     return
 
-  parser_history_details = ''
-  for parser_history in parsed_response[parser_constants.KEY_CBN_PARSER]:
-    try:
-      del parser_history[parser_constants.KEY_CONFIG]
-      parser_history_details += parser_templates.parser_history_template.substitute(
-          config_id=f'{parser_history[parser_constants.KEY_CONFIG_ID]}',
-          log_type=f'{parser_history[common_constants.KEY_LOG_TYPE]}',
-          state=f'{parser_history[parser_constants.KEY_STATE]}',
-          sha256=f'{parser_history[parser_constants.KEY_SHA256]}',
-          author=f'{parser_history.get(parser_constants.KEY_AUTHOR, "-")}',
-          submit_time=f'{parser_history[parser_constants.KEY_SUBMIT_TIME]}',
-          last_live_time=get_last_live_time(parser_history),
-          state_last_changed_time=f'{parser_history[parser_constants.KEY_STATE_LAST_CHANGED_TIME]}',
-          validationErrors=get_validation_errors(parser_history))
-    except KeyError as e:
-      parser_history_details += f'\nKey {str(e)} not found in the response.'
-    except Exception as e:  # pylint: disable=broad-except
-      parser_history_details += f'\nFailed with exception: str({e})'
-    parser_history_details += f'\n\n{"=" * 60}\n'
-
-  click.echo(parser_history_details)
-
+  export_path = None
   if export:
     export_path = os.path.abspath(export) + f'.{file_format.lower()}'
+  txt_export_path = (
+      export_path if file_format != file_utility.FILE_FORMAT_JSON else None)
+
+  with report_renderer.ReportRenderer(txt_export_path) as renderer:
+    for parser_history in parsed_response[parser_constants.KEY_CBN_PARSER]:
+      try:
+        del parser_history[parser_constants.KEY_CONFIG]
+        parser_history_details = parser_templates.parser_history_template.substitute(
+            config_id=f'{parser_history[parser_constants.KEY_CONFIG_ID]}',
+            log_type=f'{parser_history[common_constants.KEY_LOG_TYPE]}',
+            state=f'{parser_history[parser_constants.KEY_STATE]}',
+            sha256=f'{parser_history[parser_constants.KEY_SHA256]}',
+            author=f'{parser_history.get(parser_constants.KEY_AUTHOR, "-")}',
+            submit_time=f'{parser_history[parser_constants.KEY_SUBMIT_TIME]}',
+            last_live_time=get_last_live_time(parser_history),
+            state_last_changed_time=f'{parser_history[parser_constants.KEY_STATE_LAST_CHANGED_TIME]}',
+            validationErrors=get_validation_errors(parser_history))
+      except KeyError as e:
+        parser_history_details = f'\nKey {str(e)} not found in the response.'
+      except Exception as e:  # pylint: disable=broad-except
+        parser_history_details = f'\nFailed with exception: str({e})'
+      renderer.write_record(parser_history_details)
+    renderer.end_block()
+
+  if export:
     if file_format == file_utility.FILE_FORMAT_JSON:
       file_utility.export_json(export_path, parsed_response)
-    else:
-      file_utility.export_txt(export_path, parser_history_details)
     click.echo(f'\nParser history exported successfully to: {export_path}')
 
   if verbose:
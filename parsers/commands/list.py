@@ -24,6 +24,7 @@ from common import chronicle_auth
 from common import exception_handler
 from common import file_utility
 from common import options
+from common import report_renderer
 from common.constants import key_constants as common_constants
 from common.constants import status
 from parsers import parser_templates
@@ -70,7 +71,7 @@ def list_command(credential_file: AnyStr, verbose: bool, region: str, env: str,
   method = "GET"
   response = client.request(
       method, list_parser_url, timeout=url.HTTP_REQUEST_TIMEOUT_IN_SECS)
-  parser_response = api_utility.check_content_type(response.text)
+  parser_response = api_utility.check_content_type(response.content)
 
   if response.status_code != status.STATUS_OK:
     click.echo(
@@ -83,34 +84,36 @@ def list_command(credential_file: AnyStr, verbose: bool, region: str, env: str,
     click.echo("No CBN parsers currently configured.")
     return
 
-  parser_details = ""
-  for parser in parser_response[parser_constants.KEY_CBN_PARSER]:
-    try:
-      del parser[parser_constants.KEY_CONFIG]
-      parser_details += parser_templates.parser_details_template.substitute(
-          config_id=f"{parser[parser_constants.KEY_CONFIG_ID]}",
-          log_type=f"{parser[common_constants.KEY_LOG_TYPE]}",
-          state=f"{parser[parser_constants.KEY_STATE]}",
-          sha256=f"{parser[parser_constants.KEY_SHA256]}",
-          author=f'{parser.get(parser_constants.KEY_AUTHOR, "-")}',
-          submit_time=f"{parser[parser_constants.KEY_SUBMIT_TIME]}",
-          last_live_time=f'{parser.get(parser_constants.KEY_LAST_LIVE_TIME, "-")}',
-          state_last_changed_time=f'{parser.get(parser_constants.KEY_STATE_LAST_CHANGED_TIME, "-")}',
-      )
-    except KeyError as e:
-      parser_details += f"\nKey {str(e)} not found in the response."
-    except Exception as e:  # pylint: disable=broad-except
-      parser_details += f"\nFailed with exception: str({e})"
-    parser_details += f'\n\n{"=" * 60}\n'
+  export_path = None
+  if export:
+    export_path = os.path.abspath(export) + f".{file_format.lower()}"
+  txt_export_path = (
+      export_path if file_format != file_utility.FILE_FORMAT_JSON else None)
 
-  click.echo(parser_details)
+  with report_renderer.ReportRenderer(txt_export_path) as renderer:
+    for parser in parser_response[parser_constants.KEY_CBN_PARSER]:
+      try:
+        del parser[parser_constants.KEY_CONFIG]
+        parser_details = parser_templates.parser_details_template.substitute(
+            config_id=f"{parser[parser_constants.KEY_CONFIG_ID]}",
+            log_type=f"{parser[common_constants.KEY_LOG_TYPE]}",
+            state=f"{parser[parser_constants.KEY_STATE]}",
+            sha256=f"{parser[parser_constants.KEY_SHA256]}",
+            author=f'{parser.get(parser_constants.KEY_AUTHOR, "-")}',
+            submit_time=f"{parser[parser_constants.KEY_SUBMIT_TIME]}",
+            last_live_time=f'{parser.get(parser_constants.KEY_LAST_LIVE_TIME, "-")}',
+            state_last_changed_time=f'{parser.get(parser_constants.KEY_STATE_LAST_CHANGED_TIME, "-")}',
+        )
+      except KeyError as e:
+        parser_details = f"\nKey {str(e)} not found in the response."
+      except Exception as e:  # pylint: disable=broad-except
+        parser_details = f"\nFailed with exception: str({e})"
+      renderer.write_record(parser_details)
+    renderer.end_block()
 
   if export:
-    export_path = os.path.abspath(export) + f".{file_format.lower()}"
     if file_format == file_utility.FILE_FORMAT_JSON:
       file_utility.export_json(export_path, parser_response)
-    else:
-      file_utility.export_txt(export_path, parser_details)
     click.echo(f"\nParser details exported successfully to: {export_path}")
 
   if verbose:
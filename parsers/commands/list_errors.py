@@ -24,6 +24,7 @@ from common import chronicle_auth
 from common import exception_handler
 from common import file_utility
 from common import options
+from common import report_renderer
 from common.constants import key_constants as common_constants
 from common.constants import status
 from parsers import parser_templates
@@ -117,7 +118,7 @@ def list_errors(credential_file: AnyStr, verbose: bool, region: str, env: str,
   method = "GET"
   response = client.request(
       method, list_errors_url, timeout=url.HTTP_REQUEST_TIMEOUT_IN_SECS)
-  list_errors_response = api_utility.check_content_type(response.text)
+  list_errors_response = api_utility.check_content_type(response.content)
 
   if response.status_code != status.STATUS_OK:
     click.echo(
@@ -130,27 +131,31 @@ def list_errors(credential_file: AnyStr, verbose: bool, region: str, env: str,
     click.echo("No errors found for the log type and time range provided.")
     return
 
-  errors_details = ""
-  for errors in list_errors_response.get(common_constants.KEY_ERRORS, []):
-    try:
-      errors_details += parser_templates.errors_details_template.substitute(
-          error_id=f"{errors[parser_constants.KEY_ERROR_ID]}",
-          config_id=f"{errors.get(parser_constants.KEY_CONFIG_ID, 'N/A')}",
-          log_type=f"{errors[common_constants.KEY_LOG_TYPE]}",
-          error_time=f"{errors[parser_constants.KEY_ERROR_TIME]}",
-          category=f"{errors[parser_constants.KEY_CATEGORY]}",
-          error_msg=f"{errors[parser_constants.KEY_ERROR_MESSAGE]}",
-          logs=get_formatted_error_logs(errors))
-    except KeyError as e:
-      errors_details += f"\nKey {str(e)} not found in the response."
-    except Exception as e:  # pylint: disable=broad-except
-      errors_details += f"\nFailed with exception: str({e})"
-    errors_details += f'\n\n{"=" * 60}\n'
-
-  click.echo(errors_details)
-
+  export_path = None
   if export:
     export_path = os.path.abspath(export) + f".{file_format.lower()}"
+  txt_export_path = (
+      export_path if file_format != file_utility.FILE_FORMAT_JSON else None)
+
+  with report_renderer.ReportRenderer(txt_export_path) as renderer:
+    for errors in list_errors_response.get(common_constants.KEY_ERRORS, []):
+      try:
+        errors_details = parser_templates.errors_details_template.substitute(
+            error_id=f"{errors[parser_constants.KEY_ERROR_ID]}",
+            config_id=f"{errors.get(parser_constants.KEY_CONFIG_ID, 'N/A')}",
+            log_type=f"{errors[common_constants.KEY_LOG_TYPE]}",
+            error_time=f"{errors[parser_constants.KEY_ERROR_TIME]}",
+            category=f"{errors[parser_constants.KEY_CATEGORY]}",
+            error_msg=f"{errors[parser_constants.KEY_ERROR_MESSAGE]}",
+            logs=get_formatted_error_logs(errors))
+      except KeyError as e:
+        errors_details = f"\nKey {str(e)} not found in the response."
+      except Exception as e:  # pylint: disable=broad-except
+        errors_details = f"\nFailed with exception: str({e})"
+      renderer.write_record(errors_details)
+    renderer.end_block()
+
+  if export:
     if file_format == file_utility.FILE_FORMAT_JSON:
       for index, error in enumerate(
           list_errors_response[common_constants.KEY_ERRORS]):
@@ -160,8 +165,6 @@ def list_errors(credential_file: AnyStr, verbose: bool, region: str, env: str,
         list_errors_response[common_constants.KEY_ERRORS][index][
             parser_constants.KEY_LOGS] = decode_logs
       file_utility.export_json(export_path, list_errors_response)
-    else:
-      file_utility.export_txt(export_path, errors_details)
     click.echo(
         f"\nParser Errors details exported successfully to: {export_path}")
 
@@ -14,7 +14,9 @@
 #
 """List all parser extensions for a given customer."""
 
+import itertools
 import os
+from typing import Optional
 
 import click
 
@@ -23,6 +25,8 @@ from common import chronicle_auth
 from common import exception_handler
 from common import file_utility
 from common import options
+from common import paginator
+from common import report_renderer
 from common.constants import key_constants as common_constants
 from common.constants import status
 from parsers import parser_templates as templates
@@ -42,6 +46,8 @@ from parsers.constants import key_constants as parser_constants
 @click.argument("project_id", required=True, default="")
 @click.argument("customer_id", required=True, default="")
 @click.argument("log_type", required=True, default="-")
+@options.page_size_option
+@options.max_items_option
 @options.export_option
 @options.env_option
 @options.region_option
@@ -59,7 +65,9 @@ def list_extensions(
     project_id: str,
     customer_id: str,
     log_type: str,
-    file_format: str) -> None:
+    file_format: str,
+    page_size: int,
+    max_items: Optional[int]) -> None:
   """List all parser extensions for a given customer.
 
   Args:
@@ -74,6 +82,8 @@ def list_extensions(
     customer_id (str): The Customer ID.
     log_type (str): The Log Type.
     file_format (str): Format of the content to be exported.
+    page_size (int): Number of parser extensions fetched per API request.
+    max_items (int): Maximum number of parser extensions to list. All if None.
 
   Raises:
     OSError: Failed to read the given file, e.g. not found, no read access
@@ -109,102 +119,130 @@ def list_extensions(
       "list_extensions",
       env,
       resources,
-      page_size=1000)
+      page_size=page_size)
   client = chronicle_auth.initialize_dataplane_http_session(credential_file)
   method = "GET"
-  response = client.request(
-      method, list_extensions_url, timeout=url.HTTP_REQUEST_TIMEOUT_IN_SECS)
-  parsed_response = api_utility.check_content_type(response.text)
-
-  if response.status_code != status.STATUS_OK:
-    click.echo(
-        f"Error while fetching list of Parser Extensions.\n"
-        f"Response Code: {response.status_code}\n"
-        f"Error: "
-        f"{parsed_response[common_constants.KEY_ERROR][common_constants.KEY_MESSAGE]}"
-    )
+  pages = paginator.iter_pages(
+      client,
+      method,
+      list_extensions_url,
+      parser_constants.KEY_PARSER_EXTENSIONS,
+      max_items=max_items,
+      timeout=url.HTTP_REQUEST_TIMEOUT_IN_SECS)
+  first_page = next(pages)
+
+  if first_page.status_code != status.STATUS_OK:
+    print_list_error(first_page)
     return
 
-  if parser_constants.KEY_PARSER_EXTENSIONS not in parsed_response:
+  if parser_constants.KEY_PARSER_EXTENSIONS not in first_page.response:
     click.echo("No Parser Extensions currently configured.")
     return
 
-  parserextension_details = ""
+  export_path = None
+  if export:
+    export_path = os.path.abspath(export) + f".{file_format.lower()}"
+  txt_export_path = (
+      export_path if file_format != file_utility.FILE_FORMAT_JSON else None)
+
   parserextension_details_json = []
-  for extension in parsed_response[parser_constants.KEY_PARSER_EXTENSIONS]:
-    try:
-      # Remove unwanted details
-      extension.pop(parser_constants.KEY_CBN_SNIPPET, None)
-      extension.pop(parser_constants.KEY_FIELD_EXTRACTORS, None)
-      extension.pop(parser_constants.KEY_LOG, None)
-      extension.pop(parser_constants.KEY_EXTENSION_VALIDATION_REPORT, None)
-
-      # Get components from the resource name
-      resource_components = parser_utility.process_resource_name(
-          extension[parser_constants.KEY_NAME])
-
-      validation_report_id = "-"
-      if parser_constants.KEY_VALIDATION_REPORT in extension:
-        # Get components from the validation resource
-        validation_components = parser_utility.process_resource_name(
-            extension[parser_constants.KEY_VALIDATION_REPORT])
-        validation_report_id = (
-            f"{validation_components[parser_constants.KEY_VALIDATION_REPORTS]}")
-
-      # Get Parser Extension details
-      parserextension_id = (
-          f"{resource_components[parser_constants.KEY_PARSER_EXTENSIONS]}")
-      log_type = f"{resource_components[parser_constants.KEY_LOGTYPES]}"
-      state = f"{extension[parser_constants.KEY_STATE]}"
-      author = f"{extension.get(parser_constants.KEY_AUTHOR, '-')}"
-      create_time = f"{extension.get(parser_constants.KEY_CREATE_TIME, '-')}"
-      state_last_changed_time = (
-          f"{extension.get(parser_constants.KEY_STATE_LAST_CHANGED_TIME, '-')}")
-      last_live_time = (
-          f"{extension.get(parser_constants.KEY_LAST_LIVE_TIME, '-')}")
-
-      # Populate the extension details
-      parserextension_template = templates.parserextension_details_template
-      parserextension_details += parserextension_template.substitute(
-          parserextension_id=parserextension_id,
-          log_type=log_type,
-          state=state,
-          author=author,
-          validation_report_id=validation_report_id,
-          create_time=create_time,
-          state_last_changed_time=state_last_changed_time,
-          last_live_time=last_live_time
-      )
-
-      # Popluate the extension details in JSON for export if needed
-      parserextension_details_json.append({
-          parser_constants.KEY_PARSER_EXTENSION_ID: parserextension_id,
-          parser_constants.KEY_LOGTYPE: log_type,
-          parser_constants.KEY_STATE: state,
-          parser_constants.KEY_AUTHOR: author,
-          parser_constants.KEY_VALIDATION_REPORT_ID: validation_report_id,
-          parser_constants.KEY_CREATE_TIME: create_time,
-          parser_constants.KEY_STATE_LAST_CHANGED_TIME: state_last_changed_time,
-          parser_constants.KEY_LAST_LIVE_TIME: last_live_time
-      })
-    except KeyError as e:
-      parserextension_details += f"\nKey {str(e)} not found in the response."
-    except Exception as e:  # pylint: disable=broad-except
-      parserextension_details += f"\nFailed with exception: {str(e)}"
-    parserextension_details += f'\n\n{"=" * 60}\n'
-
-  click.echo(parserextension_details)
+  verbose_pages = []
+  with report_renderer.ReportRenderer(txt_export_path) as renderer:
+    for page in itertools.chain([first_page], pages):
+      if verbose:
+        verbose_pages.append(page)
+      if page.status_code != status.STATUS_OK:
+        print_list_error(page)
+        break
+
+      for extension in page.items:
+        try:
+          # Remove unwanted details
+          extension.pop(parser_constants.KEY_CBN_SNIPPET, None)
+          extension.pop(parser_constants.KEY_FIELD_EXTRACTORS, None)
+          extension.pop(parser_constants.KEY_LOG, None)
+          extension.pop(parser_constants.KEY_EXTENSION_VALIDATION_REPORT, None)
+
+          # Get components from the resource name
+          resource_components = parser_utility.process_resource_name(
+              extension[parser_constants.KEY_NAME])
+
+          validation_report_id = "-"
+          if parser_constants.KEY_VALIDATION_REPORT in extension:
+            # Get components from the validation resource
+            validation_components = parser_utility.process_resource_name(
+                extension[parser_constants.KEY_VALIDATION_REPORT])
+            validation_report_id = validation_components[
+                parser_constants.KEY_VALIDATION_REPORTS]
+
+          # Get Parser Extension details
+          parserextension_id = (
+              f"{resource_components[parser_constants.KEY_PARSER_EXTENSIONS]}")
+          log_type = f"{resource_components[parser_constants.KEY_LOGTYPES]}"
+          state = f"{extension[parser_constants.KEY_STATE]}"
+          author = f"{extension.get(parser_constants.KEY_AUTHOR, '-')}"
+          create_time = (
+              f"{extension.get(parser_constants.KEY_CREATE_TIME, '-')}")
+          state_last_changed_time = str(
+              extension.get(parser_constants.KEY_STATE_LAST_CHANGED_TIME, "-"))
+          last_live_time = (
+              f"{extension.get(parser_constants.KEY_LAST_LIVE_TIME, '-')}")
+
+          # Populate the extension details
+          parserextension_template = templates.parserextension_details_template
+          parserextension_details = parserextension_template.substitute(
+              parserextension_id=parserextension_id,
+              log_type=log_type,
+              state=state,
+              author=author,
+              validation_report_id=validation_report_id,
+              create_time=create_time,
+              state_last_changed_time=state_last_changed_time,
+              last_live_time=last_live_time
+          )
+
+          # Popluate the extension details in JSON for export if needed
+          parserextension_details_json.append({
+              parser_constants.KEY_PARSER_EXTENSION_ID: parserextension_id,
+              parser_constants.KEY_LOGTYPE: log_type,
+              parser_constants.KEY_STATE: state,
+              parser_constants.KEY_AUTHOR: author,
+              parser_constants.KEY_VALIDATION_REPORT_ID: validation_report_id,
+              parser_constants.KEY_CREATE_TIME: create_time,
+              parser_constants.KEY_STATE_LAST_CHANGED_TIME:
+                  state_last_changed_time,
+              parser_constants.KEY_LAST_LIVE_TIME: last_live_time
+          })
+        except KeyError as e:
+          parserextension_details = f"\nKey {str(e)} not found in the response."
+        except Exception as e:  # pylint: disable=broad-except
+          parserextension_details = f"\nFailed with exception: {str(e)}"
+        renderer.write_record(parserextension_details)
+
+      # Each page is printed while the next one is being fetched.
+      renderer.end_block()
 
   if export:
-    export_path = os.path.abspath(export) + f".{file_format.lower()}"
     if file_format == file_utility.FILE_FORMAT_JSON:
       file_utility.export_json(
           export_path, {"parserExtensions": parserextension_details_json})
-    else:
-      file_utility.export_txt(export_path, parserextension_details)
     click.echo(f"\nParser Extensions' details exported successfully to: "
                f"{export_path}")
 
   if verbose:
-    api_utility.print_request_details(
-        list_extensions_url, method, None, parsed_response)
+    for page in verbose_pages:
+      api_utility.print_request_details(page.url, method, None, page.response)
+
+
+def print_list_error(page: paginator.Page) -> None:
+  """Prints the error of a failed list parser extensions request.
+
+  Args:
+    page (paginator.Page): Page with non-OK status code.
+  """
+  click.echo(
+      f"Error while fetching list of Parser Extensions.\n"
+      f"Response Code: {page.status_code}\n"
+      f"Error: "
+      f"{page.response[common_constants.KEY_ERROR][common_constants.KEY_MESSAGE]}"
+  )
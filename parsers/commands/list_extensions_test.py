@@ -14,6 +14,7 @@
 #
 """Tests for list_extensions.py."""
 
+import json
 import os
 from unittest import mock
 
@@ -22,6 +23,7 @@ from click import testing
 
 from google3.third_party.chronicle.cli import mock_test_utility
 from common import file_utility
+from common import paginator
 from parsers import url
 from parsers.commands import list_extensions
 from parsers.tests import fixtures
@@ -80,6 +82,55 @@ ParserExtension Details:
       "GET", LIST_URL, timeout=url.HTTP_REQUEST_TIMEOUT_IN_SECS)
 
 
+@mock.patch(
+    "common.chronicle_auth.initialize_dataplane_http_session"
+)
+@mock.patch("parsers.url.get_dataplane_url")
+def test_list_extensions_pages(
+    mock_get_dataplane_url: mock.MagicMock,
+    mock_http_session: mock.MagicMock,
+    test_data_list_extensions: mock_test_utility.MockResponse) -> None:
+  """Test case to check list ParserExtensions follows pages up to --max-items.
+
+  Args:
+    mock_get_dataplane_url (mock.MagicMock): Mock object
+    mock_http_session (mock.MagicMock): Mock object
+    test_data_list_extensions (mock_test_utility.MockResponse): Test input data
+  """
+  extension = json.loads(
+      test_data_list_extensions.text)["parserExtensions"][0]
+  mock_get_dataplane_url.return_value = LIST_URL
+  client = mock.Mock()
+  client.request.side_effect = [
+      mock_test_utility.MockResponse(
+          status_code=200,
+          text=json.dumps({
+              "parserExtensions": [extension, extension],
+              "nextPageToken": "token2"
+          })),
+      mock_test_utility.MockResponse(
+          status_code=200,
+          text=json.dumps({
+              "parserExtensions": [extension, extension],
+              "nextPageToken": "token3"
+          })),
+  ]
+  mock_http_session.return_value = client
+  result = runner.invoke(list_extensions.list_extensions, [
+      "test_project", "test_instance", "test_log_type",
+      "--v2", "--env", "PROD", "--region", "US",
+      "--page-size", "2", "--max-items", "3"])
+  assert result.output.count(
+      "ParserExtension ID: test_parserextension_id") == 3
+  mock_get_dataplane_url.assert_called_once_with(
+      "US", "list_extensions", "prod", RESOURCES, page_size=2)
+  assert client.request.call_args_list == [
+      mock.call("GET", LIST_URL, timeout=url.HTTP_REQUEST_TIMEOUT_IN_SECS),
+      mock.call("GET", paginator.add_page_token(LIST_URL, "token2"),
+                timeout=url.HTTP_REQUEST_TIMEOUT_IN_SECS),
+  ]
+
+
 @mock.patch(
     "common.chronicle_auth.initialize_dataplane_http_session"
 )
@@ -14,8 +14,9 @@
 #
 """List all parsers for a given customer."""
 
+import itertools
 import os
-from typing import Dict
+from typing import Dict, Optional
 
 import click
 
@@ -24,6 +25,8 @@ from common import chronicle_auth
 from common import exception_handler
 from common import file_utility
 from common import options
+from common import paginator
+from common import report_renderer
 from common.constants import key_constants as common_constants
 from common.constants import status
 from parsers import parser_templates
@@ -64,6 +67,8 @@ TYPE_LIST = [ALL_TYPE, "CUSTOM", "PREBUILT"]
 @click.argument("project_id", required=True, default="")
 @click.argument("customer_id", required=True, default="")
 @click.argument("log_type", required=True, default="-")
+@options.page_size_option
+@options.max_items_option
 @options.export_option
 @options.env_option
 @options.region_option
@@ -83,7 +88,9 @@ def list_parsers(
     log_type: str,
     state: str,
     parser_type: str,
-    file_format: str) -> None:
+    file_format: str,
+    page_size: int,
+    max_items: Optional[int]) -> None:
   """List all parsers of a given customer.
 
   Args:
@@ -103,6 +110,8 @@ def list_parsers(
       CUSTOM, PREBUILT.
     file_format (str): Options for selecting the format of the content to be
       exported. Availabel options - TXT, JSON.
+    page_size (int): Number of parsers fetched per API request.
+    max_items (int): Maximum number of parsers to list. All if None.
 
   Raises:
     OSError: Failed to read the given file, e.g. not found, no read access
@@ -146,99 +155,126 @@ def list_parsers(
       env,
       resources,
       filter=construct_filter(filter_options),
-      page_size=1000)
+      page_size=page_size)
   client = chronicle_auth.initialize_dataplane_http_session(credential_file)
   method = "GET"
-  response = client.request(
-      method, list_parser_url, timeout=url.HTTP_REQUEST_TIMEOUT_IN_SECS)
-  parsed_response = api_utility.check_content_type(response.text)
-
-  if response.status_code != status.STATUS_OK:
-    click.echo(
-        f"Error while fetching list of parsers.\n"
-        f"Response Code: {response.status_code}\n"
-        f"Error: "
-        f"{parsed_response[common_constants.KEY_ERROR][common_constants.KEY_MESSAGE]}"
-    )
+  pages = paginator.iter_pages(
+      client,
+      method,
+      list_parser_url,
+      parser_constants.KEY_PARSERS,
+      max_items=max_items,
+      timeout=url.HTTP_REQUEST_TIMEOUT_IN_SECS)
+  first_page = next(pages)
+
+  if first_page.status_code != status.STATUS_OK:
+    print_list_error(first_page)
     return
 
-  if parser_constants.KEY_PARSERS not in parsed_response:
+  if parser_constants.KEY_PARSERS not in first_page.response:
     click.echo("No Parsers currently configured.")
     return
 
-  parser_details = ""
+  export_path = None
+  if export:
+    export_path = os.path.abspath(export) + f".{file_format.lower()}"
+  txt_export_path = (
+      export_path if file_format != file_utility.FILE_FORMAT_JSON else None)
+
   parser_details_json = []
-  for parser in parsed_response[parser_constants.KEY_PARSERS]:
-    try:
-      # Remove unwanted details
-      parser.pop(parser_constants.KEY_CBN, None)
-      parser.pop(parser_constants.KEY_CHANGELOGS, None)
-      parser.pop(parser_constants.KEY_LOW_CODE, None)
-
-      # Get components from the resource name
-      resource_components = parser_utility.process_resource_name(
-          parser[parser_constants.KEY_NAME])
-
-      validation_report_id = "-"
-      if parser_constants.KEY_VALIDATION_REPORT in parser:
-        # Get components from the validation resource
-        validation_components = parser_utility.process_resource_name(
-            parser[parser_constants.KEY_VALIDATION_REPORT])
-        validation_report_id = (
-            f"{validation_components[parser_constants.KEY_VALIDATION_REPORTS]}")
-
-      # Get Parser details
-      parser_id = f"{resource_components[parser_constants.KEY_PARSERS]}"
-      log_type = f"{resource_components[parser_constants.KEY_LOGTYPES]}"
-      state = f"{parser[parser_constants.KEY_STATE]}"
-      parser_type = f"{parser[parser_constants.KEY_TYPE]}"
-      create_time = f"{parser.get(parser_constants.KEY_CREATE_TIME, '-')}"
-      # Get author name
-      creator = parser[parser_constants.KEY_CREATOR]
-      author = "-"
-      if parser_constants.KEY_AUTHOR in creator:
-        author = f"{creator[parser_constants.KEY_AUTHOR]}"
-
-      # Populate the parser details
-      parser_details += parser_templates.parserv2_details_template.substitute(
-          parser_id=parser_id,
-          log_type=log_type,
-          state=state,
-          type=parser_type,
-          author=author,
-          validation_report_id=validation_report_id,
-          create_time=create_time,
-      )
-
-      # Populate the parser details in JSON for export if needed
-      parser_details_json.append({
-          parser_constants.KEY_PARSER_ID: parser_id,
-          parser_constants.KEY_LOGTYPE: log_type,
-          parser_constants.KEY_STATE: state,
-          parser_constants.KEY_TYPE: parser_type,
-          parser_constants.KEY_AUTHOR: author,
-          parser_constants.KEY_VALIDATION_REPORT_ID: validation_report_id,
-          parser_constants.KEY_CREATE_TIME: create_time,
-      })
-    except KeyError as e:
-      parser_details += f"\nKey {str(e)} not found in the response."
-    except Exception as e:  # pylint: disable=broad-except
-      parser_details += f"\nFailed with exception: {str(e)}"
-    parser_details += f'\n\n{"=" * 60}\n'
-
-  click.echo(parser_details)
+  verbose_pages = []
+  with report_renderer.ReportRenderer(txt_export_path) as renderer:
+    for page in itertools.chain([first_page], pages):
+      if verbose:
+        verbose_pages.append(page)
+      if page.status_code != status.STATUS_OK:
+        print_list_error(page)
+        break
+
+      for parser in page.items:
+        try:
+          # Remove unwanted details
+          parser.pop(parser_constants.KEY_CBN, None)
+          parser.pop(parser_constants.KEY_CHANGELOGS, None)
+          parser.pop(parser_constants.KEY_LOW_CODE, None)
+
+          # Get components from the resource name
+          resource_components = parser_utility.process_resource_name(
+              parser[parser_constants.KEY_NAME])
+
+          validation_report_id = "-"
+          if parser_constants.KEY_VALIDATION_REPORT in parser:
+            # Get components from the validation resource
+            validation_components = parser_utility.process_resource_name(
+                parser[parser_constants.KEY_VALIDATION_REPORT])
+            validation_report_id = validation_components[
+                parser_constants.KEY_VALIDATION_REPORTS]
+
+          # Get Parser details
+          parser_id = f"{resource_components[parser_constants.KEY_PARSERS]}"
+          log_type = f"{resource_components[parser_constants.KEY_LOGTYPES]}"
+          state = f"{parser[parser_constants.KEY_STATE]}"
+          parser_type = f"{parser[parser_constants.KEY_TYPE]}"
+          create_time = f"{parser.get(parser_constants.KEY_CREATE_TIME, '-')}"
+          # Get author name
+          creator = parser[parser_constants.KEY_CREATOR]
+          author = "-"
+          if parser_constants.KEY_AUTHOR in creator:
+            author = f"{creator[parser_constants.KEY_AUTHOR]}"
+
+          # Populate the parser details
+          parser_template = parser_templates.parserv2_details_template
+          parser_details = parser_template.substitute(
+              parser_id=parser_id,
+              log_type=log_type,
+              state=state,
+              type=parser_type,
+              author=author,
+              validation_report_id=validation_report_id,
+              create_time=create_time,
+          )
+
+          # Populate the parser details in JSON for export if needed
+          parser_details_json.append({
+              parser_constants.KEY_PARSER_ID: parser_id,
+              parser_constants.KEY_LOGTYPE: log_type,
+              parser_constants.KEY_STATE: state,
+              parser_constants.KEY_TYPE: parser_type,
+              parser_constants.KEY_AUTHOR: author,
+              parser_constants.KEY_VALIDATION_REPORT_ID: validation_report_id,
+              parser_constants.KEY_CREATE_TIME: create_time,
+          })
+        except KeyError as e:
+          parser_details = f"\nKey {str(e)} not found in the response."
+        except Exception as e:  # pylint: disable=broad-except
+          parser_details = f"\nFailed with exception: {str(e)}"
+        renderer.write_record(parser_details)
+
+      # Each page is printed while the next one is being fetched.
+      renderer.end_block()
 
   if export:
-    export_path = os.path.abspath(export) + f".{file_format.lower()}"
     if file_format == file_utility.FILE_FORMAT_JSON:
       file_utility.export_json(export_path, {"parsers": parser_details_json})
-    else:
-      file_utility.export_txt(export_path, parser_details)
     click.echo(f"\nParser details exported successfully to: {export_path}")
 
   if verbose:
-    api_utility.print_request_details(
-        list_parser_url, method, None, parsed_response)
+    for page in verbose_pages:
+      api_utility.print_request_details(page.url, method, None, page.response)
+
+
+def print_list_error(page: paginator.Page) -> None:
+  """Prints the error of a failed list parsers request.
+
+  Args:
+    page (paginator.Page): Page with non-OK status code.
+  """
+  click.echo(
+      f"Error while fetching list of parsers.\n"
+      f"Response Code: {page.status_code}\n"
+      f"Error: "
+      f"{page.response[common_constants.KEY_ERROR][common_constants.KEY_MESSAGE]}"
+  )
 
 
 def construct_filter(filter_options: Dict[str, str]) -> str:
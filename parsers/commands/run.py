@@ -78,7 +78,7 @@ def run(credential_file: AnyStr, verbose: bool, region: str, env: str) -> None:
       data=data,
       headers=url.HTTP_REQUEST_HEADERS,
       timeout=url.HTTP_REQUEST_TIMEOUT_IN_SECS)
-  parser_response = api_utility.check_content_type(response.text)
+  parser_response = api_utility.check_content_type(response.content)
 
   if response.status_code != status.STATUS_OK:
     click.echo(
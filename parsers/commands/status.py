@@ -67,7 +67,7 @@ def status_command(credential_file: AnyStr, verbose: bool, region: str,
   client = chronicle_auth.initialize_http_session(credential_file)
   response = client.request(
       method, get_parser_status_url, timeout=url.HTTP_REQUEST_TIMEOUT_IN_SECS)
-  parser = api_utility.check_content_type(response.text)
+  parser = api_utility.check_content_type(response.content)
 
   if response.status_code != status.STATUS_OK:
     click.echo(
@@ -101,7 +101,7 @@ def submit(credential_file: AnyStr,
       request_body,
       headers=url.HTTP_REQUEST_HEADERS,
       timeout=url.HTTP_REQUEST_TIMEOUT_IN_SECS)
-  parser = api_utility.check_content_type(response.text)
+  parser = api_utility.check_content_type(response.content)
 
   if response.status_code != status.STATUS_OK:
     click.echo(
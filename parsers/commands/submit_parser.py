@@ -143,7 +143,7 @@ def submit_parser(
   client = chronicle_auth.initialize_dataplane_http_session(credential_file)
   response = client.request(method, submit_parser_url, json=parser,
                             timeout=url.HTTP_REQUEST_TIMEOUT_IN_SECS)
-  parsed_response = api_utility.check_content_type(response.text)
+  parsed_response = api_utility.check_content_type(response.content)
 
   if response.status_code != status.STATUS_OK:
     click.echo(
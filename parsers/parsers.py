@@ -16,54 +16,36 @@
 
 import click
 
-from parsers.commands import activate_parser
-from parsers.commands import archive
-from parsers.commands import classify_log_type
-from parsers.commands import deactivate_parser
-from parsers.commands import delete_extension
-from parsers.commands import delete_parser
-from parsers.commands import download
-from parsers.commands import generate
-from parsers.commands import get_extension
-from parsers.commands import get_parser
-from parsers.commands import get_validation_report
-from parsers.commands import history
-from parsers.commands import list  # pylint: disable=redefined-builtin
-from parsers.commands import list_errors
-from parsers.commands import list_extensions
-from parsers.commands import list_parsers
-from parsers.commands import run
-from parsers.commands import run_parser
-from parsers.commands import status
-from parsers.commands import submit
-from parsers.commands import submit_extension
-from parsers.commands import submit_parser
+from common import lazy_group
 
 
-@click.group(name="parsers", help="Manage config based parsers")
+@click.group(
+    name="parsers",
+    cls=lazy_group.LazyGroup,
+    lazy_subcommands={
+        "activate_parser": "parsers.commands.activate_parser.activate_parser",
+        "archive": "parsers.commands.archive.archive",
+        "classify_log_type": "parsers.commands.classify_log_type.classify_log_type",
+        "deactivate_parser": "parsers.commands.deactivate_parser.deactivate_parser",
+        "delete_extension": "parsers.commands.delete_extension.delete_extension",
+        "delete_parser": "parsers.commands.delete_parser.delete_parser",
+        "download": "parsers.commands.download.download",
+        "generate": "parsers.commands.generate.generate",
+        "get_extension": "parsers.commands.get_extension.get_extension",
+        "get_parser": "parsers.commands.get_parser.get_parser",
+        "get_validation_report": "parsers.commands.get_validation_report.get_validation_report",
+        "history": "parsers.commands.history.history",
+        "list": "parsers.commands.list.list_command",
+        "list_errors": "parsers.commands.list_errors.list_errors",
+        "list_extensions": "parsers.commands.list_extensions.list_extensions",
+        "list_parsers": "parsers.commands.list_parsers.list_parsers",
+        "run": "parsers.commands.run.run",
+        "run_parser": "parsers.commands.run_parser.run_parser",
+        "status": "parsers.commands.status.status_command",
+        "submit": "parsers.commands.submit.submit",
+        "submit_extension": "parsers.commands.submit_extension.submit_extension",
+        "submit_parser": "parsers.commands.submit_parser.submit_parser",
+    },
+    help="Manage config based parsers")
 def parsers() -> None:
   """Group of commands to interact with Parser APIs."""
-
-
-parsers.add_command(activate_parser.activate_parser)
-parsers.add_command(archive.archive)
-parsers.add_command(classify_log_type.classify_log_type)
-parsers.add_command(deactivate_parser.deactivate_parser)
-parsers.add_command(delete_extension.delete_extension)
-parsers.add_command(delete_parser.delete_parser)
-parsers.add_command(download.download)
-parsers.add_command(generate.generate)
-parsers.add_command(get_extension.get_extension)
-parsers.add_command(get_parser.get_parser)
-parsers.add_command(get_validation_report.get_validation_report)
-parsers.add_command(history.history)
-parsers.add_command(list.list_command)
-parsers.add_command(list_errors.list_errors)
-parsers.add_command(list_parsers.list_parsers)
-parsers.add_command(list_extensions.list_extensions)
-parsers.add_command(run.run)
-parsers.add_command(run_parser.run_parser)
-parsers.add_command(status.status_command)
-parsers.add_command(submit.submit)
-parsers.add_command(submit_extension.submit_extension)
-parsers.add_command(submit_parser.submit_parser)
@@ -24,6 +24,10 @@ setup(
     version='1.1',
     py_modules=['main'],
     install_requires=deps,
+    extras_require={
+        # Faster decoding of large API responses.
+        'fast': ['orjson'],
+    },
     entry_points="""
         [console_scripts]
         chronicle_cli=main:cli
@@ -0,0 +1,134 @@
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Interactive shell running CLI commands in one process."""
+
+import shlex
+import sys
+from typing import List
+
+import click
+
+from common import exception_handler
+from common.constants import path_constants
+
+try:
+  import readline  # pylint: disable=g-import-not-at-top
+except ImportError:  # Windows
+  readline = None
+
+PROMPT = "chronicle_cli> "
+EXIT_COMMANDS = frozenset(["exit", "quit"])
+HELP_COMMANDS = frozenset(["help", "?", "-h", "--help"])
+HISTORY_LENGTH = 1000
+
+
+@click.command(
+    name="shell",
+    short_help="Run commands interactively in one process",
+    help="Run commands interactively in one process. The API session, access "
+    "tokens and schemas are reused between commands.")
+@click.pass_context
+@exception_handler.catch_exception()
+def shell(ctx: click.Context) -> None:
+  """Reads command lines and runs them until exit, quit or end of input.
+
+  Commands run as if they were given to chronicle_cli, and share the global
+  options the shell was started with. Authorized sessions, access tokens and
+  loaded feed, forwarder and collector schemas are kept between commands.
+
+  Args:
+    ctx (click.Context): Click context of the shell command.
+  """
+  root_ctx = ctx.find_root()
+  interactive = sys.stdin.isatty()
+  if interactive:
+    load_history()
+  click.echo("Chronicle CLI shell. Type 'help' for the list of commands and "
+             "'exit' to quit.")
+  try:
+    while True:
+      try:
+        line = input(PROMPT)
+      except EOFError:
+        click.echo()
+        break
+      except KeyboardInterrupt:
+        click.echo()
+        continue
+      try:
+        args = shlex.split(line)
+      except ValueError as e:
+        click.echo(f"Invalid command line: {e}")
+        continue
+      if not args:
+        continue
+      if args[0] in EXIT_COMMANDS:
+        break
+      if args[0] in HELP_COMMANDS:
+        click.echo(root_ctx.get_help())
+        continue
+      run_command(root_ctx, args)
+  finally:
+    if interactive:
+      save_history()
+
+
+def run_command(root_ctx: click.Context, args: List[str]) -> None:
+  """Runs a command line as a subcommand of the root command.
+
+  Errors are reported without ending the shell.
+
+  Args:
+    root_ctx (click.Context): Click context of the root command.
+    args (List[str]): Command line, e.g. ["feeds", "get", "123"].
+  """
+  root = root_ctx.command
+  try:
+    cmd_name, cmd, cmd_args = root.resolve_command(root_ctx, args)
+    if cmd_name == shell.name:
+      click.echo("Already running in the shell.")
+      return
+    with cmd.make_context(cmd_name, cmd_args, parent=root_ctx) as cmd_ctx:
+      cmd.invoke(cmd_ctx)
+  except click.exceptions.Exit:
+    # Raised after --help was shown.
+    pass
+  except click.ClickException as e:
+    e.show()
+  except click.Abort:
+    click.echo("Aborted!", err=True)
+  except KeyboardInterrupt:
+    click.echo("\nInterrupted.", err=True)
+
+
+def load_history() -> None:
+  """Loads the command history of earlier shells, if line editing works."""
+  if readline is None:
+    return
+  readline.set_history_length(HISTORY_LENGTH)
+  try:
+    readline.read_history_file(path_constants.SHELL_HISTORY_PATH)
+  except OSError:
+    pass
+
+
+def save_history() -> None:
+  """Saves the command history for later shells, if line editing works."""
+  if readline is None:
+    return
+  try:
+    readline.write_history_file(path_constants.SHELL_HISTORY_PATH)
+  except OSError:
+    pass
@@ -0,0 +1,80 @@
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Unit tests for shell.py."""
+
+import click
+from click.testing import CliRunner
+
+from common import lazy_group
+from shell import shell
+
+runner = CliRunner()
+
+
+@click.command(name="echo")
+@click.argument("words", nargs=-1)
+def echo(words: str) -> None:
+  click.echo(" ".join(words))
+
+
+@click.command(name="fail")
+def fail() -> None:
+  raise click.ClickException("Something failed.")
+
+
+@click.group(
+    name="cli",
+    cls=lazy_group.LazyGroup,
+    lazy_subcommands={"shell": "shell.shell.shell"})
+def cli() -> None:
+  """Root command of the tests."""
+
+
+cli.add_command(echo)
+cli.add_command(fail)
+
+
+def test_shell_runs_commands() -> None:
+  """Test that commands run until exit and errors do not end the shell."""
+  result = runner.invoke(
+      cli, ["shell"],
+      input="echo 'hello world'\n\nfail\nunknown\necho --bad\necho done\n"
+      "exit\necho not run\n")
+
+  prompt = shell.PROMPT
+  assert result.exit_code == 0
+  assert result.output == (
+      "Chronicle CLI shell. Type 'help' for the list of commands and 'exit' "
+      f"to quit.\n{prompt}hello world\n{prompt}{prompt}Error: Something "
+      f"failed.\n{prompt}Usage: cli [OPTIONS] COMMAND [ARGS]...\nTry 'cli "
+      "--help' for help.\n\nError: No such command 'unknown'.\n"
+      f"{prompt}Usage: cli echo [OPTIONS] [WORDS]...\nTry 'cli echo --help' "
+      f"for help.\n\nError: No such option: --bad\n{prompt}done\n{prompt}")
+
+
+def test_shell_help_and_end_of_input() -> None:
+  """Test that help lists the commands and end of input ends the shell."""
+  result = runner.invoke(cli, ["shell"], input="help\nshell\n")
+
+  assert "Commands:\n  echo\n  fail\n  shell" in result.output
+  assert "Already running in the shell." in result.output
+  assert result.output.endswith(f"{shell.PROMPT}\n")
+
+
+def test_shell_invalid_quoting() -> None:
+  """Test that a line which cannot be split is reported."""
+  result = runner.invoke(cli, ["shell"], input="echo 'unterminated\n")
+
+  assert "Invalid command line: No closing quotation" in result.output
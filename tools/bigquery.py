@@ -16,12 +16,15 @@
 
 import click
 
-from tools.commands import provide_access
+from common import lazy_group
 
 
-@click.group(name="bigquery", help="Manage Big Query export")
+@click.group(
+    name="bigquery",
+    cls=lazy_group.LazyGroup,
+    lazy_subcommands={
+        "provide_access": "tools.commands.provide_access.provide_access",
+    },
+    help="Manage Big Query export")
 def bigquery() -> None:
   """Group of commands to interact with bigquery APIs."""
-
-
-bigquery.add_command(provide_access.provide_access)
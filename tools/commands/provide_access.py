@@ -73,7 +73,7 @@ def provide_access(credential_file: AnyStr, verbose: bool, region: str,
       timeout=url.HTTP_REQUEST_TIMEOUT_IN_SECS,
       data=data)
 
-  parsed_response = api_utility.check_content_type(response.text)
+  parsed_response = api_utility.check_content_type(response.content)
 
   if response.status_code != status.STATUS_OK:
     error_response = bigquery_templates.errors_response_template.substitute(